@@ -3,15 +3,1536 @@ Atlassian API Clients for JIRA, Confluence, and Bitbucket
 """
 
 import requests
-from typing import Dict, Any, Optional, List
-from urllib.parse import urljoin
+from requests.adapters import HTTPAdapter
+from typing import Dict, Any, Callable, Optional, List, Iterable, Iterator, Sequence, Union
+from urllib.parse import quote_plus, urlencode, urljoin, urlsplit
+import asyncio
+import contextvars
+import copy
+import functools
+import hashlib
+import inspect
 import json
+import os
+import random
+import re
+import threading
+import time
+import uuid
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from requests.structures import CaseInsensitiveDict
+
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+from concurrent.futures import ThreadPoolExecutor, Future, wait, FIRST_COMPLETED
+from concurrent.futures import TimeoutError as FutureTimeoutError
+
+
+class RetryPolicy:
+    """Retry rules for rate-limited and transiently failing Atlassian calls"""
+    
+    RETRY_STATUSES = frozenset({429, 502, 503, 504})
+    IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+    
+    def __init__(self, max_retries: int = 5, backoff_base: float = 0.5, backoff_max: float = 30.0,
+                 max_retry_after: float = 120.0):
+        """
+        Initialize retry policy
+        
+        Args:
+            max_retries: 최대 재시도 횟수 (0이면 재시도하지 않음)
+            backoff_base: 지수 백오프 기본 대기 시간 (초)
+            backoff_max: 지수 백오프 최대 대기 시간 (초)
+            max_retry_after: 서버가 요청한 대기 시간의 상한 (초)
+        """
+        self.max_retries: int = max_retries
+        self.backoff_base: float = backoff_base
+        self.backoff_max: float = backoff_max
+        self.max_retry_after: float = max_retry_after
+    
+    def should_retry(self, method: str, attempt: int, status: Optional[int] = None,
+                     error: Optional[Exception] = None) -> bool:
+        """
+        재시도 여부 판단
+        
+        멱등 메서드는 연결 오류/타임아웃과 RETRY_STATUSES 응답을 재시도한다.
+        POST/PATCH처럼 멱등이 아닌 메서드는 서버가 요청을 처리하지 않았음이 확실한
+        경우(연결 타임아웃, 429)에만 재시도한다.
+        """
+        if attempt >= self.max_retries:
+            return False
+        
+        idempotent = method.upper() in self.IDEMPOTENT_METHODS
+        if error is not None:
+            if isinstance(error, requests.exceptions.ConnectTimeout):
+                return True
+            return idempotent and isinstance(error, (requests.exceptions.ConnectionError, requests.exceptions.Timeout))
+        
+        if status == 429:
+            return True
+        return idempotent and status in self.RETRY_STATUSES
+    
+    def backoff(self, attempt: int) -> float:
+        """지터가 적용된 지수 백오프 대기 시간 (full jitter)"""
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+    
+    def delay_for(self, response: requests.Response, attempt: int) -> float:
+        """응답 헤더를 반영한 다음 재시도까지의 대기 시간"""
+        server_delay = rate_limit_delay(response.headers)
+        if server_delay is None:
+            return self.backoff(attempt)
+        # 여러 클라이언트가 같은 시각에 몰리지 않도록 약간의 지터 추가
+        return min(server_delay, self.max_retry_after) + random.uniform(0, self.backoff_base)
+
+
+def _parse_delay(value: Any) -> Optional[float]:
+    """Retry-After/X-RateLimit-Reset 값을 대기 시간(초)으로 변환"""
+    if not isinstance(value, str) or not value.strip():
+        return None
+    value = value.strip()
+    
+    try:
+        number = float(value)
+    except ValueError:
+        number = None
+    
+    if number is not None:
+        # 큰 값은 epoch 초 단위 리셋 시각으로 간주
+        if number > 1e9:
+            return max(0.0, number - time.time())
+        return max(0.0, number)
+    
+    # HTTP-date (Retry-After) 또는 ISO 8601 (Jira X-RateLimit-Reset)
+    try:
+        reset_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        try:
+            reset_at = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    if reset_at.tzinfo is None:
+        reset_at = reset_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (reset_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def rate_limit_delay(headers: Any) -> Optional[float]:
+    """
+    Retry-After 및 X-RateLimit-* 헤더에서 서버가 요구한 대기 시간 추출
+    
+    Retry-After가 우선이며, 남은 요청 수(X-RateLimit-Remaining)가 0이면
+    X-RateLimit-Reset 시각까지 대기한다.
+    """
+    if headers is None or not hasattr(headers, "get"):
+        return None
+    
+    delay = _parse_delay(headers.get("Retry-After"))
+    if delay is not None:
+        return delay
+    
+    remaining = headers.get("X-RateLimit-Remaining")
+    if isinstance(remaining, str) and remaining.strip() == "0":
+        return _parse_delay(headers.get("X-RateLimit-Reset"))
+    return None
+
+
+class TokenBucket:
+    """Client-side token bucket limiting request rate"""
+    
+    def __init__(self, rate: Optional[float], capacity: Optional[float] = None):
+        """
+        Initialize token bucket
+        
+        Args:
+            rate: 초당 보충되는 토큰 수 (초당 허용 요청 수, None이면 제한 없음)
+            capacity: 버킷 최대 크기 (순간 허용 요청 수, 기본값: rate)
+        """
+        self.rate: Optional[float] = rate
+        self.capacity: float = capacity if capacity is not None else max(1.0, rate or 1.0)
+        self.tokens: float = self.capacity
+        self.updated: float = time.monotonic()
+        self.blocked_until: float = 0.0
+        self._lock = threading.Lock()
+    
+    def reserve(self) -> float:
+        """
+        토큰 1개를 예약하고 사용 가능해질 때까지의 대기 시간(초) 반환
+        
+        토큰이 부족하면 음수 잔고로 예약하므로 동시 호출자도 순서대로 간격이 벌어진다.
+        """
+        with self._lock:
+            now = time.monotonic()
+            if self.rate is None:
+                return max(0.0, self.blocked_until - now)
+            
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            
+            wait_time = max(0.0, self.blocked_until - now)
+            if self.tokens < 0:
+                wait_time = max(wait_time, -self.tokens / self.rate)
+            return wait_time
+    
+    def pause(self, seconds: float) -> None:
+        """서버 요청에 따라 지정 시간 동안 새 요청 중지"""
+        with self._lock:
+            self.blocked_until = max(self.blocked_until, time.monotonic() + seconds)
+
+
+class DeadlineExceeded(requests.exceptions.Timeout):
+    """Raised when an operation deadline expires before its requests complete"""
+
+
+class CircuitOpenError(requests.exceptions.ConnectionError):
+    """Raised without contacting the host while its circuit breaker is open"""
+
+
+# 현재 작업의 만료 시각 (time.monotonic 기준, None이면 기한 없음)
+_deadline_var: "contextvars.ContextVar[Optional[float]]" = contextvars.ContextVar("atlassian_api_deadline",
+                                                                                   default=None)
+
+
+@contextmanager
+def deadline(seconds: Optional[float]) -> Iterator[None]:
+    """
+    블록 안의 모든 요청에 적용할 작업 전체 제한 시간 설정
+
+    페이지 순회, 청크 병렬 조회처럼 여러 요청으로 이루어진 작업도 하나의 기한을
+    공유한다. 남은 시간은 각 요청의 읽기 타임아웃과 재시도 대기 시간을 줄이는 데
+    사용되며, 기한이 지나면 DeadlineExceeded가 발생한다. 중첩되면 더 이른 기한이
+    적용된다. seconds가 None이면 아무 것도 하지 않는다.
+    """
+    if seconds is None:
+        yield
+        return
+    expires_at = time.monotonic() + seconds
+    current = _deadline_var.get()
+    token = _deadline_var.set(expires_at if current is None else min(current, expires_at))
+    try:
+        yield
+    finally:
+        _deadline_var.reset(token)
+
+
+def deadline_remaining() -> Optional[float]:
+    """현재 작업 기한까지 남은 시간 (초, 기한이 없으면 None)"""
+    expires_at = _deadline_var.get()
+    return None if expires_at is None else expires_at - time.monotonic()
+
+
+def check_deadline() -> Optional[float]:
+    """기한이 지났으면 DeadlineExceeded 발생, 아니면 남은 시간 반환"""
+    remaining = deadline_remaining()
+    if remaining is not None and remaining <= 0:
+        raise DeadlineExceeded("작업 제한 시간 초과")
+    return remaining
+
+
+def submit_in_context(executor: ThreadPoolExecutor, fn: Callable[..., Any], *args: Any) -> Future:
+    """현재 컨텍스트(작업 기한 포함)를 복사하여 작업자 스레드에 제출"""
+    return executor.submit(contextvars.copy_context().run, fn, *args)
+
+
+class CircuitBreaker:
+    """Per-host circuit breaker
+
+    Opens after ``failure_threshold`` consecutive failures (connection errors,
+    timeouts, 5xx) and rejects requests with ``CircuitOpenError`` until
+    ``recovery_timeout`` has passed. It then lets a single probe through
+    (half-open): success closes the circuit, failure opens it again.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, recovery_timeout: float = 30.0):
+        """
+        Args:
+            failure_threshold: 회로를 여는 연속 실패 횟수
+            recovery_timeout: 열린 뒤 복구 확인 요청을 보내기까지 대기 시간 (초)
+        """
+        self.failure_threshold: int = failure_threshold
+        self.recovery_timeout: float = recovery_timeout
+        self.failures: int = 0
+        self.opened_at: float = 0.0
+        self._state: str = self.CLOSED
+        self._probing: bool = False
+        self._clock = time.monotonic
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        """현재 상태 (복구 대기 시간이 지난 open은 half_open으로 표시)"""
+        with self._lock:
+            if self._state == self.OPEN and self._clock() - self.opened_at >= self.recovery_timeout:
+                return self.HALF_OPEN
+            return self._state
+
+    def before_request(self) -> None:
+        """요청 허용 여부 확인 (거부 시 CircuitOpenError)"""
+        with self._lock:
+            if self._state == self.CLOSED:
+                return
+            if self._state == self.OPEN:
+                remaining = self.recovery_timeout - (self._clock() - self.opened_at)
+                if remaining > 0:
+                    raise CircuitOpenError(f"회로 차단기 열림: {remaining:.1f}초 후 재시도")
+                self._state = self.HALF_OPEN
+            if self._probing:
+                raise CircuitOpenError("회로 차단기 복구 확인 중")
+            self._probing = True
+
+    def record_success(self) -> None:
+        """요청 성공 기록 (회로 닫기)"""
+        with self._lock:
+            self.failures = 0
+            self._state = self.CLOSED
+            self._probing = False
+
+    def record_failure(self) -> None:
+        """요청 실패 기록 (연속 실패가 임계값에 도달하거나 복구 확인이 실패하면 회로 열기)"""
+        with self._lock:
+            self.failures += 1
+            if self._state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                self._state = self.OPEN
+                self.opened_at = self._clock()
+            self._probing = False
+
+    def release(self) -> None:
+        """성공/실패를 판단하지 않고 복구 확인 슬롯 반환 (작업 기한 초과 등)"""
+        with self._lock:
+            self._probing = False
+
+    def record(self, status: Optional[int] = None, error: Optional[BaseException] = None) -> None:
+        """응답 상태 또는 예외로 결과 기록 (5xx, 연결 오류, 타임아웃은 실패)"""
+        if isinstance(error, DeadlineExceeded):
+            self.release()
+        elif error is not None:
+            if isinstance(error, (requests.exceptions.ConnectionError, requests.exceptions.Timeout)):
+                self.record_failure()
+            else:
+                self.release()
+        elif isinstance(status, int) and status >= 500:
+            self.record_failure()
+        else:
+            self.record_success()
+
+
+class ConditionalCache:
+    """Size-bounded on-disk LRU cache for conditional GET (ETag / Last-Modified)"""
+    
+    DEFAULT_MAX_BYTES: int = 100 * 1024 * 1024
+    # 캐시 응답 재구성에 필요한 헤더만 저장
+    STORED_HEADERS = ("Content-Type", "ETag", "Last-Modified")
+    
+    def __init__(self, cache_dir: str, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Initialize conditional cache
+        
+        Args:
+            cache_dir: 캐시 파일을 저장할 디렉터리
+            max_bytes: 디스크 사용량 상한 (초과 시 가장 오래 사용하지 않은 항목부터 삭제)
+        """
+        self.cache_dir = Path(cache_dir)
+        # 인증된 응답 본문을 저장하므로 소유자만 접근 가능하게 생성
+        self.cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+        os.chmod(self.cache_dir, 0o700)
+        self.max_bytes: int = max_bytes
+        self.total_bytes: int = 0
+        self._lock = threading.Lock()
+        # key -> 파일 크기, 앞쪽일수록 오래전에 사용된 항목
+        self._index: "OrderedDict[str, int]" = OrderedDict()
+        self._load_index()
+    
+    def _load_index(self) -> None:
+        """기존 캐시 파일을 마지막 사용 시각 순으로 색인"""
+        entries = []
+        for path in self.cache_dir.glob("*.cache"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, path.stem, stat.st_size))
+        for _, key, size in sorted(entries):
+            self._index[key] = size
+            self.total_bytes += size
+    
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.cache"
+    
+    @staticmethod
+    def make_key(url: str, params: Optional[Dict[str, Any]] = None, auth: Any = None) -> str:
+        """URL, 쿼리 파라미터, 사용자 기준 캐시 키 생성 (사용자 간 응답 공유 방지)"""
+        user = auth[0] if isinstance(auth, tuple) and auth else None
+        normalized_params = sorted((str(k), str(v)) for k, v in (params or {}).items() if v is not None)
+        raw = json.dumps([url, normalized_params, user], ensure_ascii=False)
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+    
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """캐시 항목 조회 (메타데이터와 본문)"""
+        with self._lock:
+            if key not in self._index:
+                return None
+            path = self._path(key)
+            try:
+                with open(path, "rb") as f:
+                    meta = json.loads(f.readline())
+                    body = f.read()
+                os.utime(path)
+            except (OSError, ValueError):
+                self._discard(key)
+                return None
+            self._index.move_to_end(key)
+        meta["body"] = body
+        return meta
+    
+    def put(self, key: str, url: str, response: requests.Response) -> None:
+        """검증자(ETag/Last-Modified)가 있는 응답 저장"""
+        headers = {name: response.headers[name] for name in self.STORED_HEADERS if name in response.headers}
+        meta = json.dumps({"url": url, "headers": headers}, ensure_ascii=False).encode("utf-8")
+        data = meta + b"\n" + response.content
+        if len(data) > self.max_bytes:
+            return
+        
+        with self._lock:
+            path = self._path(key)
+            tmp_path = path.with_suffix(f".tmp{threading.get_ident()}")
+            try:
+                with os.fdopen(os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), "wb") as f:
+                    f.write(data)
+                os.replace(tmp_path, path)
+            except OSError:
+                return
+            self.total_bytes -= self._index.pop(key, 0)
+            self._index[key] = len(data)
+            self.total_bytes += len(data)
+            self._evict()
+    
+    def invalidate(self, key: str) -> None:
+        """캐시 항목 삭제"""
+        with self._lock:
+            self._discard(key)
+    
+    def clear(self) -> None:
+        """캐시 전체 삭제"""
+        with self._lock:
+            for key in list(self._index):
+                self._discard(key)
+    
+    def _discard(self, key: str) -> None:
+        self.total_bytes -= self._index.pop(key, 0)
+        try:
+            self._path(key).unlink()
+        except OSError:
+            pass
+    
+    def _evict(self) -> None:
+        while self.total_bytes > self.max_bytes and self._index:
+            oldest = next(iter(self._index))
+            self._discard(oldest)
+    
+    @staticmethod
+    def build_response(entry: Dict[str, Any], not_modified: requests.Response) -> requests.Response:
+        """304 응답을 캐시된 본문을 가진 200 응답으로 변환"""
+        response = requests.Response()
+        response.status_code = 200
+        response._content = entry["body"]
+        response.headers = CaseInsensitiveDict(entry.get("headers", {}))
+        response.url = getattr(not_modified, "url", entry.get("url"))
+        response.request = getattr(not_modified, "request", None)
+        response.encoding = "utf-8"
+        response.from_cache = True
+        return response
+
+
+# 요청 계측 훅: emit_request_event가 만든 이벤트 딕셔너리를 받는 callable
+RequestHook = Callable[[Dict[str, Any]], None]
+
+
+def _body_size(body: Any) -> int:
+    """요청/응답 본문 바이트 수 (알 수 없으면 0)"""
+    if isinstance(body, str):
+        return len(body.encode("utf-8"))
+    if isinstance(body, (bytes, bytearray)):
+        return len(body)
+    if hasattr(body, "__len__") and not isinstance(body, (dict, list, tuple)):
+        return len(body)
+    return 0
+
+
+def emit_request_event(hooks: Sequence[RequestHook], method: str, url: str, kwargs: Dict[str, Any],
+                       response: Any, error: Optional[BaseException], latency: float, retries: int) -> None:
+    """
+    요청 완료 이벤트를 훅에 전달
+    
+    이벤트 키: method, url, status(실패 시 None), latency(초), bytes_in, bytes_out,
+    retries, error(예외 클래스 이름 또는 None)
+    """
+    prepared = getattr(response, "request", None)
+    bytes_out = _body_size(getattr(prepared, "body", None)) if isinstance(prepared, requests.PreparedRequest) else 0
+    if not bytes_out:
+        if kwargs.get("json") is not None:
+            bytes_out = len(json.dumps(kwargs["json"]).encode("utf-8"))
+        else:
+            bytes_out = _body_size(kwargs.get("data"))
+    
+    status = getattr(response, "status_code", None)
+    bytes_in = 0
+    if response is not None:
+        # 스트리밍 응답의 본문을 읽지 않도록 이미 로드된 본문만 사용
+        content = response.content if isinstance(response, AsyncResponse) else getattr(response, "_content", None)
+        if isinstance(content, bytes):
+            bytes_in = len(content)
+        else:
+            length = getattr(response, "headers", {}).get("Content-Length")
+            bytes_in = int(length) if isinstance(length, str) and length.isdigit() else 0
+    
+    event = {
+        "method": method.upper(),
+        "url": url,
+        "status": status if isinstance(status, int) else None,
+        "latency": latency,
+        "bytes_in": bytes_in,
+        "bytes_out": bytes_out,
+        "retries": retries,
+        "error": type(error).__name__ if error is not None else None
+    }
+    for hook in hooks:
+        try:
+            hook(event)
+        except Exception:
+            # 계측 실패가 실제 요청 결과에 영향을 주지 않도록 무시
+            pass
+
+
+class MetricsRecorder:
+    """In-process per-endpoint request metrics
+    
+    Register with ``transport.add_hook(recorder)`` (or a client's
+    ``add_instrumentation``). Endpoints are grouped by host, method and URL
+    path with issue keys, numeric ids and commit hashes replaced by
+    placeholders, e.g. ``GET /rest/api/3/issue/{key}``.
+    """
+    
+    # Prometheus 히스토그램 버킷 (초)
+    BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+    # 백분위 계산용으로 엔드포인트별 보관하는 최근 지연 시간 수
+    SAMPLE_SIZE = 2048
+    
+    _ISSUE_KEY = re.compile(r"^[A-Z][A-Z0-9_]+-\d+$")
+    _NUMBER = re.compile(r"^\d+$")
+    _HASH = re.compile(r"^(?=.*\d)[0-9a-f]{7,40}$")
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._endpoints: Dict[tuple, Dict[str, Any]] = {}
+    
+    @classmethod
+    def endpoint_of(cls, url: str) -> str:
+        """URL 경로를 엔드포인트 템플릿으로 변환"""
+        segments: List[str] = []
+        for segment in urlsplit(url).path.split("/"):
+            if cls._ISSUE_KEY.match(segment):
+                segment = "{key}"
+            elif segments and segments[-1] == "api":
+                # /rest/api/3 같은 API 버전은 그대로 유지
+                pass
+            elif cls._NUMBER.match(segment):
+                segment = "{id}"
+            elif cls._HASH.match(segment):
+                segment = "{hash}"
+            segments.append(segment)
+        return "/".join(segments) or "/"
+    
+    def __call__(self, event: Dict[str, Any]) -> None:
+        key = (urlsplit(event["url"]).netloc, event["method"], self.endpoint_of(event["url"]))
+        status = str(event["status"]) if event["status"] is not None else (event["error"] or "error")
+        with self._lock:
+            stats = self._endpoints.get(key)
+            if stats is None:
+                stats = self._endpoints[key] = {
+                    "count": 0, "errors": 0, "latency_sum": 0.0, "latency_max": 0.0,
+                    "samples": deque(maxlen=self.SAMPLE_SIZE), "buckets": [0] * len(self.BUCKETS),
+                    "bytes_in": 0, "bytes_out": 0, "retries": 0, "status_codes": {}
+                }
+            latency = event["latency"]
+            stats["count"] += 1
+            if event["status"] is None or event["status"] >= 400:
+                stats["errors"] += 1
+            stats["latency_sum"] += latency
+            stats["latency_max"] = max(stats["latency_max"], latency)
+            stats["samples"].append(latency)
+            for i, bound in enumerate(self.BUCKETS):
+                if latency <= bound:
+                    stats["buckets"][i] += 1
+                    break
+            stats["bytes_in"] += event["bytes_in"]
+            stats["bytes_out"] += event["bytes_out"]
+            stats["retries"] += event["retries"]
+            stats["status_codes"][status] = stats["status_codes"].get(status, 0) + 1
+    
+    @staticmethod
+    def _percentile(samples: List[float], fraction: float) -> float:
+        """정렬된 표본의 백분위 (nearest-rank)"""
+        if not samples:
+            return 0.0
+        index = max(0, min(len(samples) - 1, int(round(fraction * len(samples) + 0.5)) - 1))
+        return samples[index]
+    
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """
+        엔드포인트별 집계 조회
+        
+        Returns:
+            {"GET host/rest/api/3/search": {"count", "errors", "latency": {"avg", "p50", "p95", "p99", "max"},
+             "bytes_in", "bytes_out", "retries", "status_codes"}}
+        """
+        with self._lock:
+            items = [(key, dict(stats, samples=sorted(stats["samples"]), status_codes=dict(stats["status_codes"])))
+                     for key, stats in self._endpoints.items()]
+        
+        result: Dict[str, Dict[str, Any]] = {}
+        for (host, method, endpoint), stats in sorted(items, key=lambda item: item[0]):
+            samples = stats["samples"]
+            result[f"{method} {host}{endpoint}"] = {
+                "count": stats["count"],
+                "errors": stats["errors"],
+                "latency": {
+                    "avg": stats["latency_sum"] / stats["count"],
+                    "p50": self._percentile(samples, 0.50),
+                    "p95": self._percentile(samples, 0.95),
+                    "p99": self._percentile(samples, 0.99),
+                    "max": stats["latency_max"]
+                },
+                "bytes_in": stats["bytes_in"],
+                "bytes_out": stats["bytes_out"],
+                "retries": stats["retries"],
+                "status_codes": stats["status_codes"]
+            }
+        return result
+    
+    def top(self, n: int = 10, by: str = "total_time") -> List[tuple]:
+        """누적 시간(total_time) 또는 요청 수(count) 기준 상위 엔드포인트"""
+        snapshot = self.snapshot()
+        
+        def weight(item):
+            stats = item[1]
+            return stats["latency"]["avg"] * stats["count"] if by == "total_time" else stats[by]
+        
+        return sorted(snapshot.items(), key=weight, reverse=True)[:n]
+    
+    def to_json(self, indent: Optional[int] = 2) -> str:
+        """집계를 JSON 문자열로 변환"""
+        return json.dumps(self.snapshot(), indent=indent, ensure_ascii=False)
+    
+    def to_prometheus(self, prefix: str = "atlassian_api") -> str:
+        """집계를 Prometheus 텍스트 형식으로 변환"""
+        def labels(host: str, method: str, endpoint: str, **extra: str) -> str:
+            pairs = dict(host=host, method=method, endpoint=endpoint, **extra)
+            escaped = []
+            for name, value in pairs.items():
+                value = str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+                escaped.append(f'{name}="{value}"')
+            return "{" + ",".join(escaped) + "}"
+        
+        with self._lock:
+            items = sorted((key, dict(stats, buckets=list(stats["buckets"]), status_codes=dict(stats["status_codes"])))
+                           for key, stats in self._endpoints.items())
+        
+        lines = [
+            f"# HELP {prefix}_requests_total Completed requests by status code.",
+            f"# TYPE {prefix}_requests_total counter"
+        ]
+        for (host, method, endpoint), stats in items:
+            for status, count in sorted(stats["status_codes"].items()):
+                lines.append(f"{prefix}_requests_total{labels(host, method, endpoint, status=status)} {count}")
+        
+        lines += [
+            f"# HELP {prefix}_request_duration_seconds Request latency including retries.",
+            f"# TYPE {prefix}_request_duration_seconds histogram"
+        ]
+        for (host, method, endpoint), stats in items:
+            cumulative = 0
+            for bound, count in zip(self.BUCKETS, stats["buckets"]):
+                cumulative += count
+                lines.append(f"{prefix}_request_duration_seconds_bucket"
+                             f"{labels(host, method, endpoint, le=repr(bound))} {cumulative}")
+            lines.append(f"{prefix}_request_duration_seconds_bucket"
+                         f"{labels(host, method, endpoint, le='+Inf')} {stats['count']}")
+            lines.append(f"{prefix}_request_duration_seconds_sum{labels(host, method, endpoint)} {stats['latency_sum']}")
+            lines.append(f"{prefix}_request_duration_seconds_count{labels(host, method, endpoint)} {stats['count']}")
+        
+        for name, field, help_text in (
+            ("response_bytes_total", "bytes_in", "Response body bytes received."),
+            ("request_bytes_total", "bytes_out", "Request body bytes sent."),
+            ("retries_total", "retries", "Retried attempts."),
+        ):
+            lines += [f"# HELP {prefix}_{name} {help_text}", f"# TYPE {prefix}_{name} counter"]
+            for (host, method, endpoint), stats in items:
+                lines.append(f"{prefix}_{name}{labels(host, method, endpoint)} {stats[field]}")
+        return "\n".join(lines) + "\n"
+    
+    def reset(self) -> None:
+        """집계 초기화"""
+        with self._lock:
+            self._endpoints.clear()
+
+
+class HTTPTransport:
+    """Pooled HTTP transport shared by Atlassian clients"""
+    
+    DEFAULT_POOL_CONNECTIONS: int = 10
+    DEFAULT_POOL_MAXSIZE: int = 10
+    # 연결/읽기 타임아웃 기본값 (초, Config의 api.connect_timeout/api.timeout과 같은 값)
+    DEFAULT_CONNECT_TIMEOUT: float = 10.0
+    DEFAULT_READ_TIMEOUT: float = 30.0
+    
+    def __init__(self, pool_connections: int = DEFAULT_POOL_CONNECTIONS, pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+                 retry_policy: Optional[RetryPolicy] = None, rate_limiter: Optional[TokenBucket] = None,
+                 connect_timeout: Optional[float] = DEFAULT_CONNECT_TIMEOUT,
+                 read_timeout: Optional[float] = DEFAULT_READ_TIMEOUT):
+        """
+        Initialize pooled transport
+        
+        Args:
+            pool_connections: 호스트별로 유지할 커넥션 풀 개수
+            pool_maxsize: 풀 하나에 보관할 최대 keep-alive 커넥션 수
+            retry_policy: 재시도 정책 (기본값: RetryPolicy())
+            rate_limiter: 클라이언트 측 요청 속도 제한 (기본값: 서버 헤더만 반영)
+            connect_timeout: 연결 타임아웃 (초, None이면 무제한)
+            read_timeout: 응답 대기 타임아웃 (초, None이면 무제한)
+        """
+        self.pool_connections: int = pool_connections
+        self.pool_maxsize: int = pool_maxsize
+        self.connect_timeout: Optional[float] = connect_timeout
+        self.read_timeout: Optional[float] = read_timeout
+        # 호스트별 회로 차단기 (연속 실패 시 요청을 보내지 않고 즉시 실패)
+        self.breaker_threshold: int = 5
+        self.breaker_recovery: float = 30.0
+        self.breakers: Dict[str, CircuitBreaker] = {}
+        self.host_pool_sizes: Dict[str, int] = {}
+        self.retry_policy: RetryPolicy = retry_policy if retry_policy is not None else RetryPolicy()
+        # 서버가 X-RateLimit-*로 대기를 요구하면 토큰 버킷을 일시 중지
+        self.rate_limiter: TokenBucket = rate_limiter if rate_limiter is not None else TokenBucket(None)
+        self.cache: Optional[ConditionalCache] = None
+        # 동일한 GET이 동시에 진행 중이면 하나의 요청 결과를 공유 (single-flight)
+        self.coalesce_gets: bool = True
+        self._inflight: Dict[str, Future] = {}
+        self.hooks: List["RequestHook"] = []
+        self._sleep = time.sleep
+        self._lock = threading.Lock()
+        self.session = requests.Session()
+        self._mount("https://", pool_maxsize)
+        self._mount("http://", pool_maxsize)
+    
+    def _mount(self, prefix: str, pool_maxsize: int) -> None:
+        """prefix에 커넥션 풀 어댑터 연결"""
+        adapter = HTTPAdapter(pool_connections=self.pool_connections, pool_maxsize=pool_maxsize)
+        self.session.mount(prefix, adapter)
+    
+    def set_pool_size(self, domain_url: str, pool_maxsize: int) -> None:
+        """특정 호스트의 커넥션 풀 크기 설정"""
+        host_key = transport_key(domain_url)
+        with self._lock:
+            if self.host_pool_sizes.get(host_key) == pool_maxsize:
+                return
+            self.host_pool_sizes[host_key] = pool_maxsize
+            # 더 긴 prefix가 우선 매칭되므로 호스트 단위 어댑터가 기본 어댑터보다 먼저 선택됨
+            self._mount(f"{host_key}/", pool_maxsize)
+    
+    def set_rate_limit(self, rate: Optional[float], capacity: Optional[float] = None) -> None:
+        """클라이언트 측 초당 요청 수 제한 설정 (None이면 제한 해제)"""
+        self.rate_limiter = TokenBucket(rate, capacity)
+    
+    def set_timeout(self, read_timeout: Optional[float], connect_timeout: Optional[float] = None) -> None:
+        """읽기/연결 타임아웃 설정 (connect_timeout을 생략하면 기존 값 유지)"""
+        self.read_timeout = read_timeout
+        if connect_timeout is not None:
+            self.connect_timeout = connect_timeout
+    
+    def set_circuit_breaker(self, failure_threshold: int, recovery_timeout: float) -> None:
+        """회로 차단기 설정 (기존 호스트별 상태는 초기화)"""
+        with self._lock:
+            self.breaker_threshold = failure_threshold
+            self.breaker_recovery = recovery_timeout
+            self.breakers = {}
+    
+    def apply_config(self, api_config: Dict[str, Any]) -> None:
+        """
+        설정 파일의 api 섹션 적용
+        
+        timeout(읽기), connect_timeout, breaker_threshold, breaker_recovery 키를 사용하며
+        없는 키는 현재 값을 유지한다.
+        """
+        self.set_timeout(api_config.get("timeout", self.read_timeout), api_config.get("connect_timeout"))
+        self.set_circuit_breaker(api_config.get("breaker_threshold", self.breaker_threshold),
+                                 api_config.get("breaker_recovery", self.breaker_recovery))
+    
+    def breaker_for(self, url: str) -> CircuitBreaker:
+        """URL 호스트의 회로 차단기"""
+        host_key = transport_key(url)
+        with self._lock:
+            breaker = self.breakers.get(host_key)
+            if breaker is None:
+                breaker = self.breakers[host_key] = CircuitBreaker(self.breaker_threshold, self.breaker_recovery)
+            return breaker
+    
+    def _timeout(self, remaining: Optional[float], requested: Any = None) -> tuple:
+        """
+        요청 하나의 (연결, 읽기) 타임아웃 (작업 기한이 있으면 남은 시간 이내로 제한)
+        
+        requested는 호출자가 지정한 timeout (숫자 또는 (연결, 읽기)), 없으면 설정값을 사용한다.
+        """
+        if requested is None:
+            connect, read = self.connect_timeout, self.read_timeout
+        elif isinstance(requested, tuple):
+            connect, read = requested
+        else:
+            connect = read = requested
+        if remaining is not None:
+            connect = remaining if connect is None else min(connect, remaining)
+            read = remaining if read is None else min(read, remaining)
+        return connect, read
+    
+    def enable_cache(self, cache_dir: str, max_bytes: int = ConditionalCache.DEFAULT_MAX_BYTES) -> ConditionalCache:
+        """조건부 GET 캐시 활성화 (같은 디렉터리면 기존 캐시 재사용)"""
+        with self._lock:
+            if self.cache is None or self.cache.cache_dir != Path(cache_dir):
+                self.cache = ConditionalCache(cache_dir, max_bytes)
+            return self.cache
+    
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        keep-alive 세션으로 요청 전송
+        
+        같은 GET(URL, 파라미터, 인증 사용자, 헤더)이 이미 진행 중이면 새 요청을 보내지
+        않고 진행 중인 요청의 응답(또는 예외)을 함께 받는다. 스트리밍 요청은 제외한다.
+        """
+        if not (self.coalesce_gets and method.upper() == "GET" and not kwargs.get("stream")):
+            return self._cached_request(method, url, **kwargs)
+        
+        key = request_key(url, kwargs.get("params"), kwargs.get("auth"), kwargs.get("headers"))
+        with self._lock:
+            shared = self._inflight.get(key)
+            leader = shared is None
+            if leader:
+                shared = self._inflight[key] = Future()
+        
+        if not leader:
+            # 대기자도 자신의 작업 기한까지만 기다린다
+            try:
+                response = shared.result(timeout=check_deadline())
+            except FutureTimeoutError:
+                raise DeadlineExceeded("작업 제한 시간 초과: 진행 중인 같은 요청 대기") from None
+            # 응답 객체를 호출자마다 분리 (본문은 이미 읽혀 있으므로 얕은 복사로 충분)
+            return copy.copy(response)
+        
+        try:
+            response = self._cached_request(method, url, **kwargs)
+        except BaseException as e:
+            shared.set_exception(e)
+            raise
+        else:
+            shared.set_result(response)
+            return response
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+    
+    def _cached_request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        조건부 GET 캐시를 적용하여 요청 전송
+        
+        캐시가 활성화되어 있으면 GET 요청에 If-None-Match/If-Modified-Since를 붙이고,
+        304 응답은 캐시된 본문으로 대체한다.
+        """
+        cache = self.cache
+        if cache is None or method.upper() != "GET" or kwargs.get("stream"):
+            return self._send(method, url, **kwargs)
+        
+        key = cache.make_key(url, kwargs.get("params"), kwargs.get("auth"))
+        entry = cache.get(key)
+        if entry is not None:
+            headers = dict(kwargs.get("headers") or {})
+            validators = entry.get("headers", {})
+            if "ETag" in validators:
+                headers["If-None-Match"] = validators["ETag"]
+            if "Last-Modified" in validators:
+                headers["If-Modified-Since"] = validators["Last-Modified"]
+            kwargs["headers"] = headers
+        
+        response = self._send(method, url, **kwargs)
+        status = getattr(response, "status_code", None)
+        if status == 304 and entry is not None:
+            return cache.build_response(entry, response)
+        if status == 200 and ("ETag" in response.headers or "Last-Modified" in response.headers):
+            cache.put(key, url, response)
+        return response
+    
+    def add_hook(self, hook: "RequestHook") -> "RequestHook":
+        """요청 계측 훅 등록 (요청 하나가 재시도를 포함해 끝날 때마다 이벤트 딕셔너리로 호출)"""
+        with self._lock:
+            self.hooks = self.hooks + [hook]
+        return hook
+    
+    def remove_hook(self, hook: "RequestHook") -> None:
+        """요청 계측 훅 제거"""
+        with self._lock:
+            self.hooks = [h for h in self.hooks if h is not hook]
+    
+    def _send(self, method: str, url: str, **kwargs) -> requests.Response:
+        """재시도 포함 요청 전송 (훅이 있으면 지연 시간/크기/재시도 횟수를 기록)"""
+        hooks = self.hooks
+        stats: Dict[str, int] = {"retries": 0}
+        if not hooks:
+            return self._send_with_retry(method, url, stats, **kwargs)
+        
+        start = time.perf_counter()
+        response: Optional[requests.Response] = None
+        error: Optional[BaseException] = None
+        try:
+            response = self._send_with_retry(method, url, stats, **kwargs)
+            return response
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            emit_request_event(hooks, method, url, kwargs, response, error,
+                               time.perf_counter() - start, stats["retries"])
+    
+    def _send_with_retry(self, method: str, url: str, stats: Dict[str, int], **kwargs) -> requests.Response:
+        """
+        재시도 정책을 적용하여 요청 전송
+        
+        429/503 등 일시적 실패는 retry_policy에 따라 Retry-After 헤더 또는
+        지터가 적용된 지수 백오프만큼 기다린 뒤 재시도한다.
+        """
+        policy = self.retry_policy
+        # 파일 스트림 본문은 다시 보낼 수 없으므로 재시도하지 않음
+        replayable = "files" not in kwargs and not hasattr(kwargs.get("data"), "read")
+        breaker = self.breaker_for(url)
+        attempt = 0
+        
+        while True:
+            stats["retries"] = attempt
+            self._wait(self.rate_limiter.reserve())
+            remaining = check_deadline()
+            breaker.before_request()
+            
+            try:
+                timeout = self._timeout(remaining, kwargs.get("timeout"))
+                response = self.session.request(method, url, **dict(kwargs, timeout=timeout))
+            except requests.exceptions.RequestException as e:
+                # 기한 때문에 줄인 타임아웃이 만료된 것은 호스트 장애가 아님
+                if remaining is not None and isinstance(e, requests.exceptions.Timeout) and \
+                        deadline_remaining() <= 0:
+                    breaker.release()
+                    raise DeadlineExceeded(f"작업 제한 시간 초과: {e}") from e
+                breaker.record(error=e)
+                if not (replayable and policy.should_retry(method, attempt, error=e)):
+                    raise
+                self._wait(policy.backoff(attempt))
+                attempt += 1
+                continue
+            
+            headers = getattr(response, "headers", None)
+            status = getattr(response, "status_code", None)
+            breaker.record(status=status)
+            
+            # 성공 응답이라도 남은 요청 수가 0이면 리셋 시각까지 이후 요청을 보류
+            server_delay = rate_limit_delay(headers)
+            if server_delay:
+                self.rate_limiter.pause(min(server_delay, policy.max_retry_after))
+            
+            if not (isinstance(status, int) and replayable and policy.should_retry(method, attempt, status=status)):
+                return response
+            
+            delay = policy.delay_for(response, attempt)
+            response.close()
+            self._wait(delay)
+            attempt += 1
+    
+    def _wait(self, seconds: float) -> None:
+        """대기 (작업 기한 전에 끝나지 않는 대기는 바로 DeadlineExceeded)"""
+        if seconds <= 0:
+            return
+        remaining = deadline_remaining()
+        if remaining is not None and seconds >= remaining:
+            raise DeadlineExceeded(f"작업 제한 시간 초과: {seconds:.1f}초 대기 필요")
+        self._sleep(seconds)
+    
+    def close(self) -> None:
+        """세션 및 커넥션 풀 정리"""
+        self.session.close()
+
+
+def fast_json_loads(data: Union[bytes, bytearray, str]) -> Any:
+    """orjson이 있으면 orjson, 없으면 표준 json으로 디코딩"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+class JSONArrayStream:
+    """Incrementally decode the item array of a paged Atlassian response
+    
+    Reads the body chunk by chunk and yields the elements of the top-level
+    ``issues``/``values``/``results`` array one at a time, so only the item
+    being decoded is held in memory. The remaining top-level fields (total,
+    startAt, isLastPage, next, ...) are collected in ``meta``; fields that
+    follow the array are available once iteration has finished. A bare
+    top-level array is streamed as well.
+    """
+    
+    ARRAY_KEYS = ("issues", "values", "results")
+    CHUNK_SIZE = 64 * 1024
+    
+    _WS = b" \t\r\n"
+    _STRUCT = re.compile(rb'[\[\]{}"]')
+    _STRING = re.compile(rb'["\\]')
+    _SCALAR_END = re.compile(rb'[,\]}\s]')
+    
+    def __init__(self, chunks: Iterable[bytes], array_keys: Sequence[str] = ARRAY_KEYS,
+                 loads: Optional[Callable[[bytes], Any]] = None):
+        self._chunks = iter(chunks)
+        self.array_keys = tuple(array_keys)
+        self.loads = loads or fast_json_loads
+        self.meta: Dict[str, Any] = {}
+        self.array_key: Optional[str] = None
+        self._buf = bytearray()
+        self._pos = 0
+        self._eof = False
+    
+    @classmethod
+    def from_response(cls, response: requests.Response, array_keys: Sequence[str] = ARRAY_KEYS,
+                      loads: Optional[Callable[[bytes], Any]] = None) -> "JSONArrayStream":
+        """stream=True로 받은 응답 본문에서 생성"""
+        return cls(response.iter_content(chunk_size=cls.CHUNK_SIZE), array_keys, loads)
+    
+    def _fill(self) -> bool:
+        """다음 청크를 버퍼에 추가 (본문 끝이면 False)"""
+        while not self._eof:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                self._eof = True
+                break
+            if chunk:
+                self._buf += chunk
+                return True
+        return False
+    
+    def _compact(self) -> None:
+        """이미 처리한 앞부분을 버려 버퍼 크기를 항목 하나 수준으로 유지"""
+        if self._pos:
+            del self._buf[:self._pos]
+            self._pos = 0
+    
+    def _peek(self) -> int:
+        """공백을 건너뛰고 다음 바이트 반환"""
+        while True:
+            while self._pos < len(self._buf) and self._buf[self._pos] in self._WS:
+                self._pos += 1
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._fill():
+                raise ValueError("JSON 본문이 예상보다 일찍 끝남")
+    
+    def _search(self, pattern: "re.Pattern", index: int) -> "re.Match":
+        """필요한 만큼 청크를 읽으며 패턴 검색"""
+        while True:
+            match = pattern.search(self._buf, index)
+            if match:
+                return match
+            index = max(index, len(self._buf))
+            if not self._fill():
+                raise ValueError("JSON 본문이 예상보다 일찍 끝남")
+    
+    def _string_end(self, index: int) -> int:
+        """index의 따옴표로 시작하는 문자열의 끝(다음 위치) 반환"""
+        index += 1
+        while True:
+            match = self._search(self._STRING, index)
+            if match.group() == b'"':
+                return match.end()
+            # 이스케이프 문자는 다음 바이트까지 건너뜀
+            index = match.end() + 1
+    
+    def _value_end(self, index: int) -> int:
+        """index에서 시작하는 JSON 값의 끝(다음 위치) 반환"""
+        first = self._buf[index]
+        if first == ord('"'):
+            return self._string_end(index)
+        if first not in b"[{":
+            return self._search(self._SCALAR_END, index).start()
+        
+        depth = 0
+        while True:
+            match = self._search(self._STRUCT, index)
+            token = match.group()
+            if token == b'"':
+                index = self._string_end(match.start())
+                continue
+            index = match.end()
+            depth += 1 if token in b"[{" else -1
+            if depth == 0:
+                return index
+    
+    def _take_value(self) -> bytes:
+        """현재 위치의 값 하나를 잘라 반환"""
+        start = self._pos
+        end = self._value_end(start)
+        self._pos = end
+        return bytes(self._buf[start:end])
+    
+    def _iter_array(self) -> Iterator[Any]:
+        """현재 위치의 배열 요소를 하나씩 디코딩"""
+        self._pos += 1
+        while True:
+            token = self._peek()
+            if token == ord("]"):
+                self._pos += 1
+                return
+            if token == ord(","):
+                self._pos += 1
+                continue
+            item = self.loads(self._take_value())
+            self._compact()
+            yield item
+    
+    def __iter__(self) -> Iterator[Any]:
+        token = self._peek()
+        if token == ord("["):
+            yield from self._iter_array()
+            return
+        if token != ord("{"):
+            raise ValueError("JSON 객체 또는 배열이 아님")
+        
+        self._pos += 1
+        while True:
+            token = self._peek()
+            if token == ord("}"):
+                self._pos += 1
+                return
+            if token == ord(","):
+                self._pos += 1
+                continue
+            key = json.loads(self._take_value())
+            if self._peek() != ord(":"):
+                raise ValueError(f"'{key}' 뒤에 ':'가 없음")
+            self._pos += 1
+            
+            if key in self.array_keys and self.array_key is None and self._peek() == ord("["):
+                self.array_key = key
+                yield from self._iter_array()
+            else:
+                self._peek()
+                self.meta[key] = self.loads(self._take_value())
+            self._compact()
+
+
+# 파일 전송 진행 콜백: (파일 경로, 전송한 바이트, 전체 바이트 또는 None)
+# 여러 파일을 동시에 전송하면 작업 스레드에서 호출되므로 GUI는 시그널로 넘겨야 한다.
+ProgressCallback = Callable[[str, int, Optional[int]], None]
+
+
+class MultipartFileStream:
+    """Single-file multipart/form-data body streamed from disk
+    
+    Behaves as a readable, sized stream so requests sends it with a
+    Content-Length header without loading the file into memory. Progress is
+    reported in file bytes as the body is consumed by the connection.
+    """
+    
+    CHUNK_SIZE = 256 * 1024
+    
+    def __init__(self, file_path: str, field: str = "file", filename: Optional[str] = None,
+                 content_type: str = "application/octet-stream", progress: Optional[ProgressCallback] = None):
+        self.file_path = file_path
+        self.progress = progress
+        self.boundary = uuid.uuid4().hex
+        name = (filename or os.path.basename(file_path)).replace('"', "%22")
+        self._head = (
+            f"--{self.boundary}\r\n"
+            f'Content-Disposition: form-data; name="{field}"; filename="{name}"\r\n'
+            f"Content-Type: {content_type}\r\n\r\n"
+        ).encode("utf-8")
+        self._tail = f"\r\n--{self.boundary}--\r\n".encode("ascii")
+        self._file = open(file_path, "rb")
+        self.file_size = os.fstat(self._file.fileno()).st_size
+        self.len = len(self._head) + self.file_size + len(self._tail)
+        self._pending = bytearray(self._head)
+        self._file_done = False
+        self._tail_sent = False
+        self.bytes_sent = 0
+    
+    @property
+    def content_type(self) -> str:
+        """Content-Type 헤더 값"""
+        return f"multipart/form-data; boundary={self.boundary}"
+    
+    def __len__(self) -> int:
+        return self.len
+    
+    def read(self, size: int = -1) -> bytes:
+        """최대 size 바이트의 본문 반환 (끝이면 b"")"""
+        if size is None or size < 0:
+            size = self.len
+        while len(self._pending) < size and not self._tail_sent:
+            if not self._file_done:
+                chunk = self._file.read(max(size - len(self._pending), self.CHUNK_SIZE))
+                if chunk:
+                    self._pending += chunk
+                    continue
+                self._file_done = True
+            self._pending += self._tail
+            self._tail_sent = True
+        
+        data = bytes(self._pending[:size])
+        del self._pending[:size]
+        self.bytes_sent += len(data)
+        if data and self.progress:
+            done = min(max(self.bytes_sent - len(self._head), 0), self.file_size)
+            self.progress(self.file_path, done, self.file_size)
+        return data
+    
+    def __iter__(self) -> Iterator[bytes]:
+        while True:
+            data = self.read(self.CHUNK_SIZE)
+            if not data:
+                return
+            yield data
+    
+    def close(self) -> None:
+        """파일 닫기"""
+        self._file.close()
+    
+    def __enter__(self) -> "MultipartFileStream":
+        return self
+    
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+
+def upload_file(transport: HTTPTransport, url: str, file_path: str, auth: Any = None,
+                headers: Optional[Dict[str, str]] = None, field: str = "file",
+                progress: Optional[ProgressCallback] = None) -> requests.Response:
+    """
+    파일 하나를 multipart/form-data로 스트리밍 업로드
+    
+    본문을 디스크에서 읽으며 전송하므로 파일 크기와 무관하게 메모리 사용량이 일정하다.
+    스트림 본문은 다시 보낼 수 없어 transport 재시도 대상에서 제외된다.
+    """
+    with MultipartFileStream(file_path, field, progress=progress) as body:
+        request_headers = dict(headers or {})
+        request_headers["Content-Type"] = body.content_type
+        return transport.request("POST", url, auth=auth, headers=request_headers, data=body)
+
+
+def _content_total(response: requests.Response, offset: int) -> Optional[int]:
+    """Content-Range 또는 Content-Length로 전체 크기 계산"""
+    content_range = response.headers.get("Content-Range", "")
+    if "/" in content_range:
+        total = content_range.rsplit("/", 1)[1].strip()
+        if total.isdigit():
+            return int(total)
+    length = response.headers.get("Content-Length")
+    if length and length.isdigit():
+        return offset + int(length)
+    return None
+
+
+def download_file(transport: HTTPTransport, url: str, dest_path: str, auth: Any = None,
+                  headers: Optional[Dict[str, str]] = None, progress: Optional[ProgressCallback] = None,
+                  max_resumes: int = 3, chunk_size: int = 256 * 1024) -> str:
+    """
+    파일 다운로드 (HTTP Range로 이어받기)
+    
+    받는 중인 내용은 dest_path + ".part"에 기록되며, 연결이 끊기면 받은 위치부터
+    Range 요청으로 최대 max_resumes번 이어받는다. 이전 실행에서 남은 .part 파일도
+    이어서 받는다. 서버가 Range를 무시하고 200을 보내면 처음부터 다시 쓴다.
+    """
+    part_path = f"{dest_path}.part"
+    base_headers = {key: value for key, value in (headers or {}).items() if key.lower() != "content-type"}
+    attempt = 0
+    
+    while True:
+        offset = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+        request_headers = dict(base_headers)
+        if offset:
+            request_headers["Range"] = f"bytes={offset}-"
+        
+        response = transport.request("GET", url, auth=auth, headers=request_headers, stream=True)
+        try:
+            # 이미 끝까지 받은 .part 파일
+            if response.status_code == 416 and offset:
+                break
+            response.raise_for_status()
+            if response.status_code != 206:
+                offset = 0
+            total = _content_total(response, offset)
+            
+            done = offset
+            with open(part_path, "ab" if offset else "wb") as f:
+                if progress:
+                    progress(dest_path, done, total)
+                for chunk in response.iter_content(chunk_size=chunk_size):
+                    f.write(chunk)
+                    done += len(chunk)
+                    if progress:
+                        progress(dest_path, done, total)
+            if total is None or done >= total:
+                break
+            error: Exception = requests.exceptions.ChunkedEncodingError(f"{done}/{total} 바이트에서 전송 중단")
+        except (requests.exceptions.ChunkedEncodingError, requests.exceptions.ConnectionError) as e:
+            error = e
+        finally:
+            response.close()
+        
+        if attempt >= max_resumes:
+            raise error
+        transport._sleep(transport.retry_policy.backoff(attempt))
+        attempt += 1
+    
+    os.replace(part_path, dest_path)
+    return dest_path
+
+
+def run_transfers(transfer: Callable[[str], Any], file_paths: Sequence[str], max_workers: int = 4) -> List[Dict[str, Any]]:
+    """
+    여러 파일 전송을 제한된 스레드 풀에서 동시에 실행
+    
+    Returns:
+        입력 순서와 같은 파일별 결과 목록 ({"path", "success", "result", "error"})
+    """
+    def run(path: str) -> Dict[str, Any]:
+        try:
+            return {"path": path, "success": True, "result": transfer(path), "error": None}
+        except Exception as e:
+            return {"path": path, "success": False, "result": None, "error": str(e)}
+    
+    if len(file_paths) <= 1 or max_workers <= 1:
+        return [run(path) for path in file_paths]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(file_paths))) as executor:
+        futures = [submit_in_context(executor, run, path) for path in file_paths]
+        return [future.result() for future in futures]
+
+
+# fields/expand 파라미터: "summary,status" 또는 ["summary", "status"]
+FieldSpec = Union[str, Sequence[str]]
+
+_transports: Dict[str, HTTPTransport] = {}
+_transports_lock = threading.Lock()
+
+
+def request_key(url: str, params: Optional[Dict[str, Any]] = None, auth: Any = None,
+                headers: Optional[Dict[str, str]] = None) -> str:
+    """요청 동일성 판단용 키 (URL, 파라미터, 인증 사용자, 헤더)"""
+    user = auth[0] if isinstance(auth, (tuple, list)) and auth else getattr(auth, "username", None)
+    raw = json.dumps([url, sorted((params or {}).items()), user, sorted((headers or {}).items())],
+                     default=str, ensure_ascii=False)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def transport_key(domain_url: str) -> str:
+    """도메인 URL에서 scheme://host[:port] 키 추출"""
+    parts = urlsplit(domain_url)
+    return f"{parts.scheme.lower()}://{parts.netloc.lower()}"
+
+
+def get_transport(domain_url: str, pool_maxsize: Optional[int] = None) -> HTTPTransport:
+    """
+    도메인별 공유 transport 조회 (없으면 생성)
+    
+    같은 호스트를 가리키는 JiraAPI/ConfluenceAPI/BitbucketAPI는 하나의 세션과
+    커넥션 풀을 함께 사용한다.
+    """
+    host_key = transport_key(domain_url)
+    with _transports_lock:
+        transport = _transports.get(host_key)
+        if transport is None:
+            transport = HTTPTransport()
+            _transports[host_key] = transport
+    if pool_maxsize is not None:
+        transport.set_pool_size(host_key, pool_maxsize)
+    return transport
+
+
+def close_transports() -> None:
+    """공유 transport 전체 정리"""
+    with _transports_lock:
+        transports = list(_transports.values())
+        _transports.clear()
+    for transport in transports:
+        transport.close()
+
+
+class JQLFunction(str):
+    """JQL function call or keyword rendered without quotes (e.g. currentUser(), EMPTY)"""
+
+
+class JQLBuilder:
+    """Composable JQL query whose values are always quoted and escaped"""
+    
+    CURRENT_USER = JQLFunction("currentUser()")
+    EMPTY = JQLFunction("EMPTY")
+    
+    # text ~ 검색값에서 Lucene 문법으로 해석되는 문자 (역슬래시로 이스케이프)
+    TEXT_SPECIAL_CHARS = frozenset('+-&|!(){}[]^~*?\\:/')
+    OPERATORS = frozenset({"=", "!=", "~", "!~", ">", ">=", "<", "<=", "IN", "NOT IN", "IS", "IS NOT"})
+    # DB 선택(db1~db3)을 대응시키는 기본 이슈 필드
+    DB_SELECTION_FIELD = "labels"
+    
+    _FIELD_RE = re.compile(r"^(?:[A-Za-z_][A-Za-z0-9_.]*|cf\[\d+\])$")
+    
+    def __init__(self):
+        self._clauses: List[str] = []
+        self._order: List[str] = []
+    
+    @staticmethod
+    def quote(value: Any) -> str:
+        """JQL 문자열 리터럴로 인용 (JQLFunction과 숫자는 그대로)"""
+        if isinstance(value, JQLFunction):
+            return str(value)
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return str(value)
+        return '"' + str(value).replace("\\", "\\\\").replace('"', '\\"') + '"'
+    
+    @classmethod
+    def field(cls, name: str) -> str:
+        """필드 이름 (공백 등이 포함된 사용자 정의 필드 이름은 인용)"""
+        return name if cls._FIELD_RE.match(name) else cls.quote(name)
+    
+    @classmethod
+    def escape_text(cls, text: str) -> str:
+        """text ~ 검색어의 Lucene 예약 문자 이스케이프 (검색어를 문자 그대로 검색)"""
+        return "".join("\\" + char if char in cls.TEXT_SPECIAL_CHARS else char for char in text)
+    
+    def where(self, field: str, operator: str, value: Any) -> 'JQLBuilder':
+        """
+        조건 추가 (값이 None이거나 비어 있으면 무시)
+        
+        목록 값은 = / != 를 in / not in 으로 바꾼다.
+        """
+        if value is None or value == "" or (isinstance(value, (list, tuple, set, frozenset)) and not value):
+            return self
+        operator = " ".join(operator.upper().split())
+        if operator not in self.OPERATORS:
+            raise ValueError(f"지원하지 않는 JQL 연산자: {operator}")
+        if isinstance(value, (list, tuple, set, frozenset)):
+            operator = {"=": "IN", "!=": "NOT IN"}.get(operator, operator)
+            if operator not in ("IN", "NOT IN"):
+                raise ValueError(f"목록 값에는 사용할 수 없는 연산자: {operator}")
+            values = sorted(value) if isinstance(value, (set, frozenset)) else value
+            rendered = "(" + ", ".join(self.quote(item) for item in values) + ")"
+        else:
+            rendered = self.quote(value)
+        self._clauses.append(f"{self.field(field)} {operator.lower()} {rendered}")
+        return self
+    
+    def text(self, query: Optional[str], field: str = "text") -> 'JQLBuilder':
+        """전문 검색 조건 (text ~ "...")"""
+        query = (query or "").strip()
+        if query:
+            self._clauses.append(f"{self.field(field)} ~ {self.quote(self.escape_text(query))}")
+        return self
+    
+    def project(self, keys: Union[str, Sequence[str], None]) -> 'JQLBuilder':
+        """프로젝트 조건 (목록이면 in)"""
+        return self.where("project", "=", keys)
+    
+    def status(self, statuses: Union[str, Sequence[str], None]) -> 'JQLBuilder':
+        """상태 조건 (목록이면 in)"""
+        return self.where("status", "=", statuses)
+    
+    def assignee(self, assignee: Union[str, Sequence[str], None]) -> 'JQLBuilder':
+        """담당자 조건 (CURRENT_USER는 currentUser(), EMPTY는 미할당)"""
+        if assignee is self.EMPTY:
+            return self.where("assignee", "IS", self.EMPTY)
+        return self.where("assignee", "=", assignee)
+    
+    def labels(self, labels: Union[str, Sequence[str], None]) -> 'JQLBuilder':
+        """레이블 조건 (목록이면 하나라도 일치)"""
+        return self.where("labels", "=", labels)
+    
+    def components(self, components: Union[str, Sequence[str], None]) -> 'JQLBuilder':
+        """컴포넌트 조건 (목록이면 하나라도 일치)"""
+        return self.where("component", "=", components)
+    
+    def db_selection(self, selection: Optional[Dict[str, str]],
+                     field: str = DB_SELECTION_FIELD) -> 'JQLBuilder':
+        """
+        DB 선택 조건
+        
+        선택된 항목(db1, db2, db3)마다 field에 그 값이 있는 이슈만 남긴다.
+        field는 인스턴스에 실제로 있는 필드여야 한다 (없는 컴포넌트 값은 Jira가 쿼리를 거부함).
+        """
+        for level in sorted(selection or {}):
+            value = selection[level]
+            if value:
+                self.where(field, "=", value)
+        return self
+    
+    def any_of(self, *builders: 'JQLBuilder') -> 'JQLBuilder':
+        """하위 조건 중 하나라도 만족 (OR로 묶어 괄호 처리)"""
+        parts = [f"({builder.where_clause()})" if len(builder._clauses) > 1 else builder.where_clause()
+                 for builder in builders if builder._clauses]
+        if len(parts) == 1:
+            self._clauses.append(parts[0])
+        elif parts:
+            self._clauses.append("(" + " OR ".join(parts) + ")")
+        return self
+    
+    def raw(self, jql: Optional[str]) -> 'JQLBuilder':
+        """신뢰할 수 있는 JQL 조각을 그대로 추가 (사용자 입력에는 사용하지 않음)"""
+        if jql and jql.strip():
+            self._clauses.append(f"({jql.strip()})")
+        return self
+    
+    def order_by(self, field: str, descending: bool = False) -> 'JQLBuilder':
+        """정렬 조건 추가"""
+        self._order.append(f"{self.field(field)} {'DESC' if descending else 'ASC'}")
+        return self
+    
+    def where_clause(self) -> str:
+        """ORDER BY를 제외한 조건 부분"""
+        return " AND ".join(self._clauses)
+    
+    def build(self) -> str:
+        """JQL 문자열 생성"""
+        order = f"ORDER BY {', '.join(self._order)}" if self._order else ""
+        return " ".join(part for part in (self.where_clause(), order) if part)
+    
+    def __bool__(self) -> bool:
+        return bool(self._clauses or self._order)
+    
+    def __str__(self) -> str:
+        return self.build()
 
 
 class JiraAPI:
     """JIRA REST API Client"""
     
-    def __init__(self, domain_url: str, user_id: str, password: str):
+    # /issue/bulk 요청당 최대 이슈 수
+    BULK_CREATE_LIMIT = 50
+    # get_issues에서 사용하는 요청 URL 최대 길이와 검색당 최대 키 수
+    MAX_URL_LENGTH = 8000
+    KEYS_PER_QUERY = 100
+    
+    def __init__(self, domain_url: str, user_id: str, password: str, transport: Optional[HTTPTransport] = None):
         """
         Initialize JIRA API client
         
@@ -19,11 +1540,13 @@ class JiraAPI:
             domain_url: JIRA domain URL (e.g., https://yourdomain.atlassian.net)
             user_id: User email or username
             password: API token or password
+            transport: Shared HTTP transport (default: per-host pooled transport)
         """
         self.domain_url: str = domain_url.rstrip('/')
         self.user_id: str = user_id
         self.password: str = password
         self.auth = (user_id, password)
+        self.transport: HTTPTransport = transport or get_transport(self.domain_url)
         self.headers: Dict[str, str] = {
             "Accept": "application/json",
             "Content-Type": "application/json"
@@ -40,26 +1563,155 @@ class JiraAPI:
             "params": params
         }
         
-        if data and method in ["POST", "PUT", "PATCH"]:
-            kwargs["json"] = data
+        if data and method in ["POST", "PUT", "PATCH"]:
+            kwargs["json"] = data
+        
+        try:
+            response = self.transport.request(method, url, **kwargs)
+            response.raise_for_status()
+            
+            if response.text:
+                return response.json()
+            return {}
+        except requests.exceptions.RequestException as e:
+            raise Exception(f"JIRA API 요청 실패: {str(e)}")
+    
+    def add_instrumentation(self, hook: Optional[RequestHook] = None) -> RequestHook:
+        """
+        요청 계측 훅 등록 (기본값: 새 MetricsRecorder)
+        
+        transport에 등록되므로 같은 transport를 공유하는 다른 클라이언트의 요청도 기록된다.
+        """
+        return self.transport.add_hook(hook if hook is not None else MetricsRecorder())
+    
+    def _request_stream(self, method: str, endpoint: str, params: Optional[Dict] = None) -> requests.Response:
+        """본문을 읽지 않은 스트리밍 응답 반환 (JSONArrayStream으로 소비 후 close 필요)"""
+        url: str = f"{self.domain_url}{self.api_version}{endpoint}"
+        try:
+            response = self.transport.request(method, url, auth=self.auth, headers=self.headers,
+                                              params=params, stream=True)
+        except requests.exceptions.RequestException as e:
+            raise Exception(f"JIRA API 요청 실패: {str(e)}")
+        try:
+            response.raise_for_status()
+        except requests.exceptions.RequestException as e:
+            response.close()
+            raise Exception(f"JIRA API 요청 실패: {str(e)}")
+        return response
+    
+    def _projection_params(self, fields: Optional[FieldSpec] = None, expand: Optional[FieldSpec] = None) -> Dict[str, str]:
+        """fields/expand 파라미터 생성 (리스트는 콤마로 결합)"""
+        params: Dict[str, str] = {}
+        if fields:
+            params["fields"] = fields if isinstance(fields, str) else ",".join(fields)
+        if expand:
+            params["expand"] = expand if isinstance(expand, str) else ",".join(expand)
+        return params
+    
+    # Issue 관련 메서드
+    def get_issue(self, issue_key: str, fields: Optional[FieldSpec] = None, expand: Optional[FieldSpec] = None) -> Dict[str, Any]:
+        """
+        이슈 조회
+        
+        Args:
+            issue_key: 이슈 키
+            fields: 응답에 포함할 필드 목록 (예: ["summary", "status"])
+            expand: 확장할 항목 목록 (예: ["renderedFields", "changelog"])
+        """
+        params = self._projection_params(fields, expand)
+        return self._request("GET", f"/issue/{issue_key}", params=params or None)
+    
+    @staticmethod
+    def _normalize_keys(issue_keys: Sequence[str]) -> List[str]:
+        """이슈 키 정규화 (대문자, 공백 제거, 순서 유지 중복 제거)"""
+        keys: List[str] = []
+        seen = set()
+        for key in issue_keys:
+            key = key.strip().upper()
+            if key and key not in seen:
+                seen.add(key)
+                keys.append(key)
+        return keys
+    
+    @staticmethod
+    def _quote_key(key: str) -> str:
+        """JQL 문자열 리터럴로 이슈 키 인용"""
+        return JQLBuilder.quote(key)
+    
+    def _key_in_jql(self, keys: Sequence[str]) -> str:
+        """key in (...) JQL 생성"""
+        return f"key in ({', '.join(self._quote_key(key) for key in keys)})"
+    
+    def _key_chunks(self, keys: Sequence[str], params: Dict[str, Any]) -> List[List[str]]:
+        """
+        URL 길이 제한(MAX_URL_LENGTH) 안에 들어가도록 이슈 키를 나눔
+        
+        인코딩된 jql 길이를 기준으로 계산하며, 청크당 키 수는 검색 한 페이지
+        최대치(KEYS_PER_QUERY)를 넘지 않는다.
+        """
+        # 빈 청크 기준 URL 길이 (maxResults 자릿수 증가분 여유 포함)
+        base = len(f"{self.domain_url}{self.api_version}/search?") + len(urlencode(self._key_chunk_params([], params))) + 2
+        budget = self.MAX_URL_LENGTH - base
+        
+        chunks: List[List[str]] = []
+        current: List[str] = []
+        used = 0
+        for key in keys:
+            cost = len(quote_plus(self._quote_key(key) + ", "))
+            if current and (used + cost > budget or len(current) >= self.KEYS_PER_QUERY):
+                chunks.append(current)
+                current, used = [], 0
+            current.append(key)
+            used += cost
+        if current:
+            chunks.append(current)
+        return chunks
+    
+    def _key_chunk_params(self, chunk: Sequence[str], params: Dict[str, Any]) -> Dict[str, Any]:
+        """청크 하나에 대한 검색 파라미터 (존재하지 않는 키는 오류 대신 경고로 처리)"""
+        return dict(params, jql=self._key_in_jql(chunk), maxResults=len(chunk), startAt=0, validateQuery="warn")
+    
+    @staticmethod
+    def _collect_issues(keys: Sequence[str], pages: Sequence[Dict[str, Any]]) -> Dict[str, Any]:
+        """검색 결과를 이슈 키 기준으로 모으고 누락된 키를 계산"""
+        found: Dict[str, Dict[str, Any]] = {}
+        for page in pages:
+            for issue in page.get("issues", []):
+                found[issue.get("key", "").upper()] = issue
+        return {
+            "issues": {key: found[key] for key in keys if key in found},
+            "missing": [key for key in keys if key not in found]
+        }
+    
+    def get_issues(self, issue_keys: Sequence[str], fields: Optional[FieldSpec] = None,
+                   expand: Optional[FieldSpec] = None, max_workers: int = 4) -> Dict[str, Any]:
+        """
+        여러 이슈를 키로 한 번에 조회
+        
+        키를 URL 길이 제한에 맞춘 key in (...) JQL 청크로 나누어 병렬로 검색한다.
+        
+        Returns:
+            {"issues": {이슈 키: 이슈}, "missing": [조회되지 않은 키]}
+            (삭제/권한 없음/다른 키로 이동된 이슈는 missing에 포함)
+        """
+        keys = self._normalize_keys(issue_keys)
+        params = self._projection_params(fields, expand)
+        chunks = self._key_chunks(keys, params)
+        
+        def fetch(chunk: List[str]) -> Dict[str, Any]:
+            return self._request("GET", "/search", params=self._key_chunk_params(chunk, params))
         
-        try:
-            response = requests.request(method, url, **kwargs)
-            response.raise_for_status()
-            
-            if response.text:
-                return response.json()
-            return {}
-        except requests.exceptions.RequestException as e:
-            raise Exception(f"JIRA API 요청 실패: {str(e)}")
-    
-    # Issue 관련 메서드
-    def get_issue(self, issue_key: str) -> Dict[str, Any]:
-        """이슈 조회"""
-        return self._request("GET", f"/issue/{issue_key}")
+        if len(chunks) <= 1 or max_workers <= 1:
+            pages = [fetch(chunk) for chunk in chunks]
+        else:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(chunks))) as executor:
+                futures = [submit_in_context(executor, fetch, chunk) for chunk in chunks]
+                pages = [future.result() for future in futures]
+        return self._collect_issues(keys, pages)
     
-    def create_issue(self, project_key: str, issue_type: str, summary: str, description: str = "", **kwargs) -> Dict[str, Any]:
-        """이슈 생성"""
+    def build_issue_payload(self, project_key: str, issue_type: str, summary: str, description: str = "",
+                            **kwargs) -> Dict[str, Any]:
+        """이슈 생성 요청 본문 구성 (create_issue/bulk_create_issues 공용)"""
         data: Dict[str, Any] = {
             "fields": {
                 "project": {"key": project_key},
@@ -87,8 +1739,95 @@ class JiraAPI:
         if kwargs:
             data["fields"].update(kwargs)
         
+        return data
+    
+    def create_issue(self, project_key: str, issue_type: str, summary: str, description: str = "", **kwargs) -> Dict[str, Any]:
+        """이슈 생성"""
+        data = self.build_issue_payload(project_key, issue_type, summary, description, **kwargs)
         return self._request("POST", "/issue", data)
     
+    def _bulk_payload(self, issue: Dict[str, Any]) -> Dict[str, Any]:
+        """bulk 항목을 issueUpdates 요소로 변환 ("fields"가 있으면 그대로 사용)"""
+        if "fields" in issue:
+            return issue
+        return self.build_issue_payload(**issue)
+    
+    def _bulk_chunk_results(self, start: int, chunk: Sequence[Dict[str, Any]],
+                            response: Optional[Dict[str, Any]] = None,
+                            error: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        /issue/bulk 응답을 입력 순서의 항목별 결과로 변환
+        
+        응답의 issues에는 성공한 항목만 순서대로 들어 있고, 실패 항목은
+        errors[].failedElementNumber(청크 내 인덱스)로 표시된다.
+        """
+        results: List[Dict[str, Any]] = [
+            {"index": start + i, "success": False, "key": None, "id": None, "error": error}
+            for i in range(len(chunk))
+        ]
+        if response is None:
+            return results
+        
+        failed: Dict[int, str] = {}
+        for item in response.get("errors", []):
+            number = item.get("failedElementNumber")
+            if number is None:
+                continue
+            detail = item.get("elementErrors", {})
+            messages = list(detail.get("errorMessages", [])) + [
+                f"{field}: {message}" for field, message in detail.get("errors", {}).items()
+            ]
+            failed[number] = "; ".join(messages) or f"HTTP {item.get('status')}"
+        
+        created = iter(response.get("issues", []))
+        for i, result in enumerate(results):
+            if i in failed:
+                result["error"] = failed[i]
+                continue
+            issue = next(created, None)
+            if issue is None:
+                result["error"] = "응답에 생성 결과가 없음"
+                continue
+            result.update(success=True, key=issue.get("key"), id=issue.get("id"))
+        return results
+    
+    def _bulk_chunks(self, issues: Sequence[Dict[str, Any]], chunk_size: int) -> List[tuple]:
+        """(시작 인덱스, 청크) 목록 생성"""
+        chunk_size = max(1, min(chunk_size, self.BULK_CREATE_LIMIT))
+        return [(start, issues[start:start + chunk_size]) for start in range(0, len(issues), chunk_size)]
+    
+    def _create_chunk(self, start: int, chunk: Sequence[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """청크 하나를 /issue/bulk로 생성 (요청 자체가 실패하면 청크 전체를 실패로 기록)"""
+        data = {"issueUpdates": [self._bulk_payload(issue) for issue in chunk]}
+        try:
+            response = self._request("POST", "/issue/bulk", data)
+        except Exception as e:
+            return self._bulk_chunk_results(start, chunk, error=str(e))
+        return self._bulk_chunk_results(start, chunk, response)
+    
+    def bulk_create_issues(self, issues: Sequence[Dict[str, Any]], chunk_size: int = 50,
+                           max_workers: int = 4) -> List[Dict[str, Any]]:
+        """
+        여러 이슈를 /issue/bulk로 일괄 생성
+        
+        Args:
+            issues: create_issue 인자(project_key, issue_type, summary, ...) 딕셔너리
+                    또는 {"fields": {...}} 형태의 요청 본문 목록
+            chunk_size: 요청당 이슈 수 (Jira 제한 50)
+            max_workers: 동시에 보내는 청크 요청 수
+        
+        Returns:
+            입력 순서와 같은 항목별 결과 목록
+            ({"index", "success", "key", "id", "error"})
+        """
+        chunks = self._bulk_chunks(issues, chunk_size)
+        if len(chunks) <= 1 or max_workers <= 1:
+            return [result for start, chunk in chunks for result in self._create_chunk(start, chunk)]
+        
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(chunks))) as executor:
+            futures = [submit_in_context(executor, self._create_chunk, start, chunk) for start, chunk in chunks]
+            return [result for future in futures for result in future.result()]
+    
     def update_issue(self, issue_key: str, fields: Dict[str, Any]) -> Dict[str, Any]:
         """이슈 업데이트"""
         data: Dict[str, Any] = {"fields": fields}
@@ -119,6 +1858,33 @@ class JiraAPI:
         }
         return self._request("POST", f"/issue/{issue_key}/comment", data)
     
+    # 첨부파일 관련 메서드
+    def add_attachment(self, issue_key: str, file_path: str,
+                       progress: Optional[ProgressCallback] = None) -> List[Dict[str, Any]]:
+        """이슈에 파일 첨부 (디스크에서 스트리밍 업로드)"""
+        url: str = f"{self.domain_url}{self.api_version}/issue/{issue_key}/attachments"
+        headers = {"Accept": "application/json", "X-Atlassian-Token": "no-check"}
+        try:
+            response = upload_file(self.transport, url, file_path, auth=self.auth, headers=headers, progress=progress)
+            response.raise_for_status()
+            return response.json()
+        except requests.exceptions.RequestException as e:
+            raise Exception(f"JIRA API 요청 실패: {str(e)}")
+    
+    def add_attachments(self, issue_key: str, file_paths: Sequence[str], max_workers: int = 4,
+                        progress: Optional[ProgressCallback] = None) -> List[Dict[str, Any]]:
+        """여러 파일을 동시에 첨부 (파일별 결과 반환)"""
+        return run_transfers(lambda path: self.add_attachment(issue_key, path, progress), file_paths, max_workers)
+    
+    def download_attachment(self, attachment_id: str, dest_path: str,
+                            progress: Optional[ProgressCallback] = None) -> str:
+        """첨부파일 다운로드 (중단된 경우 이어받기)"""
+        url: str = f"{self.domain_url}{self.api_version}/attachment/content/{attachment_id}"
+        try:
+            return download_file(self.transport, url, dest_path, auth=self.auth, progress=progress)
+        except requests.exceptions.RequestException as e:
+            raise Exception(f"JIRA API 요청 실패: {str(e)}")
+    
     # 프로젝트 관련 메서드
     def get_projects(self) -> List[Dict[str, Any]]:
         """모든 프로젝트 조회"""
@@ -129,14 +1895,129 @@ class JiraAPI:
         return self._request("GET", f"/project/{project_key}")
     
     # 검색 관련 메서드
-    def search_issues(self, jql: str, max_results: int = 50, start_at: int = 0) -> Dict[str, Any]:
-        """JQL로 이슈 검색"""
+    def search_issues(self, jql: str, max_results: int = 50, start_at: int = 0,
+                      fields: Optional[FieldSpec] = None, expand: Optional[FieldSpec] = None) -> Dict[str, Any]:
+        """
+        JQL로 이슈 검색
+        
+        fields를 지정하면 해당 필드만 응답에 포함되어 페이로드가 크게 줄어든다.
+        """
+        return self._request("GET", "/search", params=self._search_params(jql, max_results, start_at, fields, expand))
+    
+    def _search_params(self, jql: str, max_results: int, start_at: int,
+                       fields: Optional[FieldSpec] = None, expand: Optional[FieldSpec] = None) -> Dict[str, Any]:
+        """검색 요청 파라미터 생성"""
         params: Dict[str, Any] = {
             "jql": jql,
             "maxResults": max_results,
             "startAt": start_at
         }
-        return self._request("GET", "/search", params=params)
+        params.update(self._projection_params(fields, expand))
+        return params
+    
+    def _stream_search_page(self, params: Dict[str, Any], loads: Optional[Callable[[bytes], Any]] = None):
+        """검색 한 페이지를 스트리밍 디코딩 (이슈를 하나씩 반환하고 마지막에 (메타 정보, 이슈 수) 반환)"""
+        response = self._request_stream("GET", "/search", params)
+        try:
+            page = JSONArrayStream.from_response(response, ("issues",), loads)
+            count = 0
+            for issue in page:
+                count += 1
+                yield issue
+            return page.meta, count
+        except requests.exceptions.RequestException as e:
+            raise Exception(f"JIRA API 요청 실패: {str(e)}")
+        finally:
+            response.close()
+    
+    def iter_search_issues(self, jql: str, page_size: int = 50, start_at: int = 0,
+                           fields: Optional[FieldSpec] = None, expand: Optional[FieldSpec] = None,
+                           stream: bool = False, loads: Optional[Callable[[bytes], Any]] = None) -> Iterator[Dict[str, Any]]:
+        """
+        JQL 검색 결과 전체를 페이지 단위로 지연 조회
+        
+        페이지가 도착할 때마다 이슈를 하나씩 반환하며, 소비자가 순회를 멈추면
+        다음 페이지를 요청하지 않는다.
+        
+        stream=True면 응답 본문 전체를 버퍼링하지 않고 issues 배열을 소켓에서
+        한 항목씩 디코딩한다 (대량 내보내기용). loads로 디코더를 바꿀 수 있으며
+        기본값은 orjson(설치된 경우) 또는 json이다.
+        """
+        while True:
+            if stream:
+                params = self._search_params(jql, page_size, start_at, fields, expand)
+                result, count = yield from self._stream_search_page(params, loads)
+            else:
+                result = self.search_issues(jql, max_results=page_size, start_at=start_at, fields=fields, expand=expand)
+                issues: List[Dict[str, Any]] = result.get("issues", [])
+                for issue in issues:
+                    yield issue
+                count = len(issues)
+            
+            start_at += count
+            total = result.get("total")
+            # 서버가 maxResults를 낮춰 응답할 수 있으므로 total이 있으면 total 기준으로 종료
+            if not count or (total is not None and start_at >= total):
+                break
+            if total is None and count < page_size:
+                break
+    
+    def iter_search_issues_parallel(self, jql: str, page_size: int = 100, max_workers: int = 4,
+                                    ordered: bool = True, fields: Optional[FieldSpec] = None,
+                                    expand: Optional[FieldSpec] = None) -> Iterator[Dict[str, Any]]:
+        """
+        JQL 검색 결과를 여러 페이지 동시 조회로 가져오기
+        
+        첫 페이지의 total로 나머지 startAt 오프셋을 계산한 뒤 제한된 스레드 풀에서
+        병렬로 요청한다. ordered=True면 페이지 순서대로, False면 도착 순서대로 반환한다.
+        동시에 보관하는 페이지 수는 max_workers * 2개로 제한된다.
+        """
+        first = self.search_issues(jql, max_results=page_size, start_at=0, fields=fields, expand=expand)
+        issues: List[Dict[str, Any]] = first.get("issues", [])
+        for issue in issues:
+            yield issue
+        
+        total = first.get("total")
+        if not issues or total is None or len(issues) >= total:
+            return
+        
+        # 서버가 실제로 적용한 페이지 크기 기준으로 오프셋 계산
+        step = len(issues)
+        offsets = iter(range(step, total, step))
+        window = max_workers * 2
+        
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        pending: "deque[Future]" = deque()
+        
+        def submit_next() -> bool:
+            offset = next(offsets, None)
+            if offset is None:
+                return False
+            pending.append(submit_in_context(executor, self.search_issues, jql, step, offset, fields, expand))
+            return True
+        
+        try:
+            while len(pending) < window and submit_next():
+                pass
+            
+            while pending:
+                if ordered:
+                    done = [pending.popleft()]
+                else:
+                    completed, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    done = [future for future in pending if future in completed]
+                    for future in done:
+                        pending.remove(future)
+                
+                for future in done:
+                    for issue in future.result().get("issues", []):
+                        yield issue
+                    submit_next()
+        finally:
+            # 소비자가 중간에 멈춘 경우 아직 시작하지 않은 요청은 취소
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=True)
     
     # 사용자 관련 메서드
     def get_current_user(self) -> Dict[str, Any]:
@@ -147,7 +2028,7 @@ class JiraAPI:
 class ConfluenceAPI:
     """Confluence REST API Client"""
     
-    def __init__(self, domain_url: str, user_id: str, password: str):
+    def __init__(self, domain_url: str, user_id: str, password: str, transport: Optional[HTTPTransport] = None):
         """
         Initialize Confluence API client
         
@@ -155,6 +2036,7 @@ class ConfluenceAPI:
             domain_url: Confluence domain URL (e.g., https://yourdomain.atlassian.net/wiki)
             user_id: User email or username
             password: API token or password
+            transport: Shared HTTP transport (default: per-host pooled transport)
         """
         self.domain_url: str = domain_url.rstrip('/')
         if not self.domain_url.endswith('/wiki'):
@@ -163,6 +2045,7 @@ class ConfluenceAPI:
         self.user_id: str = user_id
         self.password: str = password
         self.auth = (user_id, password)
+        self.transport: HTTPTransport = transport or get_transport(self.domain_url)
         self.headers: Dict[str, str] = {
             "Accept": "application/json",
             "Content-Type": "application/json"
@@ -183,7 +2066,7 @@ class ConfluenceAPI:
             kwargs["json"] = data
         
         try:
-            response = requests.request(method, url, **kwargs)
+            response = self.transport.request(method, url, **kwargs)
             response.raise_for_status()
             
             if response.text:
@@ -192,6 +2075,14 @@ class ConfluenceAPI:
         except requests.exceptions.RequestException as e:
             raise Exception(f"Confluence API 요청 실패: {str(e)}")
     
+    def add_instrumentation(self, hook: Optional[RequestHook] = None) -> RequestHook:
+        """
+        요청 계측 훅 등록 (기본값: 새 MetricsRecorder)
+        
+        transport에 등록되므로 같은 transport를 공유하는 다른 클라이언트의 요청도 기록된다.
+        """
+        return self.transport.add_hook(hook if hook is not None else MetricsRecorder())
+    
     # 페이지 관련 메서드
     def get_page_by_id(self, page_id: str, expand: str = "body.storage,version") -> Dict[str, Any]:
         """페이지 ID로 조회"""
@@ -273,23 +2164,26 @@ class ConfluenceAPI:
         """페이지 첨부파일 조회"""
         return self._request("GET", f"/content/{page_id}/child/attachment")
     
-    def upload_attachment(self, page_id: str, file_path: str) -> Dict[str, Any]:
+    def upload_attachment(self, page_id: str, file_path: str,
+                          progress: Optional[ProgressCallback] = None) -> Dict[str, Any]:
         """첨부파일 업로드"""
-        # 파일 업로드는 multipart/form-data 필요
+        # 파일 업로드는 multipart/form-data 필요 (디스크에서 스트리밍)
         url: str = f"{self.domain_url}{self.api_version}/content/{page_id}/child/attachment"
-        
-        with open(file_path, 'rb') as f:
-            files = {'file': f}
-            headers = {"X-Atlassian-Token": "nocheck"}
-            response = requests.post(url, auth=self.auth, files=files, headers=headers)
-            response.raise_for_status()
-            return response.json()
+        headers = {"X-Atlassian-Token": "nocheck"}
+        response = upload_file(self.transport, url, file_path, auth=self.auth, headers=headers, progress=progress)
+        response.raise_for_status()
+        return response.json()
+    
+    def upload_attachments(self, page_id: str, file_paths: Sequence[str], max_workers: int = 4,
+                           progress: Optional[ProgressCallback] = None) -> List[Dict[str, Any]]:
+        """여러 파일을 동시에 업로드 (파일별 결과 반환)"""
+        return run_transfers(lambda path: self.upload_attachment(page_id, path, progress), file_paths, max_workers)
 
 
 class BitbucketAPI:
     """Bitbucket REST API Client"""
     
-    def __init__(self, domain_url: str, user_id: str, password: str):
+    def __init__(self, domain_url: str, user_id: str, password: str, transport: Optional[HTTPTransport] = None):
         """
         Initialize Bitbucket API client
         
@@ -297,11 +2191,13 @@ class BitbucketAPI:
             domain_url: Bitbucket domain URL (e.g., https://api.bitbucket.org for cloud or https://bitbucket.company.com for server)
             user_id: Username or email
             password: App password or API token
+            transport: Shared HTTP transport (default: per-host pooled transport)
         """
         self.domain_url: str = domain_url.rstrip('/')
         self.user_id: str = user_id
         self.password: str = password
         self.auth = (user_id, password)
+        self.transport: HTTPTransport = transport or get_transport(self.domain_url)
         self.headers: Dict[str, str] = {
             "Accept": "application/json",
             "Content-Type": "application/json"
@@ -316,8 +2212,11 @@ class BitbucketAPI:
             self.is_cloud: bool = False
     
     def _request(self, method: str, endpoint: str, data: Optional[Dict] = None, params: Optional[Dict] = None) -> Any:
-        """Make HTTP request to Bitbucket API"""
-        url: str = f"{self.domain_url}{self.api_version}{endpoint}"
+        """Make HTTP request to Bitbucket API (Cloud의 next 링크처럼 절대 URL도 허용)"""
+        if endpoint.startswith(("http://", "https://")):
+            url: str = endpoint
+        else:
+            url = f"{self.domain_url}{self.api_version}{endpoint}"
         
         kwargs: Dict[str, Any] = {
             "auth": self.auth,
@@ -329,7 +2228,7 @@ class BitbucketAPI:
             kwargs["json"] = data
         
         try:
-            response = requests.request(method, url, **kwargs)
+            response = self.transport.request(method, url, **kwargs)
             response.raise_for_status()
             
             if response.text:
@@ -338,13 +2237,90 @@ class BitbucketAPI:
         except requests.exceptions.RequestException as e:
             raise Exception(f"Bitbucket API 요청 실패: {str(e)}")
     
+    def add_instrumentation(self, hook: Optional[RequestHook] = None) -> RequestHook:
+        """
+        요청 계측 훅 등록 (기본값: 새 MetricsRecorder)
+        
+        transport에 등록되므로 같은 transport를 공유하는 다른 클라이언트의 요청도 기록된다.
+        """
+        return self.transport.add_hook(hook if hook is not None else MetricsRecorder())
+    
+    # 페이지 처리
+    def _first_page_params(self, params: Optional[Dict[str, Any]], page_size: Optional[int]) -> Dict[str, Any]:
+        """첫 페이지 요청 파라미터 (Cloud: pagelen, Server: limit)"""
+        params = dict(params or {})
+        if page_size:
+            params["pagelen" if self.is_cloud else "limit"] = page_size
+        return params
+    
+    def _next_page(self, page: Dict[str, Any], endpoint: str, params: Dict[str, Any]) -> Optional[tuple]:
+        """
+        다음 페이지 요청 (endpoint, params) 계산 (마지막 페이지면 None)
+        
+        Cloud는 응답의 next 링크(쿼리 포함 절대 URL)를 그대로 따라가고,
+        Server는 isLastPage가 false인 동안 nextPageStart를 start로 넘긴다.
+        """
+        if self.is_cloud:
+            next_url = page.get("next")
+            return (next_url, None) if next_url else None
+        if page.get("isLastPage", True) or page.get("nextPageStart") is None:
+            return None
+        return endpoint, dict(params, start=page["nextPageStart"])
+    
+    def iter_pages(self, endpoint: str, params: Optional[Dict[str, Any]] = None, page_size: Optional[int] = None,
+                   prefetch: bool = False) -> Iterator[Dict[str, Any]]:
+        """
+        목록 API 응답을 페이지 단위로 지연 조회
+        
+        prefetch=True면 현재 페이지를 소비하는 동안 다음 페이지를 백그라운드에서
+        미리 요청한다 (한 번에 최대 한 페이지만 선행).
+        """
+        params = self._first_page_params(params, page_size)
+        page = self._request("GET", endpoint, params=params)
+        if not prefetch:
+            while True:
+                yield page
+                following = self._next_page(page, endpoint, params)
+                if following is None:
+                    return
+                page = self._request("GET", following[0], params=following[1])
+        
+        executor = ThreadPoolExecutor(max_workers=1)
+        future: Optional[Future] = None
+        try:
+            while True:
+                following = self._next_page(page, endpoint, params)
+                if following is not None:
+                    future = submit_in_context(executor, self._request, "GET", following[0], None, following[1])
+                yield page
+                if following is None:
+                    return
+                page, future = future.result(), None
+        finally:
+            if future is not None:
+                future.cancel()
+            executor.shutdown(wait=True)
+    
+    def iter_values(self, endpoint: str, params: Optional[Dict[str, Any]] = None, page_size: Optional[int] = None,
+                    prefetch: bool = False) -> Iterator[Dict[str, Any]]:
+        """목록 API의 values 항목을 모든 페이지에 걸쳐 하나씩 조회"""
+        for page in self.iter_pages(endpoint, params, page_size, prefetch):
+            yield from page.get("values", [])
+    
     # 저장소 관련 메서드
+    def iter_repositories(self, workspace: str, page_size: Optional[int] = None,
+                          prefetch: bool = False) -> Iterator[Dict[str, Any]]:
+        """작업공간(Server: 프로젝트)의 모든 저장소를 페이지를 따라가며 조회"""
+        if self.is_cloud:
+            return self.iter_values(f"/repositories/{workspace}", page_size=page_size, prefetch=prefetch)
+        return self.iter_values(f"/projects/{workspace}/repos", page_size=page_size, prefetch=prefetch)
+    
     def get_repositories(self, workspace: str) -> Dict[str, Any]:
-        """작업공간의 모든 저장소 조회 (Cloud)"""
+        """작업공간(Server: 프로젝트)의 저장소 첫 페이지 조회 (전체는 iter_repositories)"""
         if self.is_cloud:
             return self._request("GET", f"/repositories/{workspace}")
         else:
-            return self._request("GET", "/projects")
+            return self._request("GET", f"/projects/{workspace}/repos")
     
     def get_repository(self, workspace: str, repo_slug: str) -> Dict[str, Any]:
         """특정 저장소 조회"""
@@ -377,12 +2353,21 @@ class BitbucketAPI:
     
     # 브랜치 관련 메서드
     def get_branches(self, workspace: str, repo_slug: str) -> Dict[str, Any]:
-        """저장소의 모든 브랜치 조회"""
+        """저장소의 브랜치 첫 페이지 조회 (전체는 iter_branches)"""
         if self.is_cloud:
             return self._request("GET", f"/repositories/{workspace}/{repo_slug}/refs/branches")
         else:
             return self._request("GET", f"/projects/{workspace}/repos/{repo_slug}/branches")
     
+    def iter_branches(self, workspace: str, repo_slug: str, page_size: Optional[int] = None,
+                      prefetch: bool = False) -> Iterator[Dict[str, Any]]:
+        """저장소의 모든 브랜치를 페이지를 따라가며 조회"""
+        if self.is_cloud:
+            endpoint = f"/repositories/{workspace}/{repo_slug}/refs/branches"
+        else:
+            endpoint = f"/projects/{workspace}/repos/{repo_slug}/branches"
+        return self.iter_values(endpoint, page_size=page_size, prefetch=prefetch)
+    
     def get_branch(self, workspace: str, repo_slug: str, branch_name: str) -> Dict[str, Any]:
         """특정 브랜치 조회"""
         if self.is_cloud:
@@ -408,7 +2393,7 @@ class BitbucketAPI:
     
     # Pull Request 관련 메서드
     def get_pull_requests(self, workspace: str, repo_slug: str, state: str = "OPEN") -> Dict[str, Any]:
-        """Pull Request 목록 조회"""
+        """Pull Request 목록 첫 페이지 조회 (전체는 iter_pull_requests)"""
         if self.is_cloud:
             params: Dict[str, str] = {"state": state}
             return self._request("GET", f"/repositories/{workspace}/{repo_slug}/pullrequests", params=params)
@@ -416,6 +2401,15 @@ class BitbucketAPI:
             params: Dict[str, str] = {"state": state}
             return self._request("GET", f"/projects/{workspace}/repos/{repo_slug}/pull-requests", params=params)
     
+    def iter_pull_requests(self, workspace: str, repo_slug: str, state: str = "OPEN", page_size: Optional[int] = None,
+                           prefetch: bool = False) -> Iterator[Dict[str, Any]]:
+        """Pull Request 전체를 페이지를 따라가며 조회"""
+        if self.is_cloud:
+            endpoint = f"/repositories/{workspace}/{repo_slug}/pullrequests"
+        else:
+            endpoint = f"/projects/{workspace}/repos/{repo_slug}/pull-requests"
+        return self.iter_values(endpoint, {"state": state}, page_size, prefetch)
+    
     def get_pull_request(self, workspace: str, repo_slug: str, pr_id: int) -> Dict[str, Any]:
         """특정 Pull Request 조회"""
         if self.is_cloud:
@@ -464,7 +2458,7 @@ class BitbucketAPI:
     
     # 커밋 관련 메서드
     def get_commits(self, workspace: str, repo_slug: str, branch: Optional[str] = None) -> Dict[str, Any]:
-        """커밋 목록 조회"""
+        """커밋 목록 첫 페이지 조회 (전체는 iter_commits)"""
         params: Dict[str, str] = {}
         if branch:
             params["branch"] = branch
@@ -474,6 +2468,19 @@ class BitbucketAPI:
         else:
             return self._request("GET", f"/projects/{workspace}/repos/{repo_slug}/commits", params=params)
     
+    def iter_commits(self, workspace: str, repo_slug: str, branch: Optional[str] = None,
+                     page_size: Optional[int] = None, prefetch: bool = False) -> Iterator[Dict[str, Any]]:
+        """커밋 전체를 페이지를 따라가며 조회"""
+        params: Dict[str, str] = {}
+        if branch:
+            params["branch"] = branch
+        
+        if self.is_cloud:
+            endpoint = f"/repositories/{workspace}/{repo_slug}/commits"
+        else:
+            endpoint = f"/projects/{workspace}/repos/{repo_slug}/commits"
+        return self.iter_values(endpoint, params, page_size, prefetch)
+    
     def get_commit(self, workspace: str, repo_slug: str, commit_hash: str) -> Dict[str, Any]:
         """특정 커밋 조회"""
         if self.is_cloud:
@@ -483,12 +2490,21 @@ class BitbucketAPI:
     
     # 웹훅 관련 메서드
     def get_webhooks(self, workspace: str, repo_slug: str) -> Dict[str, Any]:
-        """웹훅 목록 조회"""
+        """웹훅 목록 첫 페이지 조회 (전체는 iter_webhooks)"""
         if self.is_cloud:
             return self._request("GET", f"/repositories/{workspace}/{repo_slug}/hooks")
         else:
             return self._request("GET", f"/projects/{workspace}/repos/{repo_slug}/webhooks")
     
+    def iter_webhooks(self, workspace: str, repo_slug: str, page_size: Optional[int] = None,
+                      prefetch: bool = False) -> Iterator[Dict[str, Any]]:
+        """웹훅 전체를 페이지를 따라가며 조회"""
+        if self.is_cloud:
+            endpoint = f"/repositories/{workspace}/{repo_slug}/hooks"
+        else:
+            endpoint = f"/projects/{workspace}/repos/{repo_slug}/webhooks"
+        return self.iter_values(endpoint, page_size=page_size, prefetch=prefetch)
+    
     def create_webhook(self, workspace: str, repo_slug: str, url: str, events: List[str]) -> Dict[str, Any]:
         """웹훅 생성"""
         data: Dict[str, Any] = {
@@ -505,6 +2521,581 @@ class BitbucketAPI:
             return self._request("POST", f"/projects/{workspace}/repos/{repo_slug}/webhooks", data)
 
 
+class AsyncResponse:
+    """Buffered HTTP response returned by AsyncHTTPTransport"""
+    
+    def __init__(self, status_code: int, headers: Any, content: bytes, url: str = ""):
+        self.status_code: int = status_code
+        self.headers = CaseInsensitiveDict(headers or {})
+        self.content: bytes = content
+        self.url: str = url
+    
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8", errors="replace")
+    
+    def json(self) -> Any:
+        return json.loads(self.content)
+    
+    def raise_for_status(self) -> None:
+        """4xx/5xx 응답이면 requests와 동일한 HTTPError 발생"""
+        if self.status_code >= 400:
+            raise requests.exceptions.HTTPError(f"{self.status_code} Error for url: {self.url}", response=self)
+
+
+class AsyncHTTPTransport:
+    """
+    asyncio HTTP transport for Atlassian clients
+    
+    aiohttp가 설치되어 있으면 하나의 이벤트 루프에서 수백 개의 요청을 스레드 없이
+    동시에 처리한다. 설치되어 있지 않으면 기본 스레드 풀에서 requests로 요청한다.
+    재시도/속도 제한 규칙은 HTTPTransport와 같은 RetryPolicy, TokenBucket을 사용한다.
+    """
+    
+    def __init__(self, limit_per_host: int = 20, timeout: Optional[float] = 30.0,
+                 retry_policy: Optional[RetryPolicy] = None, rate_limiter: Optional[TokenBucket] = None,
+                 connect_timeout: Optional[float] = HTTPTransport.DEFAULT_CONNECT_TIMEOUT):
+        """
+        Initialize async transport
+        
+        Args:
+            limit_per_host: 호스트별 최대 동시 연결 수
+            timeout: 요청 하나의 전체 제한 시간 (초, None이면 무제한)
+            retry_policy: 재시도 정책 (기본값: RetryPolicy())
+            rate_limiter: 클라이언트 측 요청 속도 제한
+            connect_timeout: 연결 타임아웃 (초, None이면 무제한)
+        """
+        self.limit_per_host: int = limit_per_host
+        self.timeout: Optional[float] = timeout
+        self.connect_timeout: Optional[float] = connect_timeout
+        self.breaker_threshold: int = 5
+        self.breaker_recovery: float = 30.0
+        self.breakers: Dict[str, CircuitBreaker] = {}
+        self.retry_policy: RetryPolicy = retry_policy if retry_policy is not None else RetryPolicy()
+        self.rate_limiter: TokenBucket = rate_limiter if rate_limiter is not None else TokenBucket(None)
+        self._session = None
+        self._sync_session: Optional[requests.Session] = None
+        self._sync_transport: Optional[HTTPTransport] = None
+        self.coalesce_gets: bool = True
+        self._inflight: Dict[str, list] = {}
+        self.hooks: List[RequestHook] = []
+    
+    def add_hook(self, hook: RequestHook) -> RequestHook:
+        """요청 계측 훅 등록"""
+        self.hooks = self.hooks + [hook]
+        return hook
+    
+    def remove_hook(self, hook: RequestHook) -> None:
+        """요청 계측 훅 제거"""
+        self.hooks = [h for h in self.hooks if h is not hook]
+    
+    def breaker_for(self, url: str) -> CircuitBreaker:
+        """URL 호스트의 회로 차단기"""
+        host_key = transport_key(url)
+        breaker = self.breakers.get(host_key)
+        if breaker is None:
+            breaker = self.breakers[host_key] = CircuitBreaker(self.breaker_threshold, self.breaker_recovery)
+        return breaker
+    
+    def _timeout(self, remaining: Optional[float], requested: Any = None) -> tuple:
+        """
+        요청 하나의 (연결, 전체) 타임아웃 (작업 기한이 있으면 남은 시간 이내로 제한)
+        
+        requested는 호출자가 지정한 timeout (숫자 또는 (연결, 전체)), 없으면 설정값을 사용한다.
+        """
+        if requested is None:
+            connect, total = self.connect_timeout, self.timeout
+        elif isinstance(requested, tuple):
+            connect, total = requested
+        else:
+            connect = total = requested
+        if remaining is not None:
+            connect = remaining if connect is None else min(connect, remaining)
+            total = remaining if total is None else min(total, remaining)
+        return connect, total
+    
+    async def _get_session(self):
+        """현재 이벤트 루프에서 사용할 aiohttp 세션 (지연 생성, 타임아웃은 요청마다 지정)"""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=0, limit_per_host=self.limit_per_host)
+            self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
+    
+    async def request(self, method: str, url: str, **kwargs) -> AsyncResponse:
+        """비동기 요청 전송 (동시에 진행 중인 같은 GET은 하나의 요청 결과를 공유)"""
+        if not (self.coalesce_gets and method.upper() == "GET"):
+            return await self._send(method, url, **kwargs)
+        
+        key = request_key(url, kwargs.get("params"), kwargs.get("auth"), kwargs.get("headers"))
+        entry = self._inflight.get(key)
+        if entry is None:
+            # [공유 작업, 대기자 수]
+            entry = self._inflight[key] = [asyncio.ensure_future(self._send(method, url, **kwargs)), 0]
+            entry[0].add_done_callback(lambda _: self._forget(key, entry))
+        shared = entry[0]
+        entry[1] += 1
+        try:
+            # 대기자 하나가 취소되어도 다른 대기자가 있으면 공유 요청은 계속 진행
+            return await asyncio.shield(shared)
+        except asyncio.CancelledError:
+            if entry[1] == 1 and not shared.done():
+                # 마지막 대기자가 취소되면 공유 요청도 취소 (새 요청은 다시 전송)
+                self._forget(key, entry)
+                shared.cancel()
+            raise
+        finally:
+            entry[1] -= 1
+    
+    def _forget(self, key: str, entry: list) -> None:
+        """끝났거나 취소된 공유 요청을 진행 목록에서 제거 (같은 키의 새 요청은 유지)"""
+        if self._inflight.get(key) is entry:
+            del self._inflight[key]
+    
+    async def _send(self, method: str, url: str, **kwargs) -> AsyncResponse:
+        """재시도 포함 비동기 요청 전송 (훅이 있으면 계측 이벤트 기록)"""
+        hooks = self.hooks
+        stats: Dict[str, int] = {"retries": 0}
+        if not hooks:
+            return await self._send_with_retry(method, url, stats, **kwargs)
+        
+        start = time.perf_counter()
+        response: Optional[AsyncResponse] = None
+        error: Optional[BaseException] = None
+        try:
+            response = await self._send_with_retry(method, url, stats, **kwargs)
+            return response
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            emit_request_event(hooks, method, url, kwargs, response, error,
+                               time.perf_counter() - start, stats["retries"])
+    
+    async def _send_with_retry(self, method: str, url: str, stats: Dict[str, int], **kwargs) -> AsyncResponse:
+        """재시도 정책을 적용하여 비동기 요청 전송"""
+        policy = self.retry_policy
+        replayable = "files" not in kwargs and not hasattr(kwargs.get("data"), "read")
+        requested_timeout = kwargs.pop("timeout", None)
+        breaker = self.breaker_for(url)
+        attempt = 0
+        
+        while True:
+            stats["retries"] = attempt
+            await self._wait(self.rate_limiter.reserve())
+            remaining = check_deadline()
+            breaker.before_request()
+            
+            try:
+                response = await self._send_once(method, url, timeout=self._timeout(remaining, requested_timeout),
+                                                 **kwargs)
+            except requests.exceptions.RequestException as e:
+                if remaining is not None and isinstance(e, requests.exceptions.Timeout) and \
+                        deadline_remaining() <= 0:
+                    breaker.release()
+                    raise DeadlineExceeded(f"작업 제한 시간 초과: {e}") from e
+                breaker.record(error=e)
+                if not (replayable and policy.should_retry(method, attempt, error=e)):
+                    raise
+                await self._wait(policy.backoff(attempt))
+                attempt += 1
+                continue
+            except asyncio.CancelledError:
+                breaker.release()
+                raise
+            
+            breaker.record(status=response.status_code)
+            server_delay = rate_limit_delay(response.headers)
+            if server_delay:
+                self.rate_limiter.pause(min(server_delay, policy.max_retry_after))
+            
+            if not (replayable and policy.should_retry(method, attempt, status=response.status_code)):
+                return response
+            
+            await self._wait(policy.delay_for(response, attempt))
+            attempt += 1
+    
+    async def _wait(self, seconds: float) -> None:
+        """대기 (작업 기한 전에 끝나지 않는 대기는 바로 DeadlineExceeded)"""
+        if seconds <= 0:
+            return
+        remaining = deadline_remaining()
+        if remaining is not None and seconds >= remaining:
+            raise DeadlineExceeded(f"작업 제한 시간 초과: {seconds:.1f}초 대기 필요")
+        await asyncio.sleep(seconds)
+    
+    async def _send_once(self, method: str, url: str, auth: Any = None, headers: Optional[Dict[str, str]] = None,
+                         params: Optional[Dict[str, Any]] = None, json: Any = None, data: Any = None,
+                         files: Optional[Dict[str, Any]] = None, timeout: tuple = (None, None)) -> AsyncResponse:
+        """요청 1회 전송 (timeout은 (연결, 전체) 초, 오류는 requests 예외로 변환)"""
+        if not AIOHTTP_AVAILABLE:
+            return await self._send_in_thread(method, url, auth=auth, headers=headers, params=params,
+                                              json=json, data=data, files=files, timeout=timeout)
+        
+        session = await self._get_session()
+        if files:
+            form = aiohttp.FormData()
+            for name, file_obj in files.items():
+                form.add_field(name, file_obj, filename=os.path.basename(getattr(file_obj, "name", name)))
+            data = form
+        # aiohttp는 None/bool 쿼리 값을 허용하지 않으므로 문자열로 정규화
+        query = {key: str(value) for key, value in (params or {}).items() if value is not None}
+        
+        try:
+            async with session.request(
+                method, url,
+                auth=aiohttp.BasicAuth(*auth) if auth else None,
+                headers=headers,
+                params=query,
+                json=json,
+                data=data,
+                timeout=aiohttp.ClientTimeout(total=timeout[1], connect=timeout[0])
+            ) as resp:
+                body = await resp.read()
+                return AsyncResponse(resp.status, resp.headers, body, str(resp.url))
+        except asyncio.TimeoutError as e:
+            raise requests.exceptions.Timeout(str(e) or "요청 시간 초과")
+        except aiohttp.ClientConnectorError as e:
+            raise requests.exceptions.ConnectionError(str(e))
+        except aiohttp.ClientError as e:
+            raise requests.exceptions.RequestException(str(e))
+    
+    async def _send_in_thread(self, method: str, url: str, **kwargs) -> AsyncResponse:
+        """aiohttp 미설치 시 스레드 풀에서 requests로 전송"""
+        if self._sync_session is None:
+            self._sync_session = requests.Session()
+        loop = asyncio.get_running_loop()
+        response = await loop.run_in_executor(
+            None, functools.partial(self._sync_session.request, method, url, **kwargs)
+        )
+        return AsyncResponse(response.status_code, response.headers, response.content, response.url)
+    
+    def sync_transport(self) -> HTTPTransport:
+        """
+        스레드에서 실행하는 동기 작업(파일 전송)용 transport
+        
+        재시도 정책, 속도 제한, 회로 차단기, 훅, 타임아웃을 이 transport와 공유한다.
+        """
+        transport = self._sync_transport
+        if transport is None:
+            transport = self._sync_transport = HTTPTransport(
+                pool_maxsize=self.limit_per_host, retry_policy=self.retry_policy, rate_limiter=self.rate_limiter,
+                connect_timeout=self.connect_timeout, read_timeout=self.timeout
+            )
+            transport.breakers = self.breakers
+        # 생성 뒤에 바뀐 설정도 반영
+        transport.breaker_threshold = self.breaker_threshold
+        transport.breaker_recovery = self.breaker_recovery
+        transport.hooks = self.hooks
+        return transport
+    
+    async def close(self) -> None:
+        """세션 정리"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        if self._sync_session is not None:
+            self._sync_session.close()
+        if self._sync_transport is not None:
+            self._sync_transport.close()
+
+
+async def gather_limited(aws: Sequence[Any], limit: int = 10, timeout: Optional[float] = None) -> List[Any]:
+    """
+    동시 실행 수를 제한하여 awaitable 목록을 실행하고 입력 순서대로 결과 반환
+    
+    timeout(초)을 넘기면 남은 작업을 모두 취소하고 asyncio.TimeoutError를 발생시킨다.
+    """
+    semaphore = asyncio.Semaphore(limit)
+    
+    async def run(aw):
+        async with semaphore:
+            return await aw
+    
+    tasks = [asyncio.ensure_future(run(aw)) for aw in aws]
+    try:
+        return await asyncio.wait_for(asyncio.gather(*tasks), timeout)
+    finally:
+        for task in tasks:
+            task.cancel()
+        # 시작하지 못한 코루틴은 닫아서 "never awaited" 경고 방지
+        for aw in aws:
+            if asyncio.iscoroutine(aw) and inspect.getcoroutinestate(aw) == inspect.CORO_CREATED:
+                aw.close()
+
+
+class AsyncClientMixin:
+    """
+    Async counterpart base for the Atlassian clients
+    
+    동기 클라이언트를 상속하고 _request만 코루틴으로 바꾸므로 모든 API 메서드는
+    동기 버전과 같은 인자를 받고 await 가능한 객체를 반환한다. 응답을 후처리하거나
+    값을 반환하지 않는 메서드는 하위 클래스에서 async 메서드로 다시 정의한다.
+    """
+    
+    SERVICE_NAME: str = "Atlassian"
+    
+    async def _request(self, method: str, endpoint: str, data: Optional[Dict] = None, params: Optional[Dict] = None) -> Any:
+        """Make async HTTP request to Atlassian API (절대 URL 허용)"""
+        if endpoint.startswith(("http://", "https://")):
+            url: str = endpoint
+        else:
+            url = f"{self.domain_url}{self.api_version}{endpoint}"
+        
+        kwargs: Dict[str, Any] = {
+            "auth": self.auth,
+            "headers": self.headers,
+            "params": params
+        }
+        
+        if data and method in ["POST", "PUT", "PATCH"]:
+            kwargs["json"] = data
+        
+        try:
+            response = await self.transport.request(method, url, **kwargs)
+            response.raise_for_status()
+            
+            if response.text:
+                return response.json()
+            return {}
+        except requests.exceptions.RequestException as e:
+            raise Exception(f"{self.SERVICE_NAME} API 요청 실패: {str(e)}")
+    
+    async def _run_sync(self, method: str, *args, **kwargs) -> Any:
+        """
+        동기 클라이언트 메서드를 스레드에서 실행
+        
+        파일 스트리밍 업로드/이어받기처럼 디스크 I/O가 섞인 작업은 공유 동기
+        transport로 처리하여 동기 버전과 같은 동작(진행 콜백, 재개)을 유지한다.
+        """
+        # 재시도/회로 차단기/훅은 비동기 transport와 공유
+        transport = self.transport.sync_transport()
+        client = getattr(self, "_sync_client", None)
+        if client is None:
+            # 인스턴스마다 하나만 생성
+            sync_class = next(cls for cls in type(self).__mro__ if not issubclass(cls, AsyncClientMixin))
+            client = self._sync_client = sync_class(self.domain_url, self.user_id, self.password,
+                                                    transport=transport)
+        loop = asyncio.get_running_loop()
+        # 작업 기한(contextvars)이 작업자 스레드에도 적용되도록 컨텍스트 복사
+        call = functools.partial(contextvars.copy_context().run, getattr(client, method), *args, **kwargs)
+        return await loop.run_in_executor(None, call)
+    
+    async def close(self) -> None:
+        """transport 세션 정리"""
+        await self.transport.close()
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+
+class AsyncJiraAPI(AsyncClientMixin, JiraAPI):
+    """Async JIRA REST API Client"""
+    
+    SERVICE_NAME = "JIRA"
+    
+    def __init__(self, domain_url: str, user_id: str, password: str, transport: Optional[AsyncHTTPTransport] = None):
+        super().__init__(domain_url, user_id, password, transport=transport or AsyncHTTPTransport())
+    
+    async def delete_issue(self, issue_key: str) -> None:
+        """이슈 삭제"""
+        await self._request("DELETE", f"/issue/{issue_key}")
+    
+    async def iter_search_issues(self, jql: str, page_size: int = 50, start_at: int = 0,
+                                 fields: Optional[FieldSpec] = None, expand: Optional[FieldSpec] = None):
+        """JQL 검색 결과 전체를 페이지 단위로 지연 조회 (async generator)"""
+        while True:
+            result = await self.search_issues(jql, max_results=page_size, start_at=start_at, fields=fields, expand=expand)
+            issues: List[Dict[str, Any]] = result.get("issues", [])
+            for issue in issues:
+                yield issue
+            
+            start_at += len(issues)
+            total = result.get("total")
+            if not issues or (total is not None and start_at >= total):
+                break
+            if total is None and len(issues) < page_size:
+                break
+    
+    async def iter_search_issues_parallel(self, jql: str, page_size: int = 100, max_workers: int = 4,
+                                          ordered: bool = True, fields: Optional[FieldSpec] = None,
+                                          expand: Optional[FieldSpec] = None):
+        """JQL 검색 결과를 여러 페이지 동시 조회로 가져오기 (async generator)"""
+        first = await self.search_issues(jql, max_results=page_size, start_at=0, fields=fields, expand=expand)
+        issues: List[Dict[str, Any]] = first.get("issues", [])
+        for issue in issues:
+            yield issue
+        
+        total = first.get("total")
+        if not issues or total is None or len(issues) >= total:
+            return
+        
+        step = len(issues)
+        offsets = iter(range(step, total, step))
+        window = max_workers * 2
+        semaphore = asyncio.Semaphore(max_workers)
+        pending: "deque[asyncio.Future]" = deque()
+        
+        async def fetch(offset: int) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.search_issues(jql, step, offset, fields, expand)
+        
+        def submit_next() -> bool:
+            offset = next(offsets, None)
+            if offset is None:
+                return False
+            pending.append(asyncio.ensure_future(fetch(offset)))
+            return True
+        
+        try:
+            while len(pending) < window and submit_next():
+                pass
+            
+            while pending:
+                if ordered:
+                    done = [pending.popleft()]
+                else:
+                    completed, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    done = [task for task in pending if task in completed]
+                    for task in done:
+                        pending.remove(task)
+                
+                for task in done:
+                    page = await task
+                    for issue in page.get("issues", []):
+                        yield issue
+                    submit_next()
+        finally:
+            for task in pending:
+                task.cancel()
+    
+    async def add_attachment(self, issue_key: str, file_path: str,
+                             progress: Optional[ProgressCallback] = None) -> List[Dict[str, Any]]:
+        """이슈에 파일 첨부 (스트리밍 업로드를 스레드에서 실행)"""
+        return await self._run_sync("add_attachment", issue_key, file_path, progress)
+    
+    async def add_attachments(self, issue_key: str, file_paths: Sequence[str], max_workers: int = 4,
+                              progress: Optional[ProgressCallback] = None) -> List[Dict[str, Any]]:
+        """여러 파일을 동시에 첨부"""
+        return await self._run_sync("add_attachments", issue_key, file_paths, max_workers, progress)
+    
+    async def download_attachment(self, attachment_id: str, dest_path: str,
+                                  progress: Optional[ProgressCallback] = None) -> str:
+        """첨부파일 다운로드 (이어받기 지원)"""
+        return await self._run_sync("download_attachment", attachment_id, dest_path, progress)
+    
+    async def get_issues(self, issue_keys: Sequence[str], fields: Optional[FieldSpec] = None,
+                         expand: Optional[FieldSpec] = None, max_workers: int = 4) -> Dict[str, Any]:
+        """여러 이슈를 키로 한 번에 조회 (key in (...) 청크를 동시에 검색)"""
+        keys = self._normalize_keys(issue_keys)
+        params = self._projection_params(fields, expand)
+        pending = [
+            self._request("GET", "/search", params=self._key_chunk_params(chunk, params))
+            for chunk in self._key_chunks(keys, params)
+        ]
+        pages = await gather_limited(pending, limit=max(1, max_workers))
+        return self._collect_issues(keys, pages)
+    
+    async def _create_chunk(self, start: int, chunk: Sequence[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """청크 하나를 /issue/bulk로 생성"""
+        data = {"issueUpdates": [self._bulk_payload(issue) for issue in chunk]}
+        try:
+            response = await self._request("POST", "/issue/bulk", data)
+        except Exception as e:
+            return self._bulk_chunk_results(start, chunk, error=str(e))
+        return self._bulk_chunk_results(start, chunk, response)
+    
+    async def bulk_create_issues(self, issues: Sequence[Dict[str, Any]], chunk_size: int = 50,
+                                 max_workers: int = 4) -> List[Dict[str, Any]]:
+        """여러 이슈를 /issue/bulk로 일괄 생성 (동시 청크 수는 max_workers로 제한)"""
+        chunks = self._bulk_chunks(issues, chunk_size)
+        results = await gather_limited([self._create_chunk(start, chunk) for start, chunk in chunks],
+                                       limit=max(1, max_workers))
+        return [result for chunk_results in results for result in chunk_results]
+
+
+class AsyncConfluenceAPI(AsyncClientMixin, ConfluenceAPI):
+    """Async Confluence REST API Client"""
+    
+    SERVICE_NAME = "Confluence"
+    
+    def __init__(self, domain_url: str, user_id: str, password: str, transport: Optional[AsyncHTTPTransport] = None):
+        super().__init__(domain_url, user_id, password, transport=transport or AsyncHTTPTransport())
+    
+    async def get_page_by_title(self, space_key: str, title: str) -> Dict[str, Any]:
+        """페이지 제목으로 조회"""
+        params: Dict[str, str] = {
+            "spaceKey": space_key,
+            "title": title,
+            "expand": "body.storage,version"
+        }
+        response = await self._request("GET", "/content", params=params)
+        
+        if response.get("results"):
+            return response["results"][0]
+        return {}
+    
+    async def delete_page(self, page_id: str) -> None:
+        """페이지 삭제"""
+        await self._request("DELETE", f"/content/{page_id}")
+    
+    async def upload_attachment(self, page_id: str, file_path: str,
+                                progress: Optional[ProgressCallback] = None) -> Dict[str, Any]:
+        """첨부파일 업로드 (스트리밍 업로드를 스레드에서 실행)"""
+        return await self._run_sync("upload_attachment", page_id, file_path, progress)
+    
+    async def upload_attachments(self, page_id: str, file_paths: Sequence[str], max_workers: int = 4,
+                                 progress: Optional[ProgressCallback] = None) -> List[Dict[str, Any]]:
+        """여러 파일을 동시에 업로드"""
+        return await self._run_sync("upload_attachments", page_id, file_paths, max_workers, progress)
+
+
+class AsyncBitbucketAPI(AsyncClientMixin, BitbucketAPI):
+    """Async Bitbucket REST API Client"""
+    
+    SERVICE_NAME = "Bitbucket"
+    
+    def __init__(self, domain_url: str, user_id: str, password: str, transport: Optional[AsyncHTTPTransport] = None):
+        super().__init__(domain_url, user_id, password, transport=transport or AsyncHTTPTransport())
+    
+    async def iter_pages(self, endpoint: str, params: Optional[Dict[str, Any]] = None, page_size: Optional[int] = None,
+                         prefetch: bool = False):
+        """목록 API 응답을 페이지 단위로 지연 조회 (async generator, prefetch 시 다음 페이지를 미리 요청)"""
+        params = self._first_page_params(params, page_size)
+        page = await self._request("GET", endpoint, params=params)
+        task: Optional[asyncio.Task] = None
+        try:
+            while True:
+                following = self._next_page(page, endpoint, params)
+                if following is not None and prefetch:
+                    task = asyncio.ensure_future(self._request("GET", following[0], params=following[1]))
+                yield page
+                if following is None:
+                    return
+                if task is not None:
+                    page, task = await task, None
+                else:
+                    page = await self._request("GET", following[0], params=following[1])
+        finally:
+            if task is not None:
+                task.cancel()
+    
+    async def iter_values(self, endpoint: str, params: Optional[Dict[str, Any]] = None, page_size: Optional[int] = None,
+                          prefetch: bool = False):
+        """목록 API의 values 항목을 모든 페이지에 걸쳐 하나씩 조회 (async generator)"""
+        async for page in self.iter_pages(endpoint, params, page_size, prefetch):
+            for value in page.get("values", []):
+                yield value
+    
+    async def delete_repository(self, workspace: str, repo_slug: str) -> None:
+        """저장소 삭제"""
+        if self.is_cloud:
+            await self._request("DELETE", f"/repositories/{workspace}/{repo_slug}")
+        else:
+            await self._request("DELETE", f"/projects/{workspace}/repos/{repo_slug}")
+
+
 # 사용 예제를 위한 메인 함수
 def main():
     """API 클라이언트 사용 예제"""
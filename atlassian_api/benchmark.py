@@ -0,0 +1,396 @@
+"""
+Benchmark suite for the Atlassian API clients
+
+로컬 스텁 서버(stub_server.py)를 대상으로 검색 페이지 순회, 다중 키 조회, 벌크 생성,
+첨부파일 업로드, Bitbucket 목록 조회의 처리량과 지연 시간을 순차/스레드/비동기
+모드별로 측정하고 JSON 파일로 저장한다. --baseline으로 이전 결과와 비교하면
+기준보다 느려진 항목이 있을 때 종료 코드 1을 반환한다.
+
+    python benchmark.py --output bench.json
+    python benchmark.py --latency 0.02 --baseline bench.json --threshold 0.25
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from atlassian_api import (
+    JiraAPI, BitbucketAPI, HTTPTransport, AsyncJiraAPI, AsyncBitbucketAPI, AsyncHTTPTransport,
+    MetricsRecorder, gather_limited, AIOHTTP_AVAILABLE, ORJSON_AVAILABLE
+)
+from stub_server import StubAtlassianServer, StubData, FaultInjector
+
+
+MODES = ("sequential", "threaded", "async")
+SCENARIOS = ("search_pagination", "batch_fetch", "bulk_create", "attachment_upload", "bitbucket_listing")
+
+
+class RequestSampler:
+    """Request hook collecting per-request latency, retries and bytes for one run"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.latencies: List[float] = []
+        self.retries = 0
+        self.errors = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+
+    def __call__(self, event: Dict[str, Any]) -> None:
+        with self._lock:
+            self.latencies.append(event["latency"])
+            self.retries += event["retries"]
+            self.bytes_in += event["bytes_in"]
+            self.bytes_out += event["bytes_out"]
+            if event["status"] is None or event["status"] >= 400:
+                self.errors += 1
+
+    def summary(self) -> Dict[str, Any]:
+        """요청 지연 백분위 및 합계"""
+        samples = sorted(self.latencies)
+        return {
+            "count": len(samples),
+            "latency": {
+                "p50": MetricsRecorder._percentile(samples, 0.50),
+                "p95": MetricsRecorder._percentile(samples, 0.95),
+                "p99": MetricsRecorder._percentile(samples, 0.99)
+            },
+            "retries": self.retries,
+            "errors": self.errors,
+            "bytes_in": self.bytes_in,
+            "bytes_out": self.bytes_out
+        }
+
+
+class BenchmarkSuite:
+    """Runs each scenario in sequential, threaded and async mode against a stub server
+
+    Every run gets fresh clients and transports so connection reuse is measured
+    within a run but not carried over between runs. Run times are wall-clock;
+    request latencies come from transport hooks and the request count from the
+    stub server itself (the async attachment path uploads through worker threads
+    that are not visible to the async transport hooks).
+    """
+
+    def __init__(self, server: StubAtlassianServer, workers: int = 8, repeat: int = 3, page_size: int = 50,
+                 batch_keys: int = 400, bulk_issues: int = 200, files: int = 8, file_size: int = 1024 * 1024,
+                 bitbucket_project: str = "TM"):
+        """
+        Args:
+            server: 실행 중인 스텁 서버
+            workers: 스레드/비동기 모드의 동시 요청 수
+            repeat: 시나리오별 반복 횟수 (중앙값 사용)
+            page_size: 검색/목록 페이지 크기
+            batch_keys: batch_fetch에서 조회할 이슈 키 수
+            bulk_issues: bulk_create에서 생성할 이슈 수
+            files: attachment_upload에서 업로드할 파일 수
+            file_size: 업로드 파일 하나의 크기 (바이트)
+            bitbucket_project: bitbucket_listing 대상 프로젝트
+        """
+        self.server = server
+        self.workers = workers
+        self.repeat = repeat
+        self.page_size = page_size
+        self.batch_keys = batch_keys
+        self.bulk_issues = bulk_issues
+        self.files = files
+        self.file_size = file_size
+        self.bitbucket_project = bitbucket_project
+        self._tmpdir: Optional[tempfile.TemporaryDirectory] = None
+        self._file_paths: List[str] = []
+
+    # ----- 클라이언트 생성 -----
+    def _sync_clients(self, sampler: RequestSampler) -> Dict[str, Any]:
+        transport = HTTPTransport(pool_maxsize=max(10, self.workers))
+        transport.add_hook(sampler)
+        return {
+            "transport": transport,
+            "jira": JiraAPI(self.server.url, "bench", "token", transport=transport),
+            "bitbucket": BitbucketAPI(self.server.url, "bench", "token", transport=transport)
+        }
+
+    def _async_clients(self, sampler: RequestSampler) -> Dict[str, Any]:
+        transport = AsyncHTTPTransport(limit_per_host=max(10, self.workers))
+        transport.add_hook(sampler)
+        return {
+            "transport": transport,
+            "jira": AsyncJiraAPI(self.server.url, "bench", "token", transport=transport),
+            "bitbucket": AsyncBitbucketAPI(self.server.url, "bench", "token", transport=transport)
+        }
+
+    def _workers(self, mode: str) -> int:
+        return 1 if mode == "sequential" else self.workers
+
+    # ----- 시나리오 (처리한 항목 수 반환) -----
+    def search_pagination(self, mode: str, clients: Dict[str, Any]) -> int:
+        """project = TM 전체 페이지 순회"""
+        jql = "project = TM ORDER BY key ASC"
+        if mode == "sequential":
+            return sum(1 for _ in clients["jira"].iter_search_issues(jql, page_size=self.page_size))
+        return sum(1 for _ in clients["jira"].iter_search_issues_parallel(
+            jql, page_size=self.page_size, max_workers=self.workers))
+
+    async def search_pagination_async(self, clients: Dict[str, Any]) -> int:
+        count = 0
+        async for _ in clients["jira"].iter_search_issues_parallel("project = TM ORDER BY key ASC",
+                                                                   page_size=self.page_size,
+                                                                   max_workers=self.workers):
+            count += 1
+        return count
+
+    def _batch_keys(self) -> List[str]:
+        data = self.server.data
+        projects = data.projects
+        return [f"{projects[i % len(projects)]}-{i // len(projects) + 1}" for i in range(self.batch_keys)]
+
+    def batch_fetch(self, mode: str, clients: Dict[str, Any]) -> int:
+        """여러 키를 key in (...) 청크로 조회"""
+        result = clients["jira"].get_issues(self._batch_keys(), fields=["summary", "status"],
+                                            max_workers=self._workers(mode))
+        return len(result["issues"])
+
+    async def batch_fetch_async(self, clients: Dict[str, Any]) -> int:
+        result = await clients["jira"].get_issues(self._batch_keys(), fields=["summary", "status"],
+                                                  max_workers=self.workers)
+        return len(result["issues"])
+
+    def _bulk_items(self) -> List[Dict[str, Any]]:
+        return [{"project_key": "OPS", "issue_type": "Task", "summary": f"Benchmark issue {i}"}
+                for i in range(self.bulk_issues)]
+
+    def bulk_create(self, mode: str, clients: Dict[str, Any]) -> int:
+        """/issue/bulk 청크 생성"""
+        results = clients["jira"].bulk_create_issues(self._bulk_items(), max_workers=self._workers(mode))
+        return sum(1 for result in results if result["success"])
+
+    async def bulk_create_async(self, clients: Dict[str, Any]) -> int:
+        results = await clients["jira"].bulk_create_issues(self._bulk_items(), max_workers=self.workers)
+        return sum(1 for result in results if result["success"])
+
+    def _attachment_files(self) -> List[str]:
+        """업로드용 임시 파일 생성 (한 번만)"""
+        if not self._file_paths:
+            self._tmpdir = tempfile.TemporaryDirectory(prefix="atlassian-bench-")
+            for i in range(self.files):
+                path = os.path.join(self._tmpdir.name, f"attachment-{i}.bin")
+                with open(path, "wb") as f:
+                    f.write(os.urandom(self.file_size))
+                self._file_paths.append(path)
+        return self._file_paths
+
+    def attachment_upload(self, mode: str, clients: Dict[str, Any]) -> int:
+        """여러 파일 스트리밍 업로드"""
+        results = clients["jira"].add_attachments("DEV-1", self._attachment_files(), max_workers=self._workers(mode))
+        return sum(1 for result in results if result["success"])
+
+    async def attachment_upload_async(self, clients: Dict[str, Any]) -> int:
+        jira = clients["jira"]
+        uploads = [jira.add_attachment("DEV-1", path) for path in self._attachment_files()]
+        return len(await gather_limited(uploads, limit=self.workers))
+
+    def bitbucket_listing(self, mode: str, clients: Dict[str, Any]) -> int:
+        """저장소 목록과 저장소별 브랜치 전체 순회"""
+        bitbucket = clients["bitbucket"]
+        project = self.bitbucket_project
+        repos = [repo["slug"] for repo in bitbucket.iter_repositories(project, page_size=self.page_size)]
+
+        def branches(slug: str) -> int:
+            return sum(1 for _ in bitbucket.iter_branches(project, slug, page_size=self.page_size,
+                                                          prefetch=mode != "sequential"))
+
+        if mode == "sequential":
+            return len(repos) + sum(branches(slug) for slug in repos)
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            return len(repos) + sum(executor.map(branches, repos))
+
+    async def bitbucket_listing_async(self, clients: Dict[str, Any]) -> int:
+        bitbucket = clients["bitbucket"]
+        project = self.bitbucket_project
+        repos = [repo["slug"] async for repo in bitbucket.iter_repositories(project, page_size=self.page_size)]
+
+        async def branches(slug: str) -> int:
+            return len([branch async for branch in bitbucket.iter_branches(project, slug, page_size=self.page_size,
+                                                                           prefetch=True)])
+
+        return len(repos) + sum(await gather_limited([branches(slug) for slug in repos], limit=self.workers))
+
+    # ----- 실행 -----
+    def _run_once(self, scenario: str, mode: str) -> Dict[str, Any]:
+        """시나리오 한 번 실행 (항목 수, 소요 시간, 요청 통계)"""
+        sampler = RequestSampler()
+        before = self.server.stats["requests"]
+        if mode == "async":
+            async def run() -> int:
+                clients = self._async_clients(sampler)
+                try:
+                    return await getattr(self, f"{scenario}_async")(clients)
+                finally:
+                    await clients["transport"].close()
+
+            started = time.perf_counter()
+            items = asyncio.run(run())
+        else:
+            clients = self._sync_clients(sampler)
+            started = time.perf_counter()
+            try:
+                items = getattr(self, scenario)(mode, clients)
+            finally:
+                clients["transport"].close()
+        elapsed = time.perf_counter() - started
+        return {"items": items, "seconds": elapsed, "server_requests": self.server.stats["requests"] - before,
+                "requests": sampler.summary()}
+
+    def run_scenario(self, scenario: str, mode: str) -> Dict[str, Any]:
+        """반복 실행 후 중앙값 기준 결과"""
+        runs = [self._run_once(scenario, mode) for _ in range(self.repeat)]
+        seconds = [run["seconds"] for run in runs]
+        median = statistics.median(seconds)
+        representative = min(runs, key=lambda run: abs(run["seconds"] - median))
+        return {
+            "items": representative["items"],
+            "runs": seconds,
+            "median_seconds": median,
+            "min_seconds": min(seconds),
+            "items_per_second": representative["items"] / median if median > 0 else 0.0,
+            "server_requests": representative["server_requests"],
+            "requests": representative["requests"]
+        }
+
+    def run(self, scenarios: Sequence[str] = SCENARIOS, modes: Sequence[str] = MODES,
+            progress: Optional[Callable[[str, str, Dict[str, Any]], None]] = None) -> Dict[str, Any]:
+        """
+        시나리오 × 모드 전체 실행
+
+        Returns:
+            {"meta": {...}, "results": {scenario: {mode: result}}}
+        """
+        results: Dict[str, Dict[str, Any]] = {}
+        try:
+            for scenario in scenarios:
+                if scenario not in SCENARIOS:
+                    raise ValueError(f"알 수 없는 시나리오: {scenario}")
+                results[scenario] = {}
+                for mode in modes:
+                    if mode not in MODES:
+                        raise ValueError(f"알 수 없는 모드: {mode}")
+                    results[scenario][mode] = self.run_scenario(scenario, mode)
+                    if progress:
+                        progress(scenario, mode, results[scenario][mode])
+        finally:
+            if self._tmpdir is not None:
+                self._tmpdir.cleanup()
+                self._tmpdir, self._file_paths = None, []
+        return {"meta": self.meta(), "results": results}
+
+    def meta(self) -> Dict[str, Any]:
+        """실행 환경 및 설정"""
+        faults = self.server.faults
+        return {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "aiohttp": AIOHTTP_AVAILABLE,
+            "orjson": ORJSON_AVAILABLE,
+            "config": {
+                "workers": self.workers, "repeat": self.repeat, "page_size": self.page_size,
+                "batch_keys": self.batch_keys, "bulk_issues": self.bulk_issues,
+                "files": self.files, "file_size": self.file_size,
+                "issues": len(self.server.data.issues),
+                "latency": faults.latency, "jitter": faults.jitter,
+                "error_rate": faults.error_rate, "rate_limit": faults.rate_limit
+            }
+        }
+
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any], threshold: float = 0.2) -> List[Dict[str, Any]]:
+    """
+    이전 결과 대비 느려진 항목 찾기
+
+    Args:
+        baseline: 기준 결과 (BenchmarkSuite.run 반환값 또는 저장된 JSON)
+        current: 현재 결과
+        threshold: 허용 비율 (0.2 = 중앙값 20% 증가까지 허용)
+
+    Returns:
+        [{"scenario", "mode", "baseline_seconds", "current_seconds", "change"}]
+    """
+    regressions = []
+    for scenario, modes in current.get("results", {}).items():
+        for mode, result in modes.items():
+            before = baseline.get("results", {}).get(scenario, {}).get(mode)
+            if not before or before["median_seconds"] <= 0:
+                continue
+            change = result["median_seconds"] / before["median_seconds"] - 1
+            if change > threshold:
+                regressions.append({
+                    "scenario": scenario, "mode": mode,
+                    "baseline_seconds": before["median_seconds"],
+                    "current_seconds": result["median_seconds"],
+                    "change": change
+                })
+    return regressions
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """명령행 실행 (회귀 발견 시 1 반환)"""
+    parser = argparse.ArgumentParser(description="Benchmark the Atlassian API clients against a local stub server")
+    parser.add_argument("--output", default="benchmark_results.json", help="결과 JSON 파일")
+    parser.add_argument("--baseline", help="비교할 이전 결과 JSON 파일")
+    parser.add_argument("--threshold", type=float, default=0.2, help="허용 성능 저하 비율")
+    parser.add_argument("--scenario", action="append", choices=SCENARIOS, help="실행할 시나리오 (반복 지정 가능)")
+    parser.add_argument("--mode", action="append", choices=MODES, help="실행할 모드 (반복 지정 가능)")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--page-size", type=int, default=50)
+    parser.add_argument("--issues", type=int, default=3000, help="스텁 서버 합성 이슈 수")
+    parser.add_argument("--batch-keys", type=int, default=400)
+    parser.add_argument("--bulk-issues", type=int, default=200)
+    parser.add_argument("--files", type=int, default=8)
+    parser.add_argument("--file-size", type=int, default=1024 * 1024)
+    parser.add_argument("--latency", type=float, default=0.01, help="스텁 서버 응답 지연 (초)")
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit", type=float, default=None)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    faults = FaultInjector(args.latency, args.jitter, args.error_rate, rate_limit=args.rate_limit, seed=args.seed)
+    with StubAtlassianServer(data=StubData(issues=args.issues, branches=120, seed=args.seed), faults=faults) as server:
+        suite = BenchmarkSuite(server, workers=args.workers, repeat=args.repeat, page_size=args.page_size,
+                               batch_keys=args.batch_keys, bulk_issues=args.bulk_issues, files=args.files,
+                               file_size=args.file_size)
+
+        def report(scenario: str, mode: str, result: Dict[str, Any]) -> None:
+            print(f"{scenario:<20} {mode:<11} {result['median_seconds'] * 1000:9.1f} ms "
+                  f"{result['items_per_second']:10.1f} items/s {result['server_requests']:5d} requests")
+
+        results = suite.run(args.scenario or SCENARIOS, args.mode or MODES, progress=report)
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2, ensure_ascii=False)
+    print(f"결과 저장: {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            regressions = compare(json.load(f), results, args.threshold)
+        for item in regressions:
+            print(f"성능 저하: {item['scenario']} {item['mode']} "
+                  f"{item['baseline_seconds'] * 1000:.1f} ms -> {item['current_seconds'] * 1000:.1f} ms "
+                  f"(+{item['change']:.0%})")
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,1184 @@
+"""
+Local stand-in server for the Jira, Confluence and Bitbucket REST APIs
+
+atlassian_api.py가 사용하는 엔드포인트만 합성 데이터로 구현한 테스트/벤치마크용 서버.
+지연 시간, 오류율, 요청 속도 제한을 설정해 네트워크 없이 페이지 처리, 재시도,
+동시성 동작을 재현할 수 있다.
+
+    python stub_server.py --port 8080 --issues 1000 --latency 0.05 --error-rate 0.01 --rate-limit 50
+"""
+
+import argparse
+import hashlib
+import json
+import math
+import random
+import re
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlencode, urlsplit
+
+
+JIRA_TIME_FORMAT = "%Y-%m-%dT%H:%M:%S.000+0000"
+
+
+def jira_time(value: datetime) -> str:
+    """Jira 응답 형식의 시각 문자열"""
+    return value.astimezone(timezone.utc).strftime(JIRA_TIME_FORMAT)
+
+
+class FaultInjector:
+    """Latency, error and rate-limit injection applied before each request"""
+
+    def __init__(self, latency: float = 0.0, jitter: float = 0.0, error_rate: float = 0.0,
+                 error_status: int = 503, rate_limit: Optional[float] = None, burst: Optional[int] = None,
+                 seed: int = 0):
+        """
+        Args:
+            latency: 모든 응답에 더하는 고정 지연 (초)
+            jitter: 지연에 더하는 0~jitter초 무작위 지연
+            error_rate: error_status로 실패시킬 요청 비율 (0~1)
+            error_status: 주입할 오류 상태 코드
+            rate_limit: 초당 허용 요청 수 (None이면 제한 없음, 초과 시 429 + Retry-After)
+            burst: 순간 허용 요청 수 (기본값: rate_limit)
+            seed: 오류/지연 난수 시드 (같은 시드면 같은 순서로 재현)
+        """
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.rate_limit = rate_limit
+        self.burst = float(burst if burst is not None else max(1.0, rate_limit or 1.0))
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._clock = time.monotonic
+        self._tokens = self.burst
+        self._updated = self._clock()
+
+    def _take_token(self) -> float:
+        """토큰 하나 사용 (부족하면 다음 토큰까지 남은 시간 반환)"""
+        now = self._clock()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate_limit)
+        self._updated = now
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return 0.0
+        return (1 - self._tokens) / self.rate_limit
+
+    def apply(self) -> Optional[Tuple[int, Dict[str, str]]]:
+        """
+        요청 처리 전에 지연/제한/오류 적용
+
+        Returns:
+            주입할 (상태 코드, 헤더) 또는 정상 처리 시 None
+        """
+        with self._lock:
+            delay = self.latency + (self._rng.uniform(0, self.jitter) if self.jitter else 0.0)
+            fail = self.error_rate > 0 and self._rng.random() < self.error_rate
+            retry_after = self._take_token() if self.rate_limit else 0.0
+
+        if delay > 0:
+            time.sleep(delay)
+        if retry_after > 0:
+            return 429, {
+                # Retry-After는 정수 초 (RFC 9110 delay-seconds)
+                "Retry-After": str(math.ceil(retry_after)),
+                "X-RateLimit-Limit": str(int(self.burst)),
+                "X-RateLimit-Remaining": "0"
+            }
+        if fail:
+            return self.error_status, {}
+        return None
+
+
+class StubData:
+    """Deterministic synthetic Jira, Confluence and Bitbucket data"""
+
+    STATUSES = ["Open", "In Progress", "In Review", "Done"]
+    PRIORITIES = ["Low", "Medium", "High", "Critical"]
+    ISSUE_TYPES = ["Task", "Bug", "Story", "Improvement"]
+    USERS = ["John Doe", "Jane Smith", "Bob Johnson", "Alice Kim", "Min Lee"]
+    LABELS = ["backend", "frontend", "database", "tm", "release", "infra"]
+
+    def __init__(self, projects: Tuple[str, ...] = ("TM", "DEV", "OPS"), issues: int = 300,
+                 repos: int = 12, branches: int = 20, pull_requests: int = 8, commits: int = 40,
+                 pages: int = 20, seed: int = 0):
+        rng = random.Random(seed)
+        self.lock = threading.RLock()
+        self.projects = list(projects)
+        self.base_time = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        self.user = {"accountId": "stub-user", "displayName": "Stub User",
+                     "emailAddress": "stub@example.com", "active": True}
+
+        self.issues: Dict[str, Dict[str, Any]] = {}
+        self.counters: Dict[str, int] = {project: 0 for project in self.projects}
+        for i in range(issues):
+            project = self.projects[i % len(self.projects)]
+            created = self.base_time + timedelta(hours=i)
+            self._add_issue(project, {
+                "summary": f"{project} synthetic issue {i + 1} {rng.choice(['TM 설정', 'DB 연결', 'UI 개선', 'API 연동'])}",
+                "description": self.adf(f"Synthetic description for issue {i + 1}"),
+                "status": {"name": rng.choice(self.STATUSES)},
+                "priority": {"name": rng.choice(self.PRIORITIES)},
+                "issuetype": {"name": rng.choice(self.ISSUE_TYPES)},
+                "assignee": {"displayName": rng.choice(self.USERS)} if rng.random() > 0.2 else None,
+                "reporter": {"displayName": rng.choice(self.USERS)},
+                "labels": rng.sample(self.LABELS, rng.randint(0, 2)),
+                "components": [{"name": rng.choice(["core", "cli", "gui"])}],
+                "created": jira_time(created),
+                "updated": jira_time(created + timedelta(minutes=rng.randint(0, 60 * 24 * 30))),
+                "comment": {"comments": [], "total": 0},
+                "attachment": []
+            })
+
+        self.attachments: Dict[str, Dict[str, Any]] = {}
+        self.next_id = 10000
+
+        self.spaces = {key: {"id": i + 1, "key": key, "name": f"{key} Space", "type": "global"}
+                       for i, key in enumerate(self.projects)}
+        self.pages: Dict[str, Dict[str, Any]] = {}
+        for key in self.projects:
+            for i in range(pages):
+                self._add_page(key, f"{key} Page {i + 1}", f"<p>Synthetic page {i + 1} of {key}</p>")
+
+        self.repos: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        for project in self.projects:
+            self.repos[project] = {}
+            for r in range(repos):
+                slug = f"{project.lower()}-repo-{r + 1}"
+                commit_list = [self.commit_hash(project, slug, c) for c in range(commits)]
+                self.repos[project][slug] = {
+                    "slug": slug,
+                    "name": slug,
+                    "project": project,
+                    "branches": ["master"] + [f"feature/{project.lower()}-{b + 1}" for b in range(branches - 1)],
+                    "commits": commit_list,
+                    "pull_requests": [
+                        {"id": p + 1, "title": f"PR {p + 1} for {slug}", "state": rng.choice(["OPEN", "MERGED"]),
+                         "source": f"feature/{project.lower()}-{p + 1}", "destination": "master"}
+                        for p in range(pull_requests)
+                    ],
+                    "webhooks": [{"id": 1, "name": "ci", "url": "http://ci.example.com/hook", "active": True,
+                                  "events": ["repo:refs_changed"]}]
+                }
+
+    @staticmethod
+    def adf(text: str) -> Dict[str, Any]:
+        """Atlassian Document Format 문단 하나"""
+        return {"type": "doc", "version": 1,
+                "content": [{"type": "paragraph", "content": [{"type": "text", "text": text}]}]}
+
+    @staticmethod
+    def adf_text(value: Any) -> str:
+        """ADF 또는 문자열에서 텍스트 추출"""
+        if isinstance(value, str):
+            return value
+        if isinstance(value, dict):
+            if value.get("type") == "text":
+                return value.get("text", "")
+            return " ".join(StubData.adf_text(child) for child in value.get("content", []))
+        return ""
+
+    @staticmethod
+    def commit_hash(project: str, slug: str, index: int) -> str:
+        """결정적인 커밋 해시"""
+        return hashlib.sha1(f"{project}/{slug}/{index}".encode()).hexdigest()
+
+    def new_id(self) -> str:
+        """새 숫자 ID 발급"""
+        with self.lock:
+            self.next_id += 1
+            return str(self.next_id)
+
+    def _add_issue(self, project: str, fields: Dict[str, Any]) -> Dict[str, Any]:
+        """이슈 추가 (키 자동 발급)"""
+        with self.lock:
+            self.counters[project] = self.counters.get(project, 0) + 1
+            key = f"{project}-{self.counters[project]}"
+            fields = dict(fields, project={"key": project, "name": f"{project} Project"})
+            issue = {"id": str(len(self.issues) + 1), "key": key, "fields": fields}
+            self.issues[key] = issue
+            return issue
+
+    def _add_page(self, space_key: str, title: str, content: str, version: int = 1) -> Dict[str, Any]:
+        """페이지 추가"""
+        with self.lock:
+            page_id = str(100000 + len(self.pages) + 1)
+            page = {
+                "id": page_id, "type": "page", "status": "current", "title": title,
+                "space": {"key": space_key},
+                "body": {"storage": {"value": content, "representation": "storage"}},
+                "version": {"number": version},
+                "attachments": []
+            }
+            self.pages[page_id] = page
+            return page
+
+    def create_issue(self, fields: Dict[str, Any]) -> Dict[str, Any]:
+        """요청 필드로 이슈 생성 (필수 필드 검증 오류는 ValueError)"""
+        project = (fields.get("project") or {}).get("key")
+        errors = {}
+        if project not in self.counters:
+            errors["project"] = "valid project is required"
+        if not fields.get("summary"):
+            errors["summary"] = "You must specify a summary of the issue."
+        if errors:
+            raise ValueError(errors)
+
+        now = jira_time(datetime.now(timezone.utc))
+        issue_fields = {
+            "summary": fields["summary"],
+            "description": fields.get("description"),
+            "status": {"name": "Open"},
+            "priority": fields.get("priority") if isinstance(fields.get("priority"), dict) else {"name": "Medium"},
+            "issuetype": fields.get("issuetype") or {"name": "Task"},
+            "assignee": None,
+            "reporter": {"displayName": self.user["displayName"]},
+            "labels": list(fields.get("labels") or []),
+            "components": list(fields.get("components") or []),
+            "created": now,
+            "updated": now,
+            "comment": {"comments": [], "total": 0},
+            "attachment": []
+        }
+        return self._add_issue(project, issue_fields)
+
+    def touch(self, issue: Dict[str, Any]) -> None:
+        """이슈 수정 시각 갱신"""
+        issue["fields"]["updated"] = jira_time(datetime.now(timezone.utc))
+
+
+class JQLFilter:
+    """Minimal JQL evaluator for the clauses the clients generate
+
+    Supports AND-joined clauses on key, project, status, assignee, labels,
+    component, issuetype, text/summary (~) and created/updated comparisons,
+    plus ORDER BY. Unknown clauses are ignored (match everything).
+    """
+
+    _ORDER = re.compile(r"\s+ORDER\s+BY\s+(.+)$|^ORDER\s+BY\s+(.+)$", re.IGNORECASE)
+    _CLAUSE = re.compile(
+        r'^\s*(?P<field>[\w.]+)\s*(?P<op>!=|>=|<=|=|>|<|~|\bnot\s+in\b|\bin\b)\s*(?P<value>.+?)\s*$',
+        re.IGNORECASE
+    )
+
+    def __init__(self, jql: str, current_user: str = ""):
+        self.jql = jql.strip()
+        self.current_user = current_user
+        where, order = self.jql, ""
+        match = self._ORDER.search(self.jql)
+        if match:
+            where = self.jql[:match.start()]
+            order = match.group(1) or match.group(2)
+        self.clauses = [self._parse(part) for part in self._split_and(where) if part.strip()]
+        self.unknown_keys: List[str] = []
+        self.order = [part.strip().split() for part in order.split(",") if part.strip()]
+
+    @staticmethod
+    def _split_and(text: str) -> List[str]:
+        """따옴표/괄호 밖의 AND로 분리"""
+        parts, current, depth, quote = [], [], 0, None
+        i = 0
+        while i < len(text):
+            char = text[i]
+            if quote:
+                current.append(char)
+                if char == "\\" and i + 1 < len(text):
+                    current.append(text[i + 1])
+                    i += 1
+                elif char == quote:
+                    quote = None
+            elif char in "\"'":
+                quote = char
+                current.append(char)
+            elif char == "(":
+                depth += 1
+                current.append(char)
+            elif char == ")":
+                depth -= 1
+                current.append(char)
+            elif depth == 0 and text[i:i + 5].upper() == " AND ":
+                parts.append("".join(current))
+                current = []
+                i += 5
+                continue
+            else:
+                current.append(char)
+            i += 1
+        parts.append("".join(current))
+        return parts
+
+    @staticmethod
+    def _literal(token: str) -> str:
+        """따옴표 문자열 해제"""
+        token = token.strip()
+        if len(token) >= 2 and token[0] == token[-1] and token[0] in "\"'":
+            return re.sub(r"\\(.)", r"\1", token[1:-1])
+        return token
+
+    def _values(self, value: str) -> List[str]:
+        """in (...) 목록 또는 단일 값"""
+        value = value.strip()
+        if value.startswith("(") and value.endswith(")"):
+            return [self._literal(item) for item in self._split_list(value[1:-1]) if item.strip()]
+        return [self._literal(value)]
+
+    @staticmethod
+    def _split_list(text: str) -> List[str]:
+        """따옴표 밖의 쉼표로 분리"""
+        return [match.group(0) for match in re.finditer(r'"(?:\\.|[^"\\])*"|\'(?:\\.|[^\'\\])*\'|[^,]+', text)]
+
+    def _parse(self, clause: str) -> Optional[Tuple[str, str, List[str]]]:
+        """절 하나를 (필드, 연산자, 값 목록)으로 변환"""
+        clause = clause.strip()
+        while clause.startswith("(") and clause.endswith(")"):
+            clause = clause[1:-1].strip()
+        match = self._CLAUSE.match(clause)
+        if not match:
+            return None
+        op = " ".join(match.group("op").lower().split())
+        return match.group("field").lower(), op, self._values(match.group("value"))
+
+    def _field_values(self, issue: Dict[str, Any], field: str) -> List[str]:
+        """이슈에서 비교할 값 목록"""
+        fields = issue["fields"]
+        if field in ("key", "issuekey", "id"):
+            return [issue["key"]]
+        if field == "project":
+            return [fields["project"]["key"]]
+        if field in ("status", "priority", "issuetype", "type"):
+            value = fields.get("issuetype" if field == "type" else field) or {}
+            return [value.get("name", "")]
+        if field == "assignee":
+            return [(fields.get("assignee") or {}).get("displayName", "")]
+        if field == "labels":
+            return list(fields.get("labels") or [])
+        if field in ("component", "components"):
+            return [component.get("name", "") for component in fields.get("components") or []]
+        return []
+
+    @staticmethod
+    def _parse_time(value: str) -> Optional[datetime]:
+        """JQL 날짜 문자열 변환 (yyyy-MM-dd [HH:mm])"""
+        for fmt in ("%Y-%m-%d %H:%M", "%Y/%m/%d %H:%M", "%Y-%m-%d", "%Y/%m/%d"):
+            try:
+                return datetime.strptime(value, fmt).replace(tzinfo=timezone.utc)
+            except ValueError:
+                continue
+        return None
+
+    def matches(self, issue: Dict[str, Any]) -> bool:
+        """이슈가 모든 절을 만족하는지 확인"""
+        for clause in self.clauses:
+            if clause is None:
+                continue
+            field, op, values = clause
+            if field in ("created", "updated"):
+                bound = self._parse_time(values[0])
+                if bound is None:
+                    continue
+                actual = datetime.strptime(issue["fields"][field], JIRA_TIME_FORMAT).replace(tzinfo=timezone.utc)
+                actual = actual.replace(second=0)
+                ok = {">=": actual >= bound, ">": actual > bound, "<=": actual <= bound,
+                      "<": actual < bound, "=": actual == bound}.get(op, True)
+                if not ok:
+                    return False
+                continue
+            if field in ("text", "summary", "description"):
+                needle = values[0].lower().strip("*")
+                haystack = issue["fields"].get("summary", "")
+                if field != "summary":
+                    haystack += " " + StubData.adf_text(issue["fields"].get("description"))
+                if needle not in haystack.lower():
+                    return False
+                continue
+
+            wanted = [self.current_user if value.lower() == "currentuser()" else value for value in values]
+            wanted_lower = {value.lower() for value in wanted}
+            actual_lower = {value.lower() for value in self._field_values(issue, field)}
+            if field not in ("key", "issuekey", "id", "project", "status", "priority", "issuetype", "type",
+                             "assignee", "labels", "component", "components"):
+                continue
+            hit = bool(actual_lower & wanted_lower)
+            if op in ("=", "in") and not hit:
+                return False
+            if op in ("!=", "not in") and hit:
+                return False
+        return True
+
+    def requested_keys(self) -> List[str]:
+        """key = / key in 절에 나온 이슈 키"""
+        keys: List[str] = []
+        for clause in self.clauses:
+            if clause and clause[0] in ("key", "issuekey") and clause[1] in ("=", "in"):
+                keys.extend(value.upper() for value in clause[2])
+        return keys
+
+    def sort(self, issues: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """ORDER BY 적용 (기본: 키 순서)"""
+        for field, *direction in reversed(self.order):
+            reverse = bool(direction) and direction[0].upper() == "DESC"
+            field = field.lower()
+            if field in ("created", "updated"):
+                issues = sorted(issues, key=lambda issue: issue["fields"][field], reverse=reverse)
+            elif field in ("key", "issuekey"):
+                issues = sorted(issues, key=lambda issue: (issue["key"].split("-")[0], int(issue["key"].split("-")[1])),
+                                reverse=reverse)
+        return issues
+
+
+class StubRequestHandler(BaseHTTPRequestHandler):
+    """Routes requests to the stub Jira, Confluence and Bitbucket handlers"""
+
+    protocol_version = "HTTP/1.1"
+    server_version = "AtlassianStub/1.0"
+
+    ROUTES: List[Tuple[str, "re.Pattern", str]] = []
+
+    # ----- 공통 처리 -----
+    def log_message(self, format, *args):
+        if self.server.stub.verbose:
+            super().log_message(format, *args)
+
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+    def do_PUT(self):
+        self._dispatch("PUT")
+
+    def do_DELETE(self):
+        self._dispatch("DELETE")
+
+    def _dispatch(self, method: str) -> None:
+        """라우팅 및 오류/지연 주입"""
+        stub = self.server.stub
+        parts = urlsplit(self.path)
+        self.query = {key: values[-1] for key, values in parse_qs(parts.query, keep_blank_values=True).items()}
+        self.body = self._read_body()
+
+        route, handler, params = "unmatched", None, {}
+        for route_method, pattern, name in self.ROUTES:
+            if route_method != method:
+                continue
+            match = pattern.match(parts.path)
+            if match:
+                route, handler = f"{method} {pattern.pattern}", getattr(self, name)
+                params = {key: unquote(value) for key, value in match.groupdict().items()}
+                break
+
+        self._route = route
+        injected = stub.faults.apply()
+        if injected is not None:
+            status, headers = injected
+            self._send_json(status, {"errorMessages": [f"Injected {status}"], "errors": {}}, headers)
+        elif stub.require_auth and not self.headers.get("Authorization", "").startswith("Basic "):
+            self._send_json(401, {"errorMessages": ["Authentication required"]})
+        elif handler is None:
+            self._send_json(404, {"errorMessages": [f"No stub route for {method} {parts.path}"]})
+        else:
+            try:
+                handler(**params)
+            except KeyError as e:
+                self._send_json(404, {"errorMessages": [f"Not found: {e.args[0]}"], "errors": {}})
+            except ValueError as e:
+                self._send_json(400, {"errorMessages": [str(e)], "errors": {}})
+
+    def _read_body(self) -> bytes:
+        """요청 본문 읽기 (keep-alive 연결 유지를 위해 항상 소비)"""
+        length = int(self.headers.get("Content-Length") or 0)
+        return self.rfile.read(length) if length else b""
+
+    def _json_body(self) -> Any:
+        """JSON 요청 본문"""
+        if not self.body:
+            return {}
+        try:
+            return json.loads(self.body)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid JSON body: {e}")
+
+    def _send(self, status: int, body: bytes, content_type: str = "application/json",
+              headers: Optional[Dict[str, str]] = None) -> None:
+        """응답 전송 (클라이언트가 응답을 받기 전에 통계 기록)"""
+        self.server.stub.record(self._route, status)
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        if body:
+            self.wfile.write(body)
+
+    def _send_json(self, status: int, payload: Any, headers: Optional[Dict[str, str]] = None) -> None:
+        """JSON 응답 전송 (GET 200 응답은 ETag로 조건부 요청 지원)"""
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8") if payload is not None else b""
+        headers = dict(headers or {})
+        if status == 200 and self.command == "GET":
+            etag = '"' + hashlib.sha1(body).hexdigest() + '"'
+            headers["ETag"] = etag
+            if self.headers.get("If-None-Match") == etag:
+                self._send(304, b"", headers=headers)
+                return
+        self._send(status, body, headers=headers)
+
+    def _no_content(self) -> None:
+        self._send(204, b"")
+
+    def _base_url(self) -> str:
+        """절대 URL 생성용 기준 주소"""
+        return f"http://{self.headers.get('Host') or '%s:%s' % self.server.server_address[:2]}"
+
+    def _int_param(self, name: str, default: int, maximum: Optional[int] = None) -> int:
+        """정수 쿼리 파라미터"""
+        try:
+            value = int(self.query.get(name, default))
+        except ValueError:
+            raise ValueError(f"'{name}' must be an integer")
+        value = max(0, value)
+        return min(value, maximum) if maximum else value
+
+    # ----- Jira -----
+    def _project_issue(self, issue: Dict[str, Any]) -> Dict[str, Any]:
+        """fields 파라미터에 따라 응답 필드 제한"""
+        fields_param = self.query.get("fields")
+        result = {"id": issue["id"], "key": issue["key"],
+                  "self": f"{self._base_url()}/rest/api/3/issue/{issue['id']}"}
+        if not fields_param or fields_param in ("*all", "*navigable"):
+            result["fields"] = issue["fields"]
+        else:
+            wanted = [name.strip() for name in fields_param.split(",") if name.strip()]
+            result["fields"] = {name: issue["fields"][name] for name in wanted if name in issue["fields"]}
+        return result
+
+    def jira_myself(self):
+        self._send_json(200, self.server.stub.data.user)
+
+    def jira_search(self):
+        stub = self.server.stub
+        jql = JQLFilter(self.query.get("jql", ""), stub.data.user["displayName"])
+        start_at = self._int_param("startAt", 0)
+        max_results = self._int_param("maxResults", 50, stub.max_results)
+
+        with stub.data.lock:
+            requested = jql.requested_keys()
+            missing = [key for key in requested if key not in stub.data.issues]
+            if missing and self.query.get("validateQuery", "strict") not in ("warn", "false", "none"):
+                raise ValueError(f"An issue with key '{missing[0]}' does not exist for field 'key'.")
+            if requested:
+                candidates = [stub.data.issues[key] for key in dict.fromkeys(requested) if key in stub.data.issues]
+            else:
+                candidates = list(stub.data.issues.values())
+            matched = jql.sort([issue for issue in candidates if jql.matches(issue)])
+            page = [self._project_issue(issue) for issue in matched[start_at:start_at + max_results]]
+
+        payload = {"expand": "names,schema", "startAt": start_at, "maxResults": max_results,
+                   "total": len(matched), "issues": page}
+        if missing:
+            payload["warningMessages"] = [f"The issue key '{key}' does not exist." for key in missing]
+        self._send_json(200, payload)
+
+    def jira_get_issue(self, key):
+        with self.server.stub.data.lock:
+            issue = self.server.stub.data.issues.get(key.upper())
+            if issue is None:
+                self._send_json(404, {"errorMessages": ["Issue does not exist or you do not have permission to see it."],
+                                      "errors": {}})
+                return
+            self._send_json(200, self._project_issue(issue))
+
+    def _created(self, issue: Dict[str, Any]) -> Dict[str, Any]:
+        return {"id": issue["id"], "key": issue["key"], "self": f"{self._base_url()}/rest/api/3/issue/{issue['id']}"}
+
+    def jira_create_issue(self):
+        fields = self._json_body().get("fields", {})
+        try:
+            issue = self.server.stub.data.create_issue(fields)
+        except ValueError as e:
+            self._send_json(400, {"errorMessages": [], "errors": e.args[0]})
+            return
+        self._send_json(201, self._created(issue))
+
+    def jira_bulk_create(self):
+        updates = self._json_body().get("issueUpdates", [])
+        if len(updates) > 50:
+            raise ValueError("The number of issues to create exceeds the limit of 50.")
+        created, errors = [], []
+        for index, update in enumerate(updates):
+            try:
+                created.append(self._created(self.server.stub.data.create_issue(update.get("fields", {}))))
+            except ValueError as e:
+                errors.append({"status": 400, "failedElementNumber": index,
+                               "elementErrors": {"errorMessages": [], "errors": e.args[0]}})
+        self._send_json(201, {"issues": created, "errors": errors})
+
+    def jira_update_issue(self, key):
+        data = self.server.stub.data
+        fields = self._json_body().get("fields", {})
+        with data.lock:
+            issue = data.issues[key.upper()]
+            issue["fields"].update(fields)
+            data.touch(issue)
+        self._no_content()
+
+    def jira_delete_issue(self, key):
+        with self.server.stub.data.lock:
+            del self.server.stub.data.issues[key.upper()]
+        self._no_content()
+
+    def jira_add_comment(self, key):
+        data = self.server.stub.data
+        body = self._json_body().get("body")
+        with data.lock:
+            issue = data.issues[key.upper()]
+            comment = {"id": data.new_id(), "author": {"displayName": data.user["displayName"]}, "body": body,
+                       "created": jira_time(datetime.now(timezone.utc))}
+            issue["fields"]["comment"]["comments"].append(comment)
+            issue["fields"]["comment"]["total"] += 1
+            data.touch(issue)
+        self._send_json(201, comment)
+
+    def _multipart_files(self) -> List[Tuple[str, bytes]]:
+        """multipart/form-data 본문에서 (파일명, 내용) 목록 추출"""
+        match = re.search(r'boundary="?([^";]+)"?', self.headers.get("Content-Type", ""))
+        if not match:
+            raise ValueError("multipart/form-data body with a boundary is required")
+        delimiter = b"--" + match.group(1).encode()
+        files = []
+        for part in self.body.split(delimiter)[1:]:
+            if part.startswith(b"--"):
+                break
+            head, _, content = part.partition(b"\r\n\r\n")
+            name = re.search(rb'filename="([^"]*)"', head)
+            if name:
+                files.append((name.group(1).decode("utf-8", "replace"), content[:-2] if content.endswith(b"\r\n") else content))
+        if not files:
+            raise ValueError("No file part in request")
+        return files
+
+    def _store_attachments(self) -> List[Dict[str, Any]]:
+        """업로드된 파일을 저장하고 첨부 메타데이터 반환"""
+        data = self.server.stub.data
+        result = []
+        for filename, content in self._multipart_files():
+            attachment_id = data.new_id()
+            meta = {"id": attachment_id, "filename": filename, "title": filename, "size": len(content),
+                    "mimeType": "application/octet-stream", "created": jira_time(datetime.now(timezone.utc)),
+                    "content": f"{self._base_url()}/rest/api/3/attachment/content/{attachment_id}"}
+            with data.lock:
+                data.attachments[attachment_id] = dict(meta, data=content)
+            result.append(meta)
+        return result
+
+    def jira_add_attachment(self, key):
+        if self.headers.get("X-Atlassian-Token", "").lower() not in ("no-check", "nocheck"):
+            self._send_json(403, {"errorMessages": ["XSRF check failed"]})
+            return
+        data = self.server.stub.data
+        with data.lock:
+            issue = data.issues[key.upper()]
+        attachments = self._store_attachments()
+        with data.lock:
+            issue["fields"]["attachment"].extend(attachments)
+            data.touch(issue)
+        self._send_json(200, attachments)
+
+    def jira_attachment_content(self, attachment_id):
+        with self.server.stub.data.lock:
+            content = self.server.stub.data.attachments[attachment_id]["data"]
+        total = len(content)
+        match = re.match(r"bytes=(\d+)-(\d*)$", self.headers.get("Range", ""))
+        if not match:
+            self._send(200, content, "application/octet-stream", {"Accept-Ranges": "bytes"})
+            return
+        start = int(match.group(1))
+        end = int(match.group(2)) if match.group(2) else total - 1
+        if start >= total:
+            self._send(416, b"", "application/octet-stream", {"Content-Range": f"bytes */{total}"})
+            return
+        end = min(end, total - 1)
+        self._send(206, content[start:end + 1], "application/octet-stream",
+                   {"Content-Range": f"bytes {start}-{end}/{total}", "Accept-Ranges": "bytes"})
+
+    def jira_projects(self):
+        self._send_json(200, [{"id": str(i + 1), "key": key, "name": f"{key} Project"}
+                              for i, key in enumerate(self.server.stub.data.projects)])
+
+    def jira_project(self, key):
+        projects = self.server.stub.data.projects
+        if key.upper() not in projects:
+            raise KeyError(key)
+        self._send_json(200, {"id": str(projects.index(key.upper()) + 1), "key": key.upper(), "name": f"{key.upper()} Project"})
+
+    # ----- Confluence -----
+    def _confluence_page(self, page: Dict[str, Any]) -> Dict[str, Any]:
+        return {key: value for key, value in page.items() if key != "attachments"}
+
+    def _confluence_list(self, results: List[Any], default_limit: int = 25) -> None:
+        """Confluence 목록 응답 (start/limit 페이지 처리)"""
+        start = self._int_param("start", 0)
+        limit = self._int_param("limit", default_limit, 200)
+        page = results[start:start + limit]
+        payload: Dict[str, Any] = {"results": page, "start": start, "limit": limit, "size": len(page), "_links": {}}
+        if start + limit < len(results):
+            query = dict(self.query, start=start + limit, limit=limit)
+            payload["_links"]["next"] = f"{urlsplit(self.path).path}?{urlencode(query)}"
+        self._send_json(200, payload)
+
+    def confluence_get_content(self):
+        data = self.server.stub.data
+        with data.lock:
+            pages = [self._confluence_page(page) for page in data.pages.values()
+                     if (not self.query.get("spaceKey") or page["space"]["key"] == self.query["spaceKey"])
+                     and (not self.query.get("title") or page["title"] == self.query["title"])]
+        self._confluence_list(pages)
+
+    def confluence_create_page(self):
+        body = self._json_body()
+        space = (body.get("space") or {}).get("key")
+        if space not in self.server.stub.data.spaces or not body.get("title"):
+            raise ValueError("space and title are required")
+        page = self.server.stub.data._add_page(space, body["title"], body.get("body", {}).get("storage", {}).get("value", ""))
+        self._send_json(200, self._confluence_page(page))
+
+    def confluence_get_page(self, page_id):
+        with self.server.stub.data.lock:
+            self._send_json(200, self._confluence_page(self.server.stub.data.pages[page_id]))
+
+    def confluence_update_page(self, page_id):
+        body = self._json_body()
+        with self.server.stub.data.lock:
+            page = self.server.stub.data.pages[page_id]
+            expected = page["version"]["number"] + 1
+            if (body.get("version") or {}).get("number") != expected:
+                self._send_json(409, {"message": f"Version must be incremented to {expected}"})
+                return
+            page["title"] = body.get("title", page["title"])
+            page["body"] = body.get("body", page["body"])
+            page["version"] = {"number": expected}
+            self._send_json(200, self._confluence_page(page))
+
+    def confluence_delete_page(self, page_id):
+        with self.server.stub.data.lock:
+            del self.server.stub.data.pages[page_id]
+        self._no_content()
+
+    def confluence_search(self):
+        cql = self.query.get("cql", "")
+        space = re.search(r'space\s*=\s*"?(\w+)"?', cql)
+        text = re.search(r'(?:text|title)\s*~\s*"((?:\\.|[^"])*)"', cql)
+        with self.server.stub.data.lock:
+            pages = [self._confluence_page(page) for page in self.server.stub.data.pages.values()
+                     if (not space or page["space"]["key"] == space.group(1))
+                     and (not text or text.group(1).lower() in (page["title"] + page["body"]["storage"]["value"]).lower())]
+        self._confluence_list(pages)
+
+    def confluence_spaces(self):
+        self._confluence_list(list(self.server.stub.data.spaces.values()))
+
+    def confluence_space(self, key):
+        self._send_json(200, self.server.stub.data.spaces[key])
+
+    def confluence_attachments(self, page_id):
+        with self.server.stub.data.lock:
+            attachments = list(self.server.stub.data.pages[page_id]["attachments"])
+        self._confluence_list(attachments)
+
+    def confluence_upload(self, page_id):
+        if self.headers.get("X-Atlassian-Token", "").lower() not in ("no-check", "nocheck"):
+            self._send_json(403, {"message": "XSRF check failed"})
+            return
+        with self.server.stub.data.lock:
+            page = self.server.stub.data.pages[page_id]
+        attachments = self._store_attachments()
+        with self.server.stub.data.lock:
+            page["attachments"].extend(attachments)
+        self._send_json(200, {"results": attachments, "size": len(attachments)})
+
+    # ----- Bitbucket (Server 1.0 / Cloud 2.0) -----
+    def _repo(self, project: str, slug: str) -> Dict[str, Any]:
+        return self.server.stub.data.repos[project.upper()][slug]
+
+    def _server_list(self, values: List[Any]) -> None:
+        """Bitbucket Server 목록 응답 (start/limit, isLastPage/nextPageStart)"""
+        start = self._int_param("start", 0)
+        limit = self._int_param("limit", 25, 1000) or 25
+        page = values[start:start + limit]
+        payload: Dict[str, Any] = {"size": len(page), "limit": limit, "start": start, "values": page,
+                                   "isLastPage": start + limit >= len(values)}
+        if not payload["isLastPage"]:
+            payload["nextPageStart"] = start + limit
+        self._send_json(200, payload)
+
+    def _cloud_list(self, values: List[Any]) -> None:
+        """Bitbucket Cloud 목록 응답 (page/pagelen, next 링크)"""
+        page_number = self._int_param("page", 1) or 1
+        pagelen = self._int_param("pagelen", 10, 100) or 10
+        start = (page_number - 1) * pagelen
+        payload: Dict[str, Any] = {"size": len(values), "page": page_number, "pagelen": pagelen,
+                                   "values": values[start:start + pagelen]}
+        if start + pagelen < len(values):
+            query = dict(self.query, page=page_number + 1, pagelen=pagelen)
+            payload["next"] = f"{self._base_url()}{urlsplit(self.path).path}?{urlencode(query)}"
+        self._send_json(200, payload)
+
+    def _repo_json(self, repo: Dict[str, Any], cloud: bool) -> Dict[str, Any]:
+        if cloud:
+            return {"slug": repo["slug"], "name": repo["name"], "full_name": f"{repo['project'].lower()}/{repo['slug']}",
+                    "is_private": True, "scm": "git"}
+        return {"slug": repo["slug"], "name": repo["name"], "scmId": "git", "project": {"key": repo["project"]}}
+
+    def _branch_json(self, repo: Dict[str, Any], name: str, cloud: bool) -> Dict[str, Any]:
+        head = repo["commits"][0]
+        if cloud:
+            return {"name": name, "type": "branch", "target": {"hash": head}}
+        return {"id": f"refs/heads/{name}", "displayId": name, "latestCommit": head, "isDefault": name == "master"}
+
+    def _pr_json(self, pr: Dict[str, Any], cloud: bool) -> Dict[str, Any]:
+        if cloud:
+            return {"id": pr["id"], "title": pr["title"], "state": pr["state"],
+                    "source": {"branch": {"name": pr["source"]}}, "destination": {"branch": {"name": pr["destination"]}}}
+        return {"id": pr["id"], "title": pr["title"], "state": pr["state"],
+                "fromRef": {"id": f"refs/heads/{pr['source']}"}, "toRef": {"id": f"refs/heads/{pr['destination']}"}}
+
+    def _commit_json(self, commit: str, cloud: bool) -> Dict[str, Any]:
+        if cloud:
+            return {"hash": commit, "message": f"Commit {commit[:7]}"}
+        return {"id": commit, "displayId": commit[:11], "message": f"Commit {commit[:7]}"}
+
+    def bitbucket_projects(self):
+        self._server_list([{"key": key, "name": f"{key} Project"} for key in self.server.stub.data.projects])
+
+    def bitbucket_repos(self, project, cloud=False):
+        with self.server.stub.data.lock:
+            values = [self._repo_json(repo, cloud) for repo in self.server.stub.data.repos[project.upper()].values()]
+        (self._cloud_list if cloud else self._server_list)(values)
+
+    def bitbucket_cloud_repos(self, project):
+        self.bitbucket_repos(project, cloud=True)
+
+    def bitbucket_repo(self, project, slug, cloud=False):
+        with self.server.stub.data.lock:
+            self._send_json(200, self._repo_json(self._repo(project, slug), cloud))
+
+    def bitbucket_cloud_repo(self, project, slug):
+        self.bitbucket_repo(project, slug, cloud=True)
+
+    def bitbucket_create_repo(self, project, slug=None, cloud=False):
+        body = self._json_body()
+        slug = slug or body.get("slug") or body.get("name")
+        data = self.server.stub.data
+        with data.lock:
+            repos = data.repos[project.upper()]
+            if slug in repos:
+                self._send_json(409, {"errors": [{"message": f"Repository {slug} already exists"}]})
+                return
+            repos[slug] = {"slug": slug, "name": slug, "project": project.upper(), "branches": ["master"],
+                           "commits": [data.commit_hash(project, slug, 0)], "pull_requests": [], "webhooks": []}
+            self._send_json(201 if not cloud else 200, self._repo_json(repos[slug], cloud))
+
+    def bitbucket_cloud_create_repo(self, project, slug):
+        self.bitbucket_create_repo(project, slug, cloud=True)
+
+    def bitbucket_delete_repo(self, project, slug):
+        with self.server.stub.data.lock:
+            del self.server.stub.data.repos[project.upper()][slug]
+        self._no_content()
+
+    def bitbucket_branches(self, project, slug, cloud=False):
+        with self.server.stub.data.lock:
+            repo = self._repo(project, slug)
+            names = [name for name in repo["branches"] if self.query.get("filterText", "") in name]
+            values = [self._branch_json(repo, name, cloud) for name in names]
+        (self._cloud_list if cloud else self._server_list)(values)
+
+    def bitbucket_cloud_branches(self, project, slug):
+        self.bitbucket_branches(project, slug, cloud=True)
+
+    def bitbucket_cloud_branch(self, project, slug, name):
+        with self.server.stub.data.lock:
+            repo = self._repo(project, slug)
+            if name not in repo["branches"]:
+                raise KeyError(name)
+            self._send_json(200, self._branch_json(repo, name, True))
+
+    def bitbucket_create_branch(self, project, slug, cloud=False):
+        body = self._json_body()
+        with self.server.stub.data.lock:
+            repo = self._repo(project, slug)
+            repo["branches"].append(body["name"])
+            self._send_json(200 if not cloud else 201, self._branch_json(repo, body["name"], cloud))
+
+    def bitbucket_cloud_create_branch(self, project, slug):
+        self.bitbucket_create_branch(project, slug, cloud=True)
+
+    def bitbucket_pull_requests(self, project, slug, cloud=False):
+        state = self.query.get("state", "OPEN").upper()
+        with self.server.stub.data.lock:
+            values = [self._pr_json(pr, cloud) for pr in self._repo(project, slug)["pull_requests"]
+                      if state in ("ALL", pr["state"])]
+        (self._cloud_list if cloud else self._server_list)(values)
+
+    def bitbucket_cloud_pull_requests(self, project, slug):
+        self.bitbucket_pull_requests(project, slug, cloud=True)
+
+    def bitbucket_pull_request(self, project, slug, pr_id, cloud=False):
+        with self.server.stub.data.lock:
+            for pr in self._repo(project, slug)["pull_requests"]:
+                if pr["id"] == int(pr_id):
+                    self._send_json(200, self._pr_json(pr, cloud))
+                    return
+        raise KeyError(pr_id)
+
+    def bitbucket_cloud_pull_request(self, project, slug, pr_id):
+        self.bitbucket_pull_request(project, slug, pr_id, cloud=True)
+
+    def bitbucket_create_pull_request(self, project, slug, cloud=False):
+        body = self._json_body()
+        if cloud:
+            source, destination = body["source"]["branch"]["name"], body["destination"]["branch"]["name"]
+        else:
+            source = body["fromRef"]["id"].replace("refs/heads/", "")
+            destination = body["toRef"]["id"].replace("refs/heads/", "")
+        with self.server.stub.data.lock:
+            prs = self._repo(project, slug)["pull_requests"]
+            pr = {"id": len(prs) + 1, "title": body.get("title", ""), "state": "OPEN",
+                  "source": source, "destination": destination}
+            prs.append(pr)
+            self._send_json(201, self._pr_json(pr, cloud))
+
+    def bitbucket_cloud_create_pull_request(self, project, slug):
+        self.bitbucket_create_pull_request(project, slug, cloud=True)
+
+    def bitbucket_merge(self, project, slug, pr_id, cloud=False):
+        with self.server.stub.data.lock:
+            for pr in self._repo(project, slug)["pull_requests"]:
+                if pr["id"] == int(pr_id):
+                    pr["state"] = "MERGED"
+                    self._send_json(200, self._pr_json(pr, cloud))
+                    return
+        raise KeyError(pr_id)
+
+    def bitbucket_cloud_merge(self, project, slug, pr_id):
+        self.bitbucket_merge(project, slug, pr_id, cloud=True)
+
+    def bitbucket_commits(self, project, slug, cloud=False):
+        with self.server.stub.data.lock:
+            values = [self._commit_json(commit, cloud) for commit in self._repo(project, slug)["commits"]]
+        (self._cloud_list if cloud else self._server_list)(values)
+
+    def bitbucket_cloud_commits(self, project, slug):
+        self.bitbucket_commits(project, slug, cloud=True)
+
+    def bitbucket_commit(self, project, slug, commit, cloud=False):
+        with self.server.stub.data.lock:
+            if commit not in self._repo(project, slug)["commits"]:
+                raise KeyError(commit)
+        self._send_json(200, self._commit_json(commit, cloud))
+
+    def bitbucket_cloud_commit(self, project, slug, commit):
+        self.bitbucket_commit(project, slug, commit, cloud=True)
+
+    def bitbucket_webhooks(self, project, slug, cloud=False):
+        with self.server.stub.data.lock:
+            values = list(self._repo(project, slug)["webhooks"])
+        (self._cloud_list if cloud else self._server_list)(values)
+
+    def bitbucket_cloud_webhooks(self, project, slug):
+        self.bitbucket_webhooks(project, slug, cloud=True)
+
+    def bitbucket_create_webhook(self, project, slug, cloud=False):
+        body = self._json_body()
+        with self.server.stub.data.lock:
+            hooks = self._repo(project, slug)["webhooks"]
+            hook = dict(body, id=len(hooks) + 1)
+            hooks.append(hook)
+            self._send_json(201, hook)
+
+    def bitbucket_cloud_create_webhook(self, project, slug):
+        self.bitbucket_create_webhook(project, slug, cloud=True)
+
+
+def _route(method: str, pattern: str, handler: str) -> Tuple[str, "re.Pattern", str]:
+    return method, re.compile("^" + pattern + "/?$"), handler
+
+
+JIRA = r"/rest/api/(?:2|3)"
+WIKI = r"/wiki/rest/api"
+BB_SERVER = r"/rest/api/1\.0/projects/(?P<project>[^/]+)/repos"
+BB_CLOUD = r"/2\.0/repositories/(?P<project>[^/]+)"
+SEG = r"[^/]+"
+
+StubRequestHandler.ROUTES = [
+    # Jira
+    _route("GET", JIRA + r"/myself", "jira_myself"),
+    _route("GET", JIRA + r"/search", "jira_search"),
+    _route("POST", JIRA + r"/issue/bulk", "jira_bulk_create"),
+    _route("POST", JIRA + r"/issue", "jira_create_issue"),
+    _route("GET", JIRA + rf"/issue/(?P<key>{SEG})", "jira_get_issue"),
+    _route("PUT", JIRA + rf"/issue/(?P<key>{SEG})", "jira_update_issue"),
+    _route("DELETE", JIRA + rf"/issue/(?P<key>{SEG})", "jira_delete_issue"),
+    _route("POST", JIRA + rf"/issue/(?P<key>{SEG})/comment", "jira_add_comment"),
+    _route("POST", JIRA + rf"/issue/(?P<key>{SEG})/attachments", "jira_add_attachment"),
+    _route("GET", JIRA + r"/attachment/content/(?P<attachment_id>\d+)", "jira_attachment_content"),
+    _route("GET", JIRA + r"/project", "jira_projects"),
+    _route("GET", JIRA + rf"/project/(?P<key>{SEG})", "jira_project"),
+    # Confluence
+    _route("GET", WIKI + r"/content", "confluence_get_content"),
+    _route("POST", WIKI + r"/content", "confluence_create_page"),
+    _route("GET", WIKI + r"/content/search", "confluence_search"),
+    _route("GET", WIKI + r"/content/(?P<page_id>\d+)", "confluence_get_page"),
+    _route("PUT", WIKI + r"/content/(?P<page_id>\d+)", "confluence_update_page"),
+    _route("DELETE", WIKI + r"/content/(?P<page_id>\d+)", "confluence_delete_page"),
+    _route("GET", WIKI + r"/content/(?P<page_id>\d+)/child/attachment", "confluence_attachments"),
+    _route("POST", WIKI + r"/content/(?P<page_id>\d+)/child/attachment", "confluence_upload"),
+    _route("GET", WIKI + r"/space", "confluence_spaces"),
+    _route("GET", WIKI + rf"/space/(?P<key>{SEG})", "confluence_space"),
+    # Bitbucket Server
+    _route("GET", r"/rest/api/1\.0/projects", "bitbucket_projects"),
+    _route("GET", BB_SERVER, "bitbucket_repos"),
+    _route("POST", BB_SERVER, "bitbucket_create_repo"),
+    _route("GET", BB_SERVER + rf"/(?P<slug>{SEG})", "bitbucket_repo"),
+    _route("DELETE", BB_SERVER + rf"/(?P<slug>{SEG})", "bitbucket_delete_repo"),
+    _route("GET", BB_SERVER + rf"/(?P<slug>{SEG})/branches", "bitbucket_branches"),
+    _route("POST", BB_SERVER + rf"/(?P<slug>{SEG})/branches", "bitbucket_create_branch"),
+    _route("GET", BB_SERVER + rf"/(?P<slug>{SEG})/pull-requests", "bitbucket_pull_requests"),
+    _route("POST", BB_SERVER + rf"/(?P<slug>{SEG})/pull-requests", "bitbucket_create_pull_request"),
+    _route("GET", BB_SERVER + rf"/(?P<slug>{SEG})/pull-requests/(?P<pr_id>\d+)", "bitbucket_pull_request"),
+    _route("POST", BB_SERVER + rf"/(?P<slug>{SEG})/pull-requests/(?P<pr_id>\d+)/merge", "bitbucket_merge"),
+    _route("GET", BB_SERVER + rf"/(?P<slug>{SEG})/commits", "bitbucket_commits"),
+    _route("GET", BB_SERVER + rf"/(?P<slug>{SEG})/commits/(?P<commit>\w+)", "bitbucket_commit"),
+    _route("GET", BB_SERVER + rf"/(?P<slug>{SEG})/webhooks", "bitbucket_webhooks"),
+    _route("POST", BB_SERVER + rf"/(?P<slug>{SEG})/webhooks", "bitbucket_create_webhook"),
+    # Bitbucket Cloud
+    _route("GET", BB_CLOUD, "bitbucket_cloud_repos"),
+    _route("GET", BB_CLOUD + rf"/(?P<slug>{SEG})", "bitbucket_cloud_repo"),
+    _route("POST", BB_CLOUD + rf"/(?P<slug>{SEG})", "bitbucket_cloud_create_repo"),
+    _route("DELETE", BB_CLOUD + rf"/(?P<slug>{SEG})", "bitbucket_delete_repo"),
+    _route("GET", BB_CLOUD + rf"/(?P<slug>{SEG})/refs/branches", "bitbucket_cloud_branches"),
+    _route("POST", BB_CLOUD + rf"/(?P<slug>{SEG})/refs/branches", "bitbucket_cloud_create_branch"),
+    _route("GET", BB_CLOUD + rf"/(?P<slug>{SEG})/refs/branches/(?P<name>.+)", "bitbucket_cloud_branch"),
+    _route("GET", BB_CLOUD + rf"/(?P<slug>{SEG})/pullrequests", "bitbucket_cloud_pull_requests"),
+    _route("POST", BB_CLOUD + rf"/(?P<slug>{SEG})/pullrequests", "bitbucket_cloud_create_pull_request"),
+    _route("GET", BB_CLOUD + rf"/(?P<slug>{SEG})/pullrequests/(?P<pr_id>\d+)", "bitbucket_cloud_pull_request"),
+    _route("POST", BB_CLOUD + rf"/(?P<slug>{SEG})/pullrequests/(?P<pr_id>\d+)/merge", "bitbucket_cloud_merge"),
+    _route("GET", BB_CLOUD + rf"/(?P<slug>{SEG})/commits", "bitbucket_cloud_commits"),
+    _route("GET", BB_CLOUD + rf"/(?P<slug>{SEG})/commit/(?P<commit>\w+)", "bitbucket_cloud_commit"),
+    _route("GET", BB_CLOUD + rf"/(?P<slug>{SEG})/hooks", "bitbucket_cloud_webhooks"),
+    _route("POST", BB_CLOUD + rf"/(?P<slug>{SEG})/hooks", "bitbucket_cloud_create_webhook"),
+]
+
+
+class StubAtlassianServer:
+    """Threaded local Atlassian stand-in with synthetic data and fault injection
+
+    Serves Jira under ``/rest/api/3``, Confluence under ``/wiki/rest/api`` and
+    Bitbucket Server under ``/rest/api/1.0`` (Cloud-style ``/2.0`` routes are
+    also available), so a single ``url`` works for all three clients.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, data: Optional[StubData] = None,
+                 faults: Optional[FaultInjector] = None, max_results: int = 100, require_auth: bool = True,
+                 verbose: bool = False):
+        """
+        Args:
+            host: 바인드 주소
+            port: 포트 (0이면 빈 포트 자동 선택)
+            data: 합성 데이터 (기본값: StubData())
+            faults: 지연/오류/속도 제한 주입 설정 (기본값: 주입 없음)
+            max_results: 검색 한 페이지 최대 이슈 수 (Jira Cloud와 같은 100)
+            require_auth: Basic 인증 헤더가 없는 요청을 401로 거부
+            verbose: 요청 로그 출력
+        """
+        self.data = data or StubData()
+        self.faults = faults or FaultInjector()
+        self.max_results = max_results
+        self.require_auth = require_auth
+        self.verbose = verbose
+        self._stats_lock = threading.Lock()
+        self.stats: Dict[str, Any] = {}
+        self.reset_stats()
+        self.httpd = ThreadingHTTPServer((host, port), StubRequestHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.stub = self
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """서버 기준 URL (http://host:port)"""
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def record(self, route: str, status: int) -> None:
+        """요청 통계 기록 (라우트별 요청 수, 상태 코드별 수)"""
+        with self._stats_lock:
+            self.stats["requests"] += 1
+            self.stats["routes"][route] = self.stats["routes"].get(route, 0) + 1
+            self.stats["status"][status] = self.stats["status"].get(status, 0) + 1
+
+    def reset_stats(self) -> None:
+        """요청 통계 초기화"""
+        with self._stats_lock:
+            self.stats = {"requests": 0, "routes": {}, "status": {}}
+
+    def start(self) -> "StubAtlassianServer":
+        """백그라운드 스레드에서 서버 시작"""
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name="atlassian-stub", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """서버 종료"""
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "StubAtlassianServer":
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.stop()
+
+
+def main():
+    """명령행에서 스텁 서버 실행"""
+    parser = argparse.ArgumentParser(description="Local Atlassian REST API stand-in server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--issues", type=int, default=300, help="합성 이슈 수")
+    parser.add_argument("--repos", type=int, default=12, help="프로젝트별 저장소 수")
+    parser.add_argument("--branches", type=int, default=20, help="저장소별 브랜치 수")
+    parser.add_argument("--latency", type=float, default=0.0, help="응답 지연 (초)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="추가 무작위 지연 최대값 (초)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="오류 응답 비율 (0~1)")
+    parser.add_argument("--error-status", type=int, default=503)
+    parser.add_argument("--rate-limit", type=float, default=None, help="초당 허용 요청 수")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--verbose", action="store_true")
+    args = parser.parse_args()
+
+    server = StubAtlassianServer(
+        args.host, args.port,
+        data=StubData(issues=args.issues, repos=args.repos, branches=args.branches, seed=args.seed),
+        faults=FaultInjector(args.latency, args.jitter, args.error_rate, args.error_status, args.rate_limit,
+                             seed=args.seed),
+        verbose=args.verbose
+    )
+    print(f"Atlassian stub server: {server.url}")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -3,9 +3,27 @@ Atlassian API 클라이언트 테스트
 """
 
 import unittest
-from unittest.mock import Mock, patch, MagicMock
+from urllib.parse import urlencode
+from unittest.mock import Mock, patch, MagicMock, AsyncMock
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import asyncio
+import inspect
+import json
+import os
+import shutil
+import threading
+import time
+import tempfile
 import requests
-from atlassian_api import JiraAPI, ConfluenceAPI, BitbucketAPI
+from atlassian_api import (
+    JiraAPI, ConfluenceAPI, BitbucketAPI, HTTPTransport, get_transport,
+    RetryPolicy, TokenBucket, rate_limit_delay, ConditionalCache,
+    AsyncJiraAPI, AsyncConfluenceAPI, AsyncBitbucketAPI, AsyncHTTPTransport, AsyncResponse,
+    gather_limited, AIOHTTP_AVAILABLE, JSONArrayStream, MultipartFileStream, MetricsRecorder,
+    CircuitBreaker, CircuitOpenError, deadline, JQLBuilder, JQLFunction
+)
+from stub_server import StubAtlassianServer, StubData, FaultInjector
+from benchmark import BenchmarkSuite, SCENARIOS, compare
 
 
 class TestJiraAPI(unittest.TestCase):
@@ -27,7 +45,7 @@ class TestJiraAPI(unittest.TestCase):
         self.assertEqual(self.jira.auth, ("test@example.com", "test-token"))
         self.assertEqual(self.jira.api_version, "/rest/api/3")
     
-    @patch('requests.request')
+    @patch('requests.Session.request')
     def test_get_issue(self, mock_request):
         """이슈 조회 테스트"""
         mock_response = Mock()
@@ -44,10 +62,11 @@ class TestJiraAPI(unittest.TestCase):
             "https://test.atlassian.net/rest/api/3/issue/TEST-123",
             auth=("test@example.com", "test-token"),
             headers={"Accept": "application/json", "Content-Type": "application/json"},
-            params=None
+            params=None,
+            timeout=(HTTPTransport.DEFAULT_CONNECT_TIMEOUT, HTTPTransport.DEFAULT_READ_TIMEOUT)
         )
     
-    @patch('requests.request')
+    @patch('requests.Session.request')
     def test_create_issue(self, mock_request):
         """이슈 생성 테스트"""
         mock_response = Mock()
@@ -76,7 +95,66 @@ class TestJiraAPI(unittest.TestCase):
         self.assertEqual(sent_data["fields"]["project"]["key"], "TEST")
         self.assertEqual(sent_data["fields"]["summary"], "New Test Issue")
     
-    @patch('requests.request')
+    @patch('requests.Session.request')
+    def test_get_issues_batched(self, mock_request):
+        """여러 키 일괄 조회: URL 길이 기준 청크, 키별 결과, 누락 키 보고"""
+        def respond(method, url, **kwargs):
+            jql = kwargs["params"]["jql"]
+            keys = [part.strip(' "') for part in jql[len("key in ("):-1].split(",")]
+            issues = [{"key": key} for key in keys if key != "TEST-7"]
+            return make_response(body=json.dumps({"issues": issues, "total": len(issues)}))
+        
+        mock_request.side_effect = respond
+        self.jira.MAX_URL_LENGTH = 300
+        keys = [f"test-{i}" for i in range(40)] + ["TEST-1"]
+        
+        result = self.jira.get_issues(keys, fields=["summary"])
+        
+        self.assertGreater(mock_request.call_count, 1)
+        for call in mock_request.call_args_list:
+            params = call[1]["params"]
+            url = call[0][1] + "?" + urlencode(params)
+            self.assertLessEqual(len(url), 300)
+            self.assertEqual(params["fields"], "summary")
+            self.assertEqual(params["validateQuery"], "warn")
+        self.assertEqual(len(result["issues"]), 39)
+        self.assertEqual(list(result["issues"])[:2], ["TEST-0", "TEST-1"])
+        self.assertEqual(result["missing"], ["TEST-7"])
+    
+    @patch('requests.Session.request')
+    def test_bulk_create_issues(self, mock_request):
+        """청크 단위 일괄 생성 및 항목별 결과 테스트"""
+        def respond(method, url, **kwargs):
+            summaries = [update["fields"]["summary"] for update in kwargs["json"]["issueUpdates"]]
+            if "S-2" in summaries:
+                return make_response(500)
+            body = {"issues": [], "errors": []}
+            for i, summary in enumerate(summaries):
+                if summary == "S-5":
+                    body["errors"].append({
+                        "status": 400, "failedElementNumber": i,
+                        "elementErrors": {"errorMessages": [], "errors": {"summary": "invalid"}}
+                    })
+                else:
+                    body["issues"].append({"id": summary[2:], "key": f"TEST-{summary[2:]}"})
+            return make_response(201, body=json.dumps(body))
+        
+        mock_request.side_effect = respond
+        issues = [{"project_key": "TEST", "issue_type": "Task", "summary": f"S-{i}"} for i in range(7)]
+        
+        results = self.jira.bulk_create_issues(issues, chunk_size=2, max_workers=3)
+        
+        self.assertEqual(mock_request.call_count, 4)
+        self.assertTrue(all(call[0][1].endswith("/issue/bulk") for call in mock_request.call_args_list))
+        self.assertEqual([r["index"] for r in results], list(range(7)))
+        self.assertEqual([r["key"] for r in results if r["success"]], ["TEST-0", "TEST-1", "TEST-4", "TEST-6"])
+        # 요청 자체가 실패한 청크는 모든 항목이 실패
+        self.assertFalse(results[2]["success"])
+        self.assertFalse(results[3]["success"])
+        self.assertIn("JIRA API 요청 실패", results[3]["error"])
+        self.assertEqual(results[5]["error"], "summary: invalid")
+    
+    @patch('requests.Session.request')
     def test_search_issues(self, mock_request):
         """JQL 검색 테스트"""
         mock_response = Mock()
@@ -95,7 +173,123 @@ class TestJiraAPI(unittest.TestCase):
         self.assertEqual(call_args[1]["params"]["jql"], "project = TEST")
         self.assertEqual(call_args[1]["params"]["maxResults"], 10)
     
-    @patch('requests.request')
+    @patch('requests.Session.request')
+    def test_field_projection(self, mock_request):
+        """fields/expand 프로젝션 파라미터 테스트"""
+        mock_response = Mock()
+        mock_response.text = '{"issues": [], "total": 0}'
+        mock_response.json.return_value = {"issues": [], "total": 0}
+        mock_response.raise_for_status = Mock()
+        mock_request.return_value = mock_response
+        
+        self.jira.search_issues("project = TEST", fields=["summary", "status"], expand="renderedFields")
+        params = mock_request.call_args[1]["params"]
+        self.assertEqual(params["fields"], "summary,status")
+        self.assertEqual(params["expand"], "renderedFields")
+        
+        self.jira.get_issue("TEST-1", fields="summary,comment")
+        self.assertEqual(mock_request.call_args[1]["params"], {"fields": "summary,comment"})
+    
+    @patch('requests.Session.request')
+    def test_iter_search_issues_pagination(self, mock_request):
+        """페이지 자동 순회 검색 테스트"""
+        pages = [
+            {"issues": [{"key": "TEST-1"}, {"key": "TEST-2"}], "startAt": 0, "total": 5},
+            {"issues": [{"key": "TEST-3"}, {"key": "TEST-4"}], "startAt": 2, "total": 5},
+            {"issues": [{"key": "TEST-5"}], "startAt": 4, "total": 5},
+        ]
+        responses = []
+        for page in pages:
+            mock_response = Mock()
+            mock_response.text = "{...}"
+            mock_response.json.return_value = page
+            mock_response.raise_for_status = Mock()
+            responses.append(mock_response)
+        mock_request.side_effect = responses
+        
+        keys = [issue["key"] for issue in self.jira.iter_search_issues("project = TEST", page_size=2)]
+        
+        self.assertEqual(keys, ["TEST-1", "TEST-2", "TEST-3", "TEST-4", "TEST-5"])
+        start_ats = [call[1]["params"]["startAt"] for call in mock_request.call_args_list]
+        self.assertEqual(start_ats, [0, 2, 4])
+    
+    @patch('requests.Session.request')
+    def test_iter_search_issues_streaming(self, mock_request):
+        """스트리밍 디코딩 검색 (본문을 작은 청크로 받아 이슈 단위로 디코딩)"""
+        pages = [
+            {"startAt": 0, "total": 3, "issues": [{"key": "TEST-1"}, {"key": "TEST-2"}]},
+            {"startAt": 2, "issues": [{"key": "TEST-3", "fields": {"summary": "a \"]}\\ b"}}], "total": 3},
+        ]
+        responses = []
+        for page in pages:
+            body = json.dumps(page).encode()
+            response = make_response(body=body.decode())
+            response.iter_content.side_effect = lambda chunk_size, body=body: (body[i:i + 5] for i in range(0, len(body), 5))
+            responses.append(response)
+        mock_request.side_effect = responses
+        
+        issues = list(self.jira.iter_search_issues("project = TEST", page_size=2, stream=True))
+        
+        self.assertEqual([issue["key"] for issue in issues], ["TEST-1", "TEST-2", "TEST-3"])
+        self.assertEqual(issues[2]["fields"]["summary"], 'a "]}\\ b')
+        self.assertTrue(all(call[1]["stream"] for call in mock_request.call_args_list))
+        self.assertTrue(all(response.close.called for response in responses))
+        response.json.assert_not_called()
+    
+    @patch('requests.Session.request')
+    def test_iter_search_issues_stops_early(self, mock_request):
+        """소비자가 순회를 멈추면 다음 페이지를 요청하지 않음"""
+        mock_response = Mock()
+        mock_response.text = "{...}"
+        mock_response.json.return_value = {"issues": [{"key": "TEST-1"}, {"key": "TEST-2"}], "total": 1000}
+        mock_response.raise_for_status = Mock()
+        mock_request.return_value = mock_response
+        
+        iterator = self.jira.iter_search_issues("project = TEST", page_size=2)
+        first = next(iterator)
+        iterator.close()
+        
+        self.assertEqual(first["key"], "TEST-1")
+        self.assertEqual(mock_request.call_count, 1)
+    
+    def _paged_search_response(self, total):
+        """startAt 파라미터에 맞는 검색 페이지를 반환하는 side_effect 생성"""
+        def side_effect(method, url, **kwargs):
+            start_at = kwargs["params"]["startAt"]
+            size = kwargs["params"]["maxResults"]
+            mock_response = Mock()
+            mock_response.text = "{...}"
+            mock_response.json.return_value = {
+                "issues": [{"key": f"TEST-{i}"} for i in range(start_at, min(start_at + size, total))],
+                "startAt": start_at,
+                "total": total
+            }
+            mock_response.raise_for_status = Mock()
+            return mock_response
+        return side_effect
+    
+    @patch('requests.Session.request')
+    def test_iter_search_issues_parallel_ordered(self, mock_request):
+        """병렬 페이지 조회 (순서 보장) 테스트"""
+        mock_request.side_effect = self._paged_search_response(total=23)
+        
+        keys = [issue["key"] for issue in self.jira.iter_search_issues_parallel("project = TEST", page_size=5, max_workers=3)]
+        
+        self.assertEqual(keys, [f"TEST-{i}" for i in range(23)])
+        self.assertEqual(mock_request.call_count, 5)
+    
+    @patch('requests.Session.request')
+    def test_iter_search_issues_parallel_unordered(self, mock_request):
+        """병렬 페이지 조회 (도착 순서) 테스트"""
+        mock_request.side_effect = self._paged_search_response(total=23)
+        
+        keys = [issue["key"] for issue in self.jira.iter_search_issues_parallel(
+            "project = TEST", page_size=5, max_workers=3, ordered=False)]
+        
+        self.assertEqual(sorted(keys), sorted(f"TEST-{i}" for i in range(23)))
+        self.assertEqual(len(keys), 23)
+    
+    @patch('requests.Session.request')
     def test_request_error_handling(self, mock_request):
         """에러 처리 테스트"""
         mock_request.side_effect = requests.exceptions.RequestException("Connection error")
@@ -106,6 +300,47 @@ class TestJiraAPI(unittest.TestCase):
         self.assertIn("JIRA API 요청 실패", str(context.exception))
 
 
+class TestJQLBuilder(unittest.TestCase):
+    """JQL 빌더 테스트"""
+    
+    def test_values_are_quoted_and_escaped(self):
+        """따옴표/역슬래시/Lucene 예약 문자가 포함된 값"""
+        jql = JQLBuilder().text('it\'s "new" [C++]').project("TM").build()
+        
+        self.assertEqual(jql, 'text ~ "it\'s \\"new\\" \\\\[C\\\\+\\\\+\\\\]" AND project = "TM"')
+        self.assertEqual(JQLBuilder().status('Done" OR project = "X').build(),
+                         'status = "Done\\" OR project = \\"X"')
+    
+    def test_compose_filters(self):
+        """조건 결합, 목록 값, 함수, 빈 값 무시"""
+        jql = (JQLBuilder()
+               .text("  ")
+               .status(["Open", "In Progress"])
+               .assignee(JQLBuilder.CURRENT_USER)
+               .labels([])
+               .where("Story Points", ">=", 3)
+               .order_by("updated", descending=True)
+               .build())
+        
+        self.assertEqual(jql, 'status in ("Open", "In Progress") AND assignee = currentUser() '
+                              'AND "Story Points" >= 3 ORDER BY updated DESC')
+        self.assertEqual(JQLBuilder().assignee(JQLBuilder.EMPTY).build(), "assignee is EMPTY")
+        self.assertEqual(JQLBuilder().build(), "")
+        self.assertIsInstance(JQLBuilder.CURRENT_USER, JQLFunction)
+        with self.assertRaises(ValueError):
+            JQLBuilder().where("status", "= 1 OR", "x")
+    
+    def test_db_selection_and_any_of(self):
+        """DB 선택은 지정한 한 필드(기본 레이블)로, any_of는 OR 그룹으로 변환"""
+        jql = JQLBuilder().db_selection({"db2": "Main Schema", "db1": "Prod", "db3": ""}).build()
+        self.assertEqual(jql, 'labels = "Prod" AND labels = "Main Schema"')
+        jql = JQLBuilder().db_selection({"db1": "Prod"}, field="cf[10100]").build()
+        self.assertEqual(jql, 'cf[10100] = "Prod"')
+        
+        jql = JQLBuilder().any_of(JQLBuilder().status("Open").project("A"), JQLBuilder().status("Done")).build()
+        self.assertEqual(jql, '((status = "Open" AND project = "A") OR status = "Done")')
+
+
 class TestConfluenceAPI(unittest.TestCase):
     """Confluence API 클라이언트 테스트"""
     
@@ -132,7 +367,7 @@ class TestConfluenceAPI(unittest.TestCase):
         )
         self.assertEqual(confluence2.domain_url, "https://test.atlassian.net/wiki")
     
-    @patch('requests.request')
+    @patch('requests.Session.request')
     def test_get_page_by_id(self, mock_request):
         """페이지 ID로 조회 테스트"""
         mock_response = Mock()
@@ -150,7 +385,7 @@ class TestConfluenceAPI(unittest.TestCase):
         call_args = mock_request.call_args
         self.assertEqual(call_args[1]["params"]["expand"], "body.storage,version")
     
-    @patch('requests.request')
+    @patch('requests.Session.request')
     def test_create_page(self, mock_request):
         """페이지 생성 테스트"""
         mock_response = Mock()
@@ -176,7 +411,7 @@ class TestConfluenceAPI(unittest.TestCase):
         self.assertEqual(sent_data["space"]["key"], "TEST")
         self.assertEqual(sent_data["ancestors"][0]["id"], "12345")
     
-    @patch('requests.request')
+    @patch('requests.Session.request')
     def test_search_content(self, mock_request):
         """CQL 검색 테스트"""
         mock_response = Mock()
@@ -194,9 +429,8 @@ class TestConfluenceAPI(unittest.TestCase):
         self.assertEqual(call_args[1]["params"]["cql"], "space=TEST and type=page")
         self.assertEqual(call_args[1]["params"]["limit"], 50)
     
-    @patch('builtins.open', new_callable=unittest.mock.mock_open, read_data=b"file content")
-    @patch('requests.post')
-    def test_upload_attachment(self, mock_post, mock_open):
+    @patch('requests.Session.request')
+    def test_upload_attachment(self, mock_post):
         """첨부파일 업로드 테스트"""
         mock_response = Mock()
         mock_response.text = '{"results": [{"id": "att123", "title": "test.pdf"}]}'
@@ -204,13 +438,18 @@ class TestConfluenceAPI(unittest.TestCase):
         mock_response.raise_for_status = Mock()
         mock_post.return_value = mock_response
         
-        result = self.confluence.upload_attachment("12345", "/path/to/test.pdf")
+        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as f:
+            f.write(b"file content")
+        self.addCleanup(os.remove, f.name)
+        
+        result = self.confluence.upload_attachment("12345", f.name)
         
         self.assertIn("results", result)
         
-        # multipart 업로드 확인
+        # 디스크에서 스트리밍하는 multipart 업로드 확인
         call_args = mock_post.call_args
-        self.assertIn("files", call_args[1])
+        self.assertIsInstance(call_args[1]["data"], MultipartFileStream)
+        self.assertTrue(call_args[1]["headers"]["Content-Type"].startswith("multipart/form-data; boundary="))
         self.assertEqual(call_args[1]["headers"]["X-Atlassian-Token"], "nocheck")
 
 
@@ -245,7 +484,7 @@ class TestBitbucketAPI(unittest.TestCase):
         self.assertEqual(self.bitbucket_server.api_version, "/rest/api/1.0")
         self.assertFalse(self.bitbucket_server.is_cloud)
     
-    @patch('requests.request')
+    @patch('requests.Session.request')
     def test_get_repositories_cloud(self, mock_request):
         """저장소 목록 조회 테스트 (Cloud)"""
         mock_response = Mock()
@@ -262,7 +501,7 @@ class TestBitbucketAPI(unittest.TestCase):
         call_args = mock_request.call_args
         self.assertIn("/2.0/repositories/workspace", call_args[0][1])
     
-    @patch('requests.request')
+    @patch('requests.Session.request')
     def test_get_repositories_server(self, mock_request):
         """저장소 목록 조회 테스트 (Server)"""
         mock_response = Mock()
@@ -275,11 +514,11 @@ class TestBitbucketAPI(unittest.TestCase):
         
         self.assertIn("values", result)
         
-        # URL 확인
+        # URL 확인 (프로젝트 목록이 아닌 프로젝트의 저장소 목록)
         call_args = mock_request.call_args
-        self.assertIn("/rest/api/1.0/projects", call_args[0][1])
+        self.assertTrue(call_args[0][1].endswith("/rest/api/1.0/projects/PROJECT/repos"))
     
-    @patch('requests.request')
+    @patch('requests.Session.request')
     def test_create_pull_request_cloud(self, mock_request):
         """Pull Request 생성 테스트 (Cloud)"""
         mock_response = Mock()
@@ -306,7 +545,7 @@ class TestBitbucketAPI(unittest.TestCase):
         self.assertEqual(sent_data["source"]["branch"]["name"], "feature")
         self.assertEqual(sent_data["destination"]["branch"]["name"], "main")
     
-    @patch('requests.request')
+    @patch('requests.Session.request')
     def test_get_commits(self, mock_request):
         """커밋 목록 조회 테스트"""
         mock_response = Mock()
@@ -323,7 +562,7 @@ class TestBitbucketAPI(unittest.TestCase):
         call_args = mock_request.call_args
         self.assertEqual(call_args[1]["params"]["branch"], "main")
     
-    @patch('requests.request')
+    @patch('requests.Session.request')
     def test_create_webhook(self, mock_request):
         """웹훅 생성 테스트"""
         mock_response = Mock()
@@ -348,6 +587,1005 @@ class TestBitbucketAPI(unittest.TestCase):
         self.assertIn("pullrequest:created", sent_data["events"])
 
 
+class TestJSONArrayStream(unittest.TestCase):
+    """스트리밍 JSON 배열 디코더 테스트"""
+    
+    def test_chunk_boundaries(self):
+        """청크 경계와 무관하게 항목과 메타 정보를 디코딩"""
+        payload = {
+            "size": 2, "values": [{"id": 1, "name": "x\\\"y", "tags": [[], {}]}, {"id": 2, "ok": True}],
+            "isLastPage": False, "nextPageStart": 2
+        }
+        body = json.dumps(payload).encode()
+        for size in (1, 3, 64):
+            stream = JSONArrayStream([body[i:i + size] for i in range(0, len(body), size)])
+            self.assertEqual(list(stream), payload["values"])
+            self.assertEqual(stream.array_key, "values")
+            self.assertEqual(stream.meta, {"size": 2, "isLastPage": False, "nextPageStart": 2})
+    
+    def test_custom_decoder_and_bare_array(self):
+        """사용자 디코더 및 최상위 배열 지원"""
+        loads = Mock(side_effect=json.loads)
+        stream = JSONArrayStream([b'[{"a": 1}, ', b'2, "three"]'], loads=loads)
+        self.assertEqual(list(stream), [{"a": 1}, 2, "three"])
+        self.assertEqual(loads.call_count, 3)
+        
+        with self.assertRaises(ValueError):
+            list(JSONArrayStream([b'{"issues": [1, 2']))
+
+
+class TestAttachmentPipeline(unittest.TestCase):
+    """첨부파일 업로드/다운로드 파이프라인 테스트"""
+    
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmpdir)
+        self.jira = JiraAPI("https://test.atlassian.net", "user", "token", transport=HTTPTransport())
+        self.jira.transport._sleep = Mock()
+    
+    def _write(self, name, content):
+        path = os.path.join(self.tmpdir, name)
+        with open(path, "wb") as f:
+            f.write(content)
+        return path
+    
+    def test_multipart_stream_body(self):
+        """multipart 본문 형식과 바이트 단위 진행률"""
+        content = os.urandom(100000)
+        path = self._write("log.bin", content)
+        progress = Mock()
+        
+        with MultipartFileStream(path, progress=progress) as body:
+            data = b"".join(iter(lambda: body.read(8192), b""))
+        
+        self.assertEqual(len(data), len(body))
+        self.assertTrue(data.startswith(f"--{body.boundary}\r\n".encode()))
+        self.assertIn(b'name="file"; filename="log.bin"', data)
+        self.assertIn(content, data)
+        self.assertTrue(data.endswith(f"\r\n--{body.boundary}--\r\n".encode()))
+        self.assertEqual(progress.call_args[0], (path, len(content), len(content)))
+        self.assertGreater(progress.call_count, 10)
+    
+    @patch('requests.Session.request')
+    def test_add_attachments_concurrently(self, mock_request):
+        """여러 파일 동시 업로드 및 파일별 결과"""
+        def respond(method, url, **kwargs):
+            body = kwargs["data"].read()
+            if b"broken" in body:
+                return make_response(413)
+            return make_response(body=json.dumps([{"id": "1", "size": len(body)}]))
+        
+        mock_request.side_effect = respond
+        paths = [self._write(f"f{i}.txt", b"ok" * 10) for i in range(3)] + [self._write("big.txt", b"broken")]
+        
+        results = self.jira.add_attachments("TEST-1", paths, max_workers=3)
+        
+        self.assertEqual([r["path"] for r in results], paths)
+        self.assertEqual([r["success"] for r in results], [True, True, True, False])
+        self.assertIn("JIRA API 요청 실패", results[3]["error"])
+        self.assertEqual(mock_request.call_args[0][1], "https://test.atlassian.net/rest/api/3/issue/TEST-1/attachments")
+        self.assertEqual(mock_request.call_args[1]["headers"]["X-Atlassian-Token"], "no-check")
+    
+    @patch('requests.Session.request')
+    def test_download_resumes_with_range(self, mock_request):
+        """연결이 끊기면 Range 요청으로 이어받기"""
+        content = bytes(range(256)) * 40
+        
+        def interrupted(chunk_size):
+            yield content[:4000]
+            raise requests.exceptions.ChunkedEncodingError("connection reset")
+        
+        first = make_response(headers={"Content-Length": str(len(content))})
+        first.iter_content.side_effect = interrupted
+        second = make_response(206, headers={"Content-Range": f"bytes 4000-{len(content) - 1}/{len(content)}"})
+        second.iter_content.return_value = iter([content[4000:7000], content[7000:]])
+        mock_request.side_effect = [first, second]
+        progress = Mock()
+        dest = os.path.join(self.tmpdir, "download.bin")
+        
+        self.jira.download_attachment("10001", dest, progress=progress)
+        
+        with open(dest, "rb") as f:
+            self.assertEqual(f.read(), content)
+        self.assertFalse(os.path.exists(dest + ".part"))
+        self.assertNotIn("Range", mock_request.call_args_list[0][1]["headers"])
+        self.assertEqual(mock_request.call_args_list[1][1]["headers"]["Range"], "bytes=4000-")
+        self.assertEqual(progress.call_args[0], (dest, len(content), len(content)))
+
+
+class TestBitbucketPagination(unittest.TestCase):
+    """Bitbucket 목록 API 페이지 처리 테스트"""
+    
+    def setUp(self):
+        self.cloud = BitbucketAPI("https://api.bitbucket.org", "username", "app-password")
+        self.server = BitbucketAPI("https://bitbucket.company.com", "username", "password")
+    
+    @patch('requests.Session.request')
+    def test_cloud_follows_next_links(self, mock_request):
+        """Cloud: next 링크를 따라 모든 저장소 조회"""
+        next_url = "https://api.bitbucket.org/2.0/repositories/ws?pagelen=2&page=2"
+        mock_request.side_effect = [
+            make_response(body=json.dumps({"values": [{"slug": "a"}, {"slug": "b"}], "next": next_url})),
+            make_response(body=json.dumps({"values": [{"slug": "c"}]})),
+        ]
+        
+        repos = [repo["slug"] for repo in self.cloud.iter_repositories("ws", page_size=2)]
+        
+        self.assertEqual(repos, ["a", "b", "c"])
+        first, second = mock_request.call_args_list
+        self.assertEqual(first[1]["params"], {"pagelen": 2})
+        self.assertEqual(second[0][1], next_url)
+        self.assertIsNone(second[1]["params"])
+    
+    @patch('requests.Session.request')
+    def test_server_uses_next_page_start(self, mock_request):
+        """Server: isLastPage/nextPageStart로 페이지 이동"""
+        mock_request.side_effect = [
+            make_response(body=json.dumps({"values": [{"id": "b1"}, {"id": "b2"}], "isLastPage": False, "nextPageStart": 2})),
+            make_response(body=json.dumps({"values": [{"id": "b3"}], "isLastPage": True})),
+        ]
+        
+        branches = [branch["id"] for branch in self.server.iter_branches("PROJ", "repo", page_size=2)]
+        
+        self.assertEqual(branches, ["b1", "b2", "b3"])
+        self.assertTrue(mock_request.call_args_list[0][0][1].endswith("/rest/api/1.0/projects/PROJ/repos/repo/branches"))
+        self.assertEqual(mock_request.call_args_list[1][1]["params"], {"limit": 2, "start": 2})
+    
+    @patch('requests.Session.request')
+    def test_prefetch_and_early_stop(self, mock_request):
+        """prefetch 시 다음 페이지를 미리 요청하고, 중단하면 더 요청하지 않음"""
+        pages = [
+            {"values": [{"id": i}], "isLastPage": i == 4, "nextPageStart": i + 1}
+            for i in range(5)
+        ]
+        mock_request.side_effect = [make_response(body=json.dumps(page)) for page in pages]
+        
+        iterator = self.server.iter_pull_requests("PROJ", "repo", prefetch=True)
+        self.assertEqual(next(iterator)["id"], 0)
+        # 첫 페이지를 소비하는 동안 두 번째 페이지 요청이 이미 시작됨
+        for _ in range(100):
+            if mock_request.call_count == 2:
+                break
+            time.sleep(0.01)
+        self.assertEqual(mock_request.call_count, 2)
+        self.assertEqual(next(iterator)["id"], 1)
+        iterator.close()
+        
+        self.assertLessEqual(mock_request.call_count, 3)
+        self.assertEqual(mock_request.call_args_list[0][1]["params"], {"state": "OPEN"})
+
+
+class TestRequestCoalescing(unittest.TestCase):
+    """동시 동일 GET 요청 공유(single-flight) 테스트"""
+    
+    def _run_concurrently(self, func, count):
+        results, errors = [], []
+        
+        def worker():
+            try:
+                results.append(func())
+            except Exception as e:
+                errors.append(e)
+        
+        threads = [threading.Thread(target=worker) for _ in range(count)]
+        for thread in threads:
+            thread.start()
+        return threads, results, errors
+    
+    @patch('requests.Session.request')
+    def test_identical_gets_share_one_request(self, mock_request):
+        """동시에 들어온 같은 GET은 네트워크 요청 1회"""
+        release = threading.Event()
+        
+        def slow_response(method, url, **kwargs):
+            release.wait(5)
+            return make_response(body='{"displayName": "Test User"}')
+        
+        mock_request.side_effect = slow_response
+        jira = JiraAPI("https://test.atlassian.net", "user", "token", transport=HTTPTransport())
+        
+        threads, results, errors = self._run_concurrently(jira.get_current_user, 8)
+        time.sleep(0.1)
+        release.set()
+        for thread in threads:
+            thread.join()
+        
+        self.assertEqual(errors, [])
+        self.assertEqual(mock_request.call_count, 1)
+        self.assertEqual([r["displayName"] for r in results], ["Test User"] * 8)
+        
+        # 진행 중인 요청이 끝난 뒤의 요청은 새로 전송
+        jira.get_current_user()
+        self.assertEqual(mock_request.call_count, 2)
+    
+    @patch('requests.Session.request')
+    def test_errors_fan_out_and_different_requests_not_shared(self, mock_request):
+        """실패도 모든 대기자에게 전달, 파라미터가 다르면 별도 요청"""
+        release = threading.Event()
+        
+        def failing(method, url, **kwargs):
+            release.wait(5)
+            raise requests.exceptions.HTTPError("500 Error")
+        
+        mock_request.side_effect = failing
+        transport = HTTPTransport(retry_policy=RetryPolicy(max_retries=0))
+        jira = JiraAPI("https://test.atlassian.net", "user", "token", transport=transport)
+        
+        threads, results, errors = self._run_concurrently(lambda: jira.get_issue("TEST-1"), 4)
+        other = threading.Thread(target=lambda: self.assertRaises(Exception, jira.get_issue, "TEST-2"))
+        other.start()
+        time.sleep(0.1)
+        release.set()
+        for thread in threads + [other]:
+            thread.join()
+        
+        self.assertEqual(results, [])
+        self.assertEqual(len(errors), 4)
+        self.assertTrue(all("JIRA API 요청 실패" in str(e) for e in errors))
+        self.assertEqual(mock_request.call_count, 2)
+    
+    @patch('requests.Session.request')
+    def test_follower_respects_own_deadline(self, mock_request):
+        """공유 요청을 기다리는 대기자도 자신의 작업 기한에서 중단"""
+        release = threading.Event()
+        
+        def slow_response(method, url, **kwargs):
+            release.wait(5)
+            return make_response(body='{"displayName": "Test User"}')
+        
+        mock_request.side_effect = slow_response
+        jira = JiraAPI("https://test.atlassian.net", "user", "token", transport=HTTPTransport())
+        
+        threads, results, errors = self._run_concurrently(jira.get_current_user, 1)
+        time.sleep(0.05)
+        start = time.monotonic()
+        with deadline(0.1):
+            with self.assertRaises(Exception) as context:
+                jira.get_current_user()
+        waited = time.monotonic() - start
+        release.set()
+        for thread in threads:
+            thread.join()
+        
+        self.assertIn("작업 제한 시간 초과", str(context.exception))
+        self.assertLess(waited, 4)
+        self.assertEqual(len(results), 1)
+        self.assertEqual(mock_request.call_count, 1)
+
+
+class TestInstrumentation(unittest.TestCase):
+    """엔드포인트별 요청 계측 테스트"""
+    
+    @patch('requests.Session.request')
+    def test_metrics_per_endpoint(self, mock_request):
+        """요청 수, 상태 코드, 재시도, 바이트 수 집계"""
+        mock_request.side_effect = [
+            make_response(429, headers={"Retry-After": "0"}),
+            make_response(body='{"key": "TEST-1"}'),
+            make_response(body='{"key": "TEST-22"}'),
+            make_response(404),
+            make_response(201, body='{"key": "TEST-3"}'),
+        ]
+        transport = HTTPTransport(retry_policy=RetryPolicy(max_retries=2, backoff_base=0))
+        transport._sleep = Mock()
+        jira = JiraAPI("https://test.atlassian.net", "user", "token", transport=transport)
+        recorder = jira.add_instrumentation()
+        
+        jira.get_issue("TEST-1")
+        jira.get_issue("TEST-22")
+        with self.assertRaises(Exception):
+            jira.get_issue("OTHER-5")
+        jira.create_issue("TEST", "Task", "Summary")
+        
+        snapshot = recorder.snapshot()
+        issue = snapshot["GET test.atlassian.net/rest/api/3/issue/{key}"]
+        self.assertEqual(issue["count"], 3)
+        self.assertEqual(issue["errors"], 1)
+        self.assertEqual(issue["retries"], 1)
+        self.assertEqual(issue["status_codes"], {"200": 2, "404": 1})
+        self.assertGreater(issue["bytes_in"], 0)
+        self.assertLessEqual(issue["latency"]["p50"], issue["latency"]["p99"])
+        
+        create = snapshot["POST test.atlassian.net/rest/api/3/issue"]
+        self.assertEqual(create["status_codes"], {"201": 1})
+        self.assertGreater(create["bytes_out"], 0)
+        
+        self.assertEqual(json.loads(recorder.to_json()), json.loads(json.dumps(snapshot)))
+        text = recorder.to_prometheus()
+        self.assertIn('atlassian_api_requests_total{host="test.atlassian.net",method="GET",'
+                      'endpoint="/rest/api/3/issue/{key}",status="200"} 2', text)
+        self.assertIn('atlassian_api_request_duration_seconds_count{host="test.atlassian.net",method="GET",'
+                      'endpoint="/rest/api/3/issue/{key}"} 3', text)
+        self.assertIn('le="+Inf"', text)
+        
+        transport.remove_hook(recorder)
+        recorder.reset()
+        self.assertEqual(recorder.snapshot(), {})
+    
+    def test_endpoint_templates(self):
+        """이슈 키, 숫자 ID, 커밋 해시를 자리표시자로 변환"""
+        self.assertEqual(MetricsRecorder.endpoint_of("https://x/rest/api/3/issue/ABC-12/comment?x=1"),
+                         "/rest/api/3/issue/{key}/comment")
+        self.assertEqual(MetricsRecorder.endpoint_of("https://x/rest/api/content/98765/child/attachment"),
+                         "/rest/api/content/{id}/child/attachment")
+        self.assertEqual(MetricsRecorder.endpoint_of("https://x/2.0/repositories/ws/repo/commit/3f2a9c1d"),
+                         "/2.0/repositories/ws/repo/commit/{hash}")
+    
+    def test_failing_hook_does_not_break_requests(self):
+        """훅 오류는 요청 결과에 영향 없음"""
+        transport = HTTPTransport()
+        transport.add_hook(Mock(side_effect=RuntimeError("broken hook")))
+        with patch('requests.Session.request', return_value=make_response(body='{"ok": true}')):
+            jira = JiraAPI("https://test.atlassian.net", "user", "token", transport=transport)
+            self.assertEqual(jira.get_current_user(), {"ok": True})
+
+
+class TestHTTPTransport(unittest.TestCase):
+    """공유 HTTP transport 테스트"""
+    
+    def test_clients_share_transport_per_host(self):
+        """같은 도메인의 클라이언트는 transport를 공유"""
+        jira = JiraAPI("https://shared.atlassian.net", "user", "token")
+        confluence = ConfluenceAPI("https://shared.atlassian.net", "user", "token")
+        other = JiraAPI("https://other.atlassian.net", "user", "token")
+        
+        self.assertIs(jira.transport, confluence.transport)
+        self.assertIsNot(jira.transport, other.transport)
+        self.assertIsInstance(jira.transport.session, requests.Session)
+    
+    def test_explicit_transport(self):
+        """명시적으로 전달한 transport 사용"""
+        transport = HTTPTransport()
+        bitbucket = BitbucketAPI("https://api.bitbucket.org", "user", "app-password", transport=transport)
+        self.assertIs(bitbucket.transport, transport)
+    
+    def test_per_host_pool_size(self):
+        """호스트별 커넥션 풀 크기 설정"""
+        transport = get_transport("https://pool.atlassian.net", pool_maxsize=32)
+        adapter = transport.session.get_adapter("https://pool.atlassian.net/rest/api/3/myself")
+        
+        self.assertEqual(transport.host_pool_sizes["https://pool.atlassian.net"], 32)
+        self.assertEqual(adapter._pool_maxsize, 32)
+        # 다른 호스트는 기본 풀 크기 유지
+        default_adapter = transport.session.get_adapter("https://elsewhere.example.com/")
+        self.assertEqual(default_adapter._pool_maxsize, HTTPTransport.DEFAULT_POOL_MAXSIZE)
+
+
+def make_response(status_code=200, headers=None, body='{}'):
+    """테스트용 HTTP 응답 Mock 생성"""
+    response = Mock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    response.text = body
+    response._content = body.encode()
+    response.json.return_value = json.loads(body) if body else {}
+    if status_code >= 400:
+        response.raise_for_status.side_effect = requests.exceptions.HTTPError(f"{status_code} Error")
+    else:
+        response.raise_for_status = Mock()
+    return response
+
+
+class TestRetryEngine(unittest.TestCase):
+    """재시도 및 속도 제한 테스트"""
+    
+    def setUp(self):
+        """테스트 초기화"""
+        self.transport = HTTPTransport(retry_policy=RetryPolicy(max_retries=3, backoff_base=0.1))
+        self.transport.session.request = Mock()
+        self.transport._sleep = Mock()
+    
+    def test_retry_after_header_is_honored(self):
+        """429 응답의 Retry-After 대기 후 재시도"""
+        self.transport.session.request.side_effect = [
+            make_response(429, {"Retry-After": "2"}),
+            make_response(200, body='{"ok": true}'),
+        ]
+        
+        response = self.transport.request("GET", "https://test.atlassian.net/rest/api/3/myself")
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.transport.session.request.call_count, 2)
+        delay = self.transport._sleep.call_args_list[0][0][0]
+        self.assertGreaterEqual(delay, 2.0)
+        self.assertLessEqual(delay, 2.1)
+    
+    def test_gives_up_after_max_retries(self):
+        """최대 재시도 후 마지막 응답 반환"""
+        self.transport.session.request.return_value = make_response(503)
+        
+        response = self.transport.request("GET", "https://test.atlassian.net/rest/api/3/search")
+        
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(self.transport.session.request.call_count, 4)
+    
+    def test_non_idempotent_methods(self):
+        """POST는 503에서 재시도하지 않고 429에서만 재시도"""
+        self.transport.session.request.return_value = make_response(503)
+        self.transport.request("POST", "https://test.atlassian.net/rest/api/3/issue", json={})
+        self.assertEqual(self.transport.session.request.call_count, 1)
+        
+        self.transport.session.request.reset_mock()
+        self.transport.session.request.side_effect = [make_response(429), make_response(201)]
+        response = self.transport.request("POST", "https://test.atlassian.net/rest/api/3/issue", json={})
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(self.transport.session.request.call_count, 2)
+    
+    def test_connection_error_retry(self):
+        """멱등 메서드의 연결 오류 재시도"""
+        self.transport.session.request.side_effect = [
+            requests.exceptions.ConnectionError("reset"),
+            make_response(200),
+        ]
+        response = self.transport.request("GET", "https://test.atlassian.net/rest/api/3/myself")
+        self.assertEqual(response.status_code, 200)
+    
+    def test_rate_limit_headers(self):
+        """X-RateLimit-* 헤더 해석"""
+        self.assertIsNone(rate_limit_delay({"X-RateLimit-Remaining": "10", "X-RateLimit-Reset": "30"}))
+        self.assertEqual(rate_limit_delay({"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "30"}), 30.0)
+        self.assertEqual(rate_limit_delay({"Retry-After": "5"}), 5.0)
+    
+    def test_token_bucket(self):
+        """토큰 버킷 예약 대기 시간"""
+        bucket = TokenBucket(rate=10, capacity=2)
+        self.assertEqual(bucket.reserve(), 0.0)
+        self.assertEqual(bucket.reserve(), 0.0)
+        # 버킷이 비면 0.1초 간격으로 대기
+        self.assertAlmostEqual(bucket.reserve(), 0.1, places=2)
+        self.assertAlmostEqual(bucket.reserve(), 0.2, places=2)
+
+
+class TestConditionalCache(unittest.TestCase):
+    """조건부 GET 캐시 테스트"""
+    
+    def setUp(self):
+        """테스트 초기화"""
+        self.cache_dir = tempfile.mkdtemp()
+        self.transport = HTTPTransport()
+        self.transport.enable_cache(self.cache_dir)
+        self.transport.session.request = Mock()
+        self.url = "https://test.atlassian.net/rest/api/3/issue/TEST-1"
+    
+    def tearDown(self):
+        """테스트 정리"""
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+    
+    def _response(self, status_code, headers=None, content=b""):
+        response = Mock()
+        response.status_code = status_code
+        response.headers = headers or {}
+        response.content = content
+        return response
+    
+    def test_not_modified_serves_cached_body(self):
+        """304 응답 시 캐시된 본문 반환"""
+        self.transport.session.request.side_effect = [
+            self._response(200, {"ETag": '"v1"', "Content-Type": "application/json"}, b'{"key": "TEST-1"}'),
+            self._response(304),
+        ]
+        
+        first = self.transport.request("GET", self.url, auth=("user", "token"))
+        second = self.transport.request("GET", self.url, auth=("user", "token"))
+        
+        self.assertEqual(first.content, b'{"key": "TEST-1"}')
+        self.assertEqual(second.status_code, 200)
+        self.assertEqual(second.json(), {"key": "TEST-1"})
+        self.assertTrue(second.from_cache)
+        sent_headers = self.transport.session.request.call_args_list[1][1]["headers"]
+        self.assertEqual(sent_headers["If-None-Match"], '"v1"')
+    
+    def test_cache_is_per_user(self):
+        """다른 사용자에게는 캐시 검증자를 보내지 않음"""
+        self.transport.session.request.return_value = self._response(200, {"ETag": '"v1"'}, b"{}")
+        self.transport.request("GET", self.url, auth=("alice", "token"))
+        self.transport.request("GET", self.url, auth=("bob", "token"))
+        
+        self.assertNotIn("headers", self.transport.session.request.call_args_list[1][1])
+    
+    def test_lru_eviction(self):
+        """용량 초과 시 가장 오래 사용하지 않은 항목 삭제"""
+        cache = ConditionalCache(tempfile.mkdtemp(dir=self.cache_dir))
+        body = b"x" * 100
+        cache.put("a", "https://test/a", self._response(200, {"ETag": "a"}, body))
+        # 항목 3개까지만 보관하도록 용량 제한
+        cache.max_bytes = cache.total_bytes * 3
+        for name in ("b", "c"):
+            cache.put(name, f"https://test/{name}", self._response(200, {"ETag": name}, body))
+        cache.get("a")  # a를 최근 사용으로 갱신
+        cache.put("d", "https://test/d", self._response(200, {"ETag": "d"}, body))
+        
+        self.assertIsNotNone(cache.get("a"))
+        self.assertIsNone(cache.get("b"))
+        self.assertIsNotNone(cache.get("d"))
+        self.assertLessEqual(cache.total_bytes, cache.max_bytes)
+    
+    @unittest.skipUnless(os.name == "posix", "POSIX 권한 비트 필요")
+    def test_cache_files_private(self):
+        """캐시 디렉터리와 파일은 소유자만 접근 가능"""
+        cache_dir = os.path.join(self.cache_dir, "private")
+        os.makedirs(cache_dir, mode=0o755)
+        cache = ConditionalCache(cache_dir)
+        cache.put("a", "https://test/a", self._response(200, {"ETag": "a"}, b"secret"))
+        
+        self.assertEqual(os.stat(cache_dir).st_mode & 0o777, 0o700)
+        self.assertEqual(os.stat(os.path.join(cache_dir, "a.cache")).st_mode & 0o777, 0o600)
+
+
+class TestAsyncClients(unittest.IsolatedAsyncioTestCase):
+    """asyncio 클라이언트 테스트"""
+    
+    def _json_response(self, payload, status_code=200):
+        return AsyncResponse(status_code, {"Content-Type": "application/json"}, json.dumps(payload).encode())
+    
+    async def test_same_method_surface(self):
+        """동기 클라이언트와 같은 메서드를 await로 호출"""
+        transport = AsyncHTTPTransport()
+        transport._send_once = AsyncMock(return_value=self._json_response({"key": "TEST-1"}))
+        jira = AsyncJiraAPI("https://test.atlassian.net", "user", "token", transport=transport)
+        
+        result = await jira.get_issue("TEST-1", fields=["summary"])
+        
+        self.assertEqual(result["key"], "TEST-1")
+        args, kwargs = transport._send_once.call_args
+        self.assertEqual(args, ("GET", "https://test.atlassian.net/rest/api/3/issue/TEST-1"))
+        self.assertEqual(kwargs["params"], {"fields": "summary"})
+        
+        await jira.delete_issue("TEST-1")
+        self.assertEqual(transport._send_once.call_args[0][0], "DELETE")
+
+    async def test_deadline_and_breaker(self):
+        """작업 기한이 요청 타임아웃을 줄이고 연속 실패 시 회로가 열림"""
+        transport = AsyncHTTPTransport(retry_policy=RetryPolicy(max_retries=0))
+        transport._send_once = AsyncMock(return_value=self._json_response({"key": "TEST-1"}))
+        jira = AsyncJiraAPI("https://test.atlassian.net", "user", "token", transport=transport)
+
+        with deadline(2.0):
+            await jira.get_issue("TEST-1")
+        self.assertLessEqual(transport._send_once.call_args[1]["timeout"][1], 2.0)
+        with deadline(2.0):
+            await transport.request("GET", "https://test.atlassian.net/rest/api/3/myself", timeout=30)
+        self.assertLessEqual(transport._send_once.call_args[1]["timeout"][1], 2.0)
+
+        transport._send_once = AsyncMock(side_effect=requests.exceptions.ConnectionError("down"))
+        for _ in range(transport.breaker_threshold):
+            with self.assertRaises(Exception):
+                await jira.get_issue("TEST-1")
+        with self.assertRaises(Exception) as context:
+            await jira.get_issue("TEST-1")
+
+        self.assertIn("회로 차단기", str(context.exception))
+        self.assertEqual(transport._send_once.call_count, transport.breaker_threshold)
+
+    async def test_concurrent_gather(self):
+        """여러 요청 동시 실행 및 입력 순서 유지"""
+        transport = AsyncHTTPTransport()
+        
+        async def send(method, url, **kwargs):
+            await asyncio.sleep(0.01)
+            return self._json_response({"key": url.rsplit("/", 1)[-1]})
+        
+        transport._send_once = send
+        jira = AsyncJiraAPI("https://test.atlassian.net", "user", "token", transport=transport)
+        
+        results = await gather_limited([jira.get_issue(f"TEST-{i}") for i in range(50)], limit=10)
+        
+        self.assertEqual([r["key"] for r in results], [f"TEST-{i}" for i in range(50)])
+    
+    async def test_identical_gets_coalesced(self):
+        """동시에 들어온 같은 GET은 한 번만 전송"""
+        transport = AsyncHTTPTransport()
+        calls = []
+        
+        async def send(method, url, **kwargs):
+            calls.append(url)
+            await asyncio.sleep(0.01)
+            return self._json_response({"key": url.rsplit("/", 1)[-1]})
+        
+        transport._send_once = send
+        jira = AsyncJiraAPI("https://test.atlassian.net", "user", "token", transport=transport)
+        
+        results = await asyncio.gather(*[jira.get_issue("TEST-1") for _ in range(5)], jira.get_issue("TEST-2"))
+        
+        self.assertEqual([r["key"] for r in results], ["TEST-1"] * 5 + ["TEST-2"])
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(transport._inflight, {})
+    
+    async def test_last_waiter_cancel_cancels_shared_request(self):
+        """대기자가 모두 취소되면 공유 요청도 취소"""
+        transport = AsyncHTTPTransport()
+        started, cancelled = asyncio.Event(), asyncio.Event()
+        
+        async def send(method, url, **kwargs):
+            started.set()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+        
+        transport._send_once = send
+        url = "https://test.atlassian.net/rest/api/3/myself"
+        first = asyncio.ensure_future(transport.request("GET", url))
+        second = asyncio.ensure_future(transport.request("GET", url))
+        await started.wait()
+        
+        first.cancel()
+        await asyncio.sleep(0)
+        self.assertFalse(cancelled.is_set())
+        
+        second.cancel()
+        await asyncio.wait_for(cancelled.wait(), 1)
+        self.assertEqual(transport._inflight, {})
+    
+    async def test_timeout_cancels_pending(self):
+        """제한 시간 초과 시 남은 요청 취소"""
+        transport = AsyncHTTPTransport()
+        
+        async def slow_send(method, url, **kwargs):
+            await asyncio.sleep(10)
+        
+        transport._send_once = slow_send
+        bitbucket = AsyncBitbucketAPI("https://api.bitbucket.org", "user", "app-password", transport=transport)
+        
+        with self.assertRaises(asyncio.TimeoutError):
+            await gather_limited([bitbucket.get_repositories("workspace") for _ in range(5)], limit=2, timeout=0.05)
+    
+    async def test_timeout_closes_unstarted_coroutines(self):
+        """제한 시간 초과 시 시작하지 못한 코루틴도 닫힘 (never awaited 경고 없음)"""
+        async def slow():
+            await asyncio.sleep(10)
+        
+        coros = [slow() for _ in range(5)]
+        with self.assertRaises(asyncio.TimeoutError):
+            await gather_limited(coros, limit=2, timeout=0.05)
+        
+        self.assertTrue(all(inspect.getcoroutinestate(coro) == inspect.CORO_CLOSED for coro in coros))
+    
+    async def test_file_transfers_share_one_sync_client(self):
+        """스레드에서 실행하는 파일 전송은 인스턴스당 하나의 동기 클라이언트와 같은 설정 사용"""
+        transport = AsyncHTTPTransport(retry_policy=RetryPolicy(max_retries=1))
+        hook = Mock()
+        transport.add_hook(hook)
+        jira = AsyncJiraAPI("https://test.atlassian.net", "user", "token", transport=transport)
+        
+        with patch('requests.Session.request', return_value=make_response(body='[{"id": "1"}]')):
+            with tempfile.NamedTemporaryFile(delete=False) as f:
+                f.write(b"log")
+            try:
+                await jira.add_attachment("TEST-1", f.name)
+                await jira.add_attachment("TEST-2", f.name)
+            finally:
+                os.unlink(f.name)
+        
+        sync_transport = jira._sync_client.transport
+        self.assertIs(sync_transport, transport.sync_transport())
+        self.assertIs(sync_transport.retry_policy, transport.retry_policy)
+        self.assertIs(sync_transport.breakers, transport.breakers)
+        self.assertEqual(hook.call_count, 2)
+        await jira.close()
+    
+    async def test_error_wrapping_and_parallel_search(self):
+        """오류 메시지 형식 및 병렬 검색"""
+        transport = AsyncHTTPTransport(retry_policy=RetryPolicy(max_retries=0))
+        transport._send_once = AsyncMock(return_value=self._json_response({}, status_code=404))
+        confluence = AsyncConfluenceAPI("https://test.atlassian.net", "user", "token", transport=transport)
+        with self.assertRaises(Exception) as context:
+            await confluence.get_page_by_title("SPACE", "Missing")
+        self.assertIn("Confluence API 요청 실패", str(context.exception))
+        
+        async def search(method, url, params=None, **kwargs):
+            start, size = int(params["startAt"]), int(params["maxResults"])
+            return self._json_response({
+                "issues": [{"key": f"TEST-{i}"} for i in range(start, min(start + size, 12))],
+                "total": 12
+            })
+        
+        transport._send_once = search
+        jira = AsyncJiraAPI("https://test.atlassian.net", "user", "token", transport=transport)
+        keys = [issue["key"] async for issue in jira.iter_search_issues_parallel("project = TEST", page_size=5)]
+        self.assertEqual(keys, [f"TEST-{i}" for i in range(12)])
+
+
+class TestAsyncBitbucketPagination(unittest.IsolatedAsyncioTestCase):
+    """비동기 Bitbucket 페이지 처리 테스트"""
+    
+    async def test_iter_values_with_prefetch(self):
+        """async for로 Cloud next 링크 순회"""
+        pages = {
+            None: {"values": [{"slug": "a"}], "next": "https://api.bitbucket.org/2.0/repositories/ws?page=2"},
+            "https://api.bitbucket.org/2.0/repositories/ws?page=2": {"values": [{"slug": "b"}]},
+        }
+        transport = AsyncHTTPTransport()
+        
+        async def send(method, url, **kwargs):
+            key = url if "page=" in url else None
+            return AsyncResponse(200, {}, json.dumps(pages[key]).encode())
+        
+        transport._send_once = send
+        bitbucket = AsyncBitbucketAPI("https://api.bitbucket.org", "user", "app-password", transport=transport)
+        
+        slugs = [repo["slug"] async for repo in bitbucket.iter_repositories("ws", prefetch=True)]
+        
+        self.assertEqual(slugs, ["a", "b"])
+
+
+class _JsonHandler(BaseHTTPRequestHandler):
+    """실제 HTTP 전송 확인용 핸들러"""
+    
+    def do_GET(self):
+        body = json.dumps({"path": self.path, "auth": self.headers.get("Authorization", "")}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def log_message(self, format, *args):
+        pass
+
+
+class TestAsyncTransportOverHTTP(unittest.IsolatedAsyncioTestCase):
+    """로컬 HTTP 서버를 통한 비동기 전송 테스트"""
+    
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _JsonHandler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.base_url = f"http://127.0.0.1:{self.server.server_address[1]}"
+    
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+    
+    async def test_real_request(self):
+        """aiohttp(또는 스레드 폴백)로 실제 요청 전송"""
+        async with AsyncJiraAPI(self.base_url, "user", "token") as jira:
+            result = await jira.get_current_user()
+        
+        self.assertEqual(result["path"], "/rest/api/3/myself")
+        self.assertTrue(result["auth"].startswith("Basic "))
+
+
+class TestCircuitBreakerAndDeadline(unittest.TestCase):
+    """회로 차단기 및 작업 제한 시간 테스트"""
+
+    def setUp(self):
+        self.transport = HTTPTransport(retry_policy=RetryPolicy(max_retries=0))
+        self.transport.set_circuit_breaker(3, 30.0)
+        self.jira = JiraAPI("https://test.atlassian.net", "user", "token", transport=self.transport)
+
+    @patch('requests.Session.request')
+    def test_breaker_opens_and_fails_fast(self, mock_request):
+        """연속 실패 후에는 요청을 보내지 않고 즉시 실패"""
+        mock_request.side_effect = requests.exceptions.ConnectionError("down")
+
+        for _ in range(3):
+            with self.assertRaises(Exception):
+                self.jira.get_issue("TEST-1")
+        with self.assertRaises(Exception) as context:
+            self.jira.get_issue("TEST-1")
+
+        self.assertIn("회로 차단기", str(context.exception))
+        self.assertEqual(mock_request.call_count, 3)
+        self.assertEqual(self.transport.breaker_for(self.jira.domain_url).state, CircuitBreaker.OPEN)
+
+    def test_half_open_probe(self):
+        """복구 대기 후 한 번의 확인 요청만 허용하고 성공하면 닫힘"""
+        now = [100.0]
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=10.0)
+        breaker._clock = lambda: now[0]
+
+        breaker.record(status=503)
+        with self.assertRaises(CircuitOpenError):
+            breaker.before_request()
+
+        now[0] += 10.0
+        breaker.before_request()
+        with self.assertRaises(CircuitOpenError):
+            breaker.before_request()
+        breaker.record(status=200)
+
+        self.assertEqual(breaker.state, CircuitBreaker.CLOSED)
+        breaker.before_request()
+
+    @patch('requests.Session.request')
+    def test_timeouts_limited_by_deadline(self, mock_request):
+        """요청 타임아웃은 설정값과 남은 작업 시간 중 작은 값"""
+        mock_request.return_value = make_response(body='{"key": "TEST-1"}')
+        self.transport.set_timeout(20.0, connect_timeout=3.0)
+
+        self.jira.get_issue("TEST-1")
+        self.assertEqual(mock_request.call_args[1]["timeout"], (3.0, 20.0))
+
+        with deadline(1.0):
+            self.jira.get_issue("TEST-2")
+        connect, read = mock_request.call_args[1]["timeout"]
+        self.assertLessEqual(connect, 1.0)
+        self.assertLessEqual(read, 1.0)
+
+        # 호출자가 지정한 타임아웃도 남은 시간 이내로 제한
+        with deadline(1.0):
+            self.transport.request("GET", self.jira.domain_url + "/rest/api/3/myself", timeout=30)
+        connect, read = mock_request.call_args[1]["timeout"]
+        self.assertLessEqual(connect, 1.0)
+        self.assertLessEqual(read, 1.0)
+        self.transport.request("GET", self.jira.domain_url + "/rest/api/3/myself", timeout=(2.0, 5.0))
+        self.assertEqual(mock_request.call_args[1]["timeout"], (2.0, 5.0))
+
+    @patch('requests.Session.request')
+    def test_retry_wait_beyond_deadline_fails_immediately(self, mock_request):
+        """기한 안에 끝나지 않는 Retry-After 대기는 기다리지 않고 실패"""
+        mock_request.return_value = make_response(429, headers={"Retry-After": "10"})
+        self.transport.retry_policy = RetryPolicy(max_retries=3)
+        self.transport._sleep = Mock()
+
+        with deadline(1.0):
+            with self.assertRaises(Exception) as context:
+                self.jira.get_issue("TEST-1")
+
+        self.assertIn("제한 시간", str(context.exception))
+        self.transport._sleep.assert_not_called()
+        # 429는 호스트 장애로 보지 않음
+        self.assertEqual(self.transport.breaker_for(self.jira.domain_url).failures, 0)
+
+    def test_deadline_propagates_to_worker_threads(self):
+        """병렬 청크 조회의 작업자 스레드도 같은 기한을 사용"""
+        with StubAtlassianServer(faults=FaultInjector(latency=1.0)) as server:
+            transport = HTTPTransport(retry_policy=RetryPolicy(max_retries=0))
+            jira = JiraAPI(server.url, "user", "token", transport=transport)
+            jira.MAX_URL_LENGTH = 200
+            started = time.monotonic()
+            with deadline(0.3):
+                with self.assertRaises(Exception) as context:
+                    jira.get_issues([f"TM-{i}" for i in range(1, 40)], max_workers=4)
+            elapsed = time.monotonic() - started
+            transport.close()
+
+        self.assertIn("제한 시간", str(context.exception))
+        self.assertLess(elapsed, 0.9)
+
+
+class TestStubServer(unittest.TestCase):
+    """로컬 스텁 서버를 통한 클라이언트 종단 테스트"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = StubAtlassianServer(data=StubData(issues=120, repos=7, branches=9)).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+
+    def setUp(self):
+        self.server.reset_stats()
+        self.transport = HTTPTransport()
+        self.jira = JiraAPI(self.server.url, "user", "token", transport=self.transport)
+
+    def tearDown(self):
+        self.transport.close()
+
+    def test_search_pagination(self):
+        """모든 페이지를 순서대로 순회"""
+        keys = [issue["key"] for issue in self.jira.iter_search_issues("project = TM ORDER BY key ASC", page_size=15)]
+
+        self.assertEqual(len(keys), 40)
+        self.assertEqual(keys[:2], ["TM-1", "TM-2"])
+        self.assertEqual(self.server.stats["routes"]["GET ^/rest/api/(?:2|3)/search/?$"], 3)
+
+    def test_get_issues_reports_missing(self):
+        """존재하지 않는 키는 missing으로 보고"""
+        result = self.jira.get_issues(["TM-1", "DEV-1", "TM-999"])
+
+        self.assertEqual(sorted(result["issues"]), ["DEV-1", "TM-1"])
+        self.assertEqual(result["missing"], ["TM-999"])
+
+    def test_bulk_create_partial_failure(self):
+        """벌크 생성 항목별 결과"""
+        results = self.jira.bulk_create_issues([
+            {"project_key": "OPS", "issue_type": "Task", "summary": "ok"},
+            {"project_key": "NOPE", "issue_type": "Task", "summary": "bad"}
+        ])
+
+        self.assertTrue(results[0]["success"])
+        self.assertFalse(results[1]["success"])
+        self.assertEqual(self.jira.get_issue(results[0]["key"])["fields"]["summary"], "ok")
+
+    def test_attachment_round_trip(self):
+        """업로드한 첨부파일을 그대로 다운로드"""
+        payload = os.urandom(200000)
+        with tempfile.TemporaryDirectory() as tmp:
+            source = os.path.join(tmp, "log.bin")
+            with open(source, "wb") as f:
+                f.write(payload)
+            attachment = self.jira.add_attachment("DEV-3", source)[0]
+            target = os.path.join(tmp, "copy.bin")
+            self.jira.download_attachment(attachment["id"], target)
+            with open(target, "rb") as f:
+                self.assertEqual(f.read(), payload)
+
+    def test_bitbucket_server_pagination(self):
+        """Bitbucket Server isLastPage/nextPageStart 순회"""
+        bitbucket = BitbucketAPI(self.server.url, "user", "token", transport=self.transport)
+
+        self.assertEqual(len(list(bitbucket.iter_repositories("TM", page_size=3))), 7)
+        self.assertEqual(len(list(bitbucket.iter_branches("TM", "tm-repo-1", page_size=4))), 9)
+
+    def test_confluence_page(self):
+        """Confluence 페이지 조회"""
+        confluence = ConfluenceAPI(self.server.url, "user", "token", transport=self.transport)
+
+        self.assertEqual(confluence.get_page_by_title("OPS", "OPS Page 2")["title"], "OPS Page 2")
+
+
+class TestStubFaultInjection(unittest.TestCase):
+    """스텁 서버 오류/속도 제한 주입 테스트"""
+
+    def test_rate_limit_is_retried(self):
+        """429 + Retry-After 응답 후 재시도로 모든 페이지 수신"""
+        # 서버 토큰 버킷과 클라이언트 대기가 같은 가상 시계를 사용 (대기하면 시간이 흐름)
+        now = [0.0]
+        faults = FaultInjector(rate_limit=1, burst=1)
+        faults._clock = lambda: now[0]
+        faults._updated = now[0]
+        transport = HTTPTransport()
+        transport._sleep = lambda seconds: now.__setitem__(0, now[0] + seconds)
+        with StubAtlassianServer(data=StubData(issues=60), faults=faults) as server:
+            jira = JiraAPI(server.url, "user", "token", transport=transport)
+            issues = list(jira.iter_search_issues("project = DEV", page_size=5))
+
+        self.assertEqual(len(issues), 20)
+        # 첫 페이지 이후 페이지마다 한 번씩 429 -> Retry-After: 1 대기 후 성공
+        self.assertEqual(server.stats["status"].get(429, 0), 3)
+
+    def test_error_rate_is_deterministic(self):
+        """같은 시드는 같은 오류 순서를 재현"""
+        runs = []
+        for _ in range(2):
+            faults = FaultInjector(error_rate=0.5, seed=7)
+            runs.append([faults.apply() is None for _ in range(20)])
+
+        self.assertEqual(runs[0], runs[1])
+        self.assertIn(False, runs[0])
+
+    def test_requires_auth(self):
+        """인증 헤더가 없으면 401"""
+        with StubAtlassianServer() as server:
+            response = requests.get(f"{server.url}/rest/api/3/myself")
+
+        self.assertEqual(response.status_code, 401)
+
+
+class TestBenchmarkSuite(unittest.TestCase):
+    """벤치마크 스위트 테스트"""
+
+    def test_runs_all_modes(self):
+        """모든 모드 결과가 같은 항목 수를 처리"""
+        with StubAtlassianServer(data=StubData(issues=90, repos=3, branches=5)) as server:
+            suite = BenchmarkSuite(server, workers=3, repeat=1, page_size=10, batch_keys=30,
+                                   bulk_issues=60, files=2, file_size=1024)
+            results = suite.run()
+
+        self.assertEqual(set(results["results"]), set(SCENARIOS))
+        for scenario, modes in results["results"].items():
+            self.assertEqual(set(modes), {"sequential", "threaded", "async"})
+            self.assertEqual(len({result["items"] for result in modes.values()}), 1, scenario)
+        self.assertEqual(results["results"]["search_pagination"]["threaded"]["items"], 30)
+        self.assertEqual(results["results"]["bulk_create"]["sequential"]["server_requests"], 2)
+        json.dumps(results)
+
+    def test_compare_reports_regressions(self):
+        """기준 대비 임계값을 넘게 느려진 항목만 보고"""
+        baseline = {"results": {"batch_fetch": {"threaded": {"median_seconds": 1.0},
+                                                "async": {"median_seconds": 1.0}}}}
+        current = {"results": {"batch_fetch": {"threaded": {"median_seconds": 1.5},
+                                               "async": {"median_seconds": 1.1}}}}
+
+        regressions = compare(baseline, current, threshold=0.2)
+
+        self.assertEqual([(item["scenario"], item["mode"]) for item in regressions], [("batch_fetch", "threaded")])
+        self.assertAlmostEqual(regressions[0]["change"], 0.5)
+
+
 class TestIntegration(unittest.TestCase):
     """통합 테스트"""
     
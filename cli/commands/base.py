@@ -4,7 +4,9 @@ import json
 import sys
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
+
+from cli.fuzzy import FuzzyMatcher
 
 
 class BaseCommand(ABC):
@@ -18,6 +20,7 @@ class BaseCommand(ABC):
         """
         self.config_path = Path(config_path)
         self.config: Dict[str, Any] = self.load_config()
+        self._matcher: Optional[Tuple[List[str], FuzzyMatcher]] = None
         
     def load_config(self) -> Dict[str, Any]:
         """Load configuration from file
@@ -74,6 +77,25 @@ class BaseCommand(ABC):
             del self.config['session']
             self.save_config()
     
+    def fuzzy_search(self, options: List[str], search_term: str,
+                     limit: Optional[int] = None) -> List[Tuple[int, str]]:
+        """Search options allowing typos, best match first
+        
+        The trigram index is reused while the same options list is searched
+        repeatedly (e.g. several attempts at one prompt).
+        
+        Args:
+            options: Options to search
+            search_term: Search term
+            limit: Maximum number of results (None for all)
+            
+        Returns:
+            List of (index, option) tuples
+        """
+        if self._matcher is None or self._matcher[0] is not options or len(self._matcher[1]) != len(options):
+            self._matcher = (options, FuzzyMatcher(options))
+        return [(idx, option) for idx, option, _ in self._matcher[1].search(search_term, limit)]
+    
     def print_success(self, message: str) -> None:
         """Print success message
         
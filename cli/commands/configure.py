@@ -112,8 +112,8 @@ class ConfigureCommand(BaseCommand):
                 self.print_info(f"Selected repository: {user_input}")
                 return user_input
             else:
-                # Try partial match
-                matches = [r for r in repos if user_input.lower() in r.lower()]
+                # Try partial or close match
+                matches = [r for _, r in self.fuzzy_search(repos, user_input)]
                 if len(matches) == 1:
                     self.print_info(f"Selected repository: {matches[0]}")
                     return matches[0]
@@ -205,6 +205,13 @@ class ConfigureCommand(BaseCommand):
                 if with_v in versions:
                     self.print_info(f"Selected version: {with_v}")
                     return with_v
+            # Try partial or close match
+            matches = [v for _, v in self.fuzzy_search(versions, user_input, limit=5)]
+            if len(matches) == 1:
+                self.print_info(f"Selected version: {matches[0]}")
+                return matches[0]
+            elif matches:
+                print(f"Did you mean: {', '.join(matches)}?")
         
         self.print_warning("Invalid selection, skipping version configuration")
         return None
@@ -59,21 +59,16 @@ class SelectDBCommand(BaseCommand):
     def search_options(self, options: List[str], search_term: str) -> List[tuple[int, str]]:
         """Search and filter options
         
+        Substring matches come first, followed by close matches for typos.
+        
         Args:
             options: List of options to search
             search_term: Search term
             
         Returns:
-            List of (index, option) tuples matching search
+            List of (index, option) tuples matching search, best first
         """
-        search_lower = search_term.lower()
-        results = []
-        
-        for i, option in enumerate(options):
-            if search_lower in option.lower():
-                results.append((i, option))
-        
-        return results
+        return self.fuzzy_search(options, search_term)
     
     def display_options(self, options: List[str], title: str) -> None:
         """Display options in a formatted way
@@ -182,7 +182,20 @@ class SelectIssueCommand(BaseCommand):
                 for issue in issues:
                     if issue['key'] == user_input_upper:
                         return issue
-                self.print_error(f"Issue key '{user_input}' not found in current page")
+                
+                # Try partial or close match on key and summary
+                labels = [f"{issue['key']} {issue.get('summary', '')}" for issue in issues]
+                matches = self.fuzzy_search(labels, user_input, limit=5)
+                if len(matches) == 1:
+                    issue = issues[matches[0][0]]
+                    self.print_info(f"Selected: {issue['key']}")
+                    return issue
+                elif matches:
+                    print("Did you mean:")
+                    for _, label in matches:
+                        print(f"  {label}")
+                else:
+                    self.print_error(f"Issue key '{user_input}' not found in current page")
     
     def get_selection(self) -> Dict[str, Any]:
         """Get current selection
@@ -0,0 +1,284 @@
+"""Typo-tolerant fuzzy matching for selection prompts"""
+
+import heapq
+import math
+import re
+from array import array
+from itertools import combinations, groupby, repeat
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+
+_WORD_RE = re.compile(r'\w+')
+
+_EMPTY = array('I')
+
+
+def trigrams(text: str) -> Set[str]:
+    """Return the padded trigrams of every word in text
+
+    Each word is padded with two leading spaces and one trailing space
+    so that word starts weigh more than word middles.
+
+    Args:
+        text: Text to split (case-insensitive)
+
+    Returns:
+        Set of trigrams
+    """
+    grams: Set[str] = set()
+    for word in _WORD_RE.findall(text.lower()):
+        padded = f"  {word} "
+        grams.update([padded[i:i + 3] for i in range(len(word) + 1)])
+    return grams
+
+
+def _pad(text: str) -> str:
+    """Lowercase words of text, each padded as in trigrams()
+
+    A padded trigram occurs in this string only where it occurs in a word,
+    so counting shared trigrams needs no set construction.
+    """
+    return ''.join(f"  {word} " for word in _WORD_RE.findall(text.lower()))
+
+
+def _required_trigrams(needle: str) -> Set[str]:
+    """Return the padded trigrams every entry containing needle must have
+
+    A word of needle followed by another character of needle also ends
+    a word of the entry, and one preceded by another character also
+    starts one, so those edges contribute their padded trigrams.
+    """
+    grams: Set[str] = set()
+    for match in _WORD_RE.finditer(needle):
+        padded = ('  ' if match.start() else '') + match.group() + (' ' if match.end() < len(needle) else '')
+        grams.update([padded[i:i + 3] for i in range(len(padded) - 2)])
+    return grams
+
+
+def _short_grams(text: str) -> Set[str]:
+    """Return the characters and character pairs inside the words of text"""
+    grams: Set[str] = set()
+    for word in _WORD_RE.findall(text):
+        grams.update(word)
+        grams.update([word[i:i + 2] for i in range(len(word) - 1)])
+    return grams
+
+
+class FuzzyMatcher:
+    """Trigram index over a catalog of strings, ranked by similarity"""
+    
+    # Share of the query's trigrams a candidate must contain
+    DEFAULT_THRESHOLD = 0.5
+    
+    # Posting ids counted per query when collecting fuzzy candidates
+    SCAN_BUDGET = 2000
+    
+    # Candidates re-ranked exactly per requested result
+    RERANK_FACTOR = 4
+    
+    def __init__(self, entries: Iterable[str], threshold: float = DEFAULT_THRESHOLD):
+        """Build the index
+        
+        Posting lists hold entry ids ordered by trigram count and then by
+        catalog position, so the entries most similar to a query come
+        first in every list.
+        
+        Args:
+            entries: Catalog to search (DB codes, repositories, versions, issue keys...)
+            threshold: Minimum share of query trigrams a fuzzy match must contain
+        """
+        self.entries: List[str] = list(entries)
+        self.threshold = threshold
+        self._lowered = [entry.lower() for entry in self.entries]
+        self._padded = [_pad(text) for text in self._lowered]
+        entry_grams = [trigrams(text) for text in self._lowered]
+        self._sizes = array('I', map(len, entry_grams))
+        postings: Dict[str, List[int]] = {}
+        order = sorted(range(len(self.entries)), key=self._sizes.__getitem__)
+        # Position of each entry in posting order
+        self._rank = array('I', bytes(4 * len(order)))
+        for position, idx in enumerate(order):
+            self._rank[idx] = position
+            for gram in entry_grams[idx]:
+                postings.setdefault(gram, []).append(idx)
+        self._postings: Dict[str, array] = {gram: array('I', ids) for gram, ids in postings.items()}
+        # Posting lists of one or two word characters, built on first use
+        self._short_postings: Dict[str, array] = {}
+    
+    def __len__(self) -> int:
+        return len(self.entries)
+    
+    def search(self, query: str, limit: Optional[int] = None) -> List[Tuple[int, str, float]]:
+        """Find entries matching query, best first
+        
+        Every entry containing the query as a substring is found, and they
+        rank before fuzzy matches; within each group entries are ordered by
+        trigram similarity and then by catalog position.
+        
+        Args:
+            query: Search term (case-insensitive)
+            limit: Maximum number of results (None for all)
+        
+        Returns:
+            List of (index, entry, similarity) tuples
+        """
+        needle = query.strip().lower()
+        grams = trigrams(needle)
+        if not grams:
+            return []
+        
+        ranked = self._rank_substring_hits(needle, grams, limit)
+        if limit is None or len(ranked) < limit:
+            ranked += self._rank_fuzzy_matches(needle, grams, limit)
+        if limit is not None:
+            ranked = ranked[:limit]
+        return [(idx, self.entries[idx], -negative) for negative, idx in ranked]
+    
+    def _rank_substring_hits(self, needle: str, grams: Set[str],
+                             limit: Optional[int]) -> List[Tuple[float, int]]:
+        """Rank all entries containing needle as (-similarity, index), best first
+        
+        Such an entry has every trigram of needle except possibly the few
+        padded ones at its two edges, so its similarity only depends on
+        how many of those it shares and on its size. With a limit, the
+        entries sharing the most edge trigrams are visited first, each
+        group shortest first, and a group is left as soon as its next
+        entry cannot outrank the limit-th hit.
+        """
+        required = _required_trigrams(needle)
+        if required:
+            keys = required
+            candidates = min((self._postings.get(key, _EMPTY) for key in keys), key=len)
+        else:
+            # Needles of one or two word characters have no trigram of their own
+            keys = _short_grams(needle)
+            candidates = min((self._short_posting(key) for key in keys), key=len)
+        exact = needle in keys
+        edges = [gram for gram in grams if gram not in required]
+        base = len(grams) - len(edges)
+        total = len(grams)
+        lowered, padded, sizes = self._lowered, self._padded, self._sizes
+        
+        if limit is None:
+            hits = candidates if exact else [idx for idx in candidates if needle in lowered[idx]]
+            return self._rank_all(hits, edges, base, total)
+        
+        # Min-heap of (similarity, -index): the worst kept hit is on top
+        best: List[Tuple[float, int]] = []
+        seen: Set[int] = set()
+        for count in range(len(edges), -1, -1):
+            level = base + count
+            for subset in combinations(edges, count):
+                ids = min([candidates] + [self._postings.get(gram, _EMPTY) for gram in subset], key=len)
+                verify = not (exact and ids is candidates)
+                for idx in ids:
+                    if len(best) >= limit and level / (total + sizes[idx] - level) < best[0][0]:
+                        break
+                    if idx in seen or (verify and needle not in lowered[idx]):
+                        continue
+                    seen.add(idx)
+                    text = padded[idx]
+                    shared = base + sum(1 for gram in edges if gram in text)
+                    item = (shared / (total + sizes[idx] - shared), -idx)
+                    if len(best) < limit:
+                        heapq.heappush(best, item)
+                    elif item > best[0]:
+                        heapq.heapreplace(best, item)
+        return sorted((-similarity, -negative_idx) for similarity, negative_idx in best)
+    
+    def _short_posting(self, gram: str) -> array:
+        """Posting list of entries with a word containing gram (one or two characters)
+        
+        Derived from the trigram index on first use: the trigrams of a
+        word hold each of its characters at their third position and
+        each pair of adjacent characters at their last two.
+        """
+        posting = self._short_postings.get(gram)
+        if posting is None:
+            ids: Set[int] = set()
+            for key, ids_with_key in self._postings.items():
+                if key[3 - len(gram):] == gram:
+                    ids.update(ids_with_key)
+            posting = self._short_postings[gram] = array('I', sorted(ids, key=self._rank.__getitem__))
+        return posting
+    
+    def _rank_all(self, hits: Sequence[int], edges: List[str], base: int,
+                  total: int) -> List[Tuple[float, int]]:
+        """Rank hits (in posting order) as (-similarity, index) without scoring them one by one
+        
+        Hits are split by how many edge trigrams they share, keeping
+        posting order; every run of equally sized entries in a group has
+        the same similarity, so only the runs are scored and sorted.
+        """
+        groups: List[Sequence[int]] = [hits]
+        for gram in edges:
+            posting = set(self._postings.get(gram, _EMPTY))
+            split: List[Sequence[int]] = [[] for _ in range(len(groups) + 1)]
+            for count, group in enumerate(groups):
+                split[count].extend([idx for idx in group if idx not in posting])
+                split[count + 1].extend([idx for idx in group if idx in posting])
+            groups = split
+        
+        runs = []
+        for count, group in enumerate(groups, base):
+            for size, run in groupby(group, key=self._sizes.__getitem__):
+                runs.append((-count / (total + size - count), list(run)))
+        runs.sort(key=lambda item: (item[0], item[1][0]))
+        
+        ranked: List[Tuple[float, int]] = []
+        for negative, tied in groupby(runs, key=lambda item: item[0]):
+            tied = list(tied)
+            ids = tied[0][1]
+            if len(tied) > 1:
+                # Equally similar runs of different sizes interleave by catalog position
+                ids = sorted(idx for _, run in tied for idx in run)
+            ranked.extend(zip(repeat(negative), ids))
+        return ranked
+    
+    def _rank_fuzzy_matches(self, needle: str, grams: Set[str],
+                            limit: Optional[int]) -> List[Tuple[float, int]]:
+        """Rank close matches not containing needle as (-similarity, index), best first"""
+        need = max(1, math.ceil(self.threshold * len(grams)))
+        present = sorted((self._postings[gram] for gram in grams if gram in self._postings), key=len)
+        counts = self._count_candidates(present, need)
+        candidates: Iterable[int] = counts
+        if limit is not None:
+            # Keep the RERANK_FACTOR * limit best counted, plus any tied with the last of them
+            keep = self.RERANK_FACTOR * limit
+            common = counts.most_common(self.RERANK_FACTOR * keep)
+            cutoff = common[min(keep, len(common)) - 1][1] if common else 0
+            candidates = [idx for idx, count in common if count >= cutoff]
+        
+        total = len(grams)
+        ranked = []
+        for idx in candidates:
+            # Substring hits are ranked separately
+            if needle in self._lowered[idx]:
+                continue
+            padded = self._padded[idx]
+            shared = sum(1 for gram in grams if gram in padded)
+            if shared < need:
+                continue
+            ranked.append((-shared / (total + self._sizes[idx] - shared), idx))
+        ranked.sort()
+        return ranked
+    
+    def _count_candidates(self, present: List[array], need: int) -> Counter:
+        """Count posting-list hits per entry, rarest lists first
+        
+        An entry that is absent from the (n - need + 1) rarest lists cannot
+        share need trigrams with the query, so the common lists are never
+        scanned. At most SCAN_BUDGET ids are counted in total; a list that
+        does not fit is counted from its start, where the shortest (most
+        similar) entries are. The best candidates are then re-scored
+        exactly.
+        """
+        counts: Counter = Counter()
+        remaining = self.SCAN_BUDGET
+        for posting in present[:len(present) - need + 1]:
+            if remaining <= 0:
+                break
+            counts.update(posting[:remaining])
+            remaining -= len(posting)
+        return counts
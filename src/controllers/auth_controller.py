@@ -5,11 +5,22 @@ import time
 from typing import Optional, Dict, Any
 from datetime import datetime, timedelta
 
+try:
+    from utils.config import Config
+    DEFAULT_API_CONFIG = Config.DEFAULT_CONFIG['api']
+    CONFIG_AVAILABLE = True
+except ImportError:
+    DEFAULT_API_CONFIG = {'timeout': 30}
+    CONFIG_AVAILABLE = False
+
 
 class AuthController:
     """인증 관련 비즈니스 로직 처리"""
     
-    def __init__(self):
+    def __init__(self, api_config: Optional[Dict[str, Any]] = None):
+        # 설정 파일의 api 섹션 위에 인자로 받은 값을 덮어씀
+        user_config = Config.load_section('api') if CONFIG_AVAILABLE else {}
+        self.api_config = {**DEFAULT_API_CONFIG, **user_config, **(api_config or {})}
         self.max_login_attempts = 5
         self.lockout_duration = 30  # minutes
         self.failed_attempts = {}  # user_id: {'count': int, 'last_attempt': datetime}
@@ -39,6 +50,8 @@ class AuthController:
                     user_id=user_id,
                     password=password
                 )
+                # 응답 없는 서버에서 멈추지 않도록 연결/읽기 타임아웃 적용
+                jira_client.transport.apply_config(self.api_config)
                 # 연결 테스트
                 user_info = jira_client.get_current_user()
                 
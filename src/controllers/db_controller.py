@@ -5,6 +5,7 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from models.database import DatabaseManager
+from models.issue import IssueRecord
 
 class DBController:
     """데이터베이스 작업 관리 컨트롤러"""
@@ -107,32 +108,30 @@ class DBController:
                     status=issue.get('status', ''),
                     assignee=issue.get('assignee', ''),
                     issue_type=issue.get('type', ''),
-                    data=issue
+                    data=dict(issue)
                 )
         except Exception as e:
             print(f"Jira 이슈 캐싱 실패: {e}")
     
-    def get_cached_jira_issues(self, max_age_minutes: int = 60) -> List[Dict[str, Any]]:
-        """캐시된 Jira 이슈 조회"""
+    def get_cached_jira_issues(self, max_age_minutes: int = 60) -> List[IssueRecord]:
+        """캐시된 Jira 이슈 조회 (data 컬럼은 해당 필드에 접근할 때 디코딩)"""
         try:
-            cached_issues = self.db_manager.get_cached_issues(max_age_minutes)
-            # 필요한 형태로 변환
-            issues = []
-            for cached in cached_issues:
-                issue = cached['data'] if cached['data'] else {}
-                issue.update({
-                    'key': cached['issue_key'],
-                    'summary': cached['summary'],
-                    'status': cached['status'],
-                    'assignee': cached['assignee'],
-                    'type': cached['issue_type']
-                })
-                issues.append(issue)
-            return issues
+            cached_issues = self.db_manager.get_cached_issues(max_age_minutes, decode_data=False)
+            return [IssueRecord.from_cache_row(cached) for cached in cached_issues]
         except Exception as e:
             print(f"캐시된 Jira 이슈 조회 실패: {e}")
             return []
     
+    def search_cached_jira_issues(self, query: str, project: str = None, limit: int = 50) -> List[IssueRecord]:
+        """캐시된 Jira 이슈 전문 검색 (관련도 순)"""
+        try:
+            cached_issues = self.db_manager.search_cached_issues(query, limit=limit, project=project,
+                                                                 decode_data=False)
+            return [IssueRecord.from_cache_row(cached) for cached in cached_issues]
+        except Exception as e:
+            print(f"캐시된 Jira 이슈 검색 실패: {e}")
+            return []
+    
     def get_settings(self) -> Dict[str, Any]:
         """애플리케이션 설정 조회"""
         try:
@@ -2,7 +2,10 @@
 
 import sys
 import os
-from typing import List, Dict, Any, Optional
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import List, Dict, Any, Optional, Iterator, Callable, Sequence, Tuple, Union
+from itertools import islice
 from datetime import datetime
 import re
 
@@ -10,20 +13,71 @@ import re
 sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'atlassian_api'))
 
 try:
-    from atlassian_api import JiraAPI
+    from atlassian_api import JiraAPI, JQLBuilder, deadline
     JIRA_API_AVAILABLE = True
 except ImportError:
     JIRA_API_AVAILABLE = False
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from models.issue import IssueRecord
+from models.issue_cache import IssueCache
+from models.database import DatabaseManager
+
+try:
+    from utils.config import Config
+    DEFAULT_API_CONFIG = Config.DEFAULT_CONFIG['api']
+    DEFAULT_CACHE_CONFIG = Config.DEFAULT_CONFIG['cache']
+    CONFIG_AVAILABLE = True
+except ImportError:
+    DEFAULT_API_CONFIG = {'timeout': 30}
+    DEFAULT_CACHE_CONFIG = {}
+    CONFIG_AVAILABLE = False
+
 
 class JiraController:
     """Jira 이슈 관련 비즈니스 로직 처리"""
     
-    def __init__(self, server_url: str = None, user_id: str = None, password: str = None, use_real_api: bool = False):
+    # 검색 결과 페이지당 요청할 이슈 수
+    SEARCH_PAGE_SIZE = 100
+    
+    # 화면별로 실제 사용하는 필드만 요청 (fields 프로젝션)
+    LIST_FIELDS = ['summary', 'status', 'assignee', 'priority', 'created', 'issuetype']
+    RECENT_FIELDS = ['summary', 'status', 'priority']
+    DETAIL_FIELDS = ['summary', 'description', 'status', 'assignee', 'reporter',
+                     'priority', 'comment', 'attachment']
+    
+    # 첨부파일 최대 크기 (바이트, Jira 서버 설정에 맞춰 조정)
+    MAX_ATTACHMENT_SIZE = 1024 * 1024 * 1024
+    
+    # 백그라운드 갱신(stale-while-revalidate) 동시 작업 수
+    REFRESH_WORKERS = 2
+    
+    def __init__(self, server_url: str = None, user_id: str = None, password: str = None, use_real_api: bool = False,
+                 http_cache_dir: Optional[str] = None, api_config: Optional[Dict[str, Any]] = None,
+                 db_manager: Optional[DatabaseManager] = None, cache_config: Optional[Dict[str, Any]] = None):
         self.server_url = server_url or "https://jira.example.com"
         self.user_id = user_id
         self.password = password
-        self.cache = {}
+        # 조회 결과 캐시 (메모리 LRU, db_manager가 있으면 jira_issues_cache를 2차 캐시로 사용)
+        # 설정은 기본값 < 설정 파일 < 인자 순으로 적용
+        self.cache_config = {**DEFAULT_CACHE_CONFIG, **self._user_config('cache'), **(cache_config or {})}
+        self.cache = IssueCache(
+            db_manager,
+            ttls={kind: self.cache_config[f'{kind}_ttl'] for kind in IssueCache.DEFAULT_TTLS
+                  if f'{kind}_ttl' in self.cache_config},
+            max_entries=self.cache_config.get('memory_entries', IssueCache.DEFAULT_MAX_ENTRIES),
+            namespace=f"{self.server_url}|{user_id or ''}"
+        )
+        # 유효 시간이 지난 뒤에도 stale 구간 안이면 캐시 값을 바로 반환하고 백그라운드에서 갱신
+        self.stale_while_revalidate = self.cache_config.get('stale_while_revalidate', False)
+        self.stale_windows = {kind: self.cache_config.get(f'{kind}_stale', 0) for kind in IssueCache.DEFAULT_TTLS}
+        self.refresh_listeners: List[Callable[[str, Any, Any], None]] = []
+        self._refreshing: Dict[Tuple[str, Any], Future] = {}
+        self._refresh_lock = threading.Lock()
+        self._refresh_executor: Optional[ThreadPoolExecutor] = None
+        # 설정의 api 섹션 (타임아웃, 작업 제한 시간, 회로 차단기)
+        self.api_config = {**DEFAULT_API_CONFIG, **self._user_config('api'), **(api_config or {})}
+        self.operation_timeout = self.api_config.get('operation_timeout')
         self.use_real_api = use_real_api and JIRA_API_AVAILABLE
         self.jira_client = None
         
@@ -35,53 +89,64 @@ class JiraController:
                     user_id=self.user_id,
                     password=self.password
                 )
+                # 같은 이슈를 다시 열 때 본문 재다운로드 방지 (응답 본문이 디스크에 남으므로 경로를 지정한 경우만)
+                http_cache_dir = http_cache_dir or self.cache_config.get('http_cache_dir')
+                if http_cache_dir:
+                    try:
+                        self.jira_client.transport.enable_cache(os.path.expanduser(http_cache_dir))
+                    except OSError as e:
+                        print(f"HTTP 캐시 초기화 실패: {e}")
+                # 응답 없는 서버에서 멈추지 않도록 타임아웃/회로 차단기 적용
+                self.jira_client.transport.apply_config(self.api_config)
                 # 연결 테스트
-                self.jira_client.get_current_user()
+                with deadline(self.operation_timeout):
+                    self.jira_client.get_current_user()
                 print(f"Jira API 연결 성공: {self.server_url}")
             except Exception as e:
                 print(f"Jira API 연결 실패: {e}")
                 self.use_real_api = False
                 self.jira_client = None
     
+    @staticmethod
+    def _user_config(section: str) -> Dict[str, Any]:
+        """설정 파일(~/.tm_setter/config.json)의 섹션 (설정 모듈이 없으면 빈 딕셔너리)"""
+        return Config.load_section(section) if CONFIG_AVAILABLE else {}
+    
     def search_issues(self, query: str, project: str = None, 
-                     max_results: int = 50) -> List[Dict[str, Any]]:
+                     max_results: Optional[int] = 50, status: Union[str, Sequence[str], None] = None,
+                     assignee: Optional[str] = None,
+                     db_selection: Optional[Dict[str, str]] = None) -> List[IssueRecord]:
         """
         Jira 이슈 검색
+        
+        모든 조건은 JQL로 서버에서 적용된다. max_results가 None이면 모든 페이지를 조회한다.
+        캐시와 갱신 리스너에는 search_key()가 반환하는 키가 쓰인다.
+        
+        Args:
+            status: 상태 (목록이면 그중 하나)
+            assignee: 담당자 ('currentUser()'는 현재 사용자, 'EMPTY'는 미할당)
+            db_selection: DB 선택 (db1~db3 값을 설정의 api.db_selection_field 필드로 검색, 기본 labels)
         """
+        filters = self._search_filters(status, assignee, db_selection)
         # 실제 API 사용
         if self.use_real_api and self.jira_client:
             try:
-                jql = ""
-                if query:
-                    jql = f"text ~ '{query}'"
-                if project:
-                    jql += f" AND project = {project}" if jql else f"project = {project}"
-                if not jql:
-                    jql = "ORDER BY created DESC"
-                    
-                result = self.jira_client.search_issues(jql, max_results)
-                
-                # API 응답을 표준 형식으로 변환
-                issues = []
-                for issue in result.get('issues', []):
-                    fields = issue.get('fields', {})
-                    issues.append({
-                        'key': issue.get('key'),
-                        'summary': fields.get('summary'),
-                        'status': fields.get('status', {}).get('name', 'Unknown'),
-                        'assignee': fields.get('assignee', {}).get('displayName') if fields.get('assignee') else 'Unassigned',
-                        'priority': fields.get('priority', {}).get('name', 'None'),
-                        'created': fields.get('created', '').split('T')[0] if fields.get('created') else '',
-                        'type': fields.get('issuetype', {}).get('name', 'Task')
-                    })
-                return issues
+                key = self.search_key(query, project, max_results, status, assignee, db_selection)
+                return self._cached('search', key,
+                                    lambda: self._fetch_issues(query, project, max_results, filters))
                 
             except Exception as e:
                 print(f"Jira API 검색 실패: {e}")
-                # 실패 시 더미 데이터로 폴백
+                # 실패 시 로컬 캐시 전문 검색, 그래도 없으면 더미 데이터로 폴백
+        
+        # 오프라인 검색 (캐시 DB가 있으면 관련도 순 전문 검색)
+        if query:
+            offline = self._filter_local(self.search_offline(query, project, max_results or 50), filters)
+            if offline:
+                return offline
         
         # 더미 데이터 사용 (API 사용 불가 시)
-        dummy_issues = [
+        dummy_issues = [IssueRecord.from_dict(issue) for issue in [
             {
                 'key': 'TM-101',
                 'summary': 'TM 설정 자동화 구현',
@@ -109,7 +174,7 @@ class JiraController:
                 'created': '2024-01-14',
                 'type': 'Improvement'
             }
-        ]
+        ]]
         
         # 검색어로 필터링
         if query:
@@ -117,56 +182,225 @@ class JiraController:
             for issue in dummy_issues:
                 if query.lower() in issue['summary'].lower():
                     filtered.append(issue)
-            return filtered
+            return self._filter_local(filtered, filters)
         
-        return dummy_issues
+        return self._filter_local(dummy_issues, filters)
     
-    def get_issue_details(self, issue_key: str) -> Dict[str, Any]:
+    def search_key(self, query: str, project: str = None, max_results: Optional[int] = 50,
+                   status: Union[str, Sequence[str], None] = None, assignee: Optional[str] = None,
+                   db_selection: Optional[Dict[str, str]] = None) -> Tuple:
+        """
+        search_issues가 같은 인자로 쓰는 캐시 키 (갱신 리스너에서 표시 중인 검색을 식별할 때 사용)
+        
+        (query, project, max_results)에 지정한 검색 조건이 있으면 정규화한 조건 튜플이 붙는다.
+        """
+        filters = self._search_filters(status, assignee, db_selection)
+        return (query, project, max_results) + ((filters,) if filters else ())
+    
+    @staticmethod
+    def _search_filters(status: Union[str, Sequence[str], None] = None, assignee: Optional[str] = None,
+                        db_selection: Optional[Dict[str, str]] = None) -> Tuple[Tuple[str, Any], ...]:
+        """검색 조건을 캐시 키로 쓸 수 있는 정규화된 튜플로 변환 (지정하지 않은 조건은 제외)"""
+        filters = []
+        if status:
+            filters.append(('status', status if isinstance(status, str) else tuple(status)))
+        if assignee:
+            filters.append(('assignee', assignee))
+        selection = tuple(sorted((level, value) for level, value in (db_selection or {}).items() if value))
+        if selection:
+            filters.append(('db_selection', selection))
+        return tuple(filters)
+    
+    @staticmethod
+    def _filter_local(issues: List[IssueRecord], filters: Tuple[Tuple[str, Any], ...]) -> List[IssueRecord]:
+        """
+        오프라인/더미 결과에 검색 조건 적용
+        
+        목록 레코드에 없는 DB 선택 필드(db_selection)와 currentUser()는 확인할 수 없어 무시한다.
+        """
+        for name, value in filters:
+            if name == 'status':
+                statuses = {value} if isinstance(value, str) else set(value)
+                issues = [issue for issue in issues if issue.get('status') in statuses]
+            elif name == 'assignee' and value not in ('currentUser()', 'EMPTY'):
+                issues = [issue for issue in issues if issue.get('assignee') == value]
+            elif name == 'assignee' and value == 'EMPTY':
+                issues = [issue for issue in issues if issue.get('assignee') in (None, '', 'Unassigned')]
+        return issues
+    
+    def search_offline(self, query: str, project: str = None, limit: int = 50) -> List[IssueRecord]:
+        """
+        로컬 캐시(jira_issues_cache) 전문 검색
+        
+        키/요약/설명/코멘트 대상, 단어는 접두어 검색이고 "..."는 구문 검색이다.
+        """
+        db_manager = self.cache.db_manager
+        if not db_manager:
+            return []
+        try:
+            rows = db_manager.search_cached_issues(query, limit=limit, project=project, decode_data=False)
+            return [IssueRecord.from_cache_row(row) for row in rows]
+        except Exception as e:
+            print(f"오프라인 검색 실패: {e}")
+            return []
+    
+    def _fetch_issues(self, query: str, project: str = None, max_results: Optional[int] = 50,
+                      filters: Tuple[Tuple[str, Any], ...] = ()) -> List[IssueRecord]:
+        """검색 결과를 API에서 조회 (캐시 미적용)"""
+        return self._fetch_jql(self._build_search_jql(query, project, filters), max_results)
+    
+    def _fetch_jql(self, jql: str, max_results: Optional[int] = 50) -> List[IssueRecord]:
+        """JQL 결과를 API에서 조회 (max_results가 None이면 전체, 캐시 미적용)"""
+        page_size = min(max_results, self.SEARCH_PAGE_SIZE) if max_results else self.SEARCH_PAGE_SIZE
+        with deadline(self.operation_timeout):
+            return list(islice(self._iter_jql(jql, page_size), max_results))
+    
+    def _cached(self, kind: str, key: Any, fetch: Callable[[], Any]) -> Any:
+        """
+        캐시를 거쳐 조회 (유효한 값이 없으면 fetch 결과를 저장)
+        
+        API 호출이 실패하면 만료된 캐시 값이라도 반환하고, 캐시도 없으면 예외를 그대로 전달한다.
+        """
+        entry = self.cache.lookup(kind, key)
+        if entry is not None:
+            age = self.cache.age(entry)
+            if age <= self.cache.ttl(kind):
+                return entry[1]
+            if self.stale_while_revalidate and age <= self.cache.ttl(kind) + self.stale_windows.get(kind, 0):
+                self._revalidate(kind, key, fetch, entry[1])
+                return entry[1]
+        try:
+            value = fetch()
+        except Exception:
+            if entry is None:
+                raise
+            return entry[1]
+        self.cache.put(kind, key, value)
+        return value
+    
+    def add_refresh_listener(self, listener: Callable[[str, Any, Any], None]) -> Callable[[str, Any, Any], None]:
+        """
+        백그라운드 갱신 결과 리스너 등록
+        
+        반환했던 stale 값과 다른 결과가 도착하면 listener(종류, 캐시 키, 새 값)으로 호출된다.
+        갱신 스레드에서 호출되므로 GUI는 시그널로 UI 스레드에 전달해야 한다.
+        """
+        with self._refresh_lock:
+            self.refresh_listeners = self.refresh_listeners + [listener]
+        return listener
+    
+    def remove_refresh_listener(self, listener: Callable[[str, Any, Any], None]):
+        """백그라운드 갱신 결과 리스너 제거"""
+        with self._refresh_lock:
+            self.refresh_listeners = [l for l in self.refresh_listeners if l is not listener]
+    
+    def _revalidate(self, kind: str, key: Any, fetch: Callable[[], Any], current: Any):
+        """백그라운드 갱신 예약 (같은 항목의 갱신이 진행 중이면 생략)"""
+        with self._refresh_lock:
+            if (kind, key) in self._refreshing:
+                return
+            if self._refresh_executor is None:
+                self._refresh_executor = ThreadPoolExecutor(max_workers=self.REFRESH_WORKERS,
+                                                            thread_name_prefix='jira-refresh')
+            self._refreshing[(kind, key)] = self._refresh_executor.submit(self._refresh, kind, key, fetch, current)
+    
+    def _refresh(self, kind: str, key: Any, fetch: Callable[[], Any], current: Any):
+        """백그라운드 갱신 실행 (실패하면 stale 값을 유지)"""
+        try:
+            value = fetch()
+            self.cache.put(kind, key, value)
+            if value != current:
+                for listener in self.refresh_listeners:
+                    try:
+                        listener(kind, key, value)
+                    except Exception as e:
+                        print(f"갱신 리스너 오류: {e}")
+        except Exception as e:
+            print(f"백그라운드 갱신 실패 ({kind} {key}): {e}")
+        finally:
+            with self._refresh_lock:
+                self._refreshing.pop((kind, key), None)
+    
+    def wait_for_refreshes(self, timeout: Optional[float] = None) -> bool:
+        """진행 중인 백그라운드 갱신이 끝날 때까지 대기 (CLI 종료 전, 테스트용)"""
+        with self._refresh_lock:
+            pending = list(self._refreshing.values())
+        return not wait(pending, timeout).not_done
+    
+    def close(self):
+        """백그라운드 갱신 스레드 종료"""
+        with self._refresh_lock:
+            executor, self._refresh_executor = self._refresh_executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+    
+    def invalidate_issue(self, issue_key: str):
+        """이슈 캐시 무효화 (수정/코멘트/첨부 후, 웹훅 이벤트 수신 시)"""
+        self.cache.invalidate_issue(issue_key)
+    
+    def on_issue_event(self, event: Dict[str, Any]):
+        """
+        WebhookController 리스너: 이벤트에 포함된 이슈를 메모리 캐시에서 제거
+        
+        SQLite 행은 웹훅이 이미 반영(갱신/삭제/만료)했으므로 다시 만료하지 않는다.
+        """
+        for issue_key in event.get('issue_keys', []):
+            self.cache.evict_issue(issue_key)
+    
+    def iter_issues(self, query: str = "", project: str = None,
+                    page_size: int = SEARCH_PAGE_SIZE) -> Iterator[IssueRecord]:
+        """
+        Jira 이슈 검색 결과를 페이지 단위로 지연 조회
+        
+        페이지가 도착하는 대로 표준 형식으로 변환된 이슈를 반환하며,
+        소비자가 순회를 멈추면 다음 페이지를 요청하지 않는다.
+        """
+        if not (self.use_real_api and self.jira_client):
+            yield from self.search_issues(query, project)
+            return
+        
+        yield from self._iter_jql(self._build_search_jql(query, project), page_size)
+    
+    def _iter_jql(self, jql: str, page_size: int = SEARCH_PAGE_SIZE) -> Iterator[IssueRecord]:
+        """JQL 검색 결과를 페이지 단위로 지연 조회 (내부 헬퍼, 페이지 순회는 JiraAPI.iter_search_issues 사용)"""
+        for issue in self.jira_client.iter_search_issues(jql, page_size=page_size, fields=self.LIST_FIELDS):
+            yield self._format_issue(issue)
+    
+    def _build_search_jql(self, query: str, project: str = None,
+                          filters: Tuple[Tuple[str, Any], ...] = ()) -> str:
+        """검색어, 프로젝트, 검색 조건으로 JQL 생성 (값은 모두 인용/이스케이프, 내부 헬퍼)"""
+        builder = JQLBuilder().text(query).project(project)
+        for name, value in filters:
+            if name == 'status':
+                builder.status(value)
+            elif name == 'assignee':
+                builder.assignee(self._jql_user(value))
+            elif name == 'db_selection':
+                builder.db_selection(dict(value), self.api_config.get('db_selection_field') or 'labels')
+        if not builder:
+            builder.order_by('created', descending=True)
+        return builder.build()
+    
+    @staticmethod
+    def _jql_user(value: str) -> Any:
+        """담당자 값을 JQL 값으로 변환 (currentUser()/EMPTY는 따옴표 없이)"""
+        return {'currentUser()': JQLBuilder.CURRENT_USER, 'EMPTY': JQLBuilder.EMPTY}.get(value, value)
+    
+    def get_issue_details(self, issue_key: str) -> IssueRecord:
         """
         이슈 상세 정보 조회
         """
         # 실제 API 사용
         if self.use_real_api and self.jira_client:
             try:
-                issue = self.jira_client.get_issue(issue_key, expand='changelog,comments,attachment')
-                fields = issue.get('fields', {})
-                
-                # 코멘트 포맷팅
-                comments = []
-                for comment in fields.get('comment', {}).get('comments', []):
-                    comments.append({
-                        'author': comment.get('author', {}).get('displayName', 'Unknown'),
-                        'body': comment.get('body', ''),
-                        'created': comment.get('created', '').replace('T', ' ').split('.')[0]
-                    })
-                
-                # 첨부파일 포맷팅
-                attachments = []
-                for attachment in fields.get('attachment', []):
-                    attachments.append({
-                        'filename': attachment.get('filename', ''),
-                        'size': f"{attachment.get('size', 0) / 1024:.1f}KB",
-                        'created': attachment.get('created', '').split('T')[0]
-                    })
-                
-                return {
-                    'key': issue.get('key'),
-                    'summary': fields.get('summary', ''),
-                    'description': fields.get('description', ''),
-                    'status': fields.get('status', {}).get('name', 'Unknown'),
-                    'assignee': fields.get('assignee', {}).get('displayName') if fields.get('assignee') else None,
-                    'reporter': fields.get('reporter', {}).get('displayName', 'Unknown'),
-                    'priority': fields.get('priority', {}).get('name', 'None'),
-                    'comments': comments,
-                    'attachments': attachments
-                }
+                return self._cached('detail', issue_key, lambda: self._fetch_issue_details(issue_key))
                 
             except Exception as e:
                 print(f"이슈 상세 조회 실패: {e}")
                 # 실패 시 더미 데이터로 폴백
         
         # 더미 데이터 사용
-        return {
+        return IssueRecord.from_dict({
             'key': issue_key,
             'summary': f'이슈 {issue_key} 상세 정보',
             'description': '이것은 테스트 이슈입니다.',
@@ -181,6 +415,73 @@ class JiraController:
             'attachments': [
                 {'filename': 'screenshot.png', 'size': '245KB', 'created': '2024-01-15'}
             ]
+        })
+    
+    def _fetch_issue_details(self, issue_key: str) -> IssueRecord:
+        """이슈 상세 정보를 API에서 조회 (캐시 미적용)"""
+        with deadline(self.operation_timeout):
+            issue = self.jira_client.get_issue(issue_key, fields=self.DETAIL_FIELDS)
+        fields = issue.get('fields', {})
+        
+        # 코멘트 포맷팅
+        comments = []
+        for comment in fields.get('comment', {}).get('comments', []):
+            comments.append({
+                'author': comment.get('author', {}).get('displayName', 'Unknown'),
+                'body': comment.get('body', ''),
+                'created': comment.get('created', '').replace('T', ' ').split('.')[0]
+            })
+        
+        # 첨부파일 포맷팅
+        attachments = []
+        for attachment in fields.get('attachment', []):
+            attachments.append({
+                'filename': attachment.get('filename', ''),
+                'size': f"{attachment.get('size', 0) / 1024:.1f}KB",
+                'created': attachment.get('created', '').split('T')[0]
+            })
+        
+        return IssueRecord(
+            key=issue.get('key'),
+            summary=fields.get('summary', ''),
+            status=fields.get('status', {}).get('name', 'Unknown'),
+            assignee=fields.get('assignee', {}).get('displayName') if fields.get('assignee') else None,
+            priority=fields.get('priority', {}).get('name', 'None'),
+            raw={
+                'description': fields.get('description', ''),
+                'reporter': fields.get('reporter', {}).get('displayName', 'Unknown'),
+                'comments': comments,
+                'attachments': attachments
+            }
+        )
+    
+    def get_issues_by_keys(self, issue_keys: List[str]) -> Dict[str, Any]:
+        """
+        여러 이슈를 키로 한 번에 조회 (다중 선택 확인, 저장된 issue_selection 재검증용)
+        
+        Returns:
+            {'issues': {이슈 키: 표준 형식 이슈}, 'missing': [조회되지 않은 키]}
+        """
+        # 실제 API 사용
+        if self.use_real_api and self.jira_client:
+            try:
+                with deadline(self.operation_timeout):
+                    result = self.jira_client.get_issues(issue_keys, fields=self.LIST_FIELDS)
+                return {
+                    'issues': {key: self._format_issue(issue) for key, issue in result['issues'].items()},
+                    'missing': result['missing']
+                }
+                
+            except Exception as e:
+                print(f"이슈 일괄 조회 실패: {e}")
+                return {'issues': {}, 'missing': list(issue_keys)}
+        
+        # 더미 데이터 사용
+        dummy = {issue['key']: issue for issue in self.search_issues("")}
+        keys = [key.strip().upper() for key in issue_keys]
+        return {
+            'issues': {key: dummy[key] for key in keys if key in dummy},
+            'missing': [key for key in keys if key not in dummy]
         }
     
     def create_issue(self, issue_data: Dict[str, Any]) -> str:
@@ -190,14 +491,8 @@ class JiraController:
         # 실제 API 사용
         if self.use_real_api and self.jira_client:
             try:
-                result = self.jira_client.create_issue(
-                    project_key=issue_data.get('project', 'TM'),
-                    issue_type=issue_data.get('type', 'Task'),
-                    summary=issue_data['summary'],
-                    description=issue_data.get('description', ''),
-                    priority=issue_data.get('priority', 'Medium'),
-                    assignee=issue_data.get('assignee')
-                )
+                result = self.jira_client.create_issue(**self._create_args(issue_data))
+                self.cache.invalidate_lists()
                 return result.get('key', '')
                 
             except Exception as e:
@@ -207,6 +502,55 @@ class JiraController:
         # 더미 구현
         return f"TM-{datetime.now().strftime('%H%M%S')}"
     
+    def _create_args(self, issue_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        화면 입력값을 JiraAPI.create_issue 인자로 변환
+        
+        우선순위는 {"name": ...}, 담당자는 {"accountId": ...} 형식으로 감싸고
+        담당자가 없으면 필드를 보내지 않는다.
+        """
+        args = {
+            'project_key': issue_data.get('project', 'TM'),
+            'issue_type': issue_data.get('type', 'Task'),
+            'summary': issue_data['summary'],
+            'description': issue_data.get('description', ''),
+            'priority': {'name': issue_data.get('priority') or 'Medium'}
+        }
+        if issue_data.get('assignee'):
+            args['assignee'] = {'accountId': issue_data['assignee']}
+        return args
+    
+    def create_issues(self, issues_data: List[Dict[str, Any]], max_workers: int = 4) -> List[Dict[str, Any]]:
+        """
+        여러 이슈 일괄 생성 (/issue/bulk, 50개 단위 청크를 동시에 전송)
+        
+        Returns:
+            입력 순서와 같은 항목별 결과 목록 ({"index", "success", "key", "id", "error"})
+        """
+        # 실제 API 사용
+        if self.use_real_api and self.jira_client:
+            try:
+                results = self.jira_client.bulk_create_issues(
+                    [self._create_args(issue_data) for issue_data in issues_data],
+                    max_workers=max_workers
+                )
+                self.cache.invalidate_lists()
+                return results
+                
+            except Exception as e:
+                print(f"이슈 일괄 생성 실패: {e}")
+                return [
+                    {'index': i, 'success': False, 'key': None, 'id': None, 'error': str(e)}
+                    for i in range(len(issues_data))
+                ]
+        
+        # 더미 구현
+        stamp = datetime.now().strftime('%H%M%S')
+        return [
+            {'index': i, 'success': True, 'key': f"TM-{stamp}{i}", 'id': None, 'error': None}
+            for i in range(len(issues_data))
+        ]
+    
     def update_issue(self, issue_key: str, updates: Dict[str, Any]) -> bool:
         """
         이슈 업데이트
@@ -215,6 +559,7 @@ class JiraController:
         if self.use_real_api and self.jira_client:
             try:
                 self.jira_client.update_issue(issue_key, updates)
+                self.invalidate_issue(issue_key)
                 return True
                 
             except Exception as e:
@@ -233,6 +578,7 @@ class JiraController:
         if self.use_real_api and self.jira_client:
             try:
                 self.jira_client.add_comment(issue_key, comment)
+                self.invalidate_issue(issue_key)
                 return True
                 
             except Exception as e:
@@ -243,39 +589,98 @@ class JiraController:
         print(f"이슈 {issue_key}에 코멘트 추가: {comment}")
         return True
     
-    def attach_file(self, issue_key: str, file_path: str) -> bool:
+    def attach_file(self, issue_key: str, file_path: str, progress: Optional[Callable] = None) -> bool:
         """
         이슈에 파일 첨부
         
-        TODO: [파일 첨부]
-        - 파일 크기 제한 확인
-        - 파일 형식 검증
+        파일은 디스크에서 스트리밍으로 업로드되며, progress(파일 경로, 전송 바이트, 전체 바이트)로
+        진행 상황을 받을 수 있다.
         """
-        # TODO: 실제 구현
-        # with open(file_path, 'rb') as file:
-        #     self.jira_client.add_attachment(issue=issue_key, attachment=file)
-        # return True
+        if not self._check_attachment(file_path):
+            return False
+        
+        # 실제 API 사용
+        if self.use_real_api and self.jira_client:
+            try:
+                self.jira_client.add_attachment(issue_key, file_path, progress=progress)
+                self.invalidate_issue(issue_key)
+                return True
+                
+            except Exception as e:
+                print(f"파일 첨부 실패: {e}")
+                return False
         
         # 임시 구현
         print(f"이슈 {issue_key}에 파일 첨부: {file_path}")
         return True
     
-    def get_my_issues(self, user_id: str = None) -> List[Dict[str, Any]]:
+    def attach_files(self, issue_key: str, file_paths: List[str], progress: Optional[Callable] = None,
+                     max_workers: int = 4) -> List[Dict[str, Any]]:
+        """
+        여러 파일을 동시에 첨부
+        
+        Returns:
+            입력 순서와 같은 파일별 결과 목록 ({'path', 'success', 'result', 'error'})
+        """
+        valid = [path for path in file_paths if self._check_attachment(path)]
+        results = {path: {'path': path, 'success': False, 'result': None, 'error': '첨부할 수 없는 파일'}
+                   for path in file_paths}
+        
+        # 실제 API 사용
+        if self.use_real_api and self.jira_client:
+            for result in self.jira_client.add_attachments(issue_key, valid, max_workers=max_workers,
+                                                           progress=progress):
+                results[result['path']] = result
+            self.invalidate_issue(issue_key)
+        else:
+            for path in valid:
+                results[path] = {'path': path, 'success': self.attach_file(issue_key, path),
+                                 'result': None, 'error': None}
+        return [results[path] for path in file_paths]
+    
+    def download_attachment(self, attachment_id: str, dest_path: str, progress: Optional[Callable] = None) -> bool:
+        """
+        첨부파일 다운로드 (중단된 다운로드는 받은 위치부터 이어받음)
+        """
+        if not (self.use_real_api and self.jira_client):
+            return False
+        
+        try:
+            self.jira_client.download_attachment(attachment_id, dest_path, progress=progress)
+            return True
+        except Exception as e:
+            print(f"첨부파일 다운로드 실패: {e}")
+            return False
+    
+    def _check_attachment(self, file_path: str) -> bool:
+        """첨부 가능한 파일인지 확인 (존재 여부, 크기 제한)"""
+        if not os.path.isfile(file_path):
+            print(f"첨부할 파일이 없습니다: {file_path}")
+            return False
+        if self.MAX_ATTACHMENT_SIZE and os.path.getsize(file_path) > self.MAX_ATTACHMENT_SIZE:
+            print(f"첨부 크기 제한 초과: {file_path}")
+            return False
+        return True
+    
+    def get_my_issues(self, user_id: str = None) -> List[IssueRecord]:
         """
         내 이슈 목록 조회
         """
         # 실제 API 사용
         if self.use_real_api and self.jira_client:
             try:
-                jql = "assignee = currentUser() OR reporter = currentUser()"
-                return self.search_issues("", max_results=100)
+                jql = JQLBuilder().any_of(
+                    JQLBuilder().assignee(JQLBuilder.CURRENT_USER),
+                    JQLBuilder().where('reporter', '=', JQLBuilder.CURRENT_USER)
+                ).order_by('updated', descending=True).build()
+                return self._cached('my', user_id, lambda: self._fetch_jql(jql, max_results=100))
                 
             except Exception as e:
                 print(f"내 이슈 조회 실패: {e}")
                 # 실패 시 더미 데이터로 폴백
         
         # 더미 구현
-        return [
+        return [IssueRecord.from_dict(issue) for issue in [
             {
                 'key': 'TM-201',
                 'summary': '내가 담당한 이슈 1',
@@ -288,27 +693,16 @@ class JiraController:
                 'status': 'Open',
                 'priority': 'Medium'
             }
-        ]
+        ]]
     
-    def get_recent_issues(self, limit: int = 10) -> List[Dict[str, Any]]:
+    def get_recent_issues(self, limit: int = 10) -> List[IssueRecord]:
         """
         최근 이슈 목록 조회
         """
         # 실제 API 사용
         if self.use_real_api and self.jira_client:
             try:
-                jql = "created >= -7d ORDER BY created DESC"
-                result = self.jira_client.search_issues(jql, limit)
-                issues = []
-                for issue in result.get('issues', []):
-                    fields = issue.get('fields', {})
-                    issues.append({
-                        'key': issue.get('key'),
-                        'summary': fields.get('summary'),
-                        'status': fields.get('status', {}).get('name', 'Unknown'),
-                        'priority': fields.get('priority', {}).get('name', 'None')
-                    })
-                return issues
+                return self._cached('recent', limit, lambda: self._fetch_recent_issues(limit))
                 
             except Exception as e:
                 print(f"최근 이슈 조회 실패: {e}")
@@ -317,6 +711,22 @@ class JiraController:
         # 더미 구현
         return self.search_issues("")[:limit]
     
+    def _fetch_recent_issues(self, limit: int) -> List[IssueRecord]:
+        """최근 이슈 목록을 API에서 조회 (캐시 미적용)"""
+        jql = "created >= -7d ORDER BY created DESC"
+        with deadline(self.operation_timeout):
+            result = self.jira_client.search_issues(jql, limit, fields=self.RECENT_FIELDS)
+        issues = []
+        for issue in result.get('issues', []):
+            fields = issue.get('fields', {})
+            issues.append(IssueRecord(
+                key=issue.get('key'),
+                summary=fields.get('summary'),
+                status=fields.get('status', {}).get('name', 'Unknown'),
+                priority=fields.get('priority', {}).get('name', 'None')
+            ))
+        return issues
+    
     def validate_issue_key(self, issue_key: str) -> bool:
         """
         이슈 키 형식 검증
@@ -364,14 +774,9 @@ class JiraController:
         print(f"이슈 {issue_key} 상태 전환: {transition_id}")
         return True
     
-    def _format_issue(self, issue: Any) -> Dict[str, Any]:
-        """이슈 데이터 포맷팅 (내부 헬퍼)"""
-        # TODO: 실제 Jira 객체 포맷팅
-        return {
-            'key': str(issue),
-            'summary': 'Formatted issue',
-            'status': 'Open'
-        }
+    def _format_issue(self, issue: Dict[str, Any]) -> IssueRecord:
+        """API 응답 이슈를 표준 형식으로 변환 (내부 헬퍼)"""
+        return IssueRecord.from_api(issue)
     
     def _format_comment(self, comment: Any) -> Dict[str, str]:
         """코멘트 데이터 포맷팅 (내부 헬퍼)"""
@@ -0,0 +1,243 @@
+"""Jira 증분 동기화 컨트롤러 - updated 워터마크 기반 로컬 미러 유지"""
+
+import re
+import sys
+import os
+from datetime import datetime, timedelta, timezone
+from typing import List, Dict, Any, Optional
+
+try:
+    from zoneinfo import ZoneInfo
+    ZONEINFO_AVAILABLE = True
+except ImportError:
+    ZONEINFO_AVAILABLE = False
+
+# atlassian_api 모듈 경로 추가
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'atlassian_api'))
+
+try:
+    from atlassian_api import JQLBuilder
+    JQL_BUILDER_AVAILABLE = True
+except ImportError:
+    JQL_BUILDER_AVAILABLE = False
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from models.database import DatabaseManager
+
+try:
+    from utils.config import Config
+except ImportError:
+    Config = None
+
+
+class JiraSyncController:
+    """Incrementally mirrors Jira search results into jira_issues_cache"""
+
+    # 동기화 페이지 크기 (Jira Cloud 검색 최대값)
+    PAGE_SIZE = 100
+
+    # 로컬 미러에 저장하는 필드
+    SYNC_FIELDS = ['summary', 'status', 'assignee', 'reporter', 'priority', 'issuetype',
+                   'created', 'updated', 'labels', 'components', 'description', 'comment', 'project']
+
+    # JQL 날짜는 분 단위이므로 워터마크와 같은 분에 갱신된 이슈를 놓치지 않도록 겹쳐 조회
+    OVERLAP_MINUTES = 1
+
+    # 동기화 중 갱신으로 updated 순서가 바뀌어도 오프셋이 밀리지 않도록 고정 컬럼으로 정렬
+    SYNC_ORDER = 'ORDER BY created ASC, key ASC'
+
+    JIRA_TIME_FORMAT = '%Y-%m-%dT%H:%M:%S.%f%z'
+
+    def __init__(self, jira_client, db_manager: Optional[DatabaseManager] = None,
+                 time_zone: Optional[str] = None):
+        """
+        Args:
+            jira_client: JiraAPI 인스턴스
+            db_manager: 데이터베이스 관리자 (없으면 기본 경로 사용)
+            time_zone: JQL 날짜 해석에 쓸 사용자 시간대 (없으면 /myself에서 조회)
+        """
+        self.jira_client = jira_client
+        self.db_manager = db_manager or DatabaseManager()
+        self.time_zone = time_zone
+
+    def sync(self, jql: str, full: bool = False) -> Dict[str, Any]:
+        """
+        JQL 결과를 로컬 캐시에 증분 동기화
+
+        이전 동기화의 워터마크(가장 늦은 updated) 이후 변경된 이슈만 조회해
+        페이지 단위로 upsert한다. 워터마크는 전체 조회가 끝난 뒤에만 저장하므로
+        중간에 실패하면 다음 실행이 같은 구간부터 다시 가져온다.
+        삭제된 이슈는 검색 결과에 나타나지 않으므로 full=True로 재동기화해야 반영된다.
+
+        Args:
+            jql: 동기화 대상 JQL (ORDER BY는 무시됨)
+            full: True면 워터마크를 무시하고 전체 조회
+
+        Returns:
+            동기화 결과 (jql, full, fetched, upserted, watermark)
+        """
+        sync_key = self.normalize_jql(jql)
+        state = None if full else self.db_manager.get_sync_state(sync_key)
+        watermark = state['watermark'] if state else None
+
+        query = self.build_query(sync_key, watermark)
+        fetched = 0
+        upserted = 0
+        latest = self.parse_time(watermark)
+        batch: List[Dict[str, Any]] = []
+
+        for issue in self.jira_client.iter_search_issues(query, page_size=self.PAGE_SIZE,
+                                                         fields=self.SYNC_FIELDS):
+            fetched += 1
+            row = self.to_cache_row(issue)
+            batch.append(row)
+            updated = self.parse_time(row['updated'])
+            if updated and (latest is None or updated > latest):
+                latest = updated
+                watermark = row['updated']
+            if len(batch) >= self.PAGE_SIZE:
+                upserted += self.db_manager.upsert_jira_issues(batch)
+                batch = []
+
+        upserted += self.db_manager.upsert_jira_issues(batch)
+        self.db_manager.save_sync_state(sync_key, watermark, upserted)
+
+        return {
+            'jql': sync_key,
+            'full': state is None,
+            'fetched': fetched,
+            'upserted': upserted,
+            'watermark': watermark
+        }
+
+    def sync_projects(self, project_keys: List[str], full: bool = False) -> List[Dict[str, Any]]:
+        """프로젝트별로 동기화 (프로젝트마다 워터마크를 따로 유지, 키는 JQL 문자열로 인용)"""
+        return [self.sync(JQLBuilder().project(key).build(), full=full) for key in project_keys]
+
+    def reset(self, jql: str):
+        """워터마크 삭제 (다음 동기화는 전체 조회)"""
+        self.db_manager.delete_sync_state(self.normalize_jql(jql))
+
+    @staticmethod
+    def normalize_jql(jql: str) -> str:
+        """ORDER BY 절과 여분 공백 제거 (워터마크 키로 사용)"""
+        jql = re.split(r'\border\s+by\b', jql, maxsplit=1, flags=re.IGNORECASE)[0]
+        return ' '.join(jql.split())
+
+    def build_query(self, jql: str, watermark: Optional[str] = None) -> str:
+        """워터마크 조건과 고정 정렬을 붙인 동기화 JQL 생성"""
+        clauses = []
+        if jql:
+            clauses.append(f'({jql})')
+        since = self.parse_time(watermark)
+        if since is not None:
+            clauses.append(f'updated >= "{self.format_jql_time(since)}"')
+        return ' '.join(filter(None, [' AND '.join(clauses), self.SYNC_ORDER]))
+
+    def format_jql_time(self, value: datetime) -> str:
+        """JQL 날짜 문자열 (사용자 시간대, 분 단위 내림 후 겹침 구간 적용)"""
+        local = value.astimezone(self._user_timezone()).replace(second=0, microsecond=0)
+        return (local - timedelta(minutes=self.OVERLAP_MINUTES)).strftime('%Y/%m/%d %H:%M')
+
+    def _user_timezone(self):
+        """JQL 날짜를 해석하는 사용자 시간대 (알 수 없으면 UTC)"""
+        if self.time_zone is None:
+            try:
+                self.time_zone = self.jira_client.get_current_user().get('timeZone') or 'UTC'
+            except Exception:
+                self.time_zone = 'UTC'
+        if ZONEINFO_AVAILABLE:
+            try:
+                return ZoneInfo(self.time_zone)
+            except Exception:
+                pass
+        return timezone.utc
+
+    @classmethod
+    def parse_time(cls, value: Optional[str]) -> Optional[datetime]:
+        """Jira 시각 문자열 파싱"""
+        if not value:
+            return None
+        try:
+            return datetime.strptime(value, cls.JIRA_TIME_FORMAT)
+        except ValueError:
+            return None
+
+    @classmethod
+    def to_cache_row(cls, issue: Dict[str, Any]) -> Dict[str, Any]:
+        """검색 결과 이슈를 jira_issues_cache 행으로 변환"""
+        fields = issue.get('fields', {})
+
+        def name(value, key='name'):
+            return value.get(key) if isinstance(value, dict) else value
+
+        assignee = name(fields.get('assignee'), 'displayName') or 'Unassigned'
+        data = {
+            'key': issue.get('key'),
+            'summary': fields.get('summary', ''),
+            'status': name(fields.get('status')) or 'Unknown',
+            'assignee': assignee,
+            'reporter': name(fields.get('reporter'), 'displayName'),
+            'priority': name(fields.get('priority')) or 'Medium',
+            'type': name(fields.get('issuetype')) or 'Task',
+            'created': fields.get('created'),
+            'updated': fields.get('updated'),
+            'labels': fields.get('labels') or [],
+            'components': [name(c) for c in fields.get('components') or []],
+            'project': name(fields.get('project'), 'key'),
+            'description': cls._plain_text(fields.get('description')),
+            'comments': [
+                {'author': name(c.get('author'), 'displayName'),
+                 'body': cls._plain_text(c.get('body')),
+                 'created': c.get('created')}
+                for c in (fields.get('comment') or {}).get('comments', [])
+            ]
+        }
+        return {
+            'issue_key': data['key'],
+            'summary': data['summary'],
+            'status': data['status'],
+            'assignee': assignee,
+            'issue_type': data['type'],
+            'updated': data['updated'],
+            'data': data
+        }
+
+    @classmethod
+    def _plain_text(cls, value) -> str:
+        """문자열 또는 ADF 문서를 일반 텍스트로 변환"""
+        if value is None:
+            return ''
+        if isinstance(value, str):
+            return value
+        if isinstance(value, dict):
+            if value.get('type') == 'text':
+                return value.get('text', '')
+            parts = [cls._plain_text(child) for child in value.get('content', [])]
+            separator = '\n' if value.get('type') == 'doc' else ''
+            return separator.join(part for part in parts if part)
+        if isinstance(value, list):
+            return ''.join(cls._plain_text(item) for item in value)
+        return str(value)
+
+
+def sync_configured_projects(jira_client, db_manager: Optional[DatabaseManager] = None,
+                             config=None, full: bool = False) -> List[Dict[str, Any]]:
+    """
+    설정 파일의 sync.projects에 나열된 프로젝트를 로컬 미러에 동기화
+
+    Args:
+        jira_client: JiraAPI 인스턴스
+        db_manager: 데이터베이스 관리자 (없으면 기본 경로 사용)
+        config: 설정 (없으면 ~/.tm_setter/config.json)
+        full: True면 워터마크를 무시하고 전체 조회
+
+    Returns:
+        프로젝트별 동기화 결과 (설정된 프로젝트가 없으면 빈 리스트)
+    """
+    if config is None and Config is not None:
+        config = Config()
+    project_keys = [key for key in ((config.get('sync.projects') if config else None) or []) if key]
+    if not project_keys:
+        return []
+    return JiraSyncController(jira_client, db_manager).sync_projects(project_keys, full=full)
@@ -0,0 +1,345 @@
+"""웹훅 컨트롤러 - Jira/Bitbucket 이벤트를 받아 로컬 캐시에 즉시 반영"""
+
+import hmac
+import hashlib
+import ipaddress
+import json
+import re
+import sys
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List, Dict, Any, Optional, Callable
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from models.database import DatabaseManager
+from controllers.sync_controller import JiraSyncController
+
+try:
+    from utils.config import Config
+    DEFAULT_WEBHOOK_CONFIG = Config.DEFAULT_CONFIG['webhook']
+except ImportError:
+    Config = None
+    DEFAULT_WEBHOOK_CONFIG = {'enabled': False, 'host': '127.0.0.1', 'port': 8765, 'secret': ''}
+
+# 캐시 변경 알림 리스너: handle()이 만든 이벤트 딕셔너리를 받는 callable
+WebhookListener = Callable[[Dict[str, Any]], None]
+
+
+class WebhookController:
+    """Applies Jira and Bitbucket webhook events to the local issue cache"""
+
+    # 커밋 메시지/브랜치/PR 제목에서 Jira 이슈 키 추출
+    ISSUE_KEY_PATTERN = re.compile(r'\b[A-Z][A-Z0-9_]+-\d+\b')
+
+    # 이슈 전체가 페이로드에 포함되는 Jira 이벤트
+    JIRA_UPSERT_EVENTS = ('jira:issue_created', 'jira:issue_updated')
+    JIRA_DELETE_EVENTS = ('jira:issue_deleted',)
+
+    # create_webhook에 등록할 Bitbucket 이벤트 (Cloud / Server)
+    BITBUCKET_CLOUD_EVENTS = ['repo:push', 'pullrequest:created', 'pullrequest:updated',
+                              'pullrequest:fulfilled', 'pullrequest:rejected']
+    BITBUCKET_SERVER_EVENTS = ['repo:refs_changed', 'pr:opened', 'pr:modified',
+                               'pr:merged', 'pr:declined', 'pr:deleted']
+
+    def __init__(self, db_manager: Optional[DatabaseManager] = None, secret: Optional[str] = None):
+        """
+        Args:
+            db_manager: 데이터베이스 관리자 (없으면 기본 경로 사용)
+            secret: 웹훅 서명 비밀값 (설정하면 X-Hub-Signature가 맞지 않는 요청 거부)
+        """
+        self.db_manager = db_manager or DatabaseManager()
+        self.secret = secret or None
+        self.listeners: List[WebhookListener] = []
+        self._lock = threading.Lock()
+
+    def add_listener(self, listener: WebhookListener) -> WebhookListener:
+        """캐시 변경 알림 리스너 등록 (웹훅 서버 스레드에서 호출됨)"""
+        with self._lock:
+            self.listeners = self.listeners + [listener]
+        return listener
+
+    def remove_listener(self, listener: WebhookListener):
+        """캐시 변경 알림 리스너 제거"""
+        with self._lock:
+            self.listeners = [l for l in self.listeners if l is not listener]
+
+    def verify_signature(self, body: bytes, signature: Optional[str]) -> bool:
+        """X-Hub-Signature(sha256=<hex>) 검증 (비밀값이 없으면 항상 통과)"""
+        if not self.secret:
+            return True
+        if not signature or '=' not in signature:
+            return False
+        algorithm, digest = signature.split('=', 1)
+        if algorithm not in ('sha256', 'sha1'):
+            return False
+        expected = hmac.new(self.secret.encode('utf-8'), body, getattr(hashlib, algorithm)).hexdigest()
+        return hmac.compare_digest(expected, digest)
+
+    def handle(self, payload: Dict[str, Any], event_key: Optional[str] = None) -> Dict[str, Any]:
+        """
+        웹훅 이벤트 처리
+
+        Args:
+            payload: 웹훅 본문
+            event_key: X-Event-Key 헤더 (Bitbucket)
+
+        Returns:
+            처리 결과 (source, event, issue_keys, updated, deleted, invalidated, repository)
+        """
+        if 'webhookEvent' in payload:
+            result = self._handle_jira(payload)
+        else:
+            result = self._handle_bitbucket(event_key or payload.get('eventKey', ''), payload)
+
+        for listener in self.listeners:
+            try:
+                listener(result)
+            except Exception as e:
+                print(f"웹훅 리스너 오류: {str(e)}")
+        return result
+
+    def _handle_jira(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Jira 이슈/댓글 이벤트 반영"""
+        event = payload.get('webhookEvent', '')
+        issue = payload.get('issue') or {}
+        key = issue.get('key')
+        result = self._result('jira', event, [key] if key else [])
+
+        if not key:
+            return result
+        if event in self.JIRA_DELETE_EVENTS:
+            result['deleted'] = self.db_manager.delete_jira_issues([key])
+        elif event in self.JIRA_UPSERT_EVENTS and issue.get('fields'):
+            row = JiraSyncController.to_cache_row(issue)
+            if self._is_newer(row):
+                result['updated'] = self.db_manager.upsert_jira_issues([row])
+        else:
+            # 댓글/작업 로그 이벤트는 이슈 일부만 포함하므로 만료만 처리
+            result['invalidated'] = self.db_manager.invalidate_jira_issues([key])
+        return result
+
+    def _is_newer(self, row: Dict[str, Any]) -> bool:
+        """캐시보다 최신인 이벤트인지 확인 (웹훅은 순서가 뒤바뀌어 도착할 수 있음)"""
+        cached = self.db_manager.get_cached_issue(row['issue_key'])
+        if not cached:
+            return True
+        incoming = JiraSyncController.parse_time(row['updated'])
+        current = JiraSyncController.parse_time(cached.get('updated'))
+        return incoming is None or current is None or incoming >= current
+
+    def _handle_bitbucket(self, event: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Bitbucket push/PR 이벤트 반영 (언급된 이슈 캐시 만료)"""
+        texts: List[str] = []
+        refs: List[str] = []
+
+        # Server: repo:refs_changed
+        for change in payload.get('changes', []):
+            ref = change.get('ref') or {}
+            refs.append(ref.get('displayId') or ref.get('id', ''))
+        # Cloud: repo:push
+        for change in (payload.get('push') or {}).get('changes', []):
+            new = change.get('new') or {}
+            refs.append(new.get('name', ''))
+            texts.append((new.get('target') or {}).get('message', ''))
+            texts.extend(commit.get('message', '') for commit in change.get('commits', []))
+
+        # Server: pullRequest / Cloud: pullrequest
+        pull_request = payload.get('pullRequest') or payload.get('pullrequest') or {}
+        if pull_request:
+            source = pull_request.get('fromRef') or pull_request.get('source') or {}
+            refs.append(source.get('displayId') or (source.get('branch') or {}).get('name', ''))
+            texts.extend([pull_request.get('title', ''), pull_request.get('description') or ''])
+
+        texts.extend(refs)
+        issue_keys = sorted(set(self.ISSUE_KEY_PATTERN.findall(' '.join(texts))))
+        result = self._result('bitbucket', event, issue_keys)
+        result['repository'] = self._repository_name(payload.get('repository') or
+                                                     (pull_request.get('toRef') or {}).get('repository') or {})
+        result['refs'] = [ref for ref in refs if ref]
+        if issue_keys:
+            result['invalidated'] = self.db_manager.invalidate_jira_issues(issue_keys)
+        return result
+
+    @staticmethod
+    def _repository_name(repository: Dict[str, Any]) -> Optional[str]:
+        """저장소 식별자 (Cloud: workspace/slug, Server: PROJECT/slug)"""
+        if repository.get('full_name'):
+            return repository['full_name']
+        if repository.get('slug'):
+            project = (repository.get('project') or {}).get('key', '')
+            return f"{project}/{repository['slug']}" if project else repository['slug']
+        return None
+
+    @staticmethod
+    def _result(source: str, event: str, issue_keys: List[str]) -> Dict[str, Any]:
+        return {
+            'source': source,
+            'event': event,
+            'issue_keys': issue_keys,
+            'updated': 0,
+            'deleted': 0,
+            'invalidated': 0,
+            'repository': None,
+            'refs': []
+        }
+
+    def register_bitbucket(self, bitbucket_client, workspace: str, repo_slug: str, url: str) -> Dict[str, Any]:
+        """Bitbucket 저장소에 이 수신기로 보내는 웹훅 등록"""
+        events = self.BITBUCKET_CLOUD_EVENTS if bitbucket_client.is_cloud else self.BITBUCKET_SERVER_EVENTS
+        return bitbucket_client.create_webhook(workspace, repo_slug, url, events)
+
+
+class WebhookRequestHandler(BaseHTTPRequestHandler):
+    """HTTP handler that forwards webhook POSTs to WebhookController"""
+
+    # 허용하는 최대 본문 크기 (Jira/Bitbucket 페이로드는 보통 수십 KB)
+    MAX_BODY = 5 * 1024 * 1024
+
+    def do_POST(self):
+        controller: WebhookController = self.server.controller
+        # 서명 검증 전이므로 본문을 읽기 전에 길이부터 확인
+        length = self._content_length()
+        if length is None:
+            self._reject(400)
+            return
+        if length > self.MAX_BODY:
+            self._reject(413)
+            return
+        body = self.rfile.read(length)
+
+        if not controller.verify_signature(body, self.headers.get('X-Hub-Signature')):
+            self._respond(401)
+            return
+        try:
+            payload = json.loads(body or b'{}')
+        except ValueError:
+            self._respond(400)
+            return
+        if not isinstance(payload, dict):
+            self._respond(400)
+            return
+
+        try:
+            controller.handle(payload, self.headers.get('X-Event-Key'))
+        except Exception as e:
+            print(f"웹훅 처리 실패: {str(e)}")
+            self._respond(500)
+            return
+        self._respond(204)
+
+    def _content_length(self) -> Optional[int]:
+        """Content-Length 헤더 값 (없거나 음이 아닌 정수가 아니면 None)"""
+        value = (self.headers.get('Content-Length') or '').strip()
+        if not value.isdigit():
+            return None
+        return int(value)
+
+    def _reject(self, status: int):
+        """본문을 읽지 않고 응답한 뒤 연결 종료 (남은 본문이 다음 요청으로 해석되지 않도록)"""
+        self.close_connection = True
+        self._respond(status)
+
+    def _respond(self, status: int):
+        self.send_response(status)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        """요청 로그 출력 안 함"""
+        pass
+
+
+class WebhookServer:
+    """Lightweight local HTTP receiver for Jira and Bitbucket webhooks"""
+
+    def __init__(self, controller: WebhookController, host: str = '127.0.0.1', port: int = 0):
+        """
+        Args:
+            controller: 이벤트를 처리할 웹훅 컨트롤러
+            host: 바인드 주소
+            port: 포트 (0이면 빈 포트 자동 선택)
+            
+        Raises:
+            ValueError: 비밀값 없이 루프백이 아닌 주소에 바인드하려는 경우 (서명 검증이 모두 통과되므로)
+        """
+        if not controller.secret and not self.is_loopback(host):
+            raise ValueError(f"웹훅 비밀값 없이 외부 주소({host})에서 수신할 수 없습니다")
+        self.controller = controller
+        self.httpd = ThreadingHTTPServer((host, port), WebhookRequestHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.controller = controller
+        self._thread: Optional[threading.Thread] = None
+
+    @staticmethod
+    def is_loopback(host: str) -> bool:
+        """로컬에서만 접근 가능한 바인드 주소인지 확인"""
+        if host == 'localhost':
+            return True
+        try:
+            return ipaddress.ip_address(host).is_loopback
+        except ValueError:
+            return False
+
+    @property
+    def url(self) -> str:
+        """수신 URL (http://host:port)"""
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> 'WebhookServer':
+        """백그라운드 스레드에서 수신 시작"""
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name='webhook-receiver', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """수신 종료"""
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> 'WebhookServer':
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+
+def start_webhook_server(db_manager: Optional[DatabaseManager] = None, jira_controller=None,
+                         config=None) -> WebhookServer:
+    """
+    설정 파일의 webhook 섹션(host, port, secret)으로 웹훅 수신기 시작
+
+    Args:
+        db_manager: 데이터베이스 관리자 (없으면 기본 경로 사용)
+        jira_controller: 이벤트마다 메모리 캐시를 비울 JiraController (on_issue_event 리스너 등록)
+        config: 설정 (없으면 ~/.tm_setter/config.json)
+
+    Returns:
+        수신 중인 WebhookServer (종료는 stop())
+    """
+    if config is None and Config is not None:
+        config = Config()
+    settings = dict(DEFAULT_WEBHOOK_CONFIG, **((config.get('webhook') if config else None) or {}))
+    controller = WebhookController(db_manager, secret=settings.get('secret'))
+    if jira_controller is not None:
+        controller.add_listener(jira_controller.on_issue_event)
+    return WebhookServer(controller, settings.get('host') or '127.0.0.1', int(settings.get('port') or 0)).start()
+
+
+def main():
+    """웹훅 수신기 단독 실행 (Ctrl+C로 종료)"""
+    server = start_webhook_server()
+    print(f"웹훅 수신 중: {server.url}")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -15,6 +15,10 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from utils.config import Config, SessionManager
 from utils.pyqt_theme import PyQtDarkTheme
 from utils.animations import AnimationHelper
+from controllers.jira_controller import JiraController
+from controllers.webhook_controller import start_webhook_server
+from controllers.sync_controller import sync_configured_projects
+from models.database import DatabaseManager
 from widgets.loading_indicator import LoadingIndicator
 from pyqt_views.login_view import LoginView
 from pyqt_views.db_code_view import DBCodeView
@@ -111,6 +115,10 @@ class TMSetterMainWindow(QMainWindow):
         self.config = Config()
         self.session = SessionManager()
         self.jira_credentials = None
+        self.jira_controller = None
+        self.jira_worker = None
+        self.webhook_server = None
+        self.sync_worker = None
         self.animation_helper = AnimationHelper()
         self.first_load = True  # 초기 로드 플래그
         self.setup_ui()
@@ -201,6 +209,7 @@ class TMSetterMainWindow(QMainWindow):
         
         # 시그널 연결
         self.login_view.login_success.connect(lambda: self.show_view('db_code'))
+        self.login_view.login_success.connect(self.setup_jira_controller)
         self.db_code_view.next_clicked.connect(lambda: self.show_view('jira_issue'))
         self.db_code_view.back_clicked.connect(lambda: self.show_view('login'))
         self.jira_issue_view.next_clicked.connect(lambda: self.show_view('options'))
@@ -211,6 +220,66 @@ class TMSetterMainWindow(QMainWindow):
         # 첫 화면 표시
         self.show_view('login')
         
+    def setup_jira_controller(self):
+        """로그인한 사용자의 Jira 컨트롤러 생성 (연결 테스트가 있어 작업 스레드에서 실행)"""
+        credentials = self.jira_credentials or {}
+        self.jira_worker = AsyncWorker(JiraController, kwargs={
+            'server_url': credentials.get('url'),
+            'user_id': credentials.get('user_id'),
+            'password': credentials.get('password'),
+            'use_real_api': bool(credentials),
+            'db_manager': DatabaseManager()
+        })
+        self.jira_worker.finished.connect(self.on_jira_controller_ready)
+        self.jira_worker.error.connect(lambda e: print(f"Jira 컨트롤러 생성 실패: {e}"))
+        self.jira_worker.start()
+        
+    def on_jira_controller_ready(self, jira_controller):
+        """Jira 컨트롤러를 이슈 화면에 연결 (백그라운드 갱신 알림 구독)"""
+        if self.jira_controller is not None:
+            self.jira_controller.close()
+        self.jira_controller = jira_controller
+        self.jira_issue_view.set_jira_controller(jira_controller)
+        self.update_connection_status(jira_controller.jira_client is not None)
+        self.setup_webhook_server()
+        self.start_project_sync()
+        
+    def start_project_sync(self):
+        """설정의 sync.projects를 로컬 미러에 증분 동기화 (작업 스레드에서 실행)"""
+        jira_client = self.jira_controller.jira_client if self.jira_controller else None
+        if jira_client is None or not self.config.get('sync.projects'):
+            return
+        if self.sync_worker is not None and self.sync_worker.isRunning():
+            return
+        self.sync_worker = AsyncWorker(sync_configured_projects, args=(
+            jira_client, self.jira_controller.cache.db_manager, self.config))
+        self.sync_worker.finished.connect(self.on_project_sync_finished)
+        self.sync_worker.error.connect(lambda e: print(f"Jira 동기화 실패: {e}"))
+        self.sync_worker.start()
+        
+    def on_project_sync_finished(self, results):
+        """동기화 결과를 상태바에 표시"""
+        upserted = sum(result['upserted'] for result in results)
+        self.update_status_bar(f"Jira 동기화 완료: {len(results)}개 프로젝트, {upserted}건 갱신")
+        
+    def setup_webhook_server(self):
+        """설정에서 웹훅 수신을 켠 경우(webhook.enabled) 수신기 시작 (이벤트마다 이슈 메모리 캐시 정리)"""
+        self.stop_webhook_server()
+        if not self.config.get('webhook.enabled'):
+            return
+        try:
+            self.webhook_server = start_webhook_server(self.jira_controller.cache.db_manager,
+                                                       self.jira_controller, self.config)
+            self.update_status_bar(f"웹훅 수신 중: {self.webhook_server.url}")
+        except (OSError, ValueError) as e:
+            print(f"웹훅 수신기 시작 실패: {e}")
+            
+    def stop_webhook_server(self):
+        """웹훅 수신기 종료"""
+        if self.webhook_server is not None:
+            self.webhook_server.stop()
+            self.webhook_server = None
+        
     def show_view(self, view_name: str):
         """뷰 전환 (애니메이션 포함)"""
         print(f"[DEBUG] show_view called with: {view_name}")
@@ -296,6 +365,11 @@ class TMSetterMainWindow(QMainWindow):
         
         if reply == QMessageBox.Yes:
             self.config.save()
+            self.stop_webhook_server()
+            if self.sync_worker is not None:
+                self.sync_worker.wait()  # 동기화 중인 Jira 클라이언트를 닫지 않도록
+            if self.jira_controller is not None:
+                self.jira_controller.close()
             event.accept()
         else:
             event.ignore()
@@ -372,6 +446,7 @@ class TMSetterMainWindow(QMainWindow):
             self.update_status_bar("화면을 새로고침했습니다.")
         else:
             self.update_status_bar("새로고침할 내용이 없습니다.")
+        self.start_project_sync()
 
 
 class AsyncWorker(QThread):
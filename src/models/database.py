@@ -2,14 +2,31 @@
 
 import sqlite3
 import json
+import re
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 import os
 from pathlib import Path
 
+
+# 전문 검색 색인 컬럼 값: ADF 문서/코멘트 목록에서 텍스트 노드와 문자열 본문만 모은다
+# (순수 SQL이라 사용자 정의 함수 없이 어느 연결에서든 트리거가 동작)
+_INDEX_TEXT_SQL = ("(SELECT group_concat(value, ' ') FROM json_tree({row}.data, '{path}') "
+                   "WHERE type = 'text' AND (key IS NULL OR key IN ('text', 'body')))")
+
+
 class DatabaseManager:
     """데이터베이스 연결 및 쿼리 관리"""
     
+    # 캐시된 Issue 전문 검색 색인 테이블
+    FTS_TABLE_SQL = """
+        CREATE VIRTUAL TABLE IF NOT EXISTS jira_issues_fts USING fts5(
+            issue_key, summary, description, comments,
+            tokenize = 'unicode61 remove_diacritics 2',
+            prefix = '2 3'
+        )
+    """
+    
     def __init__(self, db_path: str = None):
         if db_path is None:
             # 기본 데이터베이스 경로 설정
@@ -67,6 +84,33 @@ class DatabaseManager:
                 )
             """)
             
+            # 이전 버전 DB에 updated 컬럼 추가 (증분 동기화 워터마크 비교용)
+            self._ensure_column(cursor, 'jira_issues_cache', 'updated', 'TEXT')
+            # 상세 정보(설명, 코멘트, 첨부)를 마지막으로 받은 시각 (상세 캐시 만료 판단용)
+            self._ensure_column(cursor, 'jira_issues_cache', 'detail_cached_at', 'TIMESTAMP')
+            
+            # Jira 검색 결과 캐시 (조회 키별 이슈 키 목록, 이슈 본문은 jira_issues_cache)
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS jira_search_cache (
+                    cache_key TEXT PRIMARY KEY,
+                    issue_keys JSON,
+                    cached_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+            
+            # Jira 증분 동기화 상태 (JQL별 updated 워터마크)
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS jira_sync_state (
+                    sync_key TEXT PRIMARY KEY,
+                    watermark TEXT,
+                    issue_count INTEGER DEFAULT 0,
+                    last_synced_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+            
+            # 캐시된 Issue 전문 검색 색인 (FTS5가 없는 SQLite에서는 LIKE 검색으로 대체)
+            self.fts_enabled = self._init_fts(cursor)
+            
             # Sessions 테이블
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS sessions (
@@ -96,6 +140,61 @@ class DatabaseManager:
             self._insert_sample_data(cursor)
             conn.commit()
     
+    def _init_fts(self, cursor) -> bool:
+        """
+        전문 검색 색인 (키, 요약, 설명, 코멘트) 생성 - 트리거로 jira_issues_cache와 동기화
+        
+        FTS5 모듈이 없으면 색인 트리거를 제거하고 False를 반환한다 (캐시 쓰기가 실패하지 않도록).
+        트리거가 없던 색인(이전 버전 또는 FTS5 없이 연 뒤)은 기존 캐시로 다시 채운다.
+        """
+        triggers = ('jira_issues_fts_insert', 'jira_issues_fts_update', 'jira_issues_fts_delete')
+        try:
+            cursor.execute(self.FTS_TABLE_SQL)
+            cursor.execute("SELECT rowid FROM jira_issues_fts LIMIT 0")
+        except sqlite3.OperationalError as e:
+            print(f"전문 검색 색인 생성 실패 (LIKE 검색 사용): {e}")
+            for name in triggers:
+                cursor.execute(f"DROP TRIGGER IF EXISTS {name}")
+            return False
+        
+        cursor.execute("SELECT sql FROM sqlite_master WHERE type = 'trigger' AND name IN (?, ?, ?)", triggers)
+        existing = [row[0] for row in cursor.fetchall()]
+        # 사용자 정의 함수(jira_index_text)를 쓰던 이전 트리거는 다시 생성
+        indexed = len(existing) == len(triggers) and not any('jira_index_text' in sql for sql in existing)
+        if not indexed:
+            for name in triggers:
+                cursor.execute(f"DROP TRIGGER IF EXISTS {name}")
+        fts_values = ', '.join(_INDEX_TEXT_SQL.format(row='new', path=path)
+                               for path in ('$.description', '$.comments'))
+        cursor.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS jira_issues_fts_insert AFTER INSERT ON jira_issues_cache BEGIN
+                INSERT INTO jira_issues_fts (rowid, issue_key, summary, description, comments)
+                VALUES (new.id, new.issue_key, new.summary, {fts_values});
+            END
+        """)
+        cursor.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS jira_issues_fts_update
+            AFTER UPDATE OF issue_key, summary, data ON jira_issues_cache BEGIN
+                DELETE FROM jira_issues_fts WHERE rowid = old.id;
+                INSERT INTO jira_issues_fts (rowid, issue_key, summary, description, comments)
+                VALUES (new.id, new.issue_key, new.summary, {fts_values});
+            END
+        """)
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS jira_issues_fts_delete AFTER DELETE ON jira_issues_cache BEGIN
+                DELETE FROM jira_issues_fts WHERE rowid = old.id;
+            END
+        """)
+        if not indexed:
+            # 기존 캐시 색인
+            cursor.execute("DELETE FROM jira_issues_fts")
+            cursor.execute(f"""
+                INSERT INTO jira_issues_fts (rowid, issue_key, summary, description, comments)
+                SELECT id, issue_key, summary, {fts_values.replace('new.', 'jira_issues_cache.')}
+                FROM jira_issues_cache
+            """)
+        return True
+    
     def _insert_sample_data(self, cursor):
         """샘플 데이터 삽입"""
         # 샘플 DB Codes 확인 및 삽입
@@ -113,6 +212,12 @@ class DatabaseManager:
                 sample_codes
             )
     
+    def _ensure_column(self, cursor, table: str, column: str, column_type: str):
+        """테이블에 컬럼이 없으면 추가 (간단한 스키마 마이그레이션)"""
+        cursor.execute(f"PRAGMA table_info({table})")
+        if column not in [row[1] for row in cursor.fetchall()]:
+            cursor.execute(f"ALTER TABLE {table} ADD COLUMN {column} {column_type}")
+    
     def connect(self):
         """데이터베이스 연결 컨텍스트 매니저"""
         conn = sqlite3.connect(self.db_path)
@@ -188,15 +293,27 @@ class DatabaseManager:
         """Jira Issue 캐싱"""
         with self.connect() as conn:
             cursor = conn.cursor()
+            # INSERT OR REPLACE는 삭제 트리거를 실행하지 않으므로 전문 검색 색인이 남지 않도록 upsert 사용
             cursor.execute("""
-                INSERT OR REPLACE INTO jira_issues_cache 
+                INSERT INTO jira_issues_cache 
                 (issue_key, summary, status, assignee, issue_type, data, cached_at)
                 VALUES (?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+                ON CONFLICT(issue_key) DO UPDATE SET
+                    summary = excluded.summary,
+                    status = excluded.status,
+                    assignee = excluded.assignee,
+                    issue_type = excluded.issue_type,
+                    data = excluded.data,
+                    cached_at = CURRENT_TIMESTAMP
             """, (issue_key, summary, status, assignee, issue_type, json.dumps(data)))
             conn.commit()
     
-    def get_cached_issues(self, max_age_minutes: int = 60) -> List[Dict[str, Any]]:
-        """캐시된 Issue 목록 조회"""
+    def get_cached_issues(self, max_age_minutes: int = 60, decode_data: bool = True) -> List[Dict[str, Any]]:
+        """
+        캐시된 Issue 목록 조회
+        
+        decode_data=False면 data 컬럼을 JSON 문자열 그대로 반환한다 (필요할 때 디코딩하는 경우).
+        """
         with self.connect() as conn:
             cursor = conn.cursor()
             cursor.execute("""
@@ -208,10 +325,255 @@ class DatabaseManager:
             issues = []
             for row in cursor.fetchall():
                 issue = dict(row)
+                if decode_data:
+                    issue['data'] = json.loads(issue['data']) if issue['data'] else {}
+                issues.append(issue)
+            return issues
+    
+    def upsert_jira_issues(self, issues: List[Dict[str, Any]], detail: bool = False) -> int:
+        """
+        Jira Issue 여러 건을 한 트랜잭션으로 추가/갱신
+        
+        data는 기존 값에 병합되므로 목록 필드만 가진 행이 상세 필드를 지우지 않는다
+        (detail=True인 행은 상세 정보 전체이므로 교체).
+        
+        Args:
+            issues: issue_key, summary, status, assignee, issue_type, updated, data 키를 가진 딕셔너리 목록
+            detail: 상세 정보까지 포함된 행이면 True (detail_cached_at 갱신)
+            
+        Returns:
+            처리한 Issue 수
+        """
+        rows = [
+            (issue['issue_key'], issue.get('summary'), issue.get('status'), issue.get('assignee'),
+             issue.get('issue_type'), issue.get('updated'), json.dumps(issue.get('data') or {}))
+            for issue in issues
+        ]
+        if not rows:
+            return 0
+        with self.connect() as conn:
+            cursor = conn.cursor()
+            cursor.executemany("""
+                INSERT INTO jira_issues_cache
+                (issue_key, summary, status, assignee, issue_type, updated, data, cached_at, detail_cached_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP, CASE WHEN ? THEN CURRENT_TIMESTAMP END)
+                ON CONFLICT(issue_key) DO UPDATE SET
+                    summary = excluded.summary,
+                    status = excluded.status,
+                    assignee = excluded.assignee,
+                    issue_type = excluded.issue_type,
+                    updated = COALESCE(excluded.updated, jira_issues_cache.updated),
+                    data = CASE WHEN excluded.detail_cached_at IS NOT NULL THEN excluded.data
+                                ELSE json_patch(COALESCE(jira_issues_cache.data, '{}'), excluded.data) END,
+                    cached_at = CURRENT_TIMESTAMP,
+                    detail_cached_at = COALESCE(excluded.detail_cached_at, jira_issues_cache.detail_cached_at)
+            """, [row + (detail,) for row in rows])
+            conn.commit()
+        return len(rows)
+    
+    def get_cached_issue(self, issue_key: str, decode_data: bool = True) -> Optional[Dict[str, Any]]:
+        """캐시된 Issue 한 건 조회 (만료 여부와 무관)"""
+        with self.connect() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT * FROM jira_issues_cache WHERE issue_key = ?", (issue_key,))
+            row = cursor.fetchone()
+            if not row:
+                return None
+            issue = dict(row)
+            if decode_data:
                 issue['data'] = json.loads(issue['data']) if issue['data'] else {}
+            return issue
+    
+    def get_cached_issues_by_keys(self, issue_keys: List[str], decode_data: bool = True) -> List[Dict[str, Any]]:
+        """캐시된 Issue 여러 건을 키 순서대로 조회 (없는 키는 제외)"""
+        rows: Dict[str, Dict[str, Any]] = {}
+        with self.connect() as conn:
+            cursor = conn.cursor()
+            # SQLite 바인드 변수 개수 제한을 넘지 않도록 나눠서 조회
+            for start in range(0, len(issue_keys), 500):
+                chunk = issue_keys[start:start + 500]
+                cursor.execute(f"""
+                    SELECT * FROM jira_issues_cache
+                    WHERE issue_key IN ({', '.join('?' * len(chunk))})
+                """, chunk)
+                for row in cursor.fetchall():
+                    issue = dict(row)
+                    if decode_data:
+                        issue['data'] = json.loads(issue['data']) if issue['data'] else {}
+                    rows[issue['issue_key']] = issue
+        return [rows[key] for key in issue_keys if key in rows]
+    
+    def delete_jira_issues(self, issue_keys: List[str]) -> int:
+        """캐시된 Issue 삭제"""
+        with self.connect() as conn:
+            cursor = conn.cursor()
+            cursor.executemany("DELETE FROM jira_issues_cache WHERE issue_key = ?",
+                               [(key,) for key in issue_keys])
+            conn.commit()
+            return cursor.rowcount
+    
+    def invalidate_jira_issues(self, issue_keys: List[str]) -> int:
+        """캐시된 Issue를 만료 처리 (데이터는 오프라인 조회용으로 유지)"""
+        with self.connect() as conn:
+            cursor = conn.cursor()
+            cursor.executemany("""
+                UPDATE jira_issues_cache SET cached_at = '1970-01-01 00:00:00', detail_cached_at = NULL
+                WHERE issue_key = ?
+            """, [(key,) for key in issue_keys])
+            conn.commit()
+            return cursor.rowcount
+    
+    @staticmethod
+    def build_fts_query(query: str) -> str:
+        """
+        검색어를 FTS5 MATCH 식으로 변환
+        
+        따옴표로 묶은 구문은 구문 검색, 나머지 단어는 접두어 검색이며 모든 조건을 AND로 결합한다.
+        FTS5 연산자는 모두 따옴표 안에 넣어 사용자 입력이 문법으로 해석되지 않게 한다.
+        """
+        terms = []
+        for text, is_phrase in DatabaseManager._query_terms(query):
+            quoted = '"' + text.replace('"', '""') + '"'
+            terms.append(quoted if is_phrase else quoted + '*')
+        return ' '.join(terms)
+    
+    @staticmethod
+    def _query_terms(query: str) -> List[tuple]:
+        """검색어를 (텍스트, 구문 여부) 목록으로 분리 (단어/문자가 없는 항목은 제외)"""
+        terms = []
+        for phrase, word in re.findall(r'"([^"]*)"|(\S+)', query or ''):
+            text = phrase if phrase else word.rstrip('*')
+            if re.search(r'\w', text):
+                terms.append((text, bool(phrase)))
+        return terms
+    
+    def search_cached_issues(self, query: str, limit: int = 50, project: Optional[str] = None,
+                             decode_data: bool = True) -> List[Dict[str, Any]]:
+        """
+        캐시된 Issue 전문 검색 (관련도 순, 오프라인)
+        
+        키와 요약에 가중치를 두어 설명/코멘트보다 먼저 정렬한다.
+        FTS5를 쓸 수 없으면 LIKE 검색으로 대체한다 (키/요약 일치를 먼저, 접두어가 아닌 부분 일치).
+        
+        Args:
+            query: 검색어 (단어는 접두어 검색, "..."는 구문 검색)
+            limit: 최대 결과 수
+            project: 프로젝트 키 (지정하면 해당 프로젝트 이슈만)
+            decode_data: False면 data 컬럼을 JSON 문자열 그대로 반환
+        """
+        if not self.fts_enabled:
+            return self._like_search_cached_issues(query, limit, project, decode_data)
+        match = self.build_fts_query(query)
+        if not match:
+            return []
+        sql = """
+            SELECT c.*, bm25(jira_issues_fts, 10.0, 5.0, 1.0, 0.5) AS rank
+            FROM jira_issues_fts
+            JOIN jira_issues_cache c ON c.id = jira_issues_fts.rowid
+            WHERE jira_issues_fts MATCH ?
+        """
+        params: List[Any] = [match]
+        if project:
+            sql += " AND c.issue_key LIKE ?"
+            params.append(f"{project.upper()}-%")
+        sql += " ORDER BY rank LIMIT ?"
+        params.append(limit)
+        return self._fetch_issue_rows(sql, params, decode_data)
+    
+    def _like_search_cached_issues(self, query: str, limit: int, project: Optional[str],
+                                   decode_data: bool) -> List[Dict[str, Any]]:
+        """FTS5가 없을 때의 캐시 검색 (모든 검색어가 키/요약/설명/코멘트 중 하나에 포함)"""
+        terms = self._query_terms(query)
+        if not terms:
+            return []
+        document = "c.issue_key || ' ' || ifnull(c.summary, '')"
+        text = " || ' ' || ".join([document] + [f"ifnull({_INDEX_TEXT_SQL.format(row='c', path=path)}, '')"
+                                                for path in ('$.description', '$.comments')])
+        conditions = []
+        params: List[Any] = []
+        for term, _ in terms:
+            conditions.append(f"({text}) LIKE ? ESCAPE '\\'")
+            params.append('%' + re.sub(r'([%_\\])', r'\\\1', term) + '%')
+        sql = f"SELECT c.* FROM jira_issues_cache c WHERE {' AND '.join(conditions)}"
+        if project:
+            sql += " AND c.issue_key LIKE ?"
+            params.append(f"{project.upper()}-%")
+        # 키/요약에 첫 검색어가 있는 이슈를 먼저
+        sql += f" ORDER BY ({document}) LIKE ? ESCAPE '\\' DESC, c.issue_key LIMIT ?"
+        params.extend([params[0], limit])
+        return self._fetch_issue_rows(sql, params, decode_data)
+    
+    def _fetch_issue_rows(self, sql: str, params: List[Any], decode_data: bool) -> List[Dict[str, Any]]:
+        """jira_issues_cache 행 조회 (decode_data면 data 컬럼을 JSON 디코딩)"""
+        with self.connect() as conn:
+            cursor = conn.cursor()
+            cursor.execute(sql, params)
+            issues = []
+            for row in cursor.fetchall():
+                issue = dict(row)
+                if decode_data:
+                    issue['data'] = json.loads(issue['data']) if issue['data'] else {}
                 issues.append(issue)
             return issues
     
+    def save_search_result(self, cache_key: str, issue_keys: List[str]):
+        """검색 결과 이슈 키 목록 저장"""
+        with self.connect() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                INSERT OR REPLACE INTO jira_search_cache (cache_key, issue_keys, cached_at)
+                VALUES (?, ?, CURRENT_TIMESTAMP)
+            """, (cache_key, json.dumps(issue_keys)))
+            conn.commit()
+    
+    def get_search_result(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """저장된 검색 결과 조회 (issue_keys, cached_at)"""
+        with self.connect() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT * FROM jira_search_cache WHERE cache_key = ?", (cache_key,))
+            row = cursor.fetchone()
+            if not row:
+                return None
+            result = dict(row)
+            result['issue_keys'] = json.loads(result['issue_keys']) if result['issue_keys'] else []
+            return result
+    
+    def clear_search_results(self):
+        """저장된 검색 결과 전체 삭제"""
+        with self.connect() as conn:
+            cursor = conn.cursor()
+            cursor.execute("DELETE FROM jira_search_cache")
+            conn.commit()
+    
+    def get_sync_state(self, sync_key: str) -> Optional[Dict[str, Any]]:
+        """증분 동기화 상태 조회"""
+        with self.connect() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT * FROM jira_sync_state WHERE sync_key = ?", (sync_key,))
+            row = cursor.fetchone()
+            return dict(row) if row else None
+    
+    def save_sync_state(self, sync_key: str, watermark: Optional[str], issue_count: int):
+        """증분 동기화 상태 저장 (issue_count는 누적)"""
+        with self.connect() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                INSERT INTO jira_sync_state (sync_key, watermark, issue_count, last_synced_at)
+                VALUES (?, ?, ?, CURRENT_TIMESTAMP)
+                ON CONFLICT(sync_key) DO UPDATE SET
+                    watermark = excluded.watermark,
+                    issue_count = jira_sync_state.issue_count + excluded.issue_count,
+                    last_synced_at = CURRENT_TIMESTAMP
+            """, (sync_key, watermark, issue_count))
+            conn.commit()
+    
+    def delete_sync_state(self, sync_key: str):
+        """증분 동기화 상태 삭제 (다음 동기화는 전체 조회)"""
+        with self.connect() as conn:
+            cursor = conn.cursor()
+            cursor.execute("DELETE FROM jira_sync_state WHERE sync_key = ?", (sync_key,))
+            conn.commit()
+    
     # Session 관련 메서드
     def create_session(self, user_id: str, db_codes: Dict[str, Any], 
                       selected_issue: str, options: Dict[str, Any]) -> int:
@@ -0,0 +1,158 @@
+"""Jira 이슈 레코드 모델"""
+
+import json
+import sys
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, Optional, Union
+
+# 슬롯 외 필드의 원본: JSON 문자열/바이트(캐시 data 컬럼) 또는 딕셔너리
+RawFields = Union[str, bytes, Dict[str, Any], None]
+
+
+class _Missing:
+    """Marker for fields that were never set"""
+
+    __slots__ = ()
+
+    def __repr__(self):
+        return '<missing>'
+
+
+_MISSING = _Missing()
+
+
+def _intern(value: Any) -> Any:
+    """값 종류가 적은 문자열은 intern해서 이슈 간에 같은 객체를 공유"""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def _name(value: Any, key: str = 'name', default: Any = None) -> Any:
+    """{'name': ...} 형태의 Jira 필드 값 추출"""
+    if isinstance(value, dict):
+        return value.get(key, default)
+    return default if value is None else value
+
+
+class IssueRecord(Mapping):
+    """Compact, dict-compatible Jira issue record with lazily decoded extra fields"""
+
+    # 목록 화면에서 쓰는 필드 (슬롯에 직접 저장)
+    FIELDS = ('key', 'summary', 'status', 'assignee', 'priority', 'created', 'type')
+    _FIELD_SET = frozenset(FIELDS)
+
+    __slots__ = FIELDS + ('_raw', '_extra')
+
+    def __init__(self, key: Any = _MISSING, summary: Any = _MISSING, status: Any = _MISSING,
+                 assignee: Any = _MISSING, priority: Any = _MISSING, created: Any = _MISSING,
+                 type: Any = _MISSING, raw: RawFields = None):
+        """
+        Args:
+            key ~ type: 목록 필드 (지정하지 않은 필드는 키가 없는 것으로 취급)
+            raw: 나머지 필드 (설명, 코멘트 등). 처음 접근할 때 디코딩한다.
+        """
+        self.key = key
+        self.summary = summary
+        self.status = _intern(status)
+        self.assignee = _intern(assignee)
+        self.priority = _intern(priority)
+        self.created = created
+        self.type = _intern(type)
+        self._raw = raw
+        self._extra: Optional[Dict[str, Any]] = None
+
+    @classmethod
+    def from_api(cls, issue: Dict[str, Any]) -> 'IssueRecord':
+        """검색 API 응답 이슈를 목록 형식 레코드로 변환"""
+        fields = issue.get('fields') or {}
+        created = fields.get('created')
+        return cls(
+            key=issue.get('key'),
+            summary=fields.get('summary'),
+            status=_name(fields.get('status'), default='Unknown'),
+            assignee=_name(fields.get('assignee'), 'displayName') or 'Unassigned',
+            priority=_name(fields.get('priority'), default='None'),
+            created=created.split('T')[0] if created else '',
+            type=_name(fields.get('issuetype'), default='Task')
+        )
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'IssueRecord':
+        """일반 딕셔너리를 레코드로 변환 (목록 필드 외 키는 raw로 보관)"""
+        slots = {name: data[name] for name in cls.FIELDS if name in data}
+        extra = {name: value for name, value in data.items() if name not in cls._FIELD_SET}
+        return cls(raw=extra or None, **slots)
+
+    @classmethod
+    def from_cache_row(cls, row: Dict[str, Any]) -> 'IssueRecord':
+        """jira_issues_cache 행을 레코드로 변환 (data 컬럼은 필요할 때 디코딩)"""
+        return cls(
+            key=row['issue_key'],
+            summary=row['summary'],
+            status=row['status'],
+            assignee=row['assignee'],
+            type=row['issue_type'],
+            raw=row.get('data')
+        )
+
+    @property
+    def extra(self) -> Dict[str, Any]:
+        """슬롯에 없는 필드 (처음 접근할 때 raw를 디코딩)"""
+        if self._extra is None:
+            raw = self._raw
+            if isinstance(raw, (str, bytes, bytearray)):
+                raw = json.loads(raw) if raw else {}
+            extra = {}
+            for name, value in (raw or {}).items():
+                if name in self._FIELD_SET:
+                    # 슬롯이 비어 있을 때만 raw 값으로 채움 (캐시 행의 priority, created 등)
+                    if getattr(self, name) is _MISSING:
+                        setattr(self, name, _intern(value))
+                else:
+                    extra[name] = value
+            self._extra = extra
+            self._raw = None
+        return self._extra
+
+    def __getitem__(self, name: str) -> Any:
+        if name in self._FIELD_SET:
+            value = getattr(self, name)
+            if value is _MISSING and self._raw is not None:
+                self.extra
+                value = getattr(self, name)
+            if value is _MISSING:
+                raise KeyError(name)
+            return value
+        return self.extra[name]
+
+    def __setitem__(self, name: str, value: Any):
+        if name in self._FIELD_SET:
+            setattr(self, name, value)
+        else:
+            self.extra[name] = value
+
+    def __contains__(self, name: object) -> bool:
+        if name in self._FIELD_SET and getattr(self, name) is not _MISSING:
+            return True
+        try:
+            self[name]
+        except KeyError:
+            return False
+        return True
+
+    def __iter__(self) -> Iterator[str]:
+        extra = self.extra
+        for name in self.FIELDS:
+            if getattr(self, name) is not _MISSING:
+                yield name
+        yield from extra
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """일반 딕셔너리로 변환 (JSON 저장용)"""
+        return dict(self)
+
+    def __repr__(self) -> str:
+        fields = {name: getattr(self, name) for name in self.FIELDS if getattr(self, name) is not _MISSING}
+        return f"IssueRecord({fields!r})"
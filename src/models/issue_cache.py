@@ -0,0 +1,199 @@
+"""Jira 이슈 2단계 캐시 (메모리 LRU + SQLite jira_issues_cache)"""
+
+import json
+import threading
+import time
+from calendar import timegm
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+from models.database import DatabaseManager
+from models.issue import IssueRecord
+
+
+class IssueCache:
+    """Two-tier cache for Jira lookups: in-memory LRU in front of SQLite"""
+
+    # 조회 종류별 유효 시간 (초)
+    DEFAULT_TTLS = {'search': 300, 'detail': 600, 'my': 300, 'recent': 120}
+
+    # 메모리에 보관할 최대 항목 수 (조회 결과 단위)
+    DEFAULT_MAX_ENTRIES = 256
+
+    # 상세 조회 결과 (나머지 종류는 이슈 목록)
+    DETAIL_KIND = 'detail'
+
+    def __init__(self, db_manager: Optional[DatabaseManager] = None, ttls: Optional[Dict[str, float]] = None,
+                 max_entries: int = DEFAULT_MAX_ENTRIES, namespace: str = ''):
+        """
+        Args:
+            db_manager: 2차 캐시로 쓸 데이터베이스 (없으면 메모리 캐시만 사용)
+            ttls: 조회 종류별 유효 시간 (초, DEFAULT_TTLS에 덮어씀)
+            max_entries: 메모리 캐시 최대 항목 수 (초과 시 가장 오래 사용하지 않은 항목부터 제거)
+            namespace: SQLite 캐시 키 구분자 (서버/사용자가 다르면 검색 결과와 상세 정보를 공유하지 않도록)
+        """
+        self.db_manager = db_manager
+        self.ttls = dict(self.DEFAULT_TTLS, **(ttls or {}))
+        self.max_entries = max_entries
+        self.namespace = namespace
+        self.stats = {'hits': 0, 'misses': 0, 'db_loads': 0}
+        # (종류, 키) -> (저장 시각, 값), 앞쪽일수록 오래전에 사용된 항목
+        self._entries: "OrderedDict[Tuple[str, Hashable], Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._clock = time.time
+
+    def ttl(self, kind: str) -> float:
+        """조회 종류별 유효 시간"""
+        return self.ttls.get(kind, self.DEFAULT_TTLS['search'])
+
+    def age(self, entry: Tuple[float, Any]) -> float:
+        """lookup()이 반환한 항목의 경과 시간 (초)"""
+        return self._clock() - entry[0]
+
+    def get(self, kind: str, key: Hashable) -> Optional[Any]:
+        """유효한 캐시 값 조회 (메모리 → SQLite 순, 없거나 만료되었으면 None)"""
+        entry = self.lookup(kind, key)
+        if entry is None or self._clock() - entry[0] > self.ttl(kind):
+            self._count('misses')
+            return None
+        self._count('hits')
+        return entry[1]
+
+    def lookup(self, kind: str, key: Hashable) -> Optional[Tuple[float, Any]]:
+        """
+        만료 여부와 관계없이 가장 최근 (저장 시각, 값) 조회
+
+        메모리 항목이 없거나 만료되었을 때만 SQLite를 조회하고, 더 최신이면 메모리로 올린다.
+        """
+        with self._lock:
+            entry = self._entries.get((kind, key))
+            if entry is not None:
+                self._entries.move_to_end((kind, key))
+        if (entry is None or self._clock() - entry[0] > self.ttl(kind)) and self.db_manager:
+            stored = self._load(kind, key)
+            if stored is not None and (entry is None or stored[0] > entry[0]):
+                self._count('db_loads')
+                entry = stored
+                self._remember(kind, key, entry)
+        return None if entry is None else (entry[0], self._copy(entry[1]))
+
+    def put(self, kind: str, key: Hashable, value: Any):
+        """캐시 저장 (메모리와 SQLite 모두)"""
+        entry = (self._clock(), value)
+        self._remember(kind, key, entry)
+        if self.db_manager:
+            try:
+                self._store(kind, key, value)
+            except Exception as e:
+                print(f"이슈 캐시 저장 실패: {e}")
+
+    def invalidate_issue(self, issue_key: str):
+        """이슈 한 건과 그 이슈를 포함한 목록 캐시 제거 (SQLite 행도 만료 처리)"""
+        self.evict_issue(issue_key)
+        if self.db_manager:
+            self.db_manager.invalidate_jira_issues([issue_key])
+
+    def evict_issue(self, issue_key: str):
+        """
+        이슈 한 건과 그 이슈를 포함한 목록을 메모리 캐시에서만 제거
+
+        SQLite 행이 이미 최신인 경우(웹훅이 방금 반영한 이벤트)에 사용한다.
+        다음 조회는 SQLite에서 다시 읽는다.
+        """
+        with self._lock:
+            for cache_key, (_, value) in list(self._entries.items()):
+                kind, key = cache_key
+                if (kind == self.DETAIL_KIND and key == issue_key) or \
+                        (isinstance(value, list) and any(issue.get('key') == issue_key for issue in value)):
+                    del self._entries[cache_key]
+
+    def invalidate_lists(self):
+        """목록 캐시 전체 제거 (이슈 생성 등 검색 결과가 바뀌는 경우)"""
+        with self._lock:
+            for cache_key in [k for k in self._entries if k[0] != self.DETAIL_KIND]:
+                del self._entries[cache_key]
+        if self.db_manager:
+            self.db_manager.clear_search_results()
+
+    def clear(self):
+        """메모리 캐시 전체 제거 (SQLite의 이슈 데이터는 오프라인 조회용으로 유지)"""
+        with self._lock:
+            self._entries.clear()
+        if self.db_manager:
+            self.db_manager.clear_search_results()
+
+    def _count(self, stat: str):
+        with self._lock:
+            self.stats[stat] += 1
+
+    def _remember(self, kind: str, key: Hashable, entry: Tuple[float, Any]):
+        with self._lock:
+            self._entries[(kind, key)] = entry
+            self._entries.move_to_end((kind, key))
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    @staticmethod
+    def _copy(value: Any) -> Any:
+        """목록은 얕은 복사로 반환 (호출자가 목록을 바꿔도 캐시는 유지)"""
+        return list(value) if isinstance(value, list) else value
+
+    def _search_key(self, kind: str, key: Hashable) -> str:
+        return json.dumps([self.namespace, kind, key], ensure_ascii=False, default=str)
+
+    def _store(self, kind: str, key: Hashable, value: Any):
+        """
+        SQLite에 저장 (이슈는 jira_issues_cache, 조회 키별 이슈 키 목록은 jira_search_cache)
+
+        jira_issues_cache 행은 이슈 키로만 구분되므로 상세 조회도 네임스페이스가 붙은 키 목록을 남긴다.
+        """
+        issues = [value] if kind == self.DETAIL_KIND else value
+        self.db_manager.upsert_jira_issues([self._to_row(issue) for issue in issues],
+                                           detail=kind == self.DETAIL_KIND)
+        self.db_manager.save_search_result(self._search_key(kind, key), [issue['key'] for issue in issues])
+
+    def _load(self, kind: str, key: Hashable) -> Optional[Tuple[float, Any]]:
+        """SQLite에서 (저장 시각, 값) 조회"""
+        try:
+            result = self.db_manager.get_search_result(self._search_key(kind, key))
+            if not result:
+                return None
+            if kind == self.DETAIL_KIND:
+                row = self.db_manager.get_cached_issue(key, decode_data=False)
+                if not row or not row.get('detail_cached_at'):
+                    return None
+                detail_at = self._timestamp(row['detail_cached_at'])
+                # 이 네임스페이스가 저장한 뒤 다른 서버/사용자가 상세 정보를 덮어썼으면 사용하지 않음
+                if detail_at > self._timestamp(result['cached_at']):
+                    return None
+                return detail_at, IssueRecord.from_cache_row(row)
+
+            rows = self.db_manager.get_cached_issues_by_keys(result['issue_keys'], decode_data=False)
+            if len(rows) != len(result['issue_keys']):
+                return None
+            # 목록에 포함된 이슈가 무효화되었으면 목록 전체를 만료된 것으로 취급
+            stored_at = min([self._timestamp(result['cached_at'])] +
+                            [self._timestamp(row['cached_at']) for row in rows])
+            return stored_at, [IssueRecord.from_cache_row(row) for row in rows]
+        except Exception as e:
+            print(f"이슈 캐시 조회 실패: {e}")
+            return None
+
+    @staticmethod
+    def _to_row(issue: Any) -> Dict[str, Any]:
+        """IssueRecord/딕셔너리를 jira_issues_cache 행으로 변환"""
+        data = dict(issue)
+        return {
+            'issue_key': data.get('key'),
+            'summary': data.get('summary'),
+            'status': data.get('status'),
+            'assignee': data.get('assignee'),
+            'issue_type': data.get('type'),
+            'updated': None,
+            'data': data
+        }
+
+    @staticmethod
+    def _timestamp(value: str) -> float:
+        """SQLite CURRENT_TIMESTAMP (UTC) 문자열을 epoch 초로 변환"""
+        return float(timegm(time.strptime(value, '%Y-%m-%d %H:%M:%S')))
@@ -3,7 +3,7 @@
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit,
     QPushButton, QTableWidget, QTableWidgetItem, QFrame,
-    QMessageBox, QHeaderView, QAbstractItemView, QCheckBox
+    QMessageBox, QHeaderView, QAbstractItemView, QCheckBox, QFileDialog
 )
 from PyQt5.QtCore import Qt, pyqtSignal, QThread
 from PyQt5.QtGui import QFont
@@ -40,20 +40,91 @@ class JiraLoadWorker(QThread):
             self.error.emit(str(e))
 
 
+class JiraSearchWorker(QThread):
+    """Jira 이슈 검색 워커"""
+    
+    # 검색어, 결과
+    success = pyqtSignal(str, list)
+    error = pyqtSignal(str)
+    
+    def __init__(self, jira_controller, search_text):
+        super().__init__()
+        self.jira_controller = jira_controller
+        self.search_text = search_text
+        
+    def run(self):
+        """검색 실행"""
+        try:
+            issues = self.jira_controller.search_issues(self.search_text)
+            self.success.emit(self.search_text, issues)
+        except Exception as e:
+            self.error.emit(str(e))
+
+
+class AttachmentUploadWorker(QThread):
+    """Jira 첨부파일 업로드 워커"""
+    
+    success = pyqtSignal(list)
+    error = pyqtSignal(str)
+    # 파일 경로, 전송한 바이트, 전체 바이트 (알 수 없으면 -1)
+    progress = pyqtSignal(str, int, int)
+    
+    def __init__(self, jira_controller, issue_key, file_paths):
+        super().__init__()
+        self.jira_controller = jira_controller
+        self.issue_key = issue_key
+        self.file_paths = file_paths
+        
+    def run(self):
+        """업로드 실행 (진행 콜백은 작업 스레드에서 호출되므로 시그널로 전달)"""
+        try:
+            results = self.jira_controller.attach_files(
+                self.issue_key,
+                self.file_paths,
+                progress=lambda path, done, total: self.progress.emit(path, done, -1 if total is None else total)
+            )
+            self.success.emit(results)
+        except Exception as e:
+            self.error.emit(str(e))
+
+
 class JiraIssueView(QWidget):
     """PyQt5 Jira Issue 선택 화면"""
     
     next_clicked = pyqtSignal()
     back_clicked = pyqtSignal()
+    # 백그라운드 갱신 결과 (종류, 캐시 키, 새 값) - 갱신 스레드에서 UI 스레드로 전달
+    issues_refreshed = pyqtSignal(str, object, object)
     
     def __init__(self, parent=None):
         super().__init__(parent)
         self.parent_window = parent
         self.jira_controller = None
         self.load_worker = None
+        self.search_worker = None
+        self.upload_worker = None
         self.selected_issues = []
+        # 현재 테이블에 표시 중인 조회 (종류, 캐시 키)
+        self.displayed_query = None
+        self.issues_refreshed.connect(self.on_issues_refreshed)
+        self._refresh_listener = self.issues_refreshed.emit
         self.setup_ui()
         
+    def set_jira_controller(self, jira_controller):
+        """Jira 컨트롤러 설정 (캐시 갱신 알림 구독)"""
+        if self.jira_controller is not None:
+            self.jira_controller.remove_refresh_listener(self._refresh_listener)
+        self.jira_controller = jira_controller
+        if jira_controller is not None:
+            jira_controller.add_refresh_listener(self._refresh_listener)
+        
+    def on_issues_refreshed(self, kind, key, issues):
+        """표시 중인 검색 결과가 갱신되면 테이블 다시 그리기"""
+        if (kind, key) != self.displayed_query or not isinstance(issues, list):
+            return
+        self.populate_table(issues)
+        self.status_label.setText(f"최신 정보로 갱신됨: {len(issues)}개 이슈")
+        
     def setup_ui(self):
         """UI 설정"""
         # 메인 레이아웃
@@ -190,6 +261,13 @@ class JiraIssueView(QWidget):
         """)
         button_layout.addWidget(self.selected_count_label)
         
+        self.attach_button = QPushButton("파일 첨부")
+        self.attach_button.setObjectName("secondaryButton")
+        self.attach_button.setFixedHeight(40)
+        self.attach_button.setEnabled(False)
+        self.attach_button.clicked.connect(self.on_attach)
+        button_layout.addWidget(self.attach_button)
+        
         button_layout.addStretch()
         
         self.next_button = QPushButton("다음")
@@ -225,7 +303,7 @@ class JiraIssueView(QWidget):
             
             # 이슈 정보
             self.issues_table.setItem(row, 1, QTableWidgetItem(issue.get("key", "")))
-            self.issues_table.setItem(row, 2, QTableWidgetItem(issue.get("title", "")))
+            self.issues_table.setItem(row, 2, QTableWidgetItem(issue.get("summary") or issue.get("title", "")))
             self.issues_table.setItem(row, 3, QTableWidgetItem(issue.get("type", "")))
             self.issues_table.setItem(row, 4, QTableWidgetItem(issue.get("status", "")))
             self.issues_table.setItem(row, 5, QTableWidgetItem(issue.get("assignee", "")))
@@ -253,6 +331,7 @@ class JiraIssueView(QWidget):
                 
         self.selected_count_label.setText(f"{selected_count}개 선택됨")
         self.next_button.setEnabled(selected_count > 0)
+        self.attach_button.setEnabled(selected_count == 1 and not self._is_uploading())
         
     def on_search(self):
         """검색 실행"""
@@ -260,11 +339,22 @@ class JiraIssueView(QWidget):
         if not search_text:
             self.status_label.setText("검색어를 입력해주세요.")
             return
+        if self.search_worker is not None and self.search_worker.isRunning():
+            # 이전 검색이 끝날 때까지 대기 (검색 버튼도 비활성화 상태)
+            return
             
         self.status_label.setText(f"'{search_text}' 검색 중...")
         self.search_button.setEnabled(False)
         
-        # 실제로는 Jira API 호출
+        if self.jira_controller is not None:
+            # API 호출은 작업 스레드에서 실행 (캐시된 결과가 갱신되면 on_issues_refreshed로 다시 그림)
+            self.displayed_query = ('search', self.jira_controller.search_key(search_text))
+            self.search_worker = JiraSearchWorker(self.jira_controller, search_text)
+            self.search_worker.success.connect(self.on_search_finished)
+            self.search_worker.error.connect(self.on_search_error)
+            self.search_worker.start()
+            return
+        
         # 여기서는 샘플 데이터 필터링
         QThread.msleep(500)  # 시뮬레이션
         
@@ -272,11 +362,66 @@ class JiraIssueView(QWidget):
             {"key": search_text, "title": f"{search_text} 관련 이슈", 
              "type": "Task", "status": "진행중", "assignee": "담당자"}
         ]
+        self.on_search_finished(search_text, filtered_issues)
+        
+    def on_search_finished(self, search_text, issues):
+        """검색 결과 표시"""
+        self.populate_table(issues)
+        self.status_label.setText(f"검색 완료: {len(issues)}개 이슈")
+        self.search_button.setEnabled(True)
         
-        self.populate_table(filtered_issues)
-        self.status_label.setText(f"검색 완료: {len(filtered_issues)}개 이슈")
+    def on_search_error(self, error_msg):
+        """검색 실패 처리"""
+        self.status_label.setText(f"검색 실패: {error_msg}")
         self.search_button.setEnabled(True)
         
+    def _is_uploading(self):
+        """첨부파일 업로드 진행 중 여부"""
+        return self.upload_worker is not None and self.upload_worker.isRunning()
+        
+    def on_attach(self):
+        """선택한 이슈에 파일 첨부 (업로드는 작업 스레드에서 실행)"""
+        if self.jira_controller is None:
+            QMessageBox.warning(self, "파일 첨부", "Jira에 연결된 후 첨부할 수 있습니다.")
+            return
+        if len(self.selected_issues) != 1 or self._is_uploading():
+            return
+        
+        file_paths, _ = QFileDialog.getOpenFileNames(self, "첨부할 파일 선택")
+        if not file_paths:
+            return
+        
+        issue_key = self.selected_issues[0]
+        self.attach_button.setEnabled(False)
+        self.status_label.setText(f"{issue_key}에 {len(file_paths)}개 파일 첨부 중...")
+        self.upload_worker = AttachmentUploadWorker(self.jira_controller, issue_key, file_paths)
+        self.upload_worker.progress.connect(self.on_attach_progress)
+        self.upload_worker.success.connect(self.on_attach_finished)
+        self.upload_worker.error.connect(self.on_attach_error)
+        # 스레드가 끝난 뒤 첨부 버튼 상태 갱신
+        self.upload_worker.finished.connect(self.update_selection)
+        self.upload_worker.start()
+        
+    def on_attach_progress(self, file_path, done, total):
+        """업로드 진행률 표시 (전체 크기를 모르면 바이트 수만 표시)"""
+        name = os.path.basename(file_path)
+        if total > 0:
+            self.status_label.setText(f"첨부 중 {name}: {done * 100 // total}% ({done:,}/{total:,} bytes)")
+        else:
+            self.status_label.setText(f"첨부 중 {name}: {done:,} bytes")
+        
+    def on_attach_finished(self, results):
+        """업로드 결과 표시"""
+        failed = [os.path.basename(result['path']) for result in results if not result['success']]
+        if failed:
+            self.status_label.setText(f"첨부 실패: {', '.join(failed)}")
+        else:
+            self.status_label.setText(f"첨부 완료: {len(results)}개 파일")
+        
+    def on_attach_error(self, error_msg):
+        """업로드 실패 처리"""
+        self.status_label.setText(f"첨부 실패: {error_msg}")
+        
     def load_all_issues(self):
         """전체 이슈 로드"""
         self.status_label.setText("전체 이슈를 불러오는 중...")
@@ -18,7 +18,34 @@ class Config:
         },
         "api": {
             "jira_url": "",
-            "timeout": 30
+            "timeout": 30,
+            "connect_timeout": 10,
+            "operation_timeout": 60,
+            "breaker_threshold": 5,
+            "breaker_recovery": 30,
+            "db_selection_field": "labels"
+        },
+        "cache": {
+            "memory_entries": 256,
+            "search_ttl": 300,
+            "detail_ttl": 600,
+            "my_ttl": 300,
+            "recent_ttl": 120,
+            "stale_while_revalidate": False,
+            "search_stale": 1800,
+            "detail_stale": 86400,
+            "my_stale": 1800,
+            "recent_stale": 600,
+            "http_cache_dir": ""
+        },
+        "webhook": {
+            "enabled": False,
+            "host": "127.0.0.1",
+            "port": 8765,
+            "secret": ""
+        },
+        "sync": {
+            "projects": []
         },
         "db_codes": {
             "item1_options": ["Option 1", "Option 2", "Option 3"],
@@ -107,6 +134,22 @@ class Config:
                 
         return value
         
+    @classmethod
+    def load_section(cls, name: str, config_path: Optional[str] = None) -> Dict[str, Any]:
+        """
+        설정 파일의 한 섹션 (기본값과 병합, 설정 디렉터리를 만들 수 없으면 기본값)
+        
+        Args:
+            name: 섹션 이름 (예: "api", "cache")
+            config_path: 설정 파일 경로 (기본값: ~/.tm_setter/config.json)
+        """
+        try:
+            section = cls(config_path).get(name)
+        except OSError as e:
+            print(f"설정 파일 로드 실패: {e}")
+            section = cls.DEFAULT_CONFIG.get(name)
+        return dict(section) if isinstance(section, dict) else {}
+        
     def set(self, key: str, value: Any):
         """
         설정 값 저장
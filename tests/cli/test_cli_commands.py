@@ -16,6 +16,7 @@ from cli.commands.login import LoginCommand
 from cli.commands.select_db import SelectDBCommand
 from cli.commands.select_issue import SelectIssueCommand
 from cli.commands.configure import ConfigureCommand
+from cli.fuzzy import FuzzyMatcher
 
 
 class TestBaseCommand(unittest.TestCase):
@@ -207,6 +208,30 @@ class TestSelectDBCommand(unittest.TestCase):
         results = cmd.search_options(options, "xyz")
         self.assertEqual(len(results), 0)
     
+    def test_search_options_with_typo(self):
+        """Test searching options with a misspelled term"""
+        cmd = SelectDBCommand(self.config_path)
+        options = ["Production Database", "Development Database", "Test Database"]
+        
+        results = cmd.search_options(options, "Databse")
+        self.assertEqual(results[0], (2, "Test Database"))
+        self.assertEqual(len(results), 3)
+        
+        results = cmd.search_options(options, "producton")
+        self.assertEqual(results, [(0, "Production Database")])
+    
+    def test_search_options_large_catalog(self):
+        """Test every substring match is found in a 100k entry catalog"""
+        cmd = SelectDBCommand(self.config_path)
+        projects = ["CORE", "WEB", "APP", "DATA", "INFRA", "QA", "OPS", "SEC", "ML", "DOC"]
+        catalog = [f"{projects[i % 10]}-{i // 10 + 1}" for i in range(100000)]
+        
+        for term, count in (("INFRA-45", 111), ("infra-4", 1111), ("data-9", 1111)):
+            results = cmd.search_options(catalog, term)
+            self.assertGreaterEqual(len(results), count)
+            # Substring matches come first and none is left out
+            self.assertTrue(all(term.lower() in option.lower() for _, option in results[:count]))
+    
     def test_get_selection(self):
         """Test getting current selection"""
         cmd = SelectDBCommand(self.config_path)
@@ -269,6 +294,20 @@ class TestSelectIssueCommand(unittest.TestCase):
         if len(page1_issues) > 0 and len(page2_issues) > 0:
             self.assertNotEqual(page1_issues[0]['key'], page2_issues[0]['key'])
     
+    @patch('builtins.input')
+    def test_prompt_issue_selection_close_match(self, mock_input):
+        """Test selecting an issue by a misspelled summary"""
+        cmd = SelectIssueCommand(self.config_path)
+        issues, _ = cmd.fetch_issues(limit=12)
+        
+        mock_input.side_effect = ["cahcing mechanism"]
+        result = cmd.prompt_issue_selection(issues)
+        self.assertEqual(result['key'], "PROJ-107")
+        
+        # Ambiguous input lists suggestions and asks again
+        mock_input.side_effect = ["PROJ-11", "q"]
+        self.assertIsNone(cmd.prompt_issue_selection(issues))
+    
     def test_set_db_filter(self):
         """Test setting DB filter"""
         cmd = SelectIssueCommand(self.config_path)
@@ -346,5 +385,53 @@ class TestConfigureCommand(unittest.TestCase):
         self.assertEqual(cmd.get_configuration(), {})
 
 
+class TestFuzzyMatcher(unittest.TestCase):
+    """Test FuzzyMatcher class"""
+    
+    def test_ranking(self):
+        """Test substring matches rank before close matches"""
+        matcher = FuzzyMatcher(["main-repository", "backend-services", "frontend-app", "mobile-app"])
+        
+        self.assertEqual([entry for _, entry, _ in matcher.search("app")], ["mobile-app", "frontend-app"])
+        self.assertEqual(matcher.search("backnd")[0][1], "backend-services")
+        self.assertEqual([idx for idx, _, _ in matcher.search("fr")], [2])
+        self.assertEqual(matcher.search("zzz"), [])
+        self.assertEqual(matcher.search(""), [])
+    
+    def test_short_substring(self):
+        """Test queries shorter than a trigram still match inside words"""
+        matcher = FuzzyMatcher(["PROD-DB2", "TEST_A", "DB01_MAIN", "Option B"])
+        
+        self.assertEqual([entry for _, entry, _ in matcher.search("b2")], ["PROD-DB2"])
+        self.assertEqual([entry for _, entry, _ in matcher.search("_A")], ["TEST_A"])
+        self.assertEqual([entry for _, entry, _ in matcher.search("1")], ["DB01_MAIN"])
+    
+    def test_large_catalog_scan_bounds(self):
+        """Test lookups in a 100k entry catalog only scan a bounded part of the index"""
+        projects = ["CORE", "WEB", "APP", "DATA", "INFRA", "QA", "OPS", "SEC", "ML", "DOC"]
+        catalog = [f"{projects[i % 10]}-{i // 10 + 1}" for i in range(100000)]
+        matcher = FuzzyMatcher(catalog)
+        scanned = []
+        count_candidates = matcher._count_candidates
+
+        def counting(present, need):
+            counts = count_candidates(present, need)
+            scanned.append(sum(counts.values()))
+            return counts
+        matcher._count_candidates = counting
+
+        expected = {"INFRA-4521": "INFRA-4521", "INFAR-4521": "INFRA-4521",
+                    "DATA-98": "DATA-98", "web-7777": "WEB-7777", "SEC-123": "SEC-123"}
+        for query, entry in expected.items():
+            self.assertEqual(matcher.search(query, limit=10)[0][1], entry)
+        # Grams shared by 10k entries
+        self.assertEqual(len(matcher.search("web")), 10000)
+        self.assertTrue(matcher.search("webb")[0][1].startswith("WEB-"))
+
+        # Posting ids counted per query stay within the scan budget
+        self.assertTrue(scanned)
+        for ids in scanned:
+            self.assertLessEqual(ids, matcher.SCAN_BUDGET)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
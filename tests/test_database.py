@@ -155,6 +155,59 @@ class TestDatabaseManager(unittest.TestCase):
         result = self.db_manager.get_setting('non_existent', default=default_value)
         self.assertEqual(result, default_value)
 
+    def test_upsert_jira_issues(self):
+        """Jira Issue 일괄 upsert 테스트"""
+        rows = [
+            {'issue_key': 'TM-1', 'summary': 'first', 'status': 'Open', 'assignee': 'A',
+             'issue_type': 'Task', 'updated': '2024-01-01T00:00:00.000+0000', 'data': {'key': 'TM-1'}},
+            {'issue_key': 'TM-2', 'summary': 'second', 'status': 'Open', 'assignee': 'B',
+             'issue_type': 'Bug', 'updated': '2024-01-02T00:00:00.000+0000', 'data': {'key': 'TM-2'}}
+        ]
+        self.assertEqual(self.db_manager.upsert_jira_issues(rows), 2)
+        
+        # 같은 키는 갱신
+        rows[0]['status'] = 'Done'
+        self.db_manager.upsert_jira_issues(rows[:1])
+        
+        issues = {issue['issue_key']: issue for issue in self.db_manager.get_cached_issues()}
+        self.assertEqual(len(issues), 2)
+        self.assertEqual(issues['TM-1']['status'], 'Done')
+        self.assertEqual(issues['TM-2']['updated'], '2024-01-02T00:00:00.000+0000')
+        self.assertEqual(self.db_manager.upsert_jira_issues([]), 0)
+    
+    def test_sync_state_operations(self):
+        """증분 동기화 상태 저장/조회 테스트"""
+        self.assertIsNone(self.db_manager.get_sync_state('project = TM'))
+        
+        self.db_manager.save_sync_state('project = TM', '2024-01-01T00:00:00.000+0000', 10)
+        self.db_manager.save_sync_state('project = TM', '2024-01-02T00:00:00.000+0000', 3)
+        
+        state = self.db_manager.get_sync_state('project = TM')
+        self.assertEqual(state['watermark'], '2024-01-02T00:00:00.000+0000')
+        self.assertEqual(state['issue_count'], 13)
+        
+        self.db_manager.delete_sync_state('project = TM')
+        self.assertIsNone(self.db_manager.get_sync_state('project = TM'))
+    
+    def test_cache_table_migration(self):
+        """이전 스키마의 jira_issues_cache에 updated 컬럼 추가"""
+        with self.db_manager.connect() as conn:
+            conn.execute("DROP TABLE jira_issues_cache")
+            conn.execute("""
+                CREATE TABLE jira_issues_cache (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    issue_key TEXT UNIQUE NOT NULL,
+                    summary TEXT, status TEXT, assignee TEXT, issue_type TEXT,
+                    data JSON, cached_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+            conn.commit()
+        
+        migrated = DatabaseManager(self.db_path)
+        with migrated.connect() as conn:
+            columns = [row[1] for row in conn.execute("PRAGMA table_info(jira_issues_cache)")]
+        self.assertIn('updated', columns)
+
 class TestDBController(unittest.TestCase):
     """DBController 테스트"""
     
@@ -0,0 +1,258 @@
+"""
+Jira 이슈 2단계 캐시 테스트
+"""
+
+import functools
+import unittest
+from unittest.mock import Mock, patch
+import os
+import shutil
+import sys
+import tempfile
+import time
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(__file__)), 'src'))
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(__file__)), 'atlassian_api'))
+
+from models.database import DatabaseManager
+from models.issue import IssueRecord
+from models.issue_cache import IssueCache
+from controllers.jira_controller import JiraController
+from atlassian_api import JiraAPI
+
+
+def make_records(*keys):
+    """목록 형식 레코드"""
+    return [IssueRecord.from_dict({'key': key, 'summary': f'{key} summary', 'status': 'Open',
+                                   'assignee': 'A', 'priority': 'High', 'created': '2024-01-01',
+                                   'type': 'Task'}) for key in keys]
+
+
+class TestIssueCache(unittest.TestCase):
+    """IssueCache 테스트"""
+
+    def setUp(self):
+        """테스트 환경 설정"""
+        self.temp_db = tempfile.NamedTemporaryFile(suffix='.db', delete=False)
+        self.db_path = self.temp_db.name
+        self.temp_db.close()
+        self.db_manager = DatabaseManager(self.db_path)
+
+    def tearDown(self):
+        """테스트 정리"""
+        self.db_manager.close()
+        if os.path.exists(self.db_path):
+            os.unlink(self.db_path)
+
+    def test_memory_ttl_and_lru(self):
+        """메모리 캐시 유효 시간과 LRU 제거"""
+        cache = IssueCache(ttls={'search': 10}, max_entries=2)
+        now = [1000.0]
+        cache._clock = lambda: now[0]
+
+        cache.put('search', 'a', make_records('TM-1'))
+        cache.put('search', 'b', make_records('TM-2'))
+        self.assertEqual(cache.get('search', 'a')[0]['key'], 'TM-1')
+        cache.put('search', 'c', make_records('TM-3'))
+
+        # 가장 오래 사용하지 않은 b가 제거됨
+        self.assertIsNone(cache.get('search', 'b'))
+        self.assertIsNotNone(cache.get('search', 'a'))
+
+        now[0] += 11
+        self.assertIsNone(cache.get('search', 'a'))
+        self.assertIsNotNone(cache.lookup('search', 'a'))
+
+    def test_sqlite_tier_survives_new_session(self):
+        """SQLite 캐시는 새 세션(새 메모리 캐시)에서도 사용"""
+        IssueCache(self.db_manager).put('search', ('q', None, 50), make_records('TM-1', 'TM-2'))
+        detail = IssueRecord(key='TM-1', summary='s', status='Open', assignee=None,
+                             raw={'description': 'text', 'comments': []})
+        IssueCache(self.db_manager).put('detail', 'TM-1', detail)
+
+        cache = IssueCache(self.db_manager)
+        issues = cache.get('search', ('q', None, 50))
+        details = cache.get('detail', 'TM-1')
+
+        self.assertEqual([issue['key'] for issue in issues], ['TM-1', 'TM-2'])
+        self.assertEqual(issues[1]['priority'], 'High')
+        self.assertEqual(details['description'], 'text')
+        self.assertIsNone(details['assignee'])
+        self.assertEqual(cache.stats['db_loads'], 2)
+
+        # 목록 행이 저장되어도 상세 정보는 유지
+        cache.put('search', ('q', None, 50), make_records('TM-1'))
+        self.assertEqual(IssueCache(self.db_manager).get('detail', 'TM-1')['description'], 'text')
+
+    def test_invalidate_issue(self):
+        """이슈 무효화 시 상세 및 그 이슈를 포함한 목록 제거"""
+        cache = IssueCache(self.db_manager)
+        cache.put('search', 'q', make_records('TM-1', 'TM-2'))
+        cache.put('search', 'other', make_records('TM-3'))
+        cache.put('detail', 'TM-1', make_records('TM-1')[0])
+
+        cache.invalidate_issue('TM-1')
+
+        self.assertIsNone(cache.get('search', 'q'))
+        self.assertIsNone(cache.get('detail', 'TM-1'))
+        self.assertIsNotNone(cache.get('search', 'other'))
+        self.assertIsNone(IssueCache(self.db_manager).get('search', 'q'))
+
+    def test_detail_rows_are_namespaced(self):
+        """다른 서버/사용자가 저장한 상세 정보는 사용하지 않음"""
+        detail = IssueRecord(key='TM-1', summary='s', status='Open', assignee=None,
+                             raw={'description': 'text', 'comments': []})
+        IssueCache(self.db_manager, namespace='https://a|u1').put('detail', 'TM-1', detail)
+
+        self.assertIsNone(IssueCache(self.db_manager, namespace='https://b|u1').get('detail', 'TM-1'))
+        self.assertEqual(IssueCache(self.db_manager, namespace='https://a|u1').get('detail', 'TM-1')['summary'], 's')
+
+        # 다른 네임스페이스가 같은 키를 나중에 덮어쓰면 기존 네임스페이스도 다시 조회
+        with self.db_manager.connect() as conn:
+            conn.execute("UPDATE jira_search_cache SET cached_at = datetime(cached_at, '-1 minute')")
+            conn.commit()
+        IssueCache(self.db_manager, namespace='https://b|u1').put('detail', 'TM-1', detail)
+        self.assertIsNone(IssueCache(self.db_manager, namespace='https://a|u1').get('detail', 'TM-1'))
+
+
+class TestJiraControllerCache(unittest.TestCase):
+    """JiraController 캐시 적용 테스트"""
+
+    def setUp(self):
+        """테스트 환경 설정"""
+        self.temp_db = tempfile.NamedTemporaryFile(suffix='.db', delete=False)
+        self.db_path = self.temp_db.name
+        self.temp_db.close()
+        self.db_manager = DatabaseManager(self.db_path)
+
+        patcher = patch('controllers.jira_controller.JiraAPI')
+        self.addCleanup(patcher.stop)
+        self.api = Mock()
+        self.api.get_current_user.return_value = {'displayName': 'Test User'}
+        # 페이지 순회는 실제 JiraAPI 구현으로 search_issues 호출
+        self.api.iter_search_issues.side_effect = functools.partial(JiraAPI.iter_search_issues, self.api)
+        self.api.search_issues.return_value = {
+            'issues': [{'key': 'TEST-1', 'fields': {'summary': 'Test', 'status': {'name': 'Open'}}}],
+            'total': 1
+        }
+        self.api.get_issue.return_value = {'key': 'TEST-1', 'fields': {'summary': 'Test', 'description': 'd'}}
+        patcher.start().return_value = self.api
+
+        http_cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, http_cache_dir, True)
+        self.controller = JiraController(
+            server_url="https://test.atlassian.net",
+            user_id="test@example.com",
+            password="test-token",
+            use_real_api=True,
+            http_cache_dir=http_cache_dir,
+            db_manager=self.db_manager
+        )
+
+    def tearDown(self):
+        """테스트 정리"""
+        self.db_manager.close()
+        if os.path.exists(self.db_path):
+            os.unlink(self.db_path)
+
+    def test_repeated_calls_served_from_cache(self):
+        """같은 검색/상세 조회는 API를 다시 호출하지 않음"""
+        for _ in range(3):
+            self.assertEqual(self.controller.search_issues("test")[0]['key'], 'TEST-1')
+            self.assertEqual(self.controller.get_issue_details("TEST-1")['description'], 'd')
+            self.controller.get_recent_issues(5)
+
+        self.assertEqual(self.api.search_issues.call_count, 2)
+        self.assertEqual(self.api.get_issue.call_count, 1)
+
+    def test_update_invalidates_detail(self):
+        """이슈 수정 후에는 상세 정보를 다시 조회"""
+        self.controller.get_issue_details("TEST-1")
+        self.controller.update_issue("TEST-1", {'summary': 'changed'})
+        self.controller.get_issue_details("TEST-1")
+
+        self.assertEqual(self.api.get_issue.call_count, 2)
+
+    def test_api_failure_returns_stale_value(self):
+        """API 실패 시 만료된 캐시 값이라도 반환"""
+        self.controller.get_issue_details("TEST-1")
+        self.controller.cache._clock = lambda: time.time() + 3600
+        self.api.get_issue.side_effect = Exception("offline")
+
+        details = self.controller.get_issue_details("TEST-1")
+
+        self.assertEqual(details['description'], 'd')
+
+
+class TestStaleWhileRevalidate(unittest.TestCase):
+    """stale-while-revalidate 테스트"""
+
+    def setUp(self):
+        """테스트 환경 설정"""
+        patcher = patch('controllers.jira_controller.JiraAPI')
+        self.addCleanup(patcher.stop)
+        self.api = Mock()
+        self.api.get_current_user.return_value = {'displayName': 'Test User'}
+        # 페이지 순회는 실제 JiraAPI 구현으로 search_issues 호출
+        self.api.iter_search_issues.side_effect = functools.partial(JiraAPI.iter_search_issues, self.api)
+        self.api.search_issues.return_value = self._page('old')
+        patcher.start().return_value = self.api
+
+        http_cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, http_cache_dir, True)
+        self.controller = JiraController(
+            server_url="https://test.atlassian.net",
+            user_id="test@example.com",
+            password="test-token",
+            use_real_api=True,
+            http_cache_dir=http_cache_dir,
+            cache_config={'stale_while_revalidate': True, 'search_ttl': 10, 'search_stale': 100}
+        )
+        self.addCleanup(self.controller.close)
+        self.now = [1000.0]
+        self.controller.cache._clock = lambda: self.now[0]
+        self.refreshed = []
+        self.controller.add_refresh_listener(lambda kind, key, value: self.refreshed.append((kind, key, value)))
+
+    @staticmethod
+    def _page(summary):
+        return {'issues': [{'key': 'TEST-1', 'fields': {'summary': summary}}], 'total': 1}
+
+    def test_stale_value_returned_and_refreshed(self):
+        """stale 구간에서는 캐시 값을 바로 반환하고 백그라운드에서 갱신"""
+        self.controller.search_issues("q")
+        self.now[0] += 20
+        self.api.search_issues.return_value = self._page('new')
+
+        issues = self.controller.search_issues("q")
+        self.assertEqual(issues[0]['summary'], 'old')
+        self.assertTrue(self.controller.wait_for_refreshes(timeout=5))
+
+        self.assertEqual(len(self.refreshed), 1)
+        kind, key, value = self.refreshed[0]
+        self.assertEqual((kind, key), ('search', self.controller.search_key("q")))
+        self.assertEqual(key, ('q', None, 50))
+        self.assertEqual(value[0]['summary'], 'new')
+        self.assertEqual(self.controller.search_issues("q")[0]['summary'], 'new')
+        self.assertEqual(self.api.search_issues.call_count, 2)
+
+    def test_unchanged_refresh_not_notified(self):
+        """갱신 결과가 같으면 알리지 않음"""
+        self.controller.search_issues("q")
+        self.now[0] += 20
+        self.controller.search_issues("q")
+        self.controller.wait_for_refreshes(timeout=5)
+
+        self.assertEqual(self.refreshed, [])
+
+    def test_beyond_stale_window_fetches_synchronously(self):
+        """stale 구간을 지나면 바로 다시 조회"""
+        self.controller.search_issues("q")
+        self.now[0] += 200
+        self.api.search_issues.return_value = self._page('new')
+
+        self.assertEqual(self.controller.search_issues("q")[0]['summary'], 'new')
+        self.assertEqual(self.refreshed, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
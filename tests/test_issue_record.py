@@ -0,0 +1,107 @@
+"""
+IssueRecord 모델 테스트
+"""
+
+import unittest
+import json
+import os
+import sys
+import tempfile
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(__file__)), 'src'))
+
+from models.issue import IssueRecord
+from controllers.db_controller import DBController
+
+
+class TestIssueRecord(unittest.TestCase):
+    """IssueRecord 테스트"""
+
+    def test_from_api(self):
+        """검색 API 응답을 목록 형식으로 변환"""
+        record = IssueRecord.from_api({
+            'key': 'TM-1',
+            'fields': {
+                'summary': 'hello',
+                'status': {'name': 'Open'},
+                'assignee': None,
+                'created': '2024-01-01T10:00:00.000+0000',
+                'issuetype': {'name': 'Bug'}
+            }
+        })
+
+        self.assertEqual(record, {
+            'key': 'TM-1', 'summary': 'hello', 'status': 'Open', 'assignee': 'Unassigned',
+            'priority': 'None', 'created': '2024-01-01', 'type': 'Bug'
+        })
+        self.assertFalse(hasattr(record, '__dict__'))
+
+    def test_dict_compatibility(self):
+        """딕셔너리처럼 조회/갱신"""
+        record = IssueRecord.from_dict({'key': 'TM-2', 'summary': 's', 'status': 'Open', 'labels': ['a']})
+
+        self.assertEqual(record['key'], 'TM-2')
+        self.assertEqual(record.get('assignee', 'Unassigned'), 'Unassigned')
+        self.assertNotIn('assignee', record)
+        self.assertIn('labels', record)
+        self.assertEqual(sorted(record), ['key', 'labels', 'status', 'summary'])
+        with self.assertRaises(KeyError):
+            record['missing']
+
+        record['status'] = 'Done'
+        record['note'] = 'x'
+        self.assertEqual(record.status, 'Done')
+        self.assertEqual(json.loads(json.dumps(record.to_dict()))['note'], 'x')
+
+    def test_lazy_raw_decoding(self):
+        """raw 필드는 처음 접근할 때만 디코딩"""
+        record = IssueRecord(key='TM-3', summary='s',
+                             raw=json.dumps({'priority': 'High', 'description': 'long text'}))
+
+        self.assertEqual(record['summary'], 's')
+        self.assertIsInstance(record._raw, str)
+
+        self.assertEqual(record['priority'], 'High')
+        self.assertEqual(record['description'], 'long text')
+        self.assertIsNone(record._raw)
+
+    def test_repeated_values_shared(self):
+        """상태 등 반복 값은 같은 문자열 객체를 공유"""
+        a = IssueRecord.from_dict({'key': 'TM-1', 'status': ''.join(['In ', 'Progress'])})
+        b = IssueRecord.from_dict({'key': 'TM-2', 'status': ''.join(['In ', 'Progress'])})
+
+        self.assertIs(a.status, b.status)
+
+
+class TestCachedIssueRecords(unittest.TestCase):
+    """캐시에서 읽은 IssueRecord 테스트"""
+
+    def setUp(self):
+        """테스트 환경 설정"""
+        self.temp_db = tempfile.NamedTemporaryFile(suffix='.db', delete=False)
+        self.db_path = self.temp_db.name
+        self.temp_db.close()
+        self.db_controller = DBController(self.db_path)
+
+    def tearDown(self):
+        """테스트 정리"""
+        self.db_controller.db_manager.close()
+        if os.path.exists(self.db_path):
+            os.unlink(self.db_path)
+
+    def test_cache_round_trip(self):
+        """레코드를 캐시에 저장하고 다시 읽기"""
+        record = IssueRecord.from_dict({'key': 'TM-9', 'summary': 'cached', 'status': 'Open',
+                                        'assignee': 'A', 'priority': 'High', 'type': 'Task'})
+        self.db_controller.cache_jira_issues([record])
+
+        cached = self.db_controller.get_cached_jira_issues()
+
+        self.assertEqual(len(cached), 1)
+        self.assertIsInstance(cached[0], IssueRecord)
+        self.assertIsNotNone(cached[0]._raw)
+        self.assertEqual(cached[0]['priority'], 'High')
+        self.assertEqual(cached[0], record)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,191 @@
+"""
+캐시된 Jira 이슈 전문 검색 테스트
+"""
+
+import unittest
+import json
+import os
+import sqlite3
+import sys
+import tempfile
+from unittest.mock import patch
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(__file__)), 'src'))
+
+from models.database import DatabaseManager
+from models.issue import IssueRecord
+from controllers.jira_controller import JiraController
+
+
+def make_row(key, summary, description='', comments=()):
+    """jira_issues_cache 행"""
+    return {
+        'issue_key': key,
+        'summary': summary,
+        'status': 'Open',
+        'assignee': 'Tester',
+        'issue_type': 'Task',
+        'updated': None,
+        'data': {'key': key, 'summary': summary, 'description': description,
+                 'comments': [{'author': 'A', 'body': body} for body in comments]}
+    }
+
+
+class TestIssueSearch(unittest.TestCase):
+    """DatabaseManager.search_cached_issues 테스트"""
+
+    def setUp(self):
+        """테스트 환경 설정"""
+        self.temp_db = tempfile.NamedTemporaryFile(suffix='.db', delete=False)
+        self.db_path = self.temp_db.name
+        self.temp_db.close()
+        self.db_manager = DatabaseManager(self.db_path)
+        self.db_manager.upsert_jira_issues([
+            make_row('TM-101', 'TM 설정 자동화 구현', 'setter 스크립트 정리'),
+            make_row('TM-102', 'DB 연결 오류 수정', 'connection timeout on login'),
+            make_row('TM-103', 'UI 개선 작업', 'login 화면 정리', comments=['DB 연결 확인 필요']),
+            make_row('DEV-7', 'Database migration', 'move to postgres'),
+        ])
+
+    def tearDown(self):
+        """테스트 정리"""
+        self.db_manager.close()
+        if os.path.exists(self.db_path):
+            os.unlink(self.db_path)
+
+    def _keys(self, query, **kwargs):
+        return [row['issue_key'] for row in self.db_manager.search_cached_issues(query, **kwargs)]
+
+    def test_ranked_by_field_weight(self):
+        """요약 일치가 코멘트 일치보다 먼저 정렬"""
+        self.assertEqual(self._keys('연결'), ['TM-102', 'TM-103'])
+        self.assertEqual(self._keys('login'), ['TM-102', 'TM-103'])
+
+    def test_prefix_phrase_and_key(self):
+        """접두어, 구문, 이슈 키 검색"""
+        self.assertEqual(self._keys('migr'), ['DEV-7'])
+        self.assertEqual(self._keys('"timeout on login"'), ['TM-102'])
+        self.assertEqual(self._keys('"login timeout"'), [])
+        self.assertEqual(self._keys('TM-103'), ['TM-103'])
+        self.assertEqual(self._keys('database', project='dev'), ['DEV-7'])
+        self.assertEqual(self._keys('database', project='TM'), [])
+
+    def test_operator_characters_are_literal(self):
+        """FTS5 문법 문자가 포함된 입력도 오류 없이 검색"""
+        for query in ['NEAR(', 'a OR', '"unclosed', '* - ^', 'col:x', '']:
+            self.assertIsInstance(self.db_manager.search_cached_issues(query), list)
+        self.assertEqual(self.db_manager.build_fts_query('* -'), '')
+
+    def test_index_follows_cache_changes(self):
+        """캐시 수정/삭제가 색인에 반영"""
+        self.db_manager.upsert_jira_issues([make_row('TM-102', 'Crash on startup')], detail=True)
+        self.db_manager.cache_jira_issue('TM-103', 'Toolbar icons', 'Open', 'A', 'Task', {'key': 'TM-103'})
+        self.assertEqual(self._keys('연결'), [])
+        self.assertEqual(self._keys('crash'), ['TM-102'])
+
+        self.db_manager.delete_jira_issues(['TM-102'])
+        self.assertEqual(self._keys('crash'), [])
+        with self.db_manager.connect() as conn:
+            count = conn.execute("SELECT COUNT(*) FROM jira_issues_fts").fetchone()[0]
+        self.assertEqual(count, 3)
+
+    def test_existing_cache_indexed_on_upgrade(self):
+        """색인 테이블이 없던 데이터베이스는 처음 열 때 기존 캐시를 색인"""
+        with sqlite3.connect(self.db_path) as conn:
+            for name in ('jira_issues_fts_insert', 'jira_issues_fts_update', 'jira_issues_fts_delete'):
+                conn.execute(f"DROP TRIGGER {name}")
+            conn.execute("DROP TABLE jira_issues_fts")
+
+        upgraded = DatabaseManager(self.db_path)
+        self.assertEqual([row['issue_key'] for row in upgraded.search_cached_issues('postgres')], ['DEV-7'])
+
+    def test_search_uses_index(self):
+        """수천 건 캐시에서도 색인으로 조회 (캐시 테이블 전체 스캔 없음)"""
+        self.db_manager.upsert_jira_issues([
+            make_row(f'BULK-{i}', f'Issue {i} for module{i % 50}', f'description text {i}',
+                     comments=[f'comment number {i}'])
+            for i in range(5000)
+        ])
+
+        results = self.db_manager.search_cached_issues('module7 descr', limit=50)
+
+        self.assertEqual(len(results), 50)
+        with self.db_manager.connect() as conn:
+            plan = ' '.join(row['detail'] for row in conn.execute("""
+                EXPLAIN QUERY PLAN
+                SELECT c.* FROM jira_issues_fts JOIN jira_issues_cache c ON c.id = jira_issues_fts.rowid
+                WHERE jira_issues_fts MATCH ?
+            """, (self.db_manager.build_fts_query('module7 descr'),)))
+        self.assertIn('VIRTUAL TABLE INDEX', plan)
+        self.assertIn('USING INTEGER PRIMARY KEY', plan)
+
+    def test_write_without_custom_functions(self):
+        """색인 트리거는 사용자 정의 함수 없이 일반 연결에서도 동작 (ADF 본문 포함)"""
+        adf = {'type': 'doc', 'content': [{'type': 'paragraph',
+                                           'content': [{'type': 'text', 'text': 'kernel panic'}]}]}
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("INSERT INTO jira_issues_cache (issue_key, summary, data) VALUES (?, ?, ?)",
+                         ('OPS-9', 'Node down', json.dumps({'description': adf, 'comments': []})))
+
+        self.assertEqual(self._keys('kernel'), ['OPS-9'])
+
+    def test_search_without_fts5(self):
+        """FTS5를 쓸 수 없으면 LIKE 검색으로 대체하고 캐시 쓰기는 계속 동작"""
+        self.db_manager.close()
+        os.unlink(self.db_path)
+        with patch.object(DatabaseManager, 'FTS_TABLE_SQL',
+                          "CREATE VIRTUAL TABLE IF NOT EXISTS jira_issues_fts USING no_such_module(x)"):
+            self.db_manager = DatabaseManager(self.db_path)
+        self.assertFalse(self.db_manager.fts_enabled)
+        self.db_manager.upsert_jira_issues([
+            make_row('TM-102', 'DB 연결 오류 수정', 'connection timeout on login'),
+            make_row('TM-103', 'UI 개선 작업', 'login 화면 정리', comments=['DB 연결 확인 필요']),
+            make_row('TM-104', '100% 완료', 'under_score'),
+        ])
+
+        self.assertEqual(self._keys('연결'), ['TM-102', 'TM-103'])
+        self.assertEqual(self._keys('login 확인'), ['TM-103'])
+        self.assertEqual(self._keys('100%'), ['TM-104'])
+        self.assertEqual(self._keys('r_s'), ['TM-104'])
+        self.assertEqual(self._keys('%'), [])
+        self.assertEqual(self._keys('login', project='DEV'), [])
+
+
+class TestOfflineSearchFallback(unittest.TestCase):
+    """JiraController 오프라인 검색 테스트"""
+
+    def setUp(self):
+        """테스트 환경 설정"""
+        self.temp_db = tempfile.NamedTemporaryFile(suffix='.db', delete=False)
+        self.db_path = self.temp_db.name
+        self.temp_db.close()
+        self.db_manager = DatabaseManager(self.db_path)
+
+    def tearDown(self):
+        """테스트 정리"""
+        self.db_manager.close()
+        if os.path.exists(self.db_path):
+            os.unlink(self.db_path)
+
+    def test_offline_search_uses_cache(self):
+        """API 없이 캐시된 이슈를 관련도 순으로 검색"""
+        self.db_manager.upsert_jira_issues([
+            make_row('OPS-1', 'Rotate certificates', 'expired cert on gateway'),
+            make_row('OPS-2', 'Gateway restart', 'after cert rotation'),
+        ])
+        controller = JiraController(db_manager=self.db_manager)
+
+        issues = controller.search_issues('gateway')
+
+        self.assertEqual([issue['key'] for issue in issues], ['OPS-2', 'OPS-1'])
+        self.assertIsInstance(issues[0], IssueRecord)
+        self.assertEqual(issues[1]['description'], 'expired cert on gateway')
+
+    def test_dummy_data_without_cache_match(self):
+        """캐시에 결과가 없으면 기존 더미 데이터 사용"""
+        controller = JiraController(db_manager=self.db_manager)
+
+        self.assertEqual([issue['key'] for issue in controller.search_issues('DB')], ['TM-102'])
+
+
+if __name__ == '__main__':
+    unittest.main()
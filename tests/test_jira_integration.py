@@ -2,15 +2,20 @@
 Jira API 통합 테스트
 """
 
+import functools
 import unittest
 from unittest.mock import Mock, patch, MagicMock
 import sys
 import os
+import json
+import shutil
+import tempfile
 sys.path.append(os.path.join(os.path.dirname(os.path.dirname(__file__)), 'src'))
 sys.path.append(os.path.join(os.path.dirname(os.path.dirname(__file__)), 'atlassian_api'))
 
 from controllers.jira_controller import JiraController
 from controllers.auth_controller import AuthController
+from atlassian_api import JiraAPI
 
 
 class TestJiraIntegration(unittest.TestCase):
@@ -52,6 +57,44 @@ class TestJiraIntegration(unittest.TestCase):
         self.assertIsNotNone(controller.jira_client)
         mock_instance.get_current_user.assert_called_once()
     
+    @patch('controllers.jira_controller.JiraAPI')
+    def test_api_config_applied_to_transport(self, mock_jira_api_class):
+        """설정의 타임아웃/회로 차단기 값을 transport에 적용"""
+        mock_instance = Mock()
+        mock_instance.get_current_user.return_value = {'displayName': 'Test User'}
+        mock_jira_api_class.return_value = mock_instance
+        
+        controller = JiraController(
+            server_url="https://test.atlassian.net",
+            user_id="test@example.com",
+            password="test-token",
+            use_real_api=True,
+            api_config={'timeout': 5, 'operation_timeout': 2}
+        )
+        
+        applied = mock_instance.transport.apply_config.call_args[0][0]
+        self.assertEqual(applied['timeout'], 5)
+        self.assertIn('breaker_threshold', applied)
+        self.assertEqual(controller.operation_timeout, 2)
+    
+    def test_user_config_file_loaded(self):
+        """설정 파일의 api/cache 섹션을 읽고 인자로 준 값이 우선"""
+        home = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, home, True)
+        os.makedirs(os.path.join(home, '.tm_setter'))
+        with open(os.path.join(home, '.tm_setter', 'config.json'), 'w', encoding='utf-8') as f:
+            json.dump({'api': {'timeout': 7, 'operation_timeout': 3}, 'cache': {'search_ttl': 42}}, f)
+        
+        with patch.dict(os.environ, {'HOME': home}):
+            controller = JiraController(api_config={'operation_timeout': 9})
+            auth_controller = AuthController()
+        
+        self.assertEqual(controller.api_config['timeout'], 7)
+        self.assertEqual(controller.operation_timeout, 9)
+        self.assertEqual(controller.cache.ttl('search'), 42)
+        self.assertIn('breaker_threshold', controller.api_config)
+        self.assertEqual(auth_controller.api_config['timeout'], 7)
+    
     def test_search_issues_with_dummy_data(self):
         """더미 데이터로 이슈 검색 테스트"""
         controller = JiraController()
@@ -70,6 +113,8 @@ class TestJiraIntegration(unittest.TestCase):
         # Mock 설정
         mock_instance = Mock()
         mock_instance.get_current_user.return_value = {'displayName': 'Test User'}
+        # 페이지 순회는 실제 JiraAPI 구현으로 search_issues 호출
+        mock_instance.iter_search_issues.side_effect = functools.partial(JiraAPI.iter_search_issues, mock_instance)
         mock_instance.search_issues.return_value = {
             'issues': [
                 {
@@ -102,6 +147,82 @@ class TestJiraIntegration(unittest.TestCase):
         self.assertEqual(issues[0]['key'], 'TEST-123')
         self.assertEqual(issues[0]['summary'], 'Test Issue')
     
+    @patch('controllers.jira_controller.JiraAPI')
+    def test_search_filters_pushed_to_jql(self, mock_jira_api_class):
+        """검색 조건은 이스케이프된 JQL로 서버에 전달"""
+        mock_instance = Mock()
+        mock_instance.get_current_user.return_value = {'displayName': 'Test User'}
+        # 페이지 순회는 실제 JiraAPI 구현으로 search_issues 호출
+        mock_instance.iter_search_issues.side_effect = functools.partial(JiraAPI.iter_search_issues, mock_instance)
+        mock_instance.search_issues.return_value = {'issues': [], 'total': 0}
+        mock_jira_api_class.return_value = mock_instance
+        
+        controller = JiraController(
+            server_url="https://test.atlassian.net",
+            user_id="test@example.com",
+            password="test-token",
+            use_real_api=True
+        )
+        controller.search_issues("it's", project="TEST", status=["Open", "In Progress"],
+                                 assignee="currentUser()", db_selection={'db1': 'Production Database'})
+        
+        jql = mock_instance.search_issues.call_args[0][0]
+        self.assertEqual(jql, 'text ~ "it\'s" AND project = "TEST" AND status in ("Open", "In Progress") '
+                              'AND assignee = currentUser() '
+                              'AND labels = "Production Database"')
+    
+    @patch('controllers.jira_controller.JiraAPI')
+    def test_http_cache_is_opt_in(self, mock_jira_api_class):
+        """경로를 지정한 경우에만 조건부 GET 캐시 사용"""
+        mock_instance = Mock()
+        mock_instance.get_current_user.return_value = {'displayName': 'Test User'}
+        mock_jira_api_class.return_value = mock_instance
+        
+        JiraController(server_url="https://test.atlassian.net", user_id="test@example.com",
+                       password="test-token", use_real_api=True, cache_config={'http_cache_dir': ''})
+        mock_instance.transport.enable_cache.assert_not_called()
+        
+        cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, cache_dir, True)
+        JiraController(server_url="https://test.atlassian.net", user_id="test@example.com",
+                       password="test-token", use_real_api=True, http_cache_dir=cache_dir)
+        mock_instance.transport.enable_cache.assert_called_once_with(cache_dir)
+    
+    @patch('controllers.jira_controller.JiraAPI')
+    def test_iter_issues_walks_all_pages(self, mock_jira_api_class):
+        """모든 페이지를 순회하는 이슈 검색 테스트"""
+        def make_page(start, count, total):
+            return {
+                'issues': [
+                    {'key': f'TEST-{start + i}', 'fields': {'summary': f'Issue {start + i}'}}
+                    for i in range(count)
+                ],
+                'startAt': start,
+                'total': total
+            }
+        
+        mock_instance = Mock()
+        mock_instance.get_current_user.return_value = {'displayName': 'Test User'}
+        # 페이지 순회는 실제 JiraAPI 구현으로 search_issues 호출
+        mock_instance.iter_search_issues.side_effect = functools.partial(JiraAPI.iter_search_issues, mock_instance)
+        mock_instance.search_issues.side_effect = [make_page(0, 2, 5), make_page(2, 2, 5), make_page(4, 1, 5)]
+        mock_jira_api_class.return_value = mock_instance
+        
+        controller = JiraController(
+            server_url="https://test.atlassian.net",
+            user_id="test@example.com",
+            password="test-token",
+            use_real_api=True
+        )
+        
+        issues = list(controller.iter_issues("test", page_size=2))
+        
+        self.assertEqual([i['key'] for i in issues], ['TEST-0', 'TEST-1', 'TEST-2', 'TEST-3', 'TEST-4'])
+        self.assertEqual(issues[0]['assignee'], 'Unassigned')
+        self.assertEqual(mock_instance.search_issues.call_count, 3)
+        # 목록 화면에서 사용하는 필드만 요청
+        self.assertEqual(mock_instance.search_issues.call_args[1]['fields'], JiraController.LIST_FIELDS)
+    
     def test_get_issue_details_with_dummy_data(self):
         """더미 데이터로 이슈 상세 조회 테스트"""
         controller = JiraController()
@@ -140,6 +261,96 @@ class TestJiraIntegration(unittest.TestCase):
         self.assertEqual(issue_key, 'TEST-999')
         mock_instance.create_issue.assert_called_once()
     
+    @patch('controllers.jira_controller.JiraAPI')
+    def test_create_issues_with_real_api(self, mock_jira_api_class):
+        """실제 API 사용 시 일괄 생성 테스트"""
+        mock_instance = Mock()
+        mock_instance.get_current_user.return_value = {'displayName': 'Test User'}
+        mock_instance.bulk_create_issues.return_value = [
+            {'index': 0, 'success': True, 'key': 'TEST-1', 'id': '1', 'error': None},
+            {'index': 1, 'success': False, 'key': None, 'id': None, 'error': 'summary: invalid'}
+        ]
+        mock_jira_api_class.return_value = mock_instance
+        
+        controller = JiraController(
+            server_url="https://test.atlassian.net",
+            user_id="test@example.com",
+            password="test-token",
+            use_real_api=True
+        )
+        
+        results = controller.create_issues([
+            {'project': 'TEST', 'summary': 'First', 'priority': 'High', 'assignee': 'abc123'},
+            {'project': 'TEST', 'summary': ''}
+        ])
+        
+        self.assertEqual([r['success'] for r in results], [True, False])
+        issues = mock_instance.bulk_create_issues.call_args[0][0]
+        self.assertEqual(issues[0]['project_key'], 'TEST')
+        self.assertEqual(issues[0]['summary'], 'First')
+        self.assertEqual(issues[0]['priority'], {'name': 'High'})
+        self.assertEqual(issues[0]['assignee'], {'accountId': 'abc123'})
+        self.assertEqual(issues[1]['priority'], {'name': 'Medium'})
+        self.assertNotIn('assignee', issues[1])
+        
+        # 전송 자체가 실패하면 모든 항목을 실패로 반환
+        mock_instance.bulk_create_issues.side_effect = Exception("connection refused")
+        results = controller.create_issues([{'project': 'TEST', 'summary': 'First'}])
+        self.assertFalse(results[0]['success'])
+        self.assertIn("connection refused", results[0]['error'])
+    
+    @patch('controllers.jira_controller.JiraAPI')
+    def test_get_issues_with_real_api(self, mock_jira_api_class):
+        """실제 API 사용 시 여러 키 일괄 조회 테스트"""
+        mock_instance = Mock()
+        mock_instance.get_current_user.return_value = {'displayName': 'Test User'}
+        mock_instance.get_issues.return_value = {
+            'issues': {'TEST-1': {'key': 'TEST-1', 'fields': {'summary': 'First', 'status': {'name': 'Open'}}}},
+            'missing': ['TEST-2']
+        }
+        mock_jira_api_class.return_value = mock_instance
+        
+        controller = JiraController(
+            server_url="https://test.atlassian.net",
+            user_id="test@example.com",
+            password="test-token",
+            use_real_api=True
+        )
+        
+        result = controller.get_issues_by_keys(['TEST-1', 'TEST-2'])
+        
+        self.assertEqual(result['issues']['TEST-1']['summary'], 'First')
+        self.assertEqual(result['issues']['TEST-1']['status'], 'Open')
+        self.assertEqual(result['missing'], ['TEST-2'])
+        mock_instance.get_issues.assert_called_once_with(['TEST-1', 'TEST-2'], fields=JiraController.LIST_FIELDS)
+    
+    @patch('controllers.jira_controller.JiraAPI')
+    def test_attach_file_with_real_api(self, mock_jira_api_class):
+        """실제 API 사용 시 파일 첨부 테스트"""
+        mock_instance = Mock()
+        mock_instance.get_current_user.return_value = {'displayName': 'Test User'}
+        mock_instance.add_attachment.return_value = [{'id': '1'}]
+        mock_jira_api_class.return_value = mock_instance
+        
+        controller = JiraController(
+            server_url="https://test.atlassian.net",
+            user_id="test@example.com",
+            password="test-token",
+            use_real_api=True
+        )
+        
+        with tempfile.NamedTemporaryFile(delete=False) as f:
+            f.write(b'log')
+        self.addCleanup(os.remove, f.name)
+        progress = Mock()
+        
+        self.assertTrue(controller.attach_file('TEST-1', f.name, progress=progress))
+        mock_instance.add_attachment.assert_called_once_with('TEST-1', f.name, progress=progress)
+        
+        # 존재하지 않는 파일은 업로드하지 않음
+        self.assertFalse(controller.attach_file('TEST-1', f.name + '.missing'))
+        self.assertEqual(mock_instance.add_attachment.call_count, 1)
+    
     def test_auth_controller_with_jira(self):
         """Jira를 사용한 인증 컨트롤러 테스트"""
         # 로컬 인증 테스트
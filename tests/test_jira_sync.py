@@ -0,0 +1,158 @@
+"""
+Jira 증분 동기화 테스트 (로컬 스텁 서버 사용)
+"""
+
+import unittest
+from unittest.mock import patch
+import os
+import shutil
+import sys
+import tempfile
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(__file__)), 'src'))
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(__file__)), 'atlassian_api'))
+
+from atlassian_api import JiraAPI, HTTPTransport
+from stub_server import StubAtlassianServer, StubData
+from models.database import DatabaseManager
+from controllers.sync_controller import JiraSyncController, sync_configured_projects
+from utils.config import Config
+
+SEARCH_ROUTE = "GET ^/rest/api/(?:2|3)/search/?$"
+
+
+class TestJiraSyncController(unittest.TestCase):
+    """JiraSyncController 테스트"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = StubAtlassianServer(data=StubData(issues=450)).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+
+    def setUp(self):
+        """테스트 환경 설정"""
+        self.temp_db = tempfile.NamedTemporaryFile(suffix='.db', delete=False)
+        self.db_path = self.temp_db.name
+        self.temp_db.close()
+        self.db_manager = DatabaseManager(self.db_path)
+
+        self.transport = HTTPTransport()
+        self.jira = JiraAPI(self.server.url, "user", "token", transport=self.transport)
+        self.sync = JiraSyncController(self.jira, self.db_manager)
+        self.server.reset_stats()
+
+    def tearDown(self):
+        """테스트 정리"""
+        self.transport.close()
+        self.db_manager.close()
+        if os.path.exists(self.db_path):
+            os.unlink(self.db_path)
+
+    def _search_requests(self):
+        return self.server.stats["routes"].get(SEARCH_ROUTE, 0)
+
+    def test_initial_sync_mirrors_project(self):
+        """첫 동기화는 전체 조회 후 워터마크 저장"""
+        result = self.sync.sync("project = TM ORDER BY updated DESC")
+
+        self.assertTrue(result['full'])
+        self.assertEqual(result['fetched'], 150)
+        self.assertEqual(result['upserted'], 150)
+        self.assertEqual(self._search_requests(), 2)
+
+        cached = self.db_manager.get_cached_issues()
+        self.assertEqual(len(cached), 150)
+        self.assertEqual(max(issue['updated'] for issue in cached), result['watermark'])
+        self.assertEqual(self.db_manager.get_sync_state("project = TM")['watermark'], result['watermark'])
+
+    def test_incremental_sync_fetches_only_changes(self):
+        """두 번째 동기화는 변경된 이슈만 조회"""
+        self.sync.sync("project = TM")
+        self.jira.update_issue("TM-7", {"summary": "changed"})
+        self.server.reset_stats()
+
+        result = self.sync.sync("project = TM")
+
+        self.assertFalse(result['full'])
+        self.assertLessEqual(result['fetched'], 3)
+        self.assertEqual(self._search_requests(), 1)
+        cached = {issue['issue_key']: issue for issue in self.db_manager.get_cached_issues()}
+        self.assertEqual(cached['TM-7']['summary'], 'changed')
+        self.assertEqual(cached['TM-7']['data']['summary'], 'changed')
+        self.assertEqual(result['watermark'], cached['TM-7']['updated'])
+
+    def test_full_resync_ignores_watermark(self):
+        """full=True면 워터마크를 무시"""
+        self.sync.sync("project = OPS")
+        result = self.sync.sync("project = OPS", full=True)
+
+        self.assertTrue(result['full'])
+        self.assertEqual(result['fetched'], 150)
+
+    def test_build_query(self):
+        """워터마크를 사용자 시간대의 분 단위 JQL 조건으로 변환"""
+        sync = JiraSyncController(self.jira, self.db_manager, time_zone='Asia/Seoul')
+
+        self.assertEqual(sync.normalize_jql("project = TM  order by key"), "project = TM")
+        self.assertEqual(sync.build_query("project = TM"), "(project = TM) ORDER BY created ASC, key ASC")
+        self.assertEqual(
+            sync.build_query("project = TM", "2024-01-05T10:23:45.000+0000"),
+            '(project = TM) AND updated >= "2024/01/05 19:22" ORDER BY created ASC, key ASC'
+        )
+        self.assertEqual(sync.build_query(""), "ORDER BY created ASC, key ASC")
+
+    def test_sync_projects_quotes_keys(self):
+        """프로젝트 키는 인용/이스케이프된 JQL로 동기화"""
+        with patch.object(self.sync, 'sync', return_value={}) as sync:
+            self.sync.sync_projects(['TM', 'X" OR project != "Y'])
+
+        self.assertEqual([c.args[0] for c in sync.call_args_list],
+                         ['project = "TM"', 'project = "X\\" OR project != \\"Y"'])
+
+    def test_sync_configured_projects(self):
+        """설정의 sync.projects만 동기화하고 비어 있으면 조회하지 않음"""
+        config_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, config_dir, True)
+        config = Config(os.path.join(config_dir, 'config.json'))
+
+        self.assertEqual(sync_configured_projects(self.jira, self.db_manager, config), [])
+        self.assertEqual(self._search_requests(), 0)
+
+        config.set('sync', {'projects': ['TM']})
+        results = sync_configured_projects(self.jira, self.db_manager, config)
+
+        self.assertEqual([result['jql'] for result in results], ['project = "TM"'])
+        self.assertEqual(results[0]['upserted'], 150)
+        self.assertIsNotNone(self.db_manager.get_sync_state('project = "TM"'))
+
+    def test_cache_row_flattens_fields(self):
+        """검색 결과 이슈를 캐시 행으로 변환"""
+        issue = {
+            "key": "TM-1",
+            "fields": {
+                "summary": "hello",
+                "status": {"name": "Open"},
+                "assignee": None,
+                "issuetype": {"name": "Bug"},
+                "updated": "2024-01-01T00:00:00.000+0000",
+                "components": [{"name": "core"}],
+                "description": {"type": "doc", "content": [
+                    {"type": "paragraph", "content": [{"type": "text", "text": "line one"}]},
+                    {"type": "paragraph", "content": [{"type": "text", "text": "line two"}]}
+                ]}
+            }
+        }
+
+        row = JiraSyncController.to_cache_row(issue)
+
+        self.assertEqual(row['issue_key'], 'TM-1')
+        self.assertEqual(row['assignee'], 'Unassigned')
+        self.assertEqual(row['issue_type'], 'Bug')
+        self.assertEqual(row['data']['components'], ['core'])
+        self.assertEqual(row['data']['description'], 'line one\nline two')
+
+
+if __name__ == '__main__':
+    unittest.main()
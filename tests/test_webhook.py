@@ -0,0 +1,235 @@
+"""
+웹훅 수신기 테스트
+"""
+
+import unittest
+import hmac
+import hashlib
+import http.client
+import json
+import os
+import shutil
+import sys
+import tempfile
+import requests
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(__file__)), 'src'))
+
+from models.database import DatabaseManager
+from controllers.webhook_controller import (WebhookController, WebhookRequestHandler, WebhookServer,
+                                            start_webhook_server)
+from controllers.jira_controller import JiraController
+from models.issue import IssueRecord
+from utils.config import Config
+
+
+def make_issue(key, summary, updated):
+    """웹훅 페이로드용 이슈"""
+    return {
+        'id': '10001',
+        'key': key,
+        'fields': {
+            'summary': summary,
+            'status': {'name': 'In Progress'},
+            'assignee': {'displayName': 'Tester'},
+            'issuetype': {'name': 'Task'},
+            'updated': updated
+        }
+    }
+
+
+class TestWebhookController(unittest.TestCase):
+    """WebhookController 테스트"""
+
+    def setUp(self):
+        """테스트 환경 설정"""
+        self.temp_db = tempfile.NamedTemporaryFile(suffix='.db', delete=False)
+        self.db_path = self.temp_db.name
+        self.temp_db.close()
+        self.db_manager = DatabaseManager(self.db_path)
+        self.controller = WebhookController(self.db_manager)
+        self.events = []
+        self.controller.add_listener(self.events.append)
+
+    def tearDown(self):
+        """테스트 정리"""
+        self.db_manager.close()
+        if os.path.exists(self.db_path):
+            os.unlink(self.db_path)
+
+    def _jira_event(self, event, issue):
+        return self.controller.handle({'webhookEvent': event, 'issue': issue})
+
+    def test_jira_issue_updated_applied(self):
+        """이슈 생성/수정 이벤트는 캐시에 즉시 반영"""
+        self._jira_event('jira:issue_created', make_issue('TM-1', 'first', '2024-01-01T00:00:00.000+0000'))
+        result = self._jira_event('jira:issue_updated', make_issue('TM-1', 'second', '2024-01-02T00:00:00.000+0000'))
+
+        self.assertEqual(result['updated'], 1)
+        cached = self.db_manager.get_cached_issue('TM-1')
+        self.assertEqual(cached['summary'], 'second')
+        self.assertEqual(cached['status'], 'In Progress')
+        self.assertEqual(self.events[-1]['issue_keys'], ['TM-1'])
+
+    def test_jira_controller_listener_keeps_fresh_rows(self):
+        """JiraController 리스너는 메모리 캐시만 비우고 웹훅이 반영한 행은 최신으로 유지"""
+        jira = JiraController(db_manager=self.db_manager)
+        self.addCleanup(jira.close)
+        self.controller.add_listener(jira.on_issue_event)
+        self._jira_event('jira:issue_created', make_issue('TM-1', 'first', '2024-01-01T00:00:00.000+0000'))
+        jira.cache.put('detail', 'TM-1', IssueRecord(key='TM-1', summary='first', status='Open', assignee=None,
+                                                     raw={'description': 'text', 'comments': []}))
+
+        self._jira_event('jira:issue_updated', make_issue('TM-1', 'second', '2024-01-02T00:00:00.000+0000'))
+
+        cached = self.db_manager.get_cached_issue('TM-1')
+        self.assertNotEqual(cached['cached_at'], '1970-01-01 00:00:00')
+        self.assertIsNotNone(cached['detail_cached_at'])
+        # 메모리의 이전 값 대신 웹훅이 갱신한 SQLite 행을 사용
+        self.assertEqual(jira.cache.get('detail', 'TM-1')['summary'], 'second')
+        self.assertEqual(jira.cache.stats['db_loads'], 1)
+
+    def test_out_of_order_event_ignored(self):
+        """늦게 도착한 이전 이벤트는 최신 캐시를 덮어쓰지 않음"""
+        self._jira_event('jira:issue_updated', make_issue('TM-1', 'new', '2024-01-02T00:00:00.000+0000'))
+        result = self._jira_event('jira:issue_updated', make_issue('TM-1', 'old', '2024-01-01T00:00:00.000+0000'))
+
+        self.assertEqual(result['updated'], 0)
+        self.assertEqual(self.db_manager.get_cached_issue('TM-1')['summary'], 'new')
+
+    def test_jira_delete_and_comment_events(self):
+        """삭제 이벤트는 캐시 삭제, 댓글 이벤트는 만료 처리"""
+        self._jira_event('jira:issue_created', make_issue('TM-1', 'a', '2024-01-01T00:00:00.000+0000'))
+        self._jira_event('jira:issue_created', make_issue('TM-2', 'b', '2024-01-01T00:00:00.000+0000'))
+
+        result = self.controller.handle({'webhookEvent': 'comment_created', 'issue': {'key': 'TM-2'},
+                                         'comment': {'body': 'hi'}})
+        self.assertEqual(result['invalidated'], 1)
+        self.assertEqual([i['issue_key'] for i in self.db_manager.get_cached_issues()], ['TM-1'])
+        self.assertIsNotNone(self.db_manager.get_cached_issue('TM-2'))
+
+        result = self._jira_event('jira:issue_deleted', {'key': 'TM-1'})
+        self.assertEqual(result['deleted'], 1)
+        self.assertIsNone(self.db_manager.get_cached_issue('TM-1'))
+
+    def test_bitbucket_events_invalidate_mentioned_issues(self):
+        """Bitbucket push/PR 이벤트는 언급된 이슈 캐시를 만료"""
+        self._jira_event('jira:issue_created', make_issue('TM-5', 'a', '2024-01-01T00:00:00.000+0000'))
+
+        result = self.controller.handle({
+            'repository': {'slug': 'app', 'project': {'key': 'TM'}},
+            'changes': [{'ref': {'id': 'refs/heads/feature/TM-5-login', 'displayId': 'feature/TM-5-login'}}]
+        }, 'repo:refs_changed')
+        self.assertEqual(result['source'], 'bitbucket')
+        self.assertEqual(result['repository'], 'TM/app')
+        self.assertEqual(result['issue_keys'], ['TM-5'])
+        self.assertEqual(result['invalidated'], 1)
+
+        result = self.controller.handle({
+            'repository': {'full_name': 'ws/app'},
+            'pullrequest': {'title': 'DEV-9 fix crash', 'source': {'branch': {'name': 'bugfix'}}}
+        }, 'pullrequest:fulfilled')
+        self.assertEqual(result['issue_keys'], ['DEV-9'])
+        self.assertEqual(result['refs'], ['bugfix'])
+        self.assertEqual(result['invalidated'], 0)
+
+
+class TestWebhookServer(unittest.TestCase):
+    """WebhookServer HTTP 수신 테스트"""
+
+    def setUp(self):
+        """테스트 환경 설정"""
+        self.temp_db = tempfile.NamedTemporaryFile(suffix='.db', delete=False)
+        self.db_path = self.temp_db.name
+        self.temp_db.close()
+        self.db_manager = DatabaseManager(self.db_path)
+        self.controller = WebhookController(self.db_manager, secret='s3cret')
+        self.server = WebhookServer(self.controller).start()
+
+    def tearDown(self):
+        """테스트 정리"""
+        self.server.stop()
+        self.db_manager.close()
+        if os.path.exists(self.db_path):
+            os.unlink(self.db_path)
+
+    def _post(self, payload, secret='s3cret', headers=None):
+        body = json.dumps(payload).encode('utf-8')
+        signature = 'sha256=' + hmac.new(secret.encode('utf-8'), body, hashlib.sha256).hexdigest()
+        return requests.post(self.server.url + '/webhook', data=body, timeout=5,
+                             headers={'X-Hub-Signature': signature, **(headers or {})})
+
+    def test_signed_event_applied(self):
+        """서명이 맞는 이벤트는 204 응답 후 캐시에 반영"""
+        response = self._post({'webhookEvent': 'jira:issue_created',
+                               'issue': make_issue('TM-1', 'hello', '2024-01-01T00:00:00.000+0000')})
+
+        self.assertEqual(response.status_code, 204)
+        self.assertEqual(self.db_manager.get_cached_issue('TM-1')['summary'], 'hello')
+
+    def test_bad_signature_rejected(self):
+        """서명이 틀리면 401"""
+        response = self._post({'webhookEvent': 'jira:issue_deleted', 'issue': {'key': 'TM-1'}}, secret='wrong')
+
+        self.assertEqual(response.status_code, 401)
+
+    def test_invalid_json_rejected(self):
+        """JSON이 아닌 본문은 400"""
+        body = b'not json'
+        signature = 'sha256=' + hmac.new(b's3cret', body, hashlib.sha256).hexdigest()
+        response = requests.post(self.server.url, data=body, headers={'X-Hub-Signature': signature}, timeout=5)
+
+        self.assertEqual(response.status_code, 400)
+
+    def _post_raw(self, content_length, body=b''):
+        connection = http.client.HTTPConnection(self.server.httpd.server_address[0],
+                                                self.server.httpd.server_address[1], timeout=5)
+        self.addCleanup(connection.close)
+        connection.putrequest('POST', '/webhook')
+        if content_length is not None:
+            connection.putheader('Content-Length', content_length)
+        connection.endheaders(body)
+        return connection.getresponse()
+
+    def test_oversized_body_rejected(self):
+        """MAX_BODY보다 큰 본문은 읽지 않고 413"""
+        response = self._post_raw(str(WebhookRequestHandler.MAX_BODY + 1), b'{}')
+
+        self.assertEqual(response.status, 413)
+
+    def test_malformed_content_length_rejected(self):
+        """Content-Length가 없거나 숫자가 아니거나 음수면 400"""
+        for content_length in (None, 'abc', '-1', ''):
+            with self.subTest(content_length=content_length):
+                response = self._post_raw(content_length)
+
+                self.assertEqual(response.status, 400)
+
+    def test_unsigned_external_bind_rejected(self):
+        """비밀값이 없으면 루프백 주소에서만 수신"""
+        with self.assertRaises(ValueError):
+            WebhookServer(WebhookController(self.db_manager), host='0.0.0.0')
+        server = WebhookServer(WebhookController(self.db_manager), host='localhost')
+        server.httpd.server_close()
+
+    def test_start_from_config(self):
+        """설정의 webhook 섹션으로 수신기를 시작하고 캐시 리스너 등록"""
+        config_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, config_dir, True)
+        config = Config(os.path.join(config_dir, 'config.json'))
+        config.set('webhook', {'host': '127.0.0.1', 'port': 0, 'secret': 'abc'})
+        jira = JiraController(db_manager=self.db_manager)
+        self.addCleanup(jira.close)
+
+        server = start_webhook_server(self.db_manager, jira, config)
+        self.addCleanup(server.stop)
+
+        self.assertEqual(server.controller.secret, 'abc')
+        self.assertEqual(len(server.controller.listeners), 1)
+        config.set('webhook.secret', '')
+        config.set('webhook.host', '0.0.0.0')
+        with self.assertRaises(ValueError):
+            start_webhook_server(self.db_manager, jira, config)
+
+
+if __name__ == '__main__':
+    unittest.main()